@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 스트리밍 결과 집계(accumulator) 모듈
+
+EncodedSimulationEngine / SimulationEngine의 run_stream은 게임마다 결과 딕셔너리를 만들지 않고
+accumulator에 필요한 상태(카드 id 손패 리스트)만 직접 전달합니다.
+
+- accumulator는 needs_opening_hand로 0턴 손패가 필요한지 선언
+- needs_turn_hands면 매 턴 드로우 카드 사용 후 손패 / 트래시도 전달 (스위트 공유 실행, 카드 곡선용)
+- 손패 판정은 CardTable 기준으로 미리 컴파일한 id 기반 HandQuery(hand_query 모듈) 사용
+- 전달되는 손패 / 트래시 리스트는 엔진 내부 상태이므로 accumulator가 보관하면 안 됨
+
+상세 로그/턴별 손패가 필요하면 기존 simulate_single_game(trace 모드)을 사용합니다.
+"""
+
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+from encoded_engine import CardTable
+from hand_query import compile_request
+
+HandPredicate = Callable[[List[int]], bool]
+
+
+class GameAccumulator:
+    """run_stream이 게임마다 호출하는 accumulator 기본 클래스"""
+
+    # True면 0턴 손패(첫 5장)를 on_opening_hand로 전달
+    needs_opening_hand = False
+    # True면 0턴~마지막 턴의 턴별 손패 / 트래시를 on_turn_hand로 전달
+    needs_turn_hands = False
+
+    def on_invalid_game(self):
+        """멀리건 실패로 무효 처리된 게임"""
+
+    def on_opening_hand(self, hand: List[int]):
+        """0턴 손패 (needs_opening_hand가 True일 때만 호출)"""
+
+    def on_turn_hand(self, turn: int, hand: List[int], discard: List[int]):
+        """turn턴 드로우 카드 사용 후 손패 / 트래시 (needs_turn_hands가 True일 때만 호출, 0턴은 시작 손패)"""
+
+    def on_final_hand(self, hand: List[int]):
+        """마지막 턴 종료 시점 손패"""
+
+
+class SuccessCounter(GameAccumulator):
+    """시작 손패 / 최종 손패 조건을 모두 만족한 게임 수 집계"""
+
+    def __init__(self, opening_predicate: Optional[HandPredicate] = None,
+                 final_predicate: Optional[HandPredicate] = None):
+        self.opening_predicate = opening_predicate
+        self.final_predicate = final_predicate
+        self.needs_opening_hand = opening_predicate is not None
+        self.success_count = 0
+        self.total_valid_games = 0
+        self._opening_ok = True
+
+    def on_opening_hand(self, hand: List[int]):
+        self._opening_ok = self.opening_predicate(hand)
+
+    def on_final_hand(self, hand: List[int]):
+        self.total_valid_games += 1
+        if self._opening_ok and (self.final_predicate is None or self.final_predicate(hand)):
+            self.success_count += 1
+
+
+class OutcomeRecorder(GameAccumulator):
+    """SuccessCounter 판정을 게임별 결과 목록으로 기록 (공통 난수 paired 비교용)
+
+    outcomes[i]: 게임 i의 성공 여부 (멀리건 실패로 무효인 게임은 None)
+    """
+
+    def __init__(self, counter: SuccessCounter):
+        self.counter = counter
+        self.needs_opening_hand = counter.needs_opening_hand
+        self.outcomes: List[Optional[bool]] = []
+
+    def on_invalid_game(self):
+        self.outcomes.append(None)
+
+    def on_opening_hand(self, hand: List[int]):
+        self.counter.on_opening_hand(hand)
+
+    def on_final_hand(self, hand: List[int]):
+        success_before = self.counter.success_count
+        self.counter.on_final_hand(hand)
+        self.outcomes.append(self.counter.success_count > success_before)
+
+
+class SuiteCounter(GameAccumulator):
+    """하나의 게임 흐름에서 여러 계산 요청의 SuccessCounter를 함께 집계
+
+    요청마다 판정 턴을 두고, 그 턴의 손패를 해당 SuccessCounter의 최종 손패로 전달합니다.
+    게임은 가장 큰 판정 턴까지 한 번만 진행하면 됩니다.
+    """
+
+    needs_turn_hands = True
+
+    def __init__(self, counters: List[Tuple[int, SuccessCounter]]):
+        """
+        Args:
+            counters: (판정 턴, SuccessCounter) 목록
+        """
+        self.counters = [counter for _, counter in counters]
+        self._opening_counters = [counter for counter in self.counters if counter.needs_opening_hand]
+        self.needs_opening_hand = bool(self._opening_counters)
+        self._counters_by_turn: Dict[int, List[SuccessCounter]] = {}
+        for turn, counter in counters:
+            self._counters_by_turn.setdefault(turn, []).append(counter)
+
+    def on_invalid_game(self):
+        for counter in self.counters:
+            counter.on_invalid_game()
+
+    def on_opening_hand(self, hand: List[int]):
+        for counter in self._opening_counters:
+            counter.on_opening_hand(hand)
+
+    def on_turn_hand(self, turn: int, hand: List[int], discard: List[int]):
+        for counter in self._counters_by_turn.get(turn, ()):
+            counter.on_final_hand(hand)
+
+
+class CardCurveCounter(GameAccumulator):
+    """카드별 / 턴별 손패 보유 횟수와 처음 본 턴 분포 집계 (card_curves)
+
+    목표 카드 없이 진행하면 Iono / Pokemon Communication을 사용하지 않아 덱을 떠난 카드가
+    돌아오지 않으므로, 손패 또는 트래시에 처음 나타난 턴이 "처음 손패에 들어온 턴"입니다.
+    (드로우한 턴에 바로 사용한 드로우 카드도 트래시로 잡힘)
+    """
+
+    needs_turn_hands = True
+
+    def __init__(self, card_table: CardTable, max_turn: int):
+        self.max_turn = max_turn
+        self.total_valid_games = 0
+        # [턴][카드 id] 게임 수
+        self.in_hand_counts = [[0] * len(card_table) for _ in range(max_turn + 1)]
+        self.first_seen_counts = [[0] * len(card_table) for _ in range(max_turn + 1)]
+        self._seen = [False] * len(card_table)
+
+    def on_turn_hand(self, turn: int, hand: List[int], discard: List[int]):
+        if turn == 0:
+            self._seen = [False] * len(self._seen)
+        seen = self._seen
+        in_hand = self.in_hand_counts[turn]
+        first_seen = self.first_seen_counts[turn]
+        for card_id in set(hand):
+            in_hand[card_id] += 1
+        for cards in (hand, discard):
+            for card_id in cards:
+                if not seen[card_id]:
+                    seen[card_id] = True
+                    first_seen[card_id] += 1
+
+    def on_final_hand(self, hand: List[int]):
+        self.total_valid_games += 1
+
+
+# ===== id 기반 손패 predicate 컴파일 =====
+
+def counter_for_request(calculation_request: Dict[str, Any], card_table: CardTable) -> SuccessCounter:
+    """계산 요청(복합 타입 포함)의 성공 조건을 컴파일한 SuccessCounter 생성
+
+    ProbabilityCalculator._is_success와 같은 판정입니다.
+    """
+    basic_cards = [name for name, basic in zip(card_table.names, card_table.is_basic) if basic]
+    opening_predicate, final_predicate = compile_request(calculation_request, card_table.ids.get, basic_cards)
+    return SuccessCounter(opening_predicate, final_predicate)
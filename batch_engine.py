@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - NumPy 배치 엔진
+
+드로우 카드 효과가 한 번도 발동되지 않는 덱/드로우 순서에서는 최종 손패가
+"셔플된 덱의 앞 5 + N장"과 같습니다. 이 경우 게임을 한 판씩 진행하지 않고
+B개의 셔플된 덱을 (B, 20) 정수 행렬로 한 번에 만들어 벡터 연산으로 판정합니다.
+
+- 셔플: 균등 난수 행렬의 argsort
+- 멀리건: 첫 5장에 Basic Pokemon이 없는 행만 골라 재셔플 (최대 50회)
+- 판정: 앞 5 + max_turn 열에 각 목표 카드가 있는지 확인
+
+NumPy가 설치되어 있지 않으면 numpy_available()이 False를 반환하며,
+ProbabilityCalculator는 기존 시뮬레이션 경로를 사용합니다.
+"""
+
+from typing import Dict, List, Any, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 환경에서는 배치 엔진 비활성화
+    np = None
+
+from card_effects import DRAW_CARDS
+from encoded_engine import CardTable
+
+
+def numpy_available() -> bool:
+    """NumPy 배치 엔진 사용 가능 여부"""
+    return np is not None
+
+
+def has_active_draw_effects(deck_input: Dict[str, Dict[str, Any]], draw_order: List[str]) -> bool:
+    """게임 중 효과가 발동될 수 있는 드로우 카드가 덱에 있는지 확인
+
+    draw_order에 있는 드로우 카드와, 드로우 순서와 무관하게 마지막 턴에
+    평가되는 Pokemon Communication이 대상입니다.
+    """
+    for card_name in deck_input:
+        if card_name not in DRAW_CARDS:
+            continue
+        if card_name in draw_order or card_name == "Pokemon Communication":
+            return True
+    return False
+
+
+class BatchDeckSampler:
+    """셔플된 덱을 (B, 20) 행렬 단위로 생성하는 배치 샘플러"""
+
+    def __init__(self, deck_input: Dict[str, Dict[str, Any]], seed=None, max_attempts: int = 50):
+        if np is None:
+            raise RuntimeError("NumPy가 설치되어 있지 않아 배치 엔진을 사용할 수 없습니다.")
+
+        self.card_table = CardTable(deck_input)
+        self.deck_ids = np.array(self.card_table.build_deck(), dtype=np.int16)
+        self.is_basic = np.array(self.card_table.is_basic, dtype=bool)
+        self.opening_hand_size = 5
+        self.max_attempts = max_attempts
+        self.rng = np.random.default_rng(seed)
+
+    def _shuffled_decks(self, batch_size: int):
+        order = np.argsort(self.rng.random((batch_size, len(self.deck_ids))), axis=1)
+        return self.deck_ids[order]
+
+    def sample_decks(self, batch_size: int) -> Tuple[Any, Any]:
+        """멀리건 규칙을 적용한 셔플 덱 행렬 생성
+
+        Returns:
+            (decks, valid): decks는 (B, 20) 카드 id 행렬(0열이 덱 맨 위),
+            valid는 max_attempts 안에 Basic Pokemon이 나온 행 여부
+        """
+        decks = self._shuffled_decks(batch_size)
+        needs_redraw = ~self.is_basic[decks[:, :self.opening_hand_size]].any(axis=1)
+        attempts = 1
+
+        while attempts < self.max_attempts and needs_redraw.any():
+            rows = np.flatnonzero(needs_redraw)
+            decks[rows] = self._shuffled_decks(len(rows))
+            needs_redraw[rows] = ~self.is_basic[decks[rows, :self.opening_hand_size]].any(axis=1)
+            attempts += 1
+
+        return decks, ~needs_redraw
+
+    def count_multi_card(self, target_cards: List[str], max_turn: int, num_simulations: int,
+                         batch_size: int = 200000, on_batch=None) -> Tuple[int, int]:
+        """max_turn까지 모든 목표 카드를 1장 이상 손패에 가진 게임 수 계산
+
+        Args:
+            on_batch: 배치마다 (games, success_count, total_valid_games)로 호출할 함수
+
+        Returns:
+            (success_count, total_valid_games)
+        """
+        seen_columns = min(self.opening_hand_size + max_turn, len(self.deck_ids))
+        target_ids = [self.card_table.id_of(name) for name in target_cards]
+        success_count = 0
+        total_valid_games = 0
+        remaining = num_simulations
+
+        while remaining > 0:
+            current_batch = min(batch_size, remaining)
+            decks, valid = self.sample_decks(current_batch)
+            seen = decks[:, :seen_columns]
+
+            success = valid.copy()
+            for target_id in target_ids:
+                if target_id < 0:
+                    success[:] = False
+                    break
+                success &= (seen == target_id).any(axis=1)
+
+            batch_success = int(success.sum())
+            batch_valid = int(valid.sum())
+            success_count += batch_success
+            total_valid_games += batch_valid
+            remaining -= current_batch
+            if on_batch is not None:
+                on_batch(current_batch, batch_success, batch_valid)
+
+        return success_count, total_valid_games
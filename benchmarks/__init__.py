@@ -0,0 +1,15 @@
+"""
+Pokemon Pocket Simulator - 벤치마크 패키지
+
+엔진 / 계산 타입 / 카드 효과 / v3 진화 시스템의 처리량과 메모리 사용량을
+고정 seed로 측정하고, 저장된 baseline(benchmarks/baseline.json)과 비교합니다.
+
+실행:
+    python -m benchmarks                    # 측정 + baseline 비교 (회귀 시 종료 코드 1)
+    python -m benchmarks --filter encoded   # 이름에 encoded가 포함된 케이스만
+    python -m benchmarks --update-baseline  # 현재 측정값을 baseline으로 저장
+"""
+
+from benchmarks.cases import BenchmarkCase, build_cases
+from benchmarks.runner import (measure_case, run_benchmarks, load_baseline, save_baseline,
+                               compare_to_baseline, print_comparison)
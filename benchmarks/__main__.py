@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""python -m benchmarks 진입점"""
+
+import argparse
+import sys
+
+from benchmarks.runner import (DEFAULT_SEED, DEFAULT_THRESHOLD, run_benchmarks, load_baseline,
+                               save_baseline, compare_to_baseline, print_comparison)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Pokemon Pocket Simulator 벤치마크")
+    parser.add_argument("--filter", default=None, help="이름에 이 문자열이 포함된 케이스만 실행")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="난수 seed")
+    parser.add_argument("--repeats", type=int, default=3, help="처리량 측정 반복 횟수")
+    parser.add_argument("--scale", type=float, default=1.0, help="케이스별 연산 수 배율")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀 판정 허용 비율")
+    parser.add_argument("--update-baseline", action="store_true", help="측정값을 baseline으로 저장")
+    args = parser.parse_args(argv)
+
+    print("=== Pokemon Pocket Simulator 벤치마크 ===")
+    results = run_benchmarks(args.filter, args.seed, args.repeats, args.scale)
+
+    if args.update_baseline:
+        save_baseline(results, args.seed)
+        print("💾 baseline 저장 완료")
+        return 0
+
+    baseline = load_baseline()
+    if baseline is None:
+        print("⚠️ baseline이 없습니다. --update-baseline으로 먼저 저장하세요.")
+        return 0
+
+    comparisons = compare_to_baseline(results, baseline, args.threshold)
+    print_comparison(comparisons, args.threshold)
+    return 1 if any(comparison['regression'] for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
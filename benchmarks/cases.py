@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+벤치마크 케이스 정의
+
+각 케이스는 setup(ops)으로 측정 대상 상태를 미리 준비하고(시간 측정 제외),
+ops번의 연산을 실행하는 인자 없는 함수를 반환합니다.
+난수 seed는 runner가 setup 직전에 고정합니다.
+
+덱:
+- DeckList.txt 덱 (Pokemon Communication 실험용, v2 엔진)
+- IONO_DECK: Iono / Galdion이 포함된 덱 (v2 엔진)
+- EVOLUTION_DECK: rare candy / Stage2 라인이 많은 v3 덱
+"""
+
+import io
+import random
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Callable, List, Any
+
+from main_simulator import SimulationEngine, GameState, load_deck_from_file
+from encoded_engine import EncodedSimulationEngine
+from probability_calculator import ProbabilityCalculator
+from card_effects import CardEffects, BASIC_TYPES, POKEMON_TYPES
+from v3_game_state import GameStateV3
+from v3_evolution_system import auto_evolve_all
+from v3_draw_card_system import use_draw_cards_v3
+
+
+IONO_DECK = {
+    "Charizard EX": {"type": "Basic Pokemon", "count": 2},
+    "Dragonite": {"type": "Stage2 Pokemon", "count": 2},
+    "Master Ball": {"type": "Item", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Squirtle": {"type": "Basic Pokemon", "count": 2},
+    "Energy Search": {"type": "Item", "count": 2},
+    "Iono": {"type": "Supporter", "count": 2},
+    "Galdion": {"type": "Supporter", "count": 2}
+}
+IONO_DRAW_ORDER = ["Poke Ball", "Professor's Research", "Iono"]
+
+EVOLUTION_DECK = {
+    "Charmander": {"카드타입": "Basic Pokemon", "count": 2},
+    "Charmeleon": {"카드타입": "Stage1 Pokemon", "count": 1},
+    "Charizard ex": {"카드타입": "Stage2 Pokemon", "count": 2},
+    "Pikachu": {"카드타입": "Basic Pokemon", "count": 2},
+    "Raichu": {"카드타입": "Stage1 Pokemon", "count": 2},
+    "rare candy": {"카드타입": "Item", "count": 2},
+    "Poke Ball": {"카드타입": "Item", "count": 2},
+    "Professor's Research": {"카드타입": "Supporter", "count": 2},
+    "Iono": {"카드타입": "Supporter", "count": 1},
+    "Potion": {"카드타입": "Item", "count": 2},
+    "Switch": {"카드타입": "Item", "count": 2}
+}
+EVOLUTION_LINES = [
+    {"basic": "Charmander", "stage1": "Charmeleon", "stage2": "Charizard ex"},
+    {"basic": "Pikachu", "stage1": "Raichu", "stage2": None}
+]
+EVOLUTION_DRAW_ORDER = ["Poke Ball", "Professor's Research", "Iono"]
+EVOLUTION_TARGETS = ["Charizard ex"]
+
+
+@dataclass
+class BenchmarkCase:
+    """벤치마크 케이스 하나"""
+    name: str
+    group: str
+    ops: int
+    setup: Callable[[int], Callable[[], Any]]
+    unit: str = "game"
+
+
+# ===== 게임 1판 시뮬레이션 =====
+
+def _single_game_case(engine_class, deck_input, draw_order, **game_kwargs):
+    def setup(ops):
+        engine = engine_class(deck_input, draw_order)
+
+        def run():
+            for _ in range(ops):
+                engine.simulate_single_game(**game_kwargs)
+        return run
+    return setup
+
+
+# ===== ProbabilityCalculator 계산 타입 =====
+
+CALCULATION_REQUESTS = {
+    'preferred_opening': {"type": "preferred_opening", "preferred_basics": ["Type:Null", "Blacephalon"]},
+    'non_preferred_opening': {"type": "non_preferred_opening", "non_preferred_basics": ["Charmander", "Squirtle"]},
+    'multi_card': {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 3},
+    'preferred_and_multi': {"type": "preferred_and_multi", "preferred_basics": ["Type:Null"],
+                            "target_cards": ["Silvally"], "turn": 2},
+    'non_preferred_and_multi': {"type": "non_preferred_and_multi", "non_preferred_basics": ["Charmander"],
+                                "target_cards": ["Blacephalon"], "turn": 2},
+    'multi_or_multi': {"type": "multi_or_multi", "turn": 2, "target_groups": [
+        {"name": "A", "target_cards": ["Blacephalon", "BalsaMine"]},
+        {"name": "B", "target_cards": ["Type:Null", "Silvally"]}]},
+}
+
+
+def _calculation_case(engine_class, calculation_request):
+    def setup(ops):
+        deck, draw_order = load_deck_from_file()
+        calculator = ProbabilityCalculator(engine_class(deck, draw_order))
+        return lambda: calculator.simulate_counts(calculation_request, ops)
+    return setup
+
+
+EVOLUTION_REQUEST = {"type": "evolution", "target_evolutions": EVOLUTION_TARGETS,
+                     "evolution_lines": EVOLUTION_LINES, "turn": 3}
+
+
+def _evolution_calculation_case(ops):
+    """진화 성공 확률 (Card 객체 기반 v3 파이프라인 EvolutionSimulator.run_stream, 시뮬레이터 생성은 setup에서)"""
+    deck = {name: {"type": info["카드타입"], "count": info["count"]} for name, info in EVOLUTION_DECK.items()}
+    calculator = ProbabilityCalculator(SimulationEngine(deck, EVOLUTION_DRAW_ORDER))
+    calculator._evolution_simulator(EVOLUTION_REQUEST)
+    return lambda: calculator.simulate_counts(EVOLUTION_REQUEST, ops)
+
+
+def _mathematical_case(method_name, deck_input, draw_order, *args):
+    """수학적 계산 (ops번 반복, 계산 함수의 print 출력은 버림)"""
+    def setup(ops):
+        calculator = ProbabilityCalculator(SimulationEngine(deck_input, draw_order))
+        method = getattr(calculator, method_name)
+
+        def run():
+            with redirect_stdout(io.StringIO()):
+                for _ in range(ops):
+                    method(*args)
+        return run
+    return setup
+
+
+def _galdion_deck():
+    """DeckList.txt 덱에서 Pokemon Communication을 Galdion으로 바꾼 덱 (Markov 연쇄 계산 가능)"""
+    deck, _ = load_deck_from_file()
+    deck = dict(deck)
+    del deck["Pokemon Communication"]
+    deck["Galdion"] = {"type": "Supporter", "count": 2}
+    return deck
+
+
+# ===== CardEffects =====
+
+def _effect_case(effect, deck_input, draw_order, prepare=None, build_index: bool = False):
+    """초기 드로우까지 끝난 GameState ops개를 준비하고 효과만 측정
+
+    build_index: 덱 색인(타입별 종류 캐시 포함)을 준비 단계에서 미리 생성
+                 (서치 효과가 색인 생성 비용 없이 O(1) 탐색만 측정되도록)
+    """
+    def setup(ops):
+        states = []
+        while len(states) < ops:
+            game_state = GameState(deck_input, draw_order)
+            if not game_state.initial_draw():
+                continue
+            if prepare is not None:
+                prepare(game_state)
+            if build_index:
+                _build_index(game_state)
+            states.append(game_state)
+
+        def run():
+            for game_state in states:
+                effect(game_state)
+        return run
+    return setup
+
+
+def _build_index(game_state):
+    """덱 색인과 Poke Ball / Pokemon Communication의 타입별 종류 캐시를 미리 생성"""
+    index = game_state.deck_index
+    index.kinds_of_types(BASIC_TYPES)
+    index.kinds_of_types(POKEMON_TYPES)
+
+
+def _draw_two(game_state):
+    game_state.draw_cards(2)
+
+
+# ===== v3 진화 / 드로우 카드 시스템 =====
+
+def _v3_state(turn: int) -> GameStateV3:
+    """EVOLUTION_DECK으로 Basic을 배치하고 turn턴을 시작한 GameStateV3"""
+    game_state = GameStateV3(EVOLUTION_DECK, EVOLUTION_DRAW_ORDER,
+                             preferred_basics=["Charmander"], evolution_lines=EVOLUTION_LINES)
+    random.shuffle(game_state.deck)
+    game_state.initial_draw()
+
+    for index, card in enumerate(game_state.get_basic_pokemon_in_hand()):
+        if index == 0:
+            game_state.place_pokemon_active(card.name)
+        else:
+            game_state.place_pokemon_bench(card.name)
+    for _ in range(turn):
+        game_state.start_turn()
+    return game_state
+
+
+def _v3_case(operation, turn: int):
+    def setup(ops):
+        states = [_v3_state(turn) for _ in range(ops)]
+
+        def run():
+            for game_state in states:
+                operation(game_state)
+        return run
+    return setup
+
+
+def _evolution_ready(game_state: GameStateV3):
+    """진화 카드 / rare candy를 손패에 추가 (auto_evolve_all이 실제로 진화하도록)"""
+    for name in ("Charmeleon", "Charizard ex", "rare candy", "Raichu"):
+        card = next((card for card in game_state.deck if card.name == name), None)
+        if card is not None:
+            game_state.deck.remove(card)
+            game_state.hand.append(card)
+    return game_state
+
+
+def _auto_evolve_case(ops):
+    states = [_evolution_ready(_v3_state(2)) for _ in range(ops)]
+
+    def run():
+        for game_state in states:
+            auto_evolve_all(game_state)
+    return run
+
+
+def build_cases() -> List[BenchmarkCase]:
+    """전체 벤치마크 케이스 목록"""
+    deck, draw_order = load_deck_from_file()
+    multi_targets = CALCULATION_REQUESTS['multi_card']['target_cards']
+
+    cases = [
+        BenchmarkCase("game/object/decklist", "game", 1000,
+                      _single_game_case(SimulationEngine, deck, draw_order, max_turn=3, target_cards=multi_targets)),
+        BenchmarkCase("game/encoded/decklist", "game", 3000,
+                      _single_game_case(EncodedSimulationEngine, deck, draw_order, max_turn=3, target_cards=multi_targets)),
+        BenchmarkCase("game/object/iono", "game", 1000,
+                      _single_game_case(SimulationEngine, IONO_DECK, IONO_DRAW_ORDER, max_turn=3,
+                                        target_cards=["Charizard EX", "Master Ball"])),
+        BenchmarkCase("game/encoded/iono", "game", 3000,
+                      _single_game_case(EncodedSimulationEngine, IONO_DECK, IONO_DRAW_ORDER, max_turn=3,
+                                        target_cards=["Charizard EX", "Master Ball"])),
+    ]
+
+    for calc_type, calculation_request in CALCULATION_REQUESTS.items():
+        cases.append(BenchmarkCase(f"calc/object/{calc_type}", "calculation", 1000,
+                                   _calculation_case(SimulationEngine, calculation_request)))
+        cases.append(BenchmarkCase(f"calc/encoded/{calc_type}", "calculation", 3000,
+                                   _calculation_case(EncodedSimulationEngine, calculation_request)))
+
+    cases.append(BenchmarkCase("calc/object/evolution", "calculation", 1000, _evolution_calculation_case))
+
+    cases += [
+        BenchmarkCase("calc/math/preferred_opening", "calculation", 500,
+                      _mathematical_case('calculate_preferred_opening_mathematical', deck, draw_order,
+                                         CALCULATION_REQUESTS['preferred_opening']['preferred_basics']), "call"),
+        BenchmarkCase("calc/math/multi_card", "calculation", 500,
+                      _mathematical_case('calculate_multi_card_mathematical', deck, [], multi_targets, 3), "call"),
+        BenchmarkCase("calc/exact/multi_card", "calculation", 1,
+                      _mathematical_case('calculate_multi_card_exact', _galdion_deck(),
+                                         ["Poke Ball", "Professor's Research", "Galdion"], multi_targets, 2), "call"),
+    ]
+
+    cases += [
+        BenchmarkCase("effect/poke_ball", "effect", 3000,
+                      _effect_case(CardEffects.poke_ball, deck, draw_order, build_index=True), "call"),
+        BenchmarkCase("effect/professors_research", "effect", 3000,
+                      _effect_case(CardEffects.professors_research, deck, draw_order), "call"),
+        BenchmarkCase("effect/galdion", "effect", 3000,
+                      _effect_case(CardEffects.galdion, deck, draw_order, build_index=True), "call"),
+        BenchmarkCase("effect/pokemon_communication", "effect", 3000,
+                      _effect_case(CardEffects.pokemon_communication, deck, draw_order, build_index=True), "call"),
+        BenchmarkCase("effect/iono", "effect", 3000,
+                      _effect_case(CardEffects.iono, IONO_DECK, IONO_DRAW_ORDER, prepare=_draw_two), "call"),
+        BenchmarkCase("v3/auto_evolve_all", "v3", 2000, _auto_evolve_case, "call"),
+        BenchmarkCase("v3/use_draw_cards_v3", "v3", 2000,
+                      _v3_case(lambda game_state: use_draw_cards_v3(game_state, EVOLUTION_DRAW_ORDER,
+                                                                    EVOLUTION_TARGETS), turn=2), "call"),
+    ]
+    return cases
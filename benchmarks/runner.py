@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+벤치마크 실행 / baseline 비교
+
+측정 항목 (케이스마다):
+- ops_per_sec: 고정 seed에서 repeats번 측정한 처리량 중 최고값
+- peak_kib: ops번 실행하는 동안 tracemalloc 기준 최대 추가 메모리 (KiB)
+- retained_bytes_per_op: 실행 후에도 남아 있는 메모리 / ops (게임별 누적 할당 감지용)
+
+CPython은 누적 할당 횟수를 제공하지 않으므로 tracemalloc의 최대/잔여 메모리로
+게임당 할당량을 대신 추적합니다. tracemalloc은 실행 속도를 크게 낮추므로
+처리량 측정과 메모리 측정은 별도로 실행합니다.
+"""
+
+import gc
+import json
+import os
+import platform
+import random
+import time
+import tracemalloc
+from typing import Dict, List, Any, Optional
+
+from benchmarks.cases import BenchmarkCase, build_cases
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SEED = 20250612
+DEFAULT_THRESHOLD = 0.25       # 처리량 25% 이상 감소 / 메모리 25% 이상 증가 시 회귀
+PEAK_KIB_SLACK = 64.0          # 작은 메모리 값의 흔들림은 무시 (KiB)
+
+
+def measure_case(case: BenchmarkCase, seed: int = DEFAULT_SEED, repeats: int = 3,
+                 scale: float = 1.0) -> Dict[str, Any]:
+    """케이스 하나의 처리량과 메모리 사용량 측정
+
+    Args:
+        case: 벤치마크 케이스
+        seed: 매 측정 직전에 고정할 난수 seed
+        repeats: 처리량 측정 반복 횟수 (최고값 사용)
+        scale: 케이스 기본 연산 수에 곱할 비율 (빠른 점검용)
+    """
+    ops = max(1, int(case.ops * scale))
+
+    best_time = None
+    for _ in range(repeats):
+        random.seed(seed)
+        run = case.setup(ops)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    random.seed(seed)
+    run = case.setup(ops)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'group': case.group,
+        'unit': case.unit,
+        'ops': ops,
+        'seconds': best_time,
+        'ops_per_sec': ops / best_time if best_time > 0 else float('inf'),
+        'peak_kib': (peak - before) / 1024,
+        'retained_bytes_per_op': max(0, current - before) / ops
+    }
+
+
+def run_benchmarks(name_filter: Optional[str] = None, seed: int = DEFAULT_SEED, repeats: int = 3,
+                   scale: float = 1.0, verbose: bool = True) -> Dict[str, Dict[str, Any]]:
+    """전체(또는 이름에 name_filter가 포함된) 벤치마크 실행
+
+    Returns:
+        {케이스 이름: measure_case 결과}
+    """
+    results = {}
+    for case in build_cases():
+        if name_filter and name_filter not in case.name:
+            continue
+        results[case.name] = measure_case(case, seed, repeats, scale)
+        if verbose:
+            measured = results[case.name]
+            print(f"  {case.name:<40} {measured['ops_per_sec']:>12,.0f} {case.unit}/s"
+                  f"  peak {measured['peak_kib']:>9,.1f} KiB")
+    return results
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    """저장된 baseline 읽기 (없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results: Dict[str, Dict[str, Any]], seed: int = DEFAULT_SEED, path: str = BASELINE_PATH):
+    """측정 결과를 baseline으로 저장 (처리량 / 메모리 값만 기록)"""
+    baseline = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seed': seed,
+        'results': {
+            name: {
+                'ops_per_sec': round(measured['ops_per_sec'], 1),
+                'peak_kib': round(measured['peak_kib'], 1),
+                'retained_bytes_per_op': round(measured['retained_bytes_per_op'], 1)
+            }
+            for name, measured in sorted(results.items())
+        }
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any],
+                        threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """baseline 대비 변화율 계산
+
+    Returns:
+        케이스별 비교 결과 목록 (regression=True면 threshold를 넘는 회귀)
+    """
+    comparisons = []
+    for name, measured in results.items():
+        reference = baseline.get('results', {}).get(name)
+        if reference is None:
+            comparisons.append({'name': name, 'status': 'new', 'regression': False})
+            continue
+
+        speed_change = measured['ops_per_sec'] / reference['ops_per_sec'] - 1
+        peak_change = measured['peak_kib'] - reference['peak_kib']
+        reasons = []
+        if speed_change < -threshold:
+            reasons.append(f"처리량 {speed_change * 100:+.1f}%")
+        if peak_change > max(PEAK_KIB_SLACK, reference['peak_kib'] * threshold):
+            reasons.append(f"최대 메모리 +{peak_change:,.1f} KiB")
+
+        comparisons.append({
+            'name': name,
+            'status': 'regression' if reasons else 'ok',
+            'regression': bool(reasons),
+            'speed_change': speed_change,
+            'peak_kib_change': peak_change,
+            'reasons': reasons
+        })
+    return comparisons
+
+
+def print_comparison(comparisons: List[Dict[str, Any]], threshold: float = DEFAULT_THRESHOLD):
+    """baseline 비교 결과 출력"""
+    print("=" * 60)
+    print(f"baseline 비교 (허용 범위 {threshold * 100:.0f}%)")
+    print("=" * 60)
+    for comparison in comparisons:
+        if comparison['status'] == 'new':
+            print(f"🆕 {comparison['name']}: baseline 없음")
+        elif comparison['regression']:
+            print(f"❌ {comparison['name']}: {', '.join(comparison['reasons'])}")
+        else:
+            print(f"✅ {comparison['name']}: 처리량 {comparison['speed_change'] * 100:+.1f}%")
+
+    regressions = sum(comparison['regression'] for comparison in comparisons)
+    print("=" * 60)
+    print(f"회귀 {regressions}건 / 전체 {len(comparisons)}건")
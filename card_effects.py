@@ -7,16 +7,65 @@ Pokemon Pocket Simulator - 카드 효과 모듈
 """
 
 import random
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from typing import Dict, Any, List, Callable, Optional
 
-# 드로우 효과가 있는 카드들 정의
-DRAW_CARDS = {
-    "Poke Ball": "random_basic_pokemon",
-    "Professor's Research": "draw_2", 
-    "Galdion": "random_type_null_silvally",
-    "Pokemon Communication": "pokemon_exchange",
-    "Iono": "hand_refresh"
-}
+# 드로우 효과가 있는 카드들 (카드 이름 -> 효과 태그)
+# register_effect()가 EFFECT_REGISTRY와 함께 채우므로 직접 수정하지 않습니다.
+DRAW_CARDS: Dict[str, str] = {}
+
+
+@dataclass(frozen=True)
+class EffectSpec:
+    """등록된 카드 효과 하나
+
+    Attributes:
+        card_name: 카드 이름
+        tag: 효과 태그 (DRAW_CARDS 값)
+        handler: handler(game_state) -> use_card_effect 형식의 결과 dict
+        precondition: precondition(game_state) -> bool, False면 카드를 사용하지 않고 손패에 남김
+                      (None이면 항상 사용 가능)
+        encoded: EncodedSimulationEngine에서 같은 효과를 id 기반으로 구현한 메서드 이름
+                 (None이면 인코딩 엔진에서 지원하지 않음). 메서드가 False를 반환하면
+                 precondition 불충족으로 보고 카드를 손패에 남깁니다.
+    """
+    card_name: str
+    tag: str
+    handler: Callable[[Any], Dict[str, Any]]
+    precondition: Optional[Callable[[Any], bool]] = None
+    encoded: Optional[str] = None
+
+
+# 카드 이름 -> EffectSpec
+EFFECT_REGISTRY: Dict[str, EffectSpec] = {}
+
+
+BASIC_TYPES = ("Basic Pokemon",)
+POKEMON_TYPES = ("Basic Pokemon", "Stage1 Pokemon", "Stage2 Pokemon")
+GALDION_TARGETS = ("Type:Null", "Silvally")
+
+
+def _deck_index(game_state, build: bool = True):
+    """게임 상태의 덱 색인 (deck_index가 없는 상태(GameStateV3 등)는 None)
+
+    색인이 있으면 서치 효과는 덱을 훑지 않고 O(1)로 대상 카드를 고르며,
+    통계적으로 불필요한 덱 셔플을 생략합니다 (deck_index 모듈 설명 참고).
+
+    Args:
+        build: False면 아직 만들어지지 않은 색인은 만들지 않고 None 반환
+    """
+    if not build and getattr(game_state, "_deck_index", None) is None:
+        return None
+    return getattr(game_state, "deck_index", None)
+
+
+def _game_rng(game_state):
+    """게임 상태에 지정된 난수 생성기 (없으면 전역 random 모듈)
+
+    공통 난수(CRN) 비교에서는 게임마다 같은 seed의 random.Random을 넣어
+    카드 효과 안의 셔플까지 같은 난수 흐름을 사용하게 합니다.
+    """
+    return getattr(game_state, "rng", None) or random
 
 class CardEffects:
     """카드 효과를 구현하는 클래스"""
@@ -32,16 +81,24 @@ class CardEffects:
         Returns:
             bool: 효과 성공 여부
         """
+        index = _deck_index(game_state)
+        if index is not None:
+            selected_card = index.take_random(_game_rng(game_state), index.kinds_of_types(BASIC_TYPES))
+            if selected_card is None:
+                return False
+            game_state.hand.append(selected_card)
+            return True
+        
         basic_pokemons_in_deck = [card for card in game_state.deck if card.card_type == "Basic Pokemon"]
         
         if not basic_pokemons_in_deck:
-            random.shuffle(game_state.deck)
+            _game_rng(game_state).shuffle(game_state.deck)
             return False
         
-        selected_card = random.choice(basic_pokemons_in_deck)
+        selected_card = _game_rng(game_state).choice(basic_pokemons_in_deck)
         game_state.deck.remove(selected_card)
         game_state.hand.append(selected_card)
-        random.shuffle(game_state.deck)
+        _game_rng(game_state).shuffle(game_state.deck)
         
         return True
     
@@ -70,16 +127,24 @@ class CardEffects:
         Returns:
             bool: 효과 성공 여부
         """
-        target_cards = [card for card in game_state.deck if card.name in ["Type:Null", "Silvally"]]
+        index = _deck_index(game_state)
+        if index is not None:
+            selected_card = index.take_random(_game_rng(game_state), GALDION_TARGETS)
+            if selected_card is None:
+                return False
+            game_state.hand.append(selected_card)
+            return True
+        
+        target_cards = [card for card in game_state.deck if card.name in GALDION_TARGETS]
         
         if not target_cards:
-            random.shuffle(game_state.deck)
+            _game_rng(game_state).shuffle(game_state.deck)
             return False
         
-        selected_card = random.choice(target_cards)
+        selected_card = _game_rng(game_state).choice(target_cards)
         game_state.deck.remove(selected_card)
         game_state.hand.append(selected_card)
-        random.shuffle(game_state.deck)
+        _game_rng(game_state).shuffle(game_state.deck)
         
         return True
     
@@ -96,16 +161,23 @@ class CardEffects:
             Dict: 효과 실행 결과
         """
         # 손패에서 Pokemon 카드들 찾기
-        hand_pokemons = [card for card in game_state.hand if card.card_type in ["Basic Pokemon", "Stage1 Pokemon", "Stage2 Pokemon"]]
+        hand_pokemons = [card for card in game_state.hand if card.card_type in POKEMON_TYPES]
         
         if not hand_pokemons:
             return {"success": False, "description": "손패에 Pokemon이 없습니다", "card_obtained": None}
         
-        # 덱에서 Pokemon 카드들 찾기
-        deck_pokemons = [card for card in game_state.deck if card.card_type in ["Basic Pokemon", "Stage1 Pokemon", "Stage2 Pokemon"]]
+        # 덱에서 Pokemon 카드들 찾기 (색인이 있으면 장수만 확인)
+        index = _deck_index(game_state)
+        if index is not None:
+            pokemon_kinds = index.kinds_of_types(POKEMON_TYPES)
+            has_deck_pokemon = index.count_any(pokemon_kinds) > 0
+        else:
+            deck_pokemons = [card for card in game_state.deck if card.card_type in POKEMON_TYPES]
+            has_deck_pokemon = bool(deck_pokemons)
         
-        if not deck_pokemons:
-            random.shuffle(game_state.deck)
+        if not has_deck_pokemon:
+            if index is None:
+                _game_rng(game_state).shuffle(game_state.deck)
             return {"success": False, "description": "덱에 Pokemon이 없습니다", "card_obtained": None}
         
         # 교환할 손패 Pokemon 선택
@@ -118,17 +190,24 @@ class CardEffects:
             # 자동 선택 (첫 번째 Pokemon)
             sacrifice_card = hand_pokemons[0]
         
-        # 덱에서 랜덤한 Pokemon 선택
-        obtained_card = random.choice(deck_pokemons)
-        
-        # 카드 교환 실행
-        game_state.hand.remove(sacrifice_card)
-        game_state.deck.remove(obtained_card)
-        game_state.hand.append(obtained_card)
-        game_state.deck.append(sacrifice_card)
-        
-        # 덱 셔플
-        random.shuffle(game_state.deck)
+        if index is not None:
+            # 덱에서 랜덤한 Pokemon을 꺼내고, 교환한 Pokemon은 덱의 랜덤한 위치에 넣기 (셔플과 같은 분포)
+            obtained_card = index.take_random(_game_rng(game_state), pokemon_kinds)
+            game_state.hand.remove(sacrifice_card)
+            game_state.hand.append(obtained_card)
+            index.insert_random(_game_rng(game_state), sacrifice_card)
+        else:
+            # 덱에서 랜덤한 Pokemon 선택
+            obtained_card = _game_rng(game_state).choice(deck_pokemons)
+            
+            # 카드 교환 실행
+            game_state.hand.remove(sacrifice_card)
+            game_state.deck.remove(obtained_card)
+            game_state.hand.append(obtained_card)
+            game_state.deck.append(sacrifice_card)
+            
+            # 덱 셔플
+            _game_rng(game_state).shuffle(game_state.deck)
         
         return {
             "success": True, 
@@ -162,11 +241,13 @@ class CardEffects:
         # 손패에서 Iono를 제외한 모든 카드 제거 (Iono는 나중에 메인 시뮬레이터에서 제거됨)
         game_state.hand = [card for card in game_state.hand if card.name == "Iono"]
         
-        # 카드들을 덱에 추가
-        game_state.deck.extend(cards_to_shuffle)
-        
-        # 덱 셔플
-        random.shuffle(game_state.deck)
+        # 카드들을 덱에 추가 후 셔플 (전체 셔플이므로 색인은 이미 있을 때만 갱신)
+        index = _deck_index(game_state, build=False)
+        if index is not None:
+            index.shuffle_in(_game_rng(game_state), cards_to_shuffle)
+        else:
+            game_state.deck.extend(cards_to_shuffle)
+            _game_rng(game_state).shuffle(game_state.deck)
         
         # 해당 장수만큼 다시 드로우
         drawn_cards = game_state.draw_cards(current_hand_size)
@@ -266,13 +347,13 @@ class CardEffects:
             return {"should_use": False, "reason": "이미 target_cards 완성됨"}
         
         # 3. 손패에 Pokemon 존재 여부 체크
-        hand_pokemons = [card for card in game_state.hand if card.card_type in ["Basic Pokemon", "Stage1 Pokemon", "Stage2 Pokemon"]]
+        hand_pokemons = [card for card in game_state.hand if card.card_type in POKEMON_TYPES]
         
         if not hand_pokemons:
             return {"should_use": False, "reason": "손패에 Pokemon이 없음"}
         
         # 4. 덱에 필요한 Pokemon 존재 여부 체크
-        deck_pokemons = [card for card in game_state.deck if card.card_type in ["Basic Pokemon", "Stage1 Pokemon", "Stage2 Pokemon"]]
+        deck_pokemons = [card for card in game_state.deck if card.card_type in POKEMON_TYPES]
         needed_pokemons_in_deck = [card for card in deck_pokemons if card.name in missing_cards]
         
         if not needed_pokemons_in_deck:
@@ -307,7 +388,9 @@ class CardEffects:
     @staticmethod
     def use_card_effect(card_name: str, game_state) -> Dict[str, Any]:
         """
-        카드 효과를 실행하는 메인 함수
+        카드 효과를 실행하는 메인 함수 (EFFECT_REGISTRY 조회)
+        
+        엔진은 덱마다 resolve_effects()로 한 번 조회해 두고 handler를 직접 호출합니다.
         
         Args:
             card_name: 사용할 카드 이름
@@ -316,72 +399,131 @@ class CardEffects:
         Returns:
             Dict: 효과 실행 결과
         """
-        result = {
-            "card_name": card_name,
-            "success": False,
-            "description": ""
-        }
-        
-        if card_name == "Poke Ball":
-            success = CardEffects.poke_ball(game_state)
-            result["success"] = success
-            result["description"] = "Basic Pokemon을 덱에서 손으로" if success else "덱에 Basic Pokemon이 없음"
-        
-        elif card_name == "Professor's Research":
-            drawn_count = CardEffects.professors_research(game_state)
-            result["success"] = drawn_count > 0
-            result["description"] = f"{drawn_count}장 드로우"
-        
-        elif card_name == "Galdion":
-            success = CardEffects.galdion(game_state)
-            result["success"] = success
-            result["description"] = "Type:Null 또는 Silvally를 덱에서 손으로" if success else "덱에 대상 카드가 없음"
-        
-        elif card_name == "Pokemon Communication":
-            # Pokemon Communication은 특별한 로직이 필요하므로 기본 효과만 실행
-            # 실제 사용 여부는 should_use_pokemon_communication에서 판단
-            pc_result = CardEffects.pokemon_communication(game_state)
-            result["success"] = pc_result["success"]
-            result["description"] = pc_result["description"]
-            if "card_sacrificed" in pc_result:
-                result["card_sacrificed"] = pc_result["card_sacrificed"]
-            if "card_obtained" in pc_result:
-                result["card_obtained"] = pc_result["card_obtained"]
-        
-        elif card_name == "Iono":
-            # Iono는 특별한 로직이 필요하므로 기본 효과만 실행
-            # 실제 사용 여부는 should_use_iono에서 판단
-            iono_result = CardEffects.iono(game_state)
-            result["success"] = iono_result["success"]
-            result["description"] = iono_result["description"]
-            if "cards_drawn" in iono_result:
-                result["cards_drawn"] = iono_result["cards_drawn"]
-            if "original_hand_size" in iono_result:
-                result["original_hand_size"] = iono_result["original_hand_size"]
-        
-        else:
-            result["description"] = f"알 수 없는 카드: {card_name}"
-        
-        return result
+        spec = EFFECT_REGISTRY.get(card_name)
+        if spec is None:
+            return _unknown_effect(card_name, game_state)
+        return spec.handler(game_state)
+
+
+# ===================== 효과 등록 =====================
+
+def register_effect(card_name: str, tag: str, precondition: Optional[Callable[[Any], bool]] = None,
+                    encoded: Optional[str] = None):
+    """카드 효과 handler를 등록하는 데코레이터
+
+    handler(game_state)는 {"card_name", "success", "description", ...} 형식의 dict를 반환합니다.
+    같은 카드 이름으로 다시 등록하면 기존 효과를 교체합니다.
+
+    Args:
+        card_name: 카드 이름
+        tag: 효과 태그 (DRAW_CARDS에 기록)
+        precondition: 사용 가능 여부를 판단하는 가벼운 함수 (None이면 항상 사용)
+        encoded: EncodedSimulationEngine의 대응 메서드 이름
+    """
+    def decorator(handler: Callable[[Any], Dict[str, Any]]):
+        EFFECT_REGISTRY[card_name] = EffectSpec(card_name, tag, handler, precondition, encoded)
+        DRAW_CARDS[card_name] = tag
+        return handler
+    return decorator
+
+
+def unregister_effect(card_name: str):
+    """등록된 카드 효과 제거 (없으면 무시)"""
+    EFFECT_REGISTRY.pop(card_name, None)
+    DRAW_CARDS.pop(card_name, None)
+
+
+def _unknown_effect(card_name: str, game_state) -> Dict[str, Any]:
+    """등록되지 않은 카드: 효과 없이 사용 처리"""
+    return {"card_name": card_name, "success": False, "description": f"알 수 없는 카드: {card_name}"}
+
+
+def resolve_effects(card_names: List[str]) -> Dict[str, EffectSpec]:
+    """카드 이름 목록의 효과를 한 번에 조회 (엔진 생성 시 덱마다 1회)
+
+    등록되지 않은 카드는 효과 없이 사용 처리되는 EffectSpec으로 채웁니다
+    (기존 use_card_effect의 "알 수 없는 카드" 동작과 동일).
+
+    Returns:
+        Dict: 카드 이름 -> EffectSpec
+    """
+    resolved = {}
+    for card_name in card_names:
+        spec = EFFECT_REGISTRY.get(card_name)
+        if spec is None:
+            spec = EffectSpec(card_name, "none", lambda game_state, name=card_name: _unknown_effect(name, game_state))
+        resolved[card_name] = spec
+    return resolved
+
+
+# handler 안에서는 CardEffects 메서드를 호출 시점에 조회합니다
+# (profiling.profile_phases가 CardEffects 메서드를 교체해도 측정되도록).
+
+@register_effect("Poke Ball", "random_basic_pokemon", encoded="_poke_ball")
+def _use_poke_ball(game_state) -> Dict[str, Any]:
+    success = CardEffects.poke_ball(game_state)
+    return {
+        "card_name": "Poke Ball",
+        "success": success,
+        "description": "Basic Pokemon을 덱에서 손으로" if success else "덱에 Basic Pokemon이 없음"
+    }
+
+
+@register_effect("Professor's Research", "draw_2", encoded="_professors_research")
+def _use_professors_research(game_state) -> Dict[str, Any]:
+    drawn_count = CardEffects.professors_research(game_state)
+    return {"card_name": "Professor's Research", "success": drawn_count > 0, "description": f"{drawn_count}장 드로우"}
+
+
+@register_effect("Galdion", "random_type_null_silvally", encoded="_galdion")
+def _use_galdion(game_state) -> Dict[str, Any]:
+    success = CardEffects.galdion(game_state)
+    return {
+        "card_name": "Galdion",
+        "success": success,
+        "description": "Type:Null 또는 Silvally를 덱에서 손으로" if success else "덱에 대상 카드가 없음"
+    }
+
+
+@register_effect("Pokemon Communication", "pokemon_exchange", encoded="_pokemon_communication_auto")
+def _use_pokemon_communication(game_state) -> Dict[str, Any]:
+    # 기본 효과만 실행 (실제 사용 여부는 should_use_pokemon_communication에서 판단)
+    pc_result = CardEffects.pokemon_communication(game_state)
+    result = {"card_name": "Pokemon Communication", "success": pc_result["success"],
+              "description": pc_result["description"]}
+    if "card_sacrificed" in pc_result:
+        result["card_sacrificed"] = pc_result["card_sacrificed"]
+    if "card_obtained" in pc_result:
+        result["card_obtained"] = pc_result["card_obtained"]
+    return result
+
+
+@register_effect("Iono", "hand_refresh", encoded="_iono")
+def _use_iono(game_state) -> Dict[str, Any]:
+    # 기본 효과만 실행 (실제 사용 여부는 should_use_iono에서 판단)
+    iono_result = CardEffects.iono(game_state)
+    result = {"card_name": "Iono", "success": iono_result["success"], "description": iono_result["description"]}
+    if "cards_drawn" in iono_result:
+        result["cards_drawn"] = iono_result["cards_drawn"]
+    if "original_hand_size" in iono_result:
+        result["original_hand_size"] = iono_result["original_hand_size"]
+    return result
+
 
 # ===================== 새로운 카드 효과 추가 가이드 =====================
 """
-새로운 카드 효과를 추가하려면:
-
-1. DRAW_CARDS 딕셔너리에 카드 추가:
-   "새카드명": "효과설명"
-
-2. CardEffects 클래스에 새 메서드 추가:
-   @staticmethod
-   def 새카드명_소문자(game_state) -> bool/int:
-       # 효과 구현
-       return result
-
-3. use_card_effect 메서드에 elif 블록 추가:
-   elif card_name == "새카드명":
-       result = CardEffects.새카드명_소문자(game_state)
-       result["success"] = ...
-       result["description"] = ...
+새로운 카드 효과를 추가하려면 handler 함수를 등록하면 됩니다 (분기 추가 불필요):
+
+    @register_effect("새카드명", "효과태그", precondition=사용조건함수)
+    def _use_새카드(game_state) -> Dict[str, Any]:
+        # 효과 구현 (필요하면 CardEffects에 staticmethod로 분리)
+        return {"card_name": "새카드명", "success": ..., "description": ...}
+
+- 등록하면 DRAW_CARDS / is_draw_card()에도 자동 반영됩니다.
+- precondition(game_state)가 False면 엔진은 카드를 사용하지 않고 손패에 남깁니다.
+- 인코딩 엔진에서도 쓰려면 EncodedSimulationEngine에 id 기반 메서드를 만들고
+  encoded="메서드이름"으로 등록합니다. 없으면 인코딩 엔진은 해당 카드를
+  draw_order에 넣었을 때 ValueError를 냅니다.
 
 예시:
 - Red Card: 상대방 손패 1장 버리기 (시뮬레이터에서는 구현 안함)
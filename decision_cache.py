@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - Iono / Pokemon Communication 판단 캐시
+
+CardEffects.should_use_iono / should_use_pokemon_communication와
+SimulationEngine._should_use_iono_for_multi_or_multi는 호출마다 손패 / 덱을 여러 번
+걸러 리스트를 만듭니다. 판단 결과는 "목표 카드와 효과에 관계된 카드의 구성"만으로
+정해지므로, 그 구성을 정규화한 서명(signature)을 키로 결과를 재사용합니다.
+배치 실행에서는 같은 손패 모양이 수없이 반복되므로 대부분의 호출이 캐시 적중입니다.
+
+서명 (판단에 쓰이는 정보만):
+- Iono (multi_card): 목표 카드 목록, 손패(Iono 제외)의 목표 카드별 장수, 손패(Iono 제외) 장수
+- Iono (multi_or_multi): 목표 그룹, 손패(Iono 제외)에 있는 목표 카드 집합
+- Pokemon Communication: 목표 카드 목록, 마지막 턴 여부, 손패 Pokemon 순서(교환 대상 선택이
+  손패 순서를 따름), 손패에 있는 목표 카드 집합, 덱에 남은 "필요한 Pokemon" 장수
+
+캐시된 판단 딕셔너리는 여러 호출이 공유하므로 읽기 전용으로 사용해야 합니다.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from card_effects import POKEMON_TYPES
+
+DEFAULT_DECISION_CACHE_SIZE = 4096
+
+
+class DecisionCache:
+    """크기 제한 LRU 판단 캐시 (적중 / 미스 횟수 집계)"""
+
+    def __init__(self, maxsize: int = DEFAULT_DECISION_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize는 1 이상이어야 합니다.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def lookup(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """key의 판단 결과 반환 (없으면 compute()로 계산해 저장, 가장 오래 쓰지 않은 항목부터 삭제)"""
+        entries = self._entries
+        try:
+            value = entries[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            entries[key] = value
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+            return value
+        entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def clear(self):
+        """저장 항목과 적중 / 미스 횟수 초기화"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """적중 / 미스 횟수, 적중률, 저장 항목 수"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'maxsize': self.maxsize
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def iono_signature(hand, target_cards: Tuple[str, ...]) -> Tuple:
+    """CardEffects.should_use_iono 판단 서명"""
+    names = [card.name for card in hand]
+    hand_size = len(names) - names.count("Iono")
+    return ('iono', target_cards, tuple(sorted(name for name in names if name in target_cards and name != "Iono")), hand_size)
+
+
+def multi_or_multi_signature(hand, group_targets: Tuple[Tuple[str, ...], ...], all_targets: frozenset) -> Tuple:
+    """SimulationEngine._should_use_iono_for_multi_or_multi 판단 서명
+
+    all_targets: 그룹 목표 카드 전체 (Iono 제외)
+    """
+    return ('multi_or_multi', group_targets, all_targets.intersection([card.name for card in hand]))
+
+
+def pokemon_communication_signature(game_state, target_cards: Tuple[str, ...], max_turn: int) -> Tuple:
+    """CardEffects.should_use_pokemon_communication 판단 서명"""
+    if game_state.turn != max_turn:
+        return ('pokemon_communication', target_cards, False)
+    hand = game_state.hand
+    hand_pokemons = tuple(card.name for card in hand if card.card_type in POKEMON_TYPES)
+    targets_in_hand = frozenset(target_cards).intersection([card.name for card in hand])
+    needed_in_deck = 0
+    if hand_pokemons and len(targets_in_hand) < len(set(target_cards)):
+        missing = frozenset(target_cards) - targets_in_hand
+        needed_in_deck = sum(1 for card in game_state.deck if card.name in missing and card.card_type in POKEMON_TYPES)
+    return ('pokemon_communication', target_cards, True, hand_pokemons, targets_in_hand, needed_in_deck)
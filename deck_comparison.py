@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 공통 난수(CRN) 덱 비교 모듈
+
+두 개 이상의 덱/드로우 순서 구성을 "같은 난수 흐름"으로 평가합니다.
+rank_draw_orders는 같은 방식으로 덱의 드로우 카드 발동 순서 전체를 경주(racing)시켜
+신뢰구간상 명백히 뒤처지는 순서를 일찍 제외하고 순위를 매깁니다.
+게임 i마다 하나의 seed를 만들고, 모든 구성이 그 seed로 초기화한
+random.Random으로 게임을 진행합니다 (초기 셔플, 멀리건, 그리고
+CardEffects.poke_ball / galdion / iono / pokemon_communication 내부 셔플까지).
+
+구성 간 차이는 게임별 성공 여부의 차이(paired difference)로 추정하므로,
+독립 실행보다 훨씬 적은 게임 수로 같은 신뢰도에 도달합니다.
+"""
+
+import itertools
+import math
+import random
+import time
+from statistics import NormalDist
+from typing import Dict, List, Any, Optional, Tuple
+
+from accumulators import OutcomeRecorder, counter_for_request
+from card_effects import DRAW_CARDS
+from encoded_engine import EncodedSimulationEngine
+from exact_engine import exact_request_probability
+from parallel_runner import new_root_seed
+from probability_calculator import ProbabilityCalculator
+
+
+def _configuration_name(configuration: Dict[str, Any], index: int) -> str:
+    return configuration.get('name') or f"구성 {index + 1}"
+
+
+def _paired_statistics(baseline: List[Optional[bool]], candidate: List[Optional[bool]]) -> Dict[str, Any]:
+    """두 구성의 게임별 결과로 paired difference와 표준오차 계산
+
+    두 구성 모두 유효한 게임(멀리건 성공)만 짝으로 사용합니다.
+    """
+    paired_games = 0
+    difference_sum = 0
+    difference_square_sum = 0
+    baseline_success = 0
+    candidate_success = 0
+
+    for base_outcome, cand_outcome in zip(baseline, candidate):
+        if base_outcome is None or cand_outcome is None:
+            continue
+        difference = int(cand_outcome) - int(base_outcome)
+        paired_games += 1
+        difference_sum += difference
+        difference_square_sum += difference * difference
+        baseline_success += base_outcome
+        candidate_success += cand_outcome
+
+    if paired_games < 2:
+        return {'paired_games': paired_games, 'difference_percent': 0.0,
+                'standard_error_percent': float('nan'), 'independent_standard_error_percent': float('nan'),
+                'variance_reduction': float('nan')}
+
+    mean_difference = difference_sum / paired_games
+    variance = (difference_square_sum - paired_games * mean_difference ** 2) / (paired_games - 1)
+    standard_error = math.sqrt(max(variance, 0.0) / paired_games)
+
+    # 같은 게임 수를 독립적으로 실행했을 때의 표준오차 (비교 기준)
+    p_base = baseline_success / paired_games
+    p_cand = candidate_success / paired_games
+    independent_error = math.sqrt((p_base * (1 - p_base) + p_cand * (1 - p_cand)) / paired_games)
+    variance_reduction = (independent_error / standard_error) ** 2 if standard_error > 0 else float('inf')
+
+    return {
+        'paired_games': paired_games,
+        'difference_percent': mean_difference * 100,
+        'standard_error_percent': standard_error * 100,
+        'independent_standard_error_percent': independent_error * 100,
+        'variance_reduction': variance_reduction
+    }
+
+
+def compare_configurations(configurations: List[Dict[str, Any]], calculation_request: Dict[str, Any],
+                           num_simulations: int = 10000, seed: int = None,
+                           engine_class=EncodedSimulationEngine, confidence: float = 0.95) -> Dict[str, Any]:
+    """
+    여러 덱/드로우 순서 구성을 공통 난수로 비교
+
+    Args:
+        configurations: [{"name": ..., "deck": deck_input, "draw_order": [...]}, ...]
+            첫 번째 구성이 비교 기준(baseline)
+        calculation_request: 계산 요청 (run_calculation과 같은 형식, 복합 타입 포함)
+        num_simulations: 구성별 게임 수 (모든 구성이 같은 게임 seed를 공유)
+        seed: root seed (None이면 새로 생성하여 결과에 기록)
+        engine_class: 사용할 시뮬레이션 엔진 (모든 구성에 같은 엔진 사용)
+        confidence: 차이의 신뢰구간 수준
+
+    Returns:
+        Dict: 구성별 확률과 baseline 대비 paired difference / 표준오차
+    """
+    if len(configurations) < 2:
+        raise ValueError("비교하려면 구성이 2개 이상 필요합니다.")
+
+    for index, configuration in enumerate(configurations):
+        total_cards = sum(card_info['count'] for card_info in configuration['deck'].values())
+        if total_cards != 20:
+            raise ValueError(f"{_configuration_name(configuration, index)}: 덱은 반드시 20장이어야 합니다. 현재: {total_cards}장")
+
+    if seed is None:
+        seed = new_root_seed()
+
+    calculators = [
+        ProbabilityCalculator(engine_class(configuration['deck'], configuration.get('draw_order', [])))
+        for configuration in configurations
+    ]
+    outcomes: List[List[Optional[bool]]] = [[] for _ in configurations]
+
+    seed_stream = random.Random(seed)
+    game_rng = random.Random()
+    for _ in range(num_simulations):
+        game_seed = seed_stream.getrandbits(64)
+        for calculator, config_outcomes in zip(calculators, outcomes):
+            game_rng.seed(game_seed)
+            config_outcomes.append(calculator.evaluate_game(calculation_request, game_rng))
+
+    z_value = NormalDist().inv_cdf(0.5 + confidence / 2)
+    configuration_results = []
+    for index, (configuration, config_outcomes) in enumerate(zip(configurations, outcomes)):
+        valid = [outcome for outcome in config_outcomes if outcome is not None]
+        success_count = sum(valid)
+        configuration_results.append({
+            'name': _configuration_name(configuration, index),
+            'draw_order': configuration.get('draw_order', []),
+            'success_count': success_count,
+            'total_valid_games': len(valid),
+            'probability_percent': (success_count / len(valid)) * 100 if valid else 0.0
+        })
+
+    comparisons = []
+    for index in range(1, len(configurations)):
+        stats = _paired_statistics(outcomes[0], outcomes[index])
+        margin = z_value * stats['standard_error_percent']
+        stats.update({
+            'baseline': configuration_results[0]['name'],
+            'candidate': configuration_results[index]['name'],
+            'confidence_interval': (stats['difference_percent'] - margin, stats['difference_percent'] + margin)
+        })
+        comparisons.append(stats)
+
+    return {
+        'calculation_type': calculation_request.get('type'),
+        'simulation_count': num_simulations,
+        'seed': seed,
+        'confidence': confidence,
+        'configurations': configuration_results,
+        'comparisons': comparisons
+    }
+
+
+def print_comparison_result(result: Dict[str, Any]):
+    """공통 난수 비교 결과 출력"""
+    print("\n" + "=" * 60)
+    print("⚖️ 공통 난수(CRN) 구성 비교 결과")
+    print("=" * 60)
+    print(f"계산 타입: {result['calculation_type']} / 구성별 {result['simulation_count']:,}게임 / seed: {result['seed']}")
+
+    print("\n📊 구성별 확률:")
+    for config in result['configurations']:
+        print(f"  • {config['name']}: {config['probability_percent']:.2f}% "
+              f"({config['success_count']:,}/{config['total_valid_games']:,})")
+
+    confidence_label = f"{result['confidence'] * 100:.0f}%"
+    print(f"\n📈 기준 대비 차이 (paired, {confidence_label} 신뢰구간):")
+    for comparison in result['comparisons']:
+        low, high = comparison['confidence_interval']
+        print(f"  • {comparison['candidate']} - {comparison['baseline']}: "
+              f"{comparison['difference_percent']:+.2f}%p ± {comparison['standard_error_percent']:.2f}%p "
+              f"[{low:+.2f}, {high:+.2f}]")
+        print(f"    독립 실행 시 표준오차: {comparison['independent_standard_error_percent']:.2f}%p "
+              f"(분산 감소 {comparison['variance_reduction']:.1f}배, 짝지은 게임 {comparison['paired_games']:,})")
+
+
+# ===================== 드로우 순서 최적화 =====================
+
+def effective_draw_order(draw_order: List[str]) -> Tuple[str, ...]:
+    """게임 진행에 영향을 주는 발동 순서 (Pokemon Communication은 항상 마지막 턴 2단계에서 평가되므로 제외)"""
+    return tuple(card_name for card_name in draw_order if card_name != "Pokemon Communication")
+
+
+def candidate_draw_orders(deck_input: Dict[str, Dict[str, Any]],
+                          draw_cards: Optional[List[str]] = None) -> List[List[str]]:
+    """덱의 드로우 카드 순열 중 게임 진행이 서로 다른 순서만 (첫 등장 순서 유지)"""
+    if draw_cards is None:
+        draw_cards = [card_name for card_name in deck_input if card_name in DRAW_CARDS]
+    orders = {}
+    for permutation in itertools.permutations(draw_cards):
+        orders.setdefault(effective_draw_order(permutation), list(permutation))
+    return list(orders.values())
+
+
+def _outcome_summary(outcomes: List[Optional[bool]]) -> Tuple[int, int]:
+    valid = [outcome for outcome in outcomes if outcome is not None]
+    return sum(valid), len(valid)
+
+
+def rank_draw_orders(deck_input: Dict[str, Dict[str, Any]], calculation_request: Dict[str, Any],
+                     draw_cards: Optional[List[str]] = None, max_games: int = 10000, round_games: int = 1000,
+                     min_games: int = 2000, confidence: float = 0.99, seed: int = None) -> Dict[str, Any]:
+    """
+    드로우 카드 발동 순서 순위 (공통 난수 + 신뢰구간 기반 조기 제외)
+
+    모든 순서가 게임 i마다 같은 seed로 진행하며, round_games씩 게임을 추가할 때마다
+    현재 1위 순서와의 paired difference 신뢰구간 상한이 0보다 작은 순서(명백히 뒤처짐)를
+    제외합니다. 남은 순서가 하나가 되거나 max_games에 도달하면 종료합니다.
+    정확 계산이 가능한 요청이면 순서마다 정확값으로 바로 순위를 매깁니다.
+
+    Args:
+        deck_input: 덱 구성 정보
+        calculation_request: 계산 요청 (복합 타입 포함)
+        draw_cards: 순서를 정할 드로우 카드 (None이면 덱의 모든 드로우 카드)
+        max_games: 순서별 최대 게임 수
+        round_games: 한 라운드에 추가하는 게임 수
+        min_games: 제외 판정을 시작하는 최소 게임 수
+        confidence: 제외 판정 신뢰수준 (단측)
+        seed: root seed (None이면 새로 생성하여 결과에 기록)
+
+    Returns:
+        Dict: 'ranking' (순위순 [{'draw_order', 'probability_percent', 'games', 'pruned_after', ...}]) 외 통계
+    """
+    if seed is None:
+        seed = new_root_seed()
+    orders = candidate_draw_orders(deck_input, draw_cards)
+    start_time = time.perf_counter()
+
+    exact = [exact_request_probability(deck_input, order, calculation_request) for order in orders]
+    if all(probability is not None for probability in exact):
+        entries = [{'draw_order': order, 'probability_percent': probability * 100, 'games': 0,
+                    'pruned_after': None, 'difference_percent': 0.0, 'standard_error_percent': 0.0}
+                   for order, probability in zip(orders, exact)]
+        entries.sort(key=lambda entry: -entry['probability_percent'])
+        for entry in entries:
+            entry['difference_percent'] = entry['probability_percent'] - entries[0]['probability_percent']
+        return {'calculation_type': calculation_request.get('type'), 'method': 'exact', 'seed': seed,
+                'candidate_orders': len(orders), 'total_games': 0, 'confidence': confidence,
+                'ranking': entries, 'execution_time': time.perf_counter() - start_time}
+
+    engines = [EncodedSimulationEngine(deck_input, order) for order in orders]
+    game_kwargs = ProbabilityCalculator(engines[0])._game_kwargs(calculation_request)
+    outcomes: List[List[Optional[bool]]] = [[] for _ in orders]
+    pruned_after: List[Optional[int]] = [None] * len(orders)
+    alive = list(range(len(orders)))
+    z_value = NormalDist().inv_cdf(confidence)
+    seed_stream = random.Random(seed)
+    games = 0
+    total_games = 0
+
+    while games < max_games and len(alive) > 1:
+        round_size = min(round_games, max_games - games)
+        game_seeds = [seed_stream.getrandbits(64) for _ in range(round_size)]
+        for index in alive:
+            recorder = OutcomeRecorder(counter_for_request(calculation_request, engines[index].card_table))
+            engines[index].run_stream(recorder, round_size, game_seeds=game_seeds, **game_kwargs)
+            outcomes[index].extend(recorder.outcomes)
+        games += round_size
+        total_games += round_size * len(alive)
+
+        if games < min_games:
+            continue
+        leader = max(alive, key=lambda index: _outcome_summary(outcomes[index])[0])
+        for index in alive:
+            if index == leader:
+                continue
+            stats = _paired_statistics(outcomes[leader], outcomes[index])
+            if stats['difference_percent'] + z_value * stats['standard_error_percent'] < 0:
+                pruned_after[index] = games
+        alive = [index for index in alive if pruned_after[index] is None]
+
+    # 남은 순서는 끝까지, 제외된 순서는 오래 살아남은 순서부터
+    best = max(alive, key=lambda index: _outcome_summary(outcomes[index])[0])
+    entries = []
+    for index, order in enumerate(orders):
+        success_count, total_valid_games = _outcome_summary(outcomes[index])
+        stats = _paired_statistics(outcomes[best], outcomes[index]) if index != best else \
+            {'difference_percent': 0.0, 'standard_error_percent': 0.0}
+        entries.append({
+            'draw_order': order,
+            'probability_percent': (success_count / total_valid_games) * 100 if total_valid_games else 0.0,
+            'success_count': success_count,
+            'total_valid_games': total_valid_games,
+            'games': len(outcomes[index]),
+            'pruned_after': pruned_after[index],
+            'difference_percent': stats['difference_percent'],
+            'standard_error_percent': stats['standard_error_percent']
+        })
+    entries.sort(key=lambda entry: (entry['pruned_after'] is not None, -(entry['pruned_after'] or 0),
+                                    -entry['probability_percent']))
+
+    return {
+        'calculation_type': calculation_request.get('type'),
+        'method': 'racing',
+        'seed': seed,
+        'candidate_orders': len(orders),
+        'total_games': total_games,
+        'unpruned_games': len(orders) * max_games,
+        'confidence': confidence,
+        'ranking': entries,
+        'execution_time': time.perf_counter() - start_time
+    }
+
+
+def print_draw_order_ranking(result: Dict[str, Any], top: int = 10):
+    """드로우 순서 순위 출력"""
+    print("\n" + "=" * 60)
+    print(f"🔀 드로우 순서 순위 ({result['calculation_type']}, {result['method']}, seed: {result['seed']})")
+    print("=" * 60)
+    if result['method'] == 'racing':
+        print(f"후보 순서 {result['candidate_orders']}개, 게임 {result['total_games']:,}회 "
+              f"(제외 없이 실행 시 {result['unpruned_games']:,}회), {result['execution_time']:.1f}초")
+    else:
+        print(f"후보 순서 {result['candidate_orders']}개, Markov 연쇄 정확값, {result['execution_time']:.1f}초")
+
+    for rank, entry in enumerate(result['ranking'][:top], 1):
+        status = f"{entry['pruned_after']:,}게임 후 제외" if entry['pruned_after'] else f"{entry['games']:,}게임"
+        print(f"  {rank}. {' → '.join(entry['draw_order'])}: {entry['probability_percent']:.2f}% "
+              f"({entry['difference_percent']:+.2f}%p ± {entry['standard_error_percent']:.2f}, {status})")
+    if len(result['ranking']) > top:
+        print(f"  ... 외 {len(result['ranking']) - top}개")
+    print("=" * 60)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 덱 색인 모듈
+
+Poke Ball / Galdion / Pokemon Communication은 덱 전체를 훑어 대상 카드 목록을 만들고,
+list.remove(또 한 번의 선형 탐색)와 덱 셔플을 수행합니다. DeckIndex는 덱 리스트와
+함께 "카드 종류별 장수"와 "종류 키 리스트"를 유지해 대상 카드 1장을 난수 1회로
+균등 선택하고, 덱 맨 아래 카드와 자리를 바꿔(swap-remove) 탐색 없이 제거합니다.
+
+- 종류 선택: randrange(대상 장수 합계) 1회로 (종류, 그 종류 안에서 몇 번째 카드) 결정
+- 위치 찾기: 키 리스트의 list.index (C 구현, 같은 종류 장수만큼만 호출)
+- 덱에 카드 1장 넣기(Pokemon Communication): 맨 아래에 넣고 임의 위치와 교환
+
+셔플 생략 근거:
+게임 진행 중 판단 로직은 덱의 "구성"만 보고 순서는 보지 않으며, 덱은 항상 구성이
+주어졌을 때 균등한 순열입니다. 균등 순열에서 대상 카드를 균등 선택해 swap-remove한
+결과도 (남은 구성의) 균등 순열이고, 맨 아래에 넣은 카드를 균등한 위치와 교환하는 것은
+Fisher-Yates 한 단계이므로 역시 균등 순열입니다. 따라서 서치 후 / 서치 실패 시의
+전체 셔플은 통계적으로 불필요합니다 (Iono처럼 손패를 덱에 섞는 경우는 셔플 유지).
+
+카드 종류(kind)는 기준 엔진에서는 카드 이름, 인코딩 엔진에서는 카드 id(덱 리스트가
+곧 키 리스트)입니다. 두 엔진은 같은 순서의 종류 목록과 같은 연산을 사용하므로
+같은 난수 흐름에서 같은 덱 순서를 만듭니다.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+
+class DeckIndex:
+    """덱 리스트의 종류별 장수 색인
+
+    덱 리스트는 외부(GameState.deck)와 공유하며, 색인이 붙어 있는 동안 덱 변경은
+    pop_top / take_random / insert_random / shuffle_in으로만 해야 합니다.
+    """
+
+    def __init__(self, deck: List[Any], kind_types: Dict[Hashable, str],
+                 key_of: Optional[Callable[[Any], Hashable]] = None):
+        """
+        Args:
+            deck: 덱 리스트 (맨 앞이 덱 맨 위)
+            kind_types: 종류 -> 카드 타입 (삽입 순서가 대상 종류 순서)
+            key_of: 카드 -> 종류 (None이면 카드 자체가 종류, 덱 리스트를 키 리스트로 사용)
+        """
+        self.kind_types = kind_types
+        self.key_of = key_of
+        self._types_cache: Dict[Tuple[str, ...], Tuple[Hashable, ...]] = {}
+        self.rebuild(deck)
+
+    def rebuild(self, deck: Optional[List[Any]] = None):
+        """덱 리스트 전체로 색인 재구성 (O(덱 크기))"""
+        if deck is not None:
+            self.deck = deck
+        if self.key_of is None:
+            self.keys = self.deck
+        else:
+            self.keys = [self.key_of(card) for card in self.deck]
+        # 덱 구성의 모든 종류를 0장으로 미리 등록 (게임 중 카드가 돌아와도 딕셔너리 항목 추가 없음)
+        counts: Dict[Hashable, int] = dict.fromkeys(self.kind_types, 0)
+        for kind in self.keys:
+            counts[kind] = counts.get(kind, 0) + 1
+        self.counts = counts
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    # ==================== 조회 ====================
+
+    def kinds_of_types(self, card_types: Tuple[str, ...]) -> Tuple[Hashable, ...]:
+        """카드 타입이 card_types에 속하는 종류 (kind_types 순서)"""
+        kinds = self._types_cache.get(card_types)
+        if kinds is None:
+            kinds = tuple(kind for kind, card_type in self.kind_types.items() if card_type in card_types)
+            self._types_cache[card_types] = kinds
+        return kinds
+
+    def count(self, kind: Hashable) -> int:
+        """덱에 있는 kind 카드 장수"""
+        return self.counts.get(kind, 0)
+
+    def count_any(self, kinds: Iterable[Hashable]) -> int:
+        """덱에 있는 kinds 카드 장수 합계"""
+        counts = self.counts
+        return sum(counts.get(kind, 0) for kind in kinds)
+
+    # ==================== 덱 변경 ====================
+
+    def pop_top(self) -> Any:
+        """덱 맨 위 카드 1장 제거 후 반환"""
+        card = self.deck.pop(0)
+        keys = self.keys
+        kind = keys.pop(0) if keys is not self.deck else card
+        self.counts[kind] -= 1
+        return card
+
+    def take_random(self, rng, kinds: Sequence[Hashable]) -> Any:
+        """kinds에 속하는 카드 중 1장을 균등하게 골라 덱에서 제거 후 반환 (없으면 None)
+
+        난수는 rng.randrange 1회만 사용합니다.
+        """
+        counts = self.counts
+        total = 0
+        for kind in kinds:
+            total += counts.get(kind, 0)
+        if total == 0:
+            return None
+
+        pick = rng.randrange(total)
+        for kind in kinds:
+            kind_count = counts.get(kind, 0)
+            if pick < kind_count:
+                break
+            pick -= kind_count
+
+        # 덱 위에서부터 pick번째(0부터) kind 카드 위치
+        keys = self.keys
+        index = keys.index(kind)
+        for _ in range(pick):
+            index = keys.index(kind, index + 1)
+
+        deck = self.deck
+        card = deck[index]
+        last = deck.pop()
+        if keys is not deck:
+            last_kind = keys.pop()
+            if index < len(deck):
+                keys[index] = last_kind
+        if index < len(deck):
+            deck[index] = last
+        counts[kind] -= 1
+        return card
+
+    def _append(self, card: Any) -> Hashable:
+        self.deck.append(card)
+        if self.keys is self.deck:
+            kind = card
+        else:
+            kind = self.key_of(card)
+            self.keys.append(kind)
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        return kind
+
+    def insert_random(self, rng, card: Any):
+        """카드 1장을 덱의 균등한 위치에 넣기 (맨 아래에 추가 후 임의 위치와 교환)
+
+        난수는 rng.randrange 1회만 사용합니다.
+        """
+        self._append(card)
+        deck = self.deck
+        keys = self.keys
+        last_index = len(deck) - 1
+        index = rng.randrange(last_index + 1)
+        if index != last_index:
+            deck[index], deck[last_index] = deck[last_index], deck[index]
+            if keys is not deck:
+                keys[index], keys[last_index] = keys[last_index], keys[index]
+
+    def shuffle_in(self, rng, cards: Iterable[Any] = ()):
+        """cards를 덱 맨 아래에 넣고 덱 전체 셔플 후 색인 재구성"""
+        self.deck.extend(cards)
+        rng.shuffle(self.deck)
+        self.rebuild()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 덱 리스트 최적화 (로컬 탐색)
+
+카드 풀 / 고정 카드 / 목적 함수(계산 요청 하나 또는 가중합)를 받아, 합법적인 20장 덱
+(같은 카드 최대 2장) 공간에서 1장 교체(1-for-1 swap) 이웃을 탐색합니다.
+
+- hill_climb: 모든 교체 이웃을 평가해 가장 좋은 이웃으로 이동, 개선이 없으면 종료
+- anneal: 매 단계 무작위 이웃 batch를 평가해 가장 좋은 이웃을 Metropolis 기준으로 수락
+
+후보 평가:
+- 정확 계산이 가능한 요청(시작 손패, 정확 계산 가능한 덱의 multi_card)은 Markov 연쇄 정확값
+- 나머지는 EncodedSimulationEngine.run_stream 시뮬레이션
+- 모든 후보가 요청별로 같은 게임별 seed 목록(공통 난수)을 사용하므로 후보 간 비교의 잡음이 작음
+  (게임 i는 덱마다 난수 사용량이 달라도 항상 같은 난수 흐름에서 시작)
+- 같은 덱 구성은 한 번만 평가 (평가 결과 캐시)
+- workers > 1이면 이웃 평가를 프로세스 풀에 나누어 실행
+
+    optimizer = DeckOptimizer(card_pool, objective, fixed_cards=fixed, draw_order=order, seed=1)
+    result = optimizer.optimize(method="anneal", max_steps=200, workers=4)
+    print_optimization_result(result)
+"""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from encoded_engine import EncodedSimulationEngine, CardTable
+from exact_engine import exact_request_probability
+from accumulators import counter_for_request
+from parallel_runner import derive_seed, new_root_seed
+from probability_calculator import ProbabilityCalculator
+
+DECK_SIZE = 20
+MAX_COPIES = 2
+OPTIMIZATION_METHODS = ("hill_climb", "anneal")
+
+Composition = Tuple[int, ...]
+Swap = Tuple[str, str]
+
+
+def normalize_objective(objective: Any) -> List[Dict[str, Any]]:
+    """목적 함수를 [{"name", "weight", "request"}] 목록으로 정규화
+
+    Args:
+        objective: 계산 요청 하나 또는 [{"request", "weight"(기본 1.0), "name"(선택)}] 목록
+    """
+    if isinstance(objective, dict):
+        objective = [{'request': objective}]
+    terms = []
+    for index, term in enumerate(objective):
+        request = term['request']
+        if request.get('type') == 'card_curves':
+            raise ValueError("card_curves는 확률 하나를 내지 않으므로 목적 함수로 사용할 수 없습니다.")
+        terms.append({
+            'name': term.get('name') or f"{request.get('type')} #{index + 1}",
+            'weight': float(term.get('weight', 1.0)),
+            'request': request
+        })
+    if not terms:
+        raise ValueError("목적 함수에 계산 요청이 1개 이상 필요합니다.")
+    return terms
+
+
+def evaluate_deck(deck_input: Dict[str, Dict[str, Any]], draw_order: List[str], objective: List[Dict[str, Any]],
+                  num_games: int, seed: int) -> Dict[str, Any]:
+    """덱 하나의 목적 함수 값 (워커 프로세스에서도 호출)
+
+    Returns:
+        {'score': 가중합(%), 'components': {항목 이름: 확률(%)}, 'simulated_games': 시뮬레이션한 게임 수}
+    """
+    engine = None
+    components = {}
+    simulated_games = 0
+    score = 0.0
+    for index, term in enumerate(objective):
+        probability = exact_request_probability(deck_input, draw_order, term['request'])
+        if probability is None:
+            if engine is None:
+                engine = EncodedSimulationEngine(deck_input, draw_order)
+                game_kwargs = ProbabilityCalculator(engine)._game_kwargs
+            # 공통 난수: 모든 후보 덱이 요청별로 같은 게임별 seed 목록 사용 (전역 random 모듈은 건드리지 않음)
+            seed_stream = random.Random(derive_seed(seed, index))
+            game_seeds = [seed_stream.getrandbits(64) for _ in range(num_games)]
+            counter = counter_for_request(term['request'], engine.card_table)
+            engine.run_stream(counter, num_games, game_seeds=game_seeds, **game_kwargs(term['request']))
+            success_count, total_valid_games = counter.success_count, counter.total_valid_games
+            probability = success_count / total_valid_games if total_valid_games else 0.0
+            simulated_games += num_games
+        components[term['name']] = probability * 100
+        score += term['weight'] * probability * 100
+    return {'score': score, 'components': components, 'simulated_games': simulated_games}
+
+
+def _evaluate_task(task: Tuple) -> Dict[str, Any]:
+    """프로세스 풀 작업 단위 (pickle 가능한 최상위 함수)"""
+    return evaluate_deck(*task)
+
+
+class DeckOptimizer:
+    """1장 교체 로컬 탐색 덱 최적화기"""
+
+    def __init__(self, card_pool: Dict[str, Dict[str, Any]], objective: Any,
+                 fixed_cards: Dict[str, Dict[str, Any]] = None, draw_order: List[str] = None,
+                 num_games: int = 2000, seed: int = None):
+        """
+        Args:
+            card_pool: 후보 카드 {카드명: {"type", "count"(최대 장수, 기본 2)}}
+            objective: 계산 요청 하나 또는 [{"request", "weight", "name"}] 가중합
+            fixed_cards: 반드시 넣을 카드 {카드명: {"type", "count"(최소 장수)}}
+            draw_order: 드로우 카드 발동 순서 (덱에 없는 카드는 무시)
+            num_games: 시뮬레이션 요청의 후보당 게임 수
+            seed: 공통 난수 root seed (None이면 새로 생성하여 결과에 기록)
+        """
+        self.fixed_cards = dict(fixed_cards or {})
+        self.draw_order = list(draw_order or [])
+        self.num_games = num_games
+        self.seed = new_root_seed() if seed is None else seed
+        self.objective = normalize_objective(objective)
+
+        # 카드 순서 고정 (덱 생성 순서가 같아야 공통 난수 효과가 큼)
+        self.card_names: List[str] = []
+        self.card_types: List[str] = []
+        self.min_counts: List[int] = []
+        self.max_counts: List[int] = []
+        for card_name, card_info in list(self.fixed_cards.items()) + list(card_pool.items()):
+            if card_name in self.card_names:
+                index = self.card_names.index(card_name)
+                self.max_counts[index] = min(MAX_COPIES, max(self.max_counts[index], card_info.get('count', MAX_COPIES)))
+                continue
+            fixed = card_name in self.fixed_cards
+            self.card_names.append(card_name)
+            self.card_types.append(card_info['type'])
+            self.min_counts.append(card_info['count'] if fixed else 0)
+            self.max_counts.append(min(MAX_COPIES, card_info['count'] if fixed else card_info.get('count', MAX_COPIES)))
+
+        for card_name, minimum, maximum in zip(self.card_names, self.min_counts, self.max_counts):
+            if minimum > maximum:
+                raise ValueError(f"'{card_name}' 고정 장수 {minimum}장이 최대 {maximum}장을 넘습니다.")
+        if sum(self.min_counts) > DECK_SIZE:
+            raise ValueError(f"고정 카드가 {sum(self.min_counts)}장으로 덱 크기 {DECK_SIZE}장을 넘습니다.")
+        if sum(self.max_counts) < DECK_SIZE:
+            raise ValueError(f"카드 풀로 만들 수 있는 최대 장수가 {sum(self.max_counts)}장으로 {DECK_SIZE}장보다 적습니다.")
+
+        # 목적 함수의 요청이 집계 가능한 타입인지 미리 확인
+        table = CardTable({name: {'type': card_type, 'count': 1} for name, card_type in zip(self.card_names, self.card_types)})
+        for term in self.objective:
+            counter_for_request(term['request'], table)
+
+        self._scores: Dict[Composition, Dict[str, Any]] = {}
+        self.evaluations = 0
+        self.cache_hits = 0
+        self.simulated_games = 0
+
+    # ===== 덱 구성 =====
+
+    def deck_input(self, composition: Composition) -> Dict[str, Dict[str, Any]]:
+        """장수 벡터를 덱 입력 형식으로 변환 (0장 카드 제외, 카드 순서 고정)"""
+        return {name: {'type': card_type, 'count': count}
+                for name, card_type, count in zip(self.card_names, self.card_types, composition) if count > 0}
+
+    def composition_of(self, deck_input: Dict[str, Dict[str, Any]]) -> Composition:
+        """덱 입력을 장수 벡터로 변환 (고정 카드 / 풀 / 장수 / 20장 제약 검증)"""
+        unknown = [name for name in deck_input if name not in self.card_names]
+        if unknown:
+            raise ValueError(f"카드 풀에 없는 카드입니다: {', '.join(unknown)}")
+        composition = tuple(deck_input[name]['count'] if name in deck_input else 0 for name in self.card_names)
+        if not self.is_legal(composition):
+            raise ValueError("시작 덱이 20장 / 최대 2장 / 고정 카드 조건을 만족하지 않습니다.")
+        return composition
+
+    def is_legal(self, composition: Composition) -> bool:
+        return (sum(composition) == DECK_SIZE
+                and all(low <= count <= high for count, low, high in zip(composition, self.min_counts, self.max_counts)))
+
+    def initial_composition(self) -> Composition:
+        """고정 카드 + 카드 풀 순서대로 채운 시작 덱"""
+        composition = list(self.min_counts)
+        for index, maximum in enumerate(self.max_counts):
+            added = min(maximum - composition[index], DECK_SIZE - sum(composition))
+            composition[index] += added
+        return tuple(composition)
+
+    def neighbors(self, composition: Composition) -> List[Tuple[Swap, Composition]]:
+        """1장 교체 이웃 목록 ((빼는 카드, 넣는 카드), 장수 벡터)"""
+        removable = [index for index, count in enumerate(composition) if count > self.min_counts[index]]
+        addable = [index for index, count in enumerate(composition) if count < self.max_counts[index]]
+        result = []
+        for out_index in removable:
+            for in_index in addable:
+                if out_index == in_index:
+                    continue
+                counts = list(composition)
+                counts[out_index] -= 1
+                counts[in_index] += 1
+                result.append(((self.card_names[out_index], self.card_names[in_index]), tuple(counts)))
+        return result
+
+    # ===== 평가 =====
+
+    def evaluate_many(self, compositions: List[Composition], executor: Optional[ProcessPoolExecutor] = None,
+                      workers: int = 1) -> List[Dict[str, Any]]:
+        """여러 후보 평가 (캐시에 없는 구성만 계산, executor가 있으면 workers개 프로세스로 병렬)"""
+        pending = list(dict.fromkeys(composition for composition in compositions if composition not in self._scores))
+        self.cache_hits += len(compositions) - len(pending)
+        tasks = [(self.deck_input(composition), self.draw_order, self.objective, self.num_games, self.seed)
+                 for composition in pending]
+        if executor is not None and len(tasks) > 1:
+            chunksize = max(1, len(tasks) // (workers * 4))
+            evaluations = list(executor.map(_evaluate_task, tasks, chunksize=chunksize))
+        else:
+            evaluations = [_evaluate_task(task) for task in tasks]
+
+        for composition, evaluation in zip(pending, evaluations):
+            self._scores[composition] = evaluation
+            self.simulated_games += evaluation['simulated_games']
+        self.evaluations += len(pending)
+        return [self._scores[composition] for composition in compositions]
+
+    # ===== 탐색 =====
+
+    def optimize(self, initial_deck: Dict[str, Dict[str, Any]] = None, method: str = "hill_climb",
+                 max_steps: int = 100, workers: int = 1, batch_size: int = None,
+                 initial_temperature: float = 2.0, final_temperature: float = 0.05,
+                 verbose: bool = True) -> Dict[str, Any]:
+        """
+        로컬 탐색 실행
+
+        Args:
+            initial_deck: 시작 덱 (None이면 고정 카드 + 카드 풀 순서대로 채움)
+            method: "hill_climb" 또는 "anneal"
+            max_steps: 최대 이동 단계 수
+            workers: 후보 평가 프로세스 수
+            batch_size: anneal 단계별 평가할 무작위 이웃 수 (기본: max(4, workers))
+            initial_temperature / final_temperature: anneal 온도 (목적 함수 %p 단위, 기하 감소)
+            verbose: 단계별 진행 출력
+
+        Returns:
+            Dict: 최적 덱 / 점수 / 항목별 확률 / 탐색 기록 / 평가 통계
+        """
+        if method not in OPTIMIZATION_METHODS:
+            raise ValueError(f"지원하지 않는 최적화 방법입니다: {method} (지원: {', '.join(OPTIMIZATION_METHODS)})")
+
+        current = self.composition_of(initial_deck) if initial_deck is not None else self.initial_composition()
+        search_rng = random.Random(derive_seed(self.seed, "search"))
+        batch_size = batch_size or max(4, workers)
+        start_time = time.perf_counter()
+
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            current_score = self.evaluate_many([current], executor, workers)[0]['score']
+            initial_score = current_score
+            best, best_score = current, current_score
+            history = [{'step': 0, 'swap': None, 'score': current_score}]
+            if verbose:
+                print(f"🧬 덱 최적화 시작 ({method}, seed={self.seed}): 시작 점수 {current_score:.2f}")
+
+            for step in range(1, max_steps + 1):
+                neighbors = self.neighbors(current)
+                if not neighbors:
+                    break
+
+                if method == "hill_climb":
+                    scores = self.evaluate_many([composition for _, composition in neighbors], executor, workers)
+                    index = max(range(len(neighbors)), key=lambda i: scores[i]['score'])
+                    if scores[index]['score'] <= current_score:
+                        if verbose:
+                            print(f"  {step}단계: 개선되는 교체 없음 → 종료")
+                        break
+                    accepted = True
+                else:
+                    sample = search_rng.sample(neighbors, min(batch_size, len(neighbors)))
+                    scores = self.evaluate_many([composition for _, composition in sample], executor, workers)
+                    index = max(range(len(sample)), key=lambda i: scores[i]['score'])
+                    neighbors = sample
+                    progress = (step - 1) / max(1, max_steps - 1)
+                    temperature = initial_temperature * (final_temperature / initial_temperature) ** progress
+                    delta = scores[index]['score'] - current_score
+                    accepted = delta >= 0 or search_rng.random() < math.exp(delta / temperature)
+
+                if accepted:
+                    swap, current = neighbors[index]
+                    current_score = scores[index]['score']
+                    history.append({'step': step, 'swap': swap, 'score': current_score})
+                    if verbose:
+                        print(f"  {step}단계: -{swap[0]} +{swap[1]} → {current_score:.2f}")
+                    if current_score > best_score:
+                        best, best_score = current, current_score
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        elapsed = time.perf_counter() - start_time
+        best_evaluation = self._scores[best]
+        return {
+            'method': method,
+            'seed': self.seed,
+            'deck': self.deck_input(best),
+            'draw_order': self.draw_order,
+            'score': best_score,
+            'initial_score': initial_score,
+            'components': best_evaluation['components'],
+            'objective': self.objective,
+            'history': history,
+            'evaluations': self.evaluations,
+            'cache_hits': self.cache_hits,
+            'simulated_games': self.simulated_games,
+            'workers': workers,
+            'execution_time': elapsed,
+            'evaluations_per_minute': self.evaluations / elapsed * 60 if elapsed > 0 else float('inf')
+        }
+
+
+def print_optimization_result(result: Dict[str, Any]):
+    """덱 최적화 결과 출력"""
+    print("\n" + "=" * 60)
+    print(f"🧬 덱 최적화 결과 ({result['method']}, seed: {result['seed']})")
+    print("=" * 60)
+    print(f"점수: {result['initial_score']:.2f} → {result['score']:.2f} (이동 {len(result['history']) - 1}회)")
+    for name, probability in result['components'].items():
+        print(f"  • {name}: {probability:.2f}%")
+
+    print("\n📋 최적 덱:")
+    for card_name, card_info in result['deck'].items():
+        print(f"  {card_name} ({card_info['type']}) x{card_info['count']}")
+
+    print(f"\n⏱️ 평가 {result['evaluations']:,}회 (캐시 재사용 {result['cache_hits']:,}회, "
+          f"시뮬레이션 {result['simulated_games']:,}게임, 프로세스 {result['workers']}개)")
+    print(f"   {result['execution_time']:.1f}초, 분당 {result['evaluations_per_minute']:,.0f}회 평가")
+    print("=" * 60)
@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 정수 인코딩 카드 모델 엔진
+
+카드 종류마다 덱별 정수 id를 부여하고(CardTable), 덱/손패/버림패를
+정수 리스트로 관리하는 SimulationEngine 대체 구현입니다.
+
+- 게임 리셋: Card 객체 deepcopy 대신 원본 덱의 슬라이스 복사 1회
+- 카드 비교: 이름 문자열 대신 정수 id 비교
+- 문자열 결과(final_hand, turn_results)는 API 경계에서만 생성
+- 집계 전용 실행(run_stream)은 결과 딕셔너리 없이 accumulator에 손패 상태만 전달
+
+카드 효과와 Iono/Pokemon Communication 판단 로직은 CardEffects 및
+SimulationEngine._use_draw_cards와 같은 규칙을 정수 id 기반으로 옮긴 것이며,
+난수 호출 순서(셔플/선택)도 기준 엔진과 동일하게 유지합니다.
+"""
+
+import random
+from typing import Dict, List, Any, Optional
+
+from card_effects import DRAW_CARDS, resolve_effects, BASIC_TYPES, POKEMON_TYPES, GALDION_TARGETS
+from deck_index import DeckIndex
+from opening_sampler import OPENING_METHODS, get_opening_sampler
+
+
+class CardTable:
+    """덱별 카드 종류 테이블
+
+    카드 종류 하나당 정수 id 하나를 부여하고, id로 바로 조회할 수 있는
+    속성 리스트(이름, 타입, 드로우 카드 여부, Basic 여부 등)를 보관합니다.
+    id는 deck_input의 카드 순서를 따릅니다.
+    """
+
+    def __init__(self, deck_input: Dict[str, Dict[str, Any]]):
+        self.names: List[str] = []
+        self.types: List[str] = []
+        self.counts: List[int] = []
+        self.is_draw: List[bool] = []
+        self.is_basic: List[bool] = []
+        self.is_pokemon: List[bool] = []
+        self.is_supporter: List[bool] = []
+        self.ids: Dict[str, int] = {}
+
+        for card_name, card_info in deck_input.items():
+            card_type = card_info["type"]
+            self.ids[card_name] = len(self.names)
+            self.names.append(card_name)
+            self.types.append(card_type)
+            self.counts.append(card_info["count"])
+            self.is_draw.append(card_name in DRAW_CARDS)
+            self.is_basic.append(card_type == "Basic Pokemon")
+            self.is_pokemon.append(card_type in POKEMON_TYPES)
+            self.is_supporter.append(card_type == "Supporter")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id_of(self, card_name: str) -> int:
+        """카드명의 id 반환 (덱에 없으면 -1)"""
+        return self.ids.get(card_name, -1)
+
+    def build_deck(self) -> List[int]:
+        """원본 덱(정수 id 리스트) 생성"""
+        deck = []
+        for card_id, count in enumerate(self.counts):
+            deck.extend([card_id] * count)
+        return deck
+
+    def decode(self, card_ids: List[int]) -> List[str]:
+        """id 리스트를 카드명 리스트로 변환 (API 경계 전용)"""
+        names = self.names
+        return [names[card_id] for card_id in card_ids]
+
+
+class _PolicyContext:
+    """target_cards / target_groups를 id 기반으로 미리 변환한 판단 정보"""
+
+    def __init__(self, table: CardTable, target_cards: Optional[List[str]], target_groups: Optional[List[Dict]]):
+        self.target_cards = target_cards or []
+        self.target_groups = target_groups or []
+        self.target_ids = frozenset(table.ids[name] for name in self.target_cards if name in table.ids)
+        self.total_target_types = len(self.target_cards)
+        # 그룹별 목표 카드 id (덱에 없는 카드는 -1로 남겨 항상 미완성 처리)
+        self.group_ids = [[table.id_of(name) for name in group['target_cards']] for group in self.target_groups]
+
+
+class EncodedGameState:
+    """정수 id 기반 게임 상태
+
+    deck / hand / discard는 모두 카드 id 리스트이며, deck의 맨 앞(인덱스 0)이
+    덱 맨 위입니다. 리셋은 원본 덱의 슬라이스 복사와 셔플만 수행합니다.
+    """
+
+    def __init__(self, table: CardTable, rng=None, opening_sampler=None):
+        self.table = table
+        self.rng = rng if rng is not None else random
+        # 멀리건 없는 시작 손패 샘플러 (None이면 셔플 반복)
+        self.opening_sampler = opening_sampler
+        self.original_deck = table.build_deck()
+        self.deck: List[int] = list(self.original_deck)
+        self.hand: List[int] = []
+        self.discard: List[int] = []
+        self.turn = 0
+        # 덱 색인 (서치 효과가 처음 필요로 할 때 구성, 리셋 시 무효화)
+        self._deck_index = DeckIndex(self.deck, dict(enumerate(table.types)))
+        self._index_valid = False
+
+    @property
+    def deck_index(self) -> DeckIndex:
+        """현재 덱의 색인"""
+        if not self._index_valid:
+            self._deck_index.rebuild()
+            self._index_valid = True
+        return self._deck_index
+
+    def reset_game(self):
+        """원본 덱 복원(슬라이스 복사) 후 셔플"""
+        self.deck[:] = self.original_deck
+        self.hand.clear()
+        self.discard.clear()
+        self.turn = 0
+        self._index_valid = False
+        self.rng.shuffle(self.deck)
+
+    def draw_cards(self, count: int) -> int:
+        """덱 맨 위에서 count장 드로우, 실제 드로우한 장수 반환"""
+        deck = self.deck
+        hand = self.hand
+        drawn = min(count, len(deck))
+        if self._index_valid:
+            pop_top = self._deck_index.pop_top
+            for _ in range(drawn):
+                hand.append(pop_top())
+        else:
+            for _ in range(drawn):
+                hand.append(deck.pop(0))
+        return drawn
+
+    def initial_draw(self) -> bool:
+        """Basic Pokemon이 나올 때까지 리셋 후 5장 드로우 (최대 50회)"""
+        if self.opening_sampler is not None:
+            if not self.opening_sampler.valid:
+                return False
+            hand, deck = self.opening_sampler.sample(self.rng)
+            self.deck[:] = deck
+            self.hand[:] = hand
+            self.discard.clear()
+            self.turn = 0
+            self._index_valid = False
+            return True
+
+        max_attempts = 50
+        is_basic = self.table.is_basic
+
+        for _ in range(max_attempts):
+            self.reset_game()
+            self.draw_cards(5)
+
+            for card_id in self.hand:
+                if is_basic[card_id]:
+                    return True
+
+        print(f"경고: {max_attempts}번 시도 후에도 Basic Pokemon을 찾지 못했습니다.")
+        return False
+
+    def start_turn(self):
+        if self.turn > 0:
+            self.draw_cards(1)
+
+
+class EncodedSimulationEngine:
+    """정수 인코딩 카드 모델을 사용하는 시뮬레이션 엔진
+
+    SimulationEngine과 같은 인터페이스(deck_input, draw_order,
+    simulate_single_game)를 제공하므로 ProbabilityCalculator에 그대로 연결할 수 있습니다.
+    게임 상태 객체는 엔진당 하나만 만들어 매 게임 재사용합니다.
+    """
+
+    def __init__(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str] = None, rng=None,
+                 opening: str = "mulligan"):
+        if opening not in OPENING_METHODS:
+            raise ValueError(f"지원하지 않는 시작 손패 방식입니다: {opening} (지원: {', '.join(OPENING_METHODS)})")
+        self.deck_input = deck_input
+        self.draw_order = draw_order or []
+        self.opening = opening
+        self.available_draw_cards = [card_name for card_name in deck_input.keys() if card_name in DRAW_CARDS]
+
+        self.card_table = CardTable(deck_input)
+        opening_sampler = None
+        if opening == "alias":
+            opening_sampler = get_opening_sampler(tuple(self.card_table.counts), tuple(self.card_table.is_basic))
+        self.game_state = EncodedGameState(self.card_table, rng, opening_sampler)
+        self.default_rng = self.game_state.rng
+
+        table = self.card_table
+        # 1단계에서 사용할 드로우 카드 id (Pokemon Communication 제외, 덱에 없는 카드 제외)
+        self.regular_draw_ids = [table.ids[name] for name in self.draw_order
+                                 if name != "Pokemon Communication" and name in table.ids]
+        self.iono_id = table.id_of("Iono")
+        self.pokemon_comm_id = table.id_of("Pokemon Communication")
+        # 서치 대상 종류 (기준 엔진의 DeckIndex 종류 순서와 동일)
+        self.basic_ids = tuple(card_id for card_id, card_type in enumerate(table.types) if card_type in BASIC_TYPES)
+        self.pokemon_ids = tuple(card_id for card_id, card_type in enumerate(table.types) if card_type in POKEMON_TYPES)
+        self.galdion_ids = tuple(table.ids[name] for name in GALDION_TARGETS if name in table.ids)
+        # 카드 id -> 효과 메서드 (EFFECT_REGISTRY의 encoded 이름으로 덱마다 한 번 조회)
+        self._effects = {}
+        for card_name, spec in resolve_effects(table.names).items():
+            if spec.card_name not in DRAW_CARDS:
+                self._effects[table.ids[card_name]] = self._no_effect
+            elif spec.encoded is not None:
+                self._effects[table.ids[card_name]] = getattr(self, spec.encoded)
+            elif card_name in self.draw_order:
+                raise ValueError(f"인코딩 엔진에서 지원하지 않는 카드 효과입니다: {card_name}")
+        self._policy_cache: Dict[Any, _PolicyContext] = {}
+
+    def _policy_context(self, target_cards: Optional[List[str]], target_groups: Optional[List[Dict]]) -> _PolicyContext:
+        """target 정보를 id 기반으로 변환 (요청별로 한 번만 계산)"""
+        key = (tuple(target_cards or ()),
+               tuple(tuple(group['target_cards']) for group in target_groups or ()))
+        context = self._policy_cache.get(key)
+        if context is None:
+            context = _PolicyContext(self.card_table, target_cards, target_groups)
+            self._policy_cache[key] = context
+        return context
+
+    def simulate_single_game(self, max_turn: int = 2, verbose: bool = False, target_cards: List[str] = None, target_groups: List[Dict] = None, rng=None) -> Dict[str, Any]:
+        # 상세 로그는 기준 엔진(SimulationEngine)으로 위임
+        if verbose:
+            from main_simulator import SimulationEngine
+            reference = SimulationEngine(self.deck_input, self.draw_order, self.opening)
+            return reference.simulate_single_game(max_turn, verbose, target_cards, target_groups, rng)
+
+        state = self.game_state
+        # rng가 주어지면 이번 게임만 해당 난수 흐름 사용 (공통 난수 비교용)
+        state.rng = rng if rng is not None else self.default_rng
+        decode = self.card_table.decode
+        result = {
+            'success': False,
+            'turn_results': {},
+            'final_hand': [],
+            'cards_used': []
+        }
+
+        # 0턴: 초기 5장 드로우
+        if not state.initial_draw():
+            return result
+
+        result['success'] = True
+        context = self._policy_context(target_cards, target_groups)
+
+        for turn in range(max_turn + 1):
+            state.turn = turn
+
+            if turn > 0:
+                state.start_turn()
+
+            turn_result = {
+                'hand_before_effects': decode(state.hand),
+                'cards_used_this_turn': [],
+                'hand_after_effects': []
+            }
+            result['turn_results'][turn] = turn_result
+
+            # 1턴부터 카드 효과 사용
+            if turn > 0:
+                used_ids = []
+                self._use_draw_cards(state, context, max_turn, used_ids)
+                cards_used_this_turn = decode(used_ids)
+                turn_result['cards_used_this_turn'] = cards_used_this_turn
+                result['cards_used'].extend(cards_used_this_turn)
+
+            turn_result['hand_after_effects'] = decode(state.hand)
+
+        result['final_hand'] = decode(state.hand)
+        return result
+
+    def run_stream(self, accumulator, num_games: int, max_turn: int = 2, target_cards: List[str] = None,
+                   target_groups: List[Dict] = None, game_seeds: List[int] = None):
+        """게임 결과 딕셔너리 없이 num_games판을 실행하고 accumulator에 상태만 전달
+
+        simulate_single_game과 난수 사용 순서가 같으므로 같은 seed에서 같은 게임이 진행됩니다.
+
+        Args:
+            accumulator: GameAccumulator (accumulators 모듈) 인터페이스 객체
+            num_games: 실행할 게임 수
+            max_turn / target_cards / target_groups: simulate_single_game과 동일
+            game_seeds: 게임마다 난수 흐름을 초기화할 seed 목록 (공통 난수 비교용, 주어지면 num_games 대신 사용)
+                        구성마다 게임 중 난수 사용량이 달라도 게임 i는 항상 같은 난수 흐름에서 시작
+
+        Returns:
+            accumulator
+        """
+        state = self.game_state
+        state.rng = self.default_rng
+        context = self._policy_context(target_cards, target_groups)
+        use_draw_cards = self._use_draw_cards
+        needs_opening_hand = accumulator.needs_opening_hand
+        needs_turn_hands = accumulator.needs_turn_hands
+        if game_seeds is not None:
+            state.rng = random.Random()
+            num_games = len(game_seeds)
+
+        for game_index in range(num_games):
+            if game_seeds is not None:
+                state.rng.seed(game_seeds[game_index])
+            if not state.initial_draw():
+                accumulator.on_invalid_game()
+                continue
+
+            if needs_opening_hand:
+                accumulator.on_opening_hand(state.hand)
+            if needs_turn_hands:
+                accumulator.on_turn_hand(0, state.hand, state.discard)
+
+            for turn in range(1, max_turn + 1):
+                state.turn = turn
+                state.start_turn()
+                use_draw_cards(state, context, max_turn)
+                if needs_turn_hands:
+                    accumulator.on_turn_hand(turn, state.hand, state.discard)
+
+            accumulator.on_final_hand(state.hand)
+
+        return accumulator
+
+    # ==================== 턴 진행 (SimulationEngine._use_draw_cards 대응) ====================
+
+    def _use_draw_cards(self, state: EncodedGameState, context: _PolicyContext, max_turn: int,
+                        cards_used: Optional[List[int]] = None) -> int:
+        """한 턴의 드로우 카드 사용 (Supporter 1장 제한 + Pokemon Communication 연쇄 로직)
+
+        Args:
+            cards_used: 사용한 카드 id를 기록할 리스트 (trace 모드에서만 전달)
+
+        Returns:
+            int: 이번 턴에 사용한 카드 수
+        """
+        table = self.card_table
+        hand = state.hand
+        iono_id = self.iono_id
+        pokemon_comm_id = self.pokemon_comm_id
+        effects = self._effects
+        total_used = 0
+        supporter_used = False
+        max_iterations = 10
+
+        for _ in range(max_iterations):
+            cards_used_this_iteration = 0
+
+            # 1단계: 일반 드로우카드들 사용 (Pokemon Communication 제외)
+            for card_id in self.regular_draw_ids:
+                is_supporter = table.is_supporter[card_id]
+
+                for _ in range(hand.count(card_id)):
+                    if is_supporter and supporter_used:
+                        continue
+
+                    if card_id == iono_id:
+                        if context.target_groups:
+                            should_use = self._should_use_iono_for_multi_or_multi(state, context)
+                        elif context.target_cards:
+                            should_use = self._should_use_iono(state, context)
+                        else:
+                            should_use = False
+
+                        if not should_use:
+                            continue
+
+                    # 효과 메서드가 False를 반환하면 사용 조건 불충족 (카드는 손패에 남김)
+                    if effects[card_id](state) is False:
+                        continue
+
+                    hand.remove(card_id)
+                    state.discard.append(card_id)
+                    if cards_used is not None:
+                        cards_used.append(card_id)
+                    cards_used_this_iteration += 1
+
+                    if is_supporter:
+                        supporter_used = True
+
+            # 2단계: Pokemon Communication 평가 (마지막 턴에서만)
+            if context.target_cards and state.turn == max_turn and pokemon_comm_id >= 0:
+                for _ in range(hand.count(pokemon_comm_id)):
+                    chosen_id = self._choose_pokemon_communication_target(state, context)
+                    if chosen_id < 0:
+                        continue
+
+                    self._pokemon_communication(state, chosen_id)
+                    hand.remove(pokemon_comm_id)
+                    state.discard.append(pokemon_comm_id)
+                    if cards_used is not None:
+                        cards_used.append(pokemon_comm_id)
+                    cards_used_this_iteration += 1
+
+            total_used += cards_used_this_iteration
+
+            # 3단계: 더 이상 사용할 카드가 없으면 루프 종료
+            if cards_used_this_iteration == 0:
+                break
+
+        return total_used
+
+    # ==================== 카드 효과 (CardEffects 대응) ====================
+
+    def _no_effect(self, state: EncodedGameState):
+        """등록되지 않은 카드 (효과 없이 사용 처리)"""
+
+    def _poke_ball(self, state: EncodedGameState):
+        self._search_to_hand(state, self.basic_ids)
+
+    def _professors_research(self, state: EncodedGameState):
+        state.draw_cards(2)
+
+    def _galdion(self, state: EncodedGameState):
+        self._search_to_hand(state, self.galdion_ids)
+
+    def _pokemon_communication_auto(self, state: EncodedGameState):
+        """자동 선택(손패 첫 번째 Pokemon) 교환"""
+        is_pokemon = self.card_table.is_pokemon
+        for hand_id in state.hand:
+            if is_pokemon[hand_id]:
+                self._pokemon_communication(state, hand_id)
+                return
+
+    @staticmethod
+    def _search_to_hand(state: EncodedGameState, kinds) -> bool:
+        """덱에서 kinds에 속하는 카드 1장을 랜덤으로 손패에 가져오기 (덱 색인 사용, 셔플 생략)"""
+        card_id = state.deck_index.take_random(state.rng, kinds)
+        if card_id is None:
+            return False
+        state.hand.append(card_id)
+        return True
+
+    def _pokemon_communication(self, state: EncodedGameState, sacrifice_id: int) -> bool:
+        """손패의 sacrifice_id Pokemon을 덱의 랜덤 Pokemon과 교환 (교환한 카드는 덱의 랜덤 위치로)"""
+        index = state.deck_index
+        obtained_id = index.take_random(state.rng, self.pokemon_ids)
+        if obtained_id is None:
+            return False
+
+        state.hand.remove(sacrifice_id)
+        state.hand.append(obtained_id)
+        index.insert_random(state.rng, sacrifice_id)
+        return True
+
+    def _iono(self, state: EncodedGameState):
+        """손패(Iono 제외)를 덱에 섞고 같은 장수만큼 다시 드로우"""
+        iono_id = self.iono_id
+        hand = state.hand
+        cards_to_shuffle = [card_id for card_id in hand if card_id != iono_id]
+
+        if not cards_to_shuffle:
+            return
+
+        hand[:] = [card_id for card_id in hand if card_id == iono_id]
+        if state._index_valid:
+            state._deck_index.shuffle_in(state.rng, cards_to_shuffle)
+        else:
+            state.deck.extend(cards_to_shuffle)
+            state.rng.shuffle(state.deck)
+        state.draw_cards(len(cards_to_shuffle))
+
+    # ==================== 사용 여부 판단 (CardEffects / SimulationEngine 대응) ====================
+
+    def _should_use_iono(self, state: EncodedGameState, context: _PolicyContext) -> bool:
+        """CardEffects.should_use_iono의 id 기반 판단"""
+        iono_id = self.iono_id
+        target_ids = context.target_ids
+        current_target_count = 0
+        current_hand_size = 0
+        unique_targets = set()
+
+        for card_id in state.hand:
+            if card_id == iono_id:
+                continue
+            current_hand_size += 1
+            if card_id in target_ids:
+                current_target_count += 1
+                unique_targets.add(card_id)
+
+        total_target_types = context.total_target_types
+        unique_targets_in_hand = len(unique_targets)
+
+        if current_target_count == 0:
+            return True
+        if unique_targets_in_hand < (total_target_types * 0.5):
+            return True
+        if current_hand_size <= 3 and unique_targets_in_hand < total_target_types:
+            return True
+        return False
+
+    def _should_use_iono_for_multi_or_multi(self, state: EncodedGameState, context: _PolicyContext) -> bool:
+        """SimulationEngine._should_use_iono_for_multi_or_multi의 id 기반 판단"""
+        iono_id = self.iono_id
+        hand_ids = set(card_id for card_id in state.hand if card_id != iono_id)
+
+        for group_ids in context.group_ids:
+            if all(card_id in hand_ids for card_id in group_ids):
+                return False
+
+        for group_ids in context.group_ids:
+            completed_cards = sum(1 for card_id in group_ids if card_id in hand_ids)
+            if completed_cards / len(group_ids) >= 0.67:
+                return False
+
+        return True
+
+    def _choose_pokemon_communication_target(self, state: EncodedGameState, context: _PolicyContext) -> int:
+        """CardEffects.should_use_pokemon_communication의 id 기반 판단
+
+        Returns:
+            int: 교환할 손패 Pokemon id (사용하지 않으면 -1)
+        """
+        table = self.card_table
+        hand = state.hand
+        is_pokemon = table.is_pokemon
+        target_ids = context.target_ids
+
+        # 덱에 없는 목표 카드는 교환으로도 얻을 수 없으므로 제외
+        missing_ids = [table.ids[name] for name in context.target_cards
+                       if name in table.ids and table.ids[name] not in hand]
+        if not missing_ids:
+            return -1
+
+        hand_pokemons = [card_id for card_id in hand if is_pokemon[card_id]]
+        if not hand_pokemons:
+            return -1
+
+        if not any(is_pokemon[card_id] and card_id in missing_ids for card_id in state.deck):
+            return -1
+
+        # 1순위: target_cards에 없는 Pokemon
+        for card_id in hand_pokemons:
+            if card_id not in target_ids:
+                return card_id
+
+        # 2순위: target에 있지만 손패에 중복으로 있는 Pokemon
+        for card_id in hand_pokemons:
+            if hand.count(card_id) > 1:
+                return card_id
+
+        return -1
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 엔진 통계적 동등성 검증 하네스
+
+빠른 엔진(인코딩, alias 시작 손패, 병렬, NumPy 배치, Markov 정확 계산)이
+기준 엔진(SimulationEngine + CardEffects)과 같은 분포를 내는지
+DeckList.txt / TestCase.txt 형식의 (덱, 계산 요청) 코퍼스에서 검정합니다.
+
+후보 종류별 검정:
+- game  (simulate_single_game 제공 엔진):
+    성공률 두 비율 z 검정 + 턴별 성공 패턴 / 최종 손패 서명 분포의 카이제곱 동질성 검정
+- counts (성공 횟수만 내는 엔진): 성공률 두 비율 z 검정
+- exact (정확 확률): 기준 엔진 성공률의 한 비율 z 검정
+
+검정 수가 많으므로 유의수준 alpha는 전체 검정에 Bonferroni 보정해 적용합니다.
+하나라도 기각되면 assert_equivalent가 EngineDivergenceError를 발생시킵니다.
+
+    python equivalence.py --games 20000 --candidates encoded,exact
+"""
+
+import argparse
+import random
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from main_simulator import SimulationEngine, load_deck_from_file, load_test_cases_from_file
+from encoded_engine import EncodedSimulationEngine
+from probability_calculator import ProbabilityCalculator
+from parallel_runner import derive_seed, run_parallel_counts
+from batch_engine import BatchDeckSampler, numpy_available, has_active_draw_effects
+from exact_engine import ExactDrawEngine, unsupported_effects
+from stats_utils import two_proportion_z_test, one_proportion_z_test, chi_square_homogeneity
+
+DEFAULT_ALPHA = 0.001
+CANDIDATE_KINDS = ("game", "counts", "exact")
+
+
+class EngineDivergenceError(AssertionError):
+    """후보 엔진의 분포가 기준 엔진과 통계적으로 다름"""
+
+
+@dataclass
+class Candidate:
+    """비교할 후보 엔진
+
+    Attributes:
+        name: 후보 이름
+        kind: "game" / "counts" / "exact"
+        run: kind별 실행 함수
+            game:   run(deck_input, draw_order) -> simulate_single_game을 가진 엔진
+            counts: run(deck_input, draw_order, request, num_games, seed) -> (success_count, total_valid_games)
+            exact:  run(deck_input, draw_order, request) -> 유효 게임 중 성공 확률
+        supports: supports(deck_input, draw_order, request) -> bool (None이면 항상 지원)
+    """
+    name: str
+    kind: str
+    run: Callable
+    supports: Optional[Callable[[Dict[str, Dict[str, Any]], List[str], Dict[str, Any]], bool]] = None
+
+
+# ===================== 기본 후보 =====================
+
+def _parallel_counts(deck_input, draw_order, request, num_games, seed):
+    return run_parallel_counts(EncodedSimulationEngine(deck_input, draw_order), request, num_games,
+                               workers=2, seed=seed)
+
+
+def _batch_supported(deck_input, draw_order, request) -> bool:
+    return (numpy_available() and request.get('type') == 'multi_card'
+            and not has_active_draw_effects(deck_input, draw_order))
+
+
+def _batch_counts(deck_input, draw_order, request, num_games, seed):
+    sampler = BatchDeckSampler(deck_input, seed=seed)
+    return sampler.count_multi_card(request['target_cards'], request.get('turn', 2), num_games)
+
+
+def _exact_supported(deck_input, draw_order, request) -> bool:
+    return request.get('type') == 'multi_card' and not unsupported_effects(deck_input, draw_order)
+
+
+def _exact_probability(deck_input, draw_order, request) -> float:
+    engine = ExactDrawEngine(deck_input, draw_order, request['target_cards'])
+    return engine.multi_card_probability(request.get('turn', 2))
+
+
+def default_candidates() -> List[Candidate]:
+    """기본 후보 엔진 목록"""
+    return [
+        Candidate("encoded", "game", lambda deck, order: EncodedSimulationEngine(deck, order)),
+        Candidate("encoded_alias", "game", lambda deck, order: EncodedSimulationEngine(deck, order, opening="alias")),
+        Candidate("object_alias", "game", lambda deck, order: SimulationEngine(deck, order, opening="alias")),
+        Candidate("parallel", "counts", _parallel_counts),
+        Candidate("batch", "counts", _batch_counts, _batch_supported),
+        Candidate("exact", "exact", _exact_probability, _exact_supported),
+    ]
+
+
+# ===================== 코퍼스 =====================
+
+def load_corpus(deck_files: Tuple[str, ...] = ("DeckList.txt",), test_case_file: str = "TestCase.txt",
+                requests: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """(덱, 드로우 순서, 계산 요청) 케이스 목록 생성
+
+    Args:
+        deck_files: DeckList.txt 형식 덱 파일들
+        test_case_file: TestCase.txt 형식 계산 요청 파일 (requests를 주면 사용하지 않음)
+        requests: 직접 지정할 계산 요청 목록 ({"name", "request"})
+
+    Returns:
+        [{"name", "deck_input", "draw_order", "request"}]
+    """
+    file_draw_order = []
+    if requests is None:
+        test_cases, file_draw_order, _ = load_test_cases_from_file(test_case_file)
+        if test_cases is None:
+            raise ValueError(f"테스트 케이스 파일을 읽을 수 없습니다: {test_case_file}")
+        requests = test_cases
+
+    corpus = []
+    for deck_file in deck_files:
+        deck_input, draw_order = load_deck_from_file(deck_file)
+        if deck_input is None:
+            raise ValueError(f"덱 파일을 읽을 수 없습니다: {deck_file}")
+        for test_case in requests:
+            corpus.append({
+                'name': f"{deck_file} | {test_case['name']}",
+                'deck_input': deck_input,
+                'draw_order': file_draw_order or draw_order,
+                'request': test_case['request']
+            })
+    return corpus
+
+
+# ===================== 게임 결과 분포 =====================
+
+def _relevant_cards(request: Dict[str, Any]) -> List[str]:
+    """최종 손패 서명에 사용할 카드 (요청에 등장하는 카드)"""
+    cards = list(request.get('target_cards', []))
+    for group in request.get('target_groups', []):
+        cards.extend(group['target_cards'])
+    cards.extend(request.get('preferred_basics', []))
+    cards.extend(request.get('non_preferred_basics', []))
+    return list(dict.fromkeys(cards))
+
+
+def collect_game_outcomes(engine, request: Dict[str, Any], num_games: int, seed: int) -> Dict[str, Any]:
+    """게임 단위 엔진을 num_games판 실행해 결과 분포 집계
+
+    Returns:
+        success_count / total_valid_games와
+        turn_patterns (턴별 효과 사용 후 성공 여부 패턴, 예: "001") /
+        final_hands (손패 장수 + 요청 카드별 장수) 빈도
+    """
+    calculator = ProbabilityCalculator(engine)
+    game_kwargs = calculator._game_kwargs(request)
+    relevant_cards = _relevant_cards(request)
+    turn_patterns = Counter()
+    final_hands = Counter()
+    success_count = 0
+    total_valid_games = 0
+
+    random.seed(seed)
+    for _ in range(num_games):
+        game_result = engine.simulate_single_game(**game_kwargs)
+        if not game_result['success']:
+            continue
+        total_valid_games += 1
+
+        pattern = []
+        for turn in sorted(game_result['turn_results']):
+            turn_hand = game_result['turn_results'][turn]['hand_after_effects']
+            turn_view = {'turn_results': game_result['turn_results'], 'final_hand': turn_hand}
+            pattern.append("1" if calculator._is_success(request, turn_view) else "0")
+        turn_patterns["".join(pattern)] += 1
+
+        final_hand = game_result['final_hand']
+        final_hands[(len(final_hand),) + tuple(final_hand.count(card) for card in relevant_cards)] += 1
+
+        if calculator._is_success(request, game_result):
+            success_count += 1
+
+    return {
+        'success_count': success_count,
+        'total_valid_games': total_valid_games,
+        'turn_patterns': turn_patterns,
+        'final_hands': final_hands
+    }
+
+
+# ===================== 검정 =====================
+
+def compare_engines(corpus: List[Dict[str, Any]], candidates: Optional[List[Candidate]] = None,
+                    num_games: int = 20000, seed: int = 20250612, alpha: float = DEFAULT_ALPHA,
+                    verbose: bool = True) -> Dict[str, Any]:
+    """코퍼스의 모든 케이스에서 기준 엔진과 후보 엔진 분포 비교
+
+    Args:
+        corpus: load_corpus 결과
+        candidates: 후보 엔진 목록 (None이면 default_candidates())
+        num_games: 케이스별 / 엔진별 게임 수
+        seed: root seed (기준 / 후보 엔진은 서로 독립인 seed 사용)
+        alpha: 전체 검정에 대한 유의수준 (Bonferroni 보정)
+
+    Returns:
+        {'tests': [검정 결과], 'alpha', 'adjusted_alpha', 'failures': [기각된 검정]}
+    """
+    if candidates is None:
+        candidates = default_candidates()
+    for candidate in candidates:
+        if candidate.kind not in CANDIDATE_KINDS:
+            raise ValueError(f"지원하지 않는 후보 종류입니다: {candidate.kind} (지원: {', '.join(CANDIDATE_KINDS)})")
+
+    tests = []
+    for case_index, case in enumerate(corpus):
+        deck_input, draw_order, request = case['deck_input'], case['draw_order'], case['request']
+        active = [candidate for candidate in candidates
+                  if candidate.supports is None or candidate.supports(deck_input, draw_order, request)]
+        if not active:
+            continue
+
+        reference = collect_game_outcomes(SimulationEngine(deck_input, draw_order), request, num_games,
+                                          derive_seed(seed, 2 * case_index))
+        reference_rate = (reference['success_count'], reference['total_valid_games'])
+        if verbose:
+            print(f"📋 {case['name']}: 기준 엔진 {reference_rate[0] / max(1, reference_rate[1]) * 100:.2f}%")
+
+        for candidate_index, candidate in enumerate(active):
+            candidate_seed = derive_seed(derive_seed(seed, 2 * case_index + 1), candidate_index)
+            label = {'case': case['name'], 'candidate': candidate.name}
+
+            if candidate.kind == "exact":
+                probability = candidate.run(deck_input, draw_order, request)
+                z, p_value = one_proportion_z_test(*reference_rate, probability)
+                tests.append({**label, 'test': "성공률 (정확값)", 'statistic': z, 'p_value': p_value,
+                              'reference': reference_rate[0] / max(1, reference_rate[1]), 'candidate_value': probability})
+                continue
+
+            if candidate.kind == "counts":
+                success_count, total_valid_games = candidate.run(deck_input, draw_order, request, num_games, candidate_seed)
+                observed = None
+            else:
+                observed = collect_game_outcomes(candidate.run(deck_input, draw_order), request, num_games, candidate_seed)
+                success_count, total_valid_games = observed['success_count'], observed['total_valid_games']
+
+            z, p_value = two_proportion_z_test(*reference_rate, success_count, total_valid_games)
+            tests.append({**label, 'test': "성공률", 'statistic': z, 'p_value': p_value,
+                          'reference': reference_rate[0] / max(1, reference_rate[1]),
+                          'candidate_value': success_count / max(1, total_valid_games)})
+
+            if observed is not None:
+                for key, test_name in (('turn_patterns', "턴별 성공 패턴"), ('final_hands', "최종 손패 분포")):
+                    statistic, degrees_of_freedom, p_value = chi_square_homogeneity(reference[key], observed[key])
+                    tests.append({**label, 'test': test_name, 'statistic': statistic, 'p_value': p_value,
+                                  'degrees_of_freedom': degrees_of_freedom})
+
+    adjusted_alpha = alpha / max(1, len(tests))
+    failures = [test for test in tests if test['p_value'] < adjusted_alpha]
+    report = {'tests': tests, 'alpha': alpha, 'adjusted_alpha': adjusted_alpha, 'failures': failures}
+    if verbose:
+        print_report(report)
+    return report
+
+
+def assert_equivalent(corpus: List[Dict[str, Any]], candidates: Optional[List[Candidate]] = None,
+                      **kwargs) -> Dict[str, Any]:
+    """compare_engines를 실행하고 기각된 검정이 있으면 EngineDivergenceError 발생"""
+    report = compare_engines(corpus, candidates, **kwargs)
+    if report['failures']:
+        details = "\n".join(f"  - [{test['candidate']}] {test['case']} / {test['test']}: p = {test['p_value']:.2e}"
+                            for test in report['failures'])
+        raise EngineDivergenceError(
+            f"기준 엔진과 분포가 다른 후보 엔진이 있습니다 (보정 유의수준 {report['adjusted_alpha']:.2e}):\n{details}")
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    """검정 결과 표 출력"""
+    print("=" * 80)
+    print(f"동등성 검정 {len(report['tests'])}건 (유의수준 {report['alpha']}, Bonferroni 보정 {report['adjusted_alpha']:.2e})")
+    print("=" * 80)
+    for test in report['tests']:
+        mark = "❌" if test in report['failures'] else "✅"
+        detail = f"p = {test['p_value']:.4f}"
+        if 'candidate_value' in test:
+            detail += f" (기준 {test['reference'] * 100:.2f}% / 후보 {test['candidate_value'] * 100:.2f}%)"
+        elif 'degrees_of_freedom' in test:
+            detail += f" (χ² = {test['statistic']:.1f}, 자유도 {test['degrees_of_freedom']})"
+        print(f"{mark} [{test['candidate']}] {test['case']} / {test['test']}: {detail}")
+    print("=" * 80)
+    print(f"기각 {len(report['failures'])}건")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="기준 엔진과 최적화 엔진의 통계적 동등성 검증")
+    parser.add_argument("--decks", default="DeckList.txt", help="쉼표로 구분한 덱 파일 목록")
+    parser.add_argument("--test-cases", default="TestCase.txt", help="계산 요청 파일")
+    parser.add_argument("--candidates", default=None, help="쉼표로 구분한 후보 이름 (기본: 전체)")
+    parser.add_argument("--games", type=int, default=20000, help="케이스별 / 엔진별 게임 수")
+    parser.add_argument("--seed", type=int, default=20250612)
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    args = parser.parse_args(argv)
+
+    candidates = default_candidates()
+    if args.candidates:
+        names = args.candidates.split(",")
+        candidates = [candidate for candidate in candidates if candidate.name in names]
+
+    corpus = load_corpus(tuple(args.decks.split(",")), args.test_cases)
+    try:
+        assert_equivalent(corpus, candidates, num_games=args.games, seed=args.seed, alpha=args.alpha)
+    except EngineDivergenceError as e:
+        print(f"\n{e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
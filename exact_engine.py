@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - Markov 연쇄 정확 계산 엔진
+
+Poke Ball, Professor's Research, Galdion의 효과는 카드 "순서"가 아니라
+덱/손패의 "구성"에만 의존합니다 (덱 위에서 뽑기 = 남은 덱에서 균등 추출,
+검색 후 셔플 = 남은 덱 균등 유지). 따라서 (덱 카드 수 벡터, 손패 카드 수 벡터)
+상태에 대한 확률 분포를 턴마다 전파하면 샘플링 오차 없는 정확한 확률을 얻습니다.
+
+- 정책: SimulationEngine._use_draw_cards와 동일 (드로우 순서, Supporter 1턴 1장,
+  최대 10회 연쇄 반복, 사용 시점의 손패 장수만큼 사용)
+- 상태 병합: 목표 카드 / 발동 드로우 카드 / Galdion 검색 대상은 카드별로,
+  나머지는 "기타 Basic Pokemon"과 "기타 카드" 두 묶음으로 합쳐 상태 수를 줄임
+- 메모이제이션: 같은 (덱, 손패) 상태의 턴 전이는 한 번만 계산
+
+Pokemon Communication(손패 순서에 따라 교환 대상이 달라짐)과 Iono는 지원하지 않습니다.
+단, 목표 카드가 없는 정책(card_curves)에서는 두 카드 모두 사용되지 않으므로 일반 카드로 취급합니다.
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple
+
+from card_effects import DRAW_CARDS
+from encoded_engine import GALDION_TARGETS
+
+# 구성만으로 결과가 정해지는 드로우 카드
+EXACT_EFFECTS = ("Poke Ball", "Professor's Research", "Galdion")
+BASIC_BUCKET = "(기타 Basic Pokemon)"
+OTHER_BUCKET = "(기타 카드)"
+
+Counts = Tuple[int, ...]
+State = Tuple[Counts, Counts]
+
+
+# 목표 카드가 없으면 사용 판단에서 항상 제외되는 드로우 카드
+TARGET_ONLY_EFFECTS = ("Pokemon Communication", "Iono")
+
+
+def unsupported_effects(deck_input: Dict[str, Dict[str, Any]], draw_order: List[str],
+                        with_targets: bool = True) -> List[str]:
+    """정확 계산을 막는 드로우 카드 목록 (비어 있으면 정확 계산 가능)
+
+    Pokemon Communication은 드로우 순서와 무관하게 마지막 턴에 평가되므로
+    덱에 있기만 해도 지원하지 않습니다.
+
+    Args:
+        with_targets: False면 목표 카드 없는 정책 (Iono / Pokemon Communication 미사용)
+    """
+    blocked = []
+    if with_targets and "Pokemon Communication" in deck_input:
+        blocked.append("Pokemon Communication")
+    for card_name in draw_order:
+        if card_name in deck_input and card_name in DRAW_CARDS and card_name not in EXACT_EFFECTS:
+            if not with_targets and card_name in TARGET_ONLY_EFFECTS:
+                continue
+            if card_name not in blocked:
+                blocked.append(card_name)
+    return blocked
+
+
+def _move(counts_from: Counts, counts_to: Counts, kind: int) -> Tuple[Counts, Counts]:
+    """kind 카드 1장을 counts_from에서 counts_to로 이동"""
+    source = list(counts_from)
+    target = list(counts_to)
+    source[kind] -= 1
+    target[kind] += 1
+    return tuple(source), tuple(target)
+
+
+class ExactDrawEngine:
+    """(덱 구성, 손패 구성) 상태 분포를 턴 단위로 전파하는 정확 계산 엔진"""
+
+    def __init__(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str] = None,
+                 target_cards: List[str] = None, max_iterations: int = 10, track_cards: List[str] = None):
+        """
+        Args:
+            target_cards: 목표 카드 (없으면 Iono / Pokemon Communication을 사용하지 않는 정책)
+            track_cards: 목표는 아니지만 병합하지 않고 개별 종류로 유지할 카드
+        """
+        self.deck_input = deck_input
+        self.draw_order = draw_order or []
+        self.target_cards = list(target_cards or [])
+        self.track_cards = list(track_cards or [])
+        self.max_iterations = max_iterations
+
+        blocked = unsupported_effects(deck_input, self.draw_order, with_targets=bool(self.target_cards))
+        if blocked:
+            raise ValueError(f"정확 계산을 지원하지 않는 카드가 있습니다: {', '.join(blocked)}")
+
+        active_draw_cards = [name for name in self.draw_order if name in deck_input]
+        galdion_active = "Galdion" in active_draw_cards
+
+        # 카드 종류 병합: 결과에 영향을 주는 카드만 개별 종류로 유지
+        kind_index: Dict[str, int] = {}
+        self.kinds: List[str] = []
+        initial_deck: List[int] = []
+        is_basic: List[bool] = []
+        is_supporter: List[bool] = []
+
+        for card_name, card_info in deck_input.items():
+            card_type = card_info["type"]
+            if (card_name in self.target_cards or card_name in self.track_cards or card_name in active_draw_cards
+                    or (galdion_active and card_name in GALDION_TARGETS)):
+                kind_name = card_name
+            elif card_type == "Basic Pokemon":
+                kind_name = BASIC_BUCKET
+            else:
+                kind_name = OTHER_BUCKET
+
+            if kind_name not in kind_index:
+                kind_index[kind_name] = len(self.kinds)
+                self.kinds.append(kind_name)
+                initial_deck.append(0)
+                is_basic.append(card_type == "Basic Pokemon")
+                is_supporter.append(card_type == "Supporter")
+            initial_deck[kind_index[kind_name]] += card_info["count"]
+
+        self.initial_deck: Counts = tuple(initial_deck)
+        self.basic_kinds = [index for index, basic in enumerate(is_basic) if basic]
+        self.galdion_kinds = [kind_index[name] for name in GALDION_TARGETS if name in kind_index]
+        self.target_kinds = [kind_index[name] for name in self.target_cards if name in kind_index]
+        self.missing_targets = [name for name in self.target_cards if name not in kind_index]
+
+        # 1단계 드로우 카드 (드로우 순서대로, 덱에 있는 카드만, 목표 없는 정책의 Iono 제외)
+        self.regular_draw = [(kind_index[name], name, is_supporter[kind_index[name]])
+                             for name in self.draw_order if name in kind_index and name in EXACT_EFFECTS]
+        # 반복마다 1장 이상 사용해야 다음 반복으로 넘어가므로, 드로우 카드가 max_iterations장
+        # 미만이면 반복 횟수 제한에 도달할 수 없음 -> 반복 회차를 상태에서 제외해 캐시 공유
+        draw_card_total = sum(initial_deck[kind] for kind, _, _ in self.regular_draw)
+        self._track_iterations = draw_card_total >= max_iterations
+
+        self.no_basic_probability = 0.0
+        self._policy_cache: Dict[Tuple, Dict[State, float]] = {}
+        self._turn_cache: Dict[State, Dict[State, float]] = {}
+
+    # ===== 기본 전이 =====
+
+    def _draw_one(self, deck: Counts, hand: Counts) -> List[Tuple[Counts, Counts, float]]:
+        """덱 위에서 1장 드로우 (남은 덱에서 균등 추출과 같음)"""
+        deck_size = sum(deck)
+        if deck_size == 0:
+            return [(deck, hand, 1.0)]
+        return [(*_move(deck, hand, kind), count / deck_size)
+                for kind, count in enumerate(deck) if count > 0]
+
+    def _search(self, deck: Counts, hand: Counts, kinds: List[int]) -> List[Tuple[Counts, Counts, float]]:
+        """덱에서 kinds 중 랜덤 1장을 손으로 (없으면 셔플만, 구성 변화 없음)"""
+        total = sum(deck[kind] for kind in kinds)
+        if total == 0:
+            return [(deck, hand, 1.0)]
+        return [(*_move(deck, hand, kind), deck[kind] / total)
+                for kind in kinds if deck[kind] > 0]
+
+    def _effect_outcomes(self, card_name: str, deck: Counts, hand: Counts) -> List[Tuple[Counts, Counts, float]]:
+        """드로우 카드 효과 1회의 결과 분포"""
+        if card_name == "Poke Ball":
+            return self._search(deck, hand, self.basic_kinds)
+        if card_name == "Galdion":
+            return self._search(deck, hand, self.galdion_kinds)
+
+        # Professor's Research: 2장 드로우
+        outcomes = []
+        for first_deck, first_hand, first_p in self._draw_one(deck, hand):
+            for second_deck, second_hand, second_p in self._draw_one(first_deck, first_hand):
+                outcomes.append((second_deck, second_hand, first_p * second_p))
+        return outcomes
+
+    # ===== 턴 정책 =====
+
+    def _use_draw_cards(self, deck: Counts, hand: Counts) -> Dict[State, float]:
+        """한 턴의 드로우 카드 사용 결과 분포 (SimulationEngine._use_draw_cards와 같은 정책)"""
+        if not self.regular_draw:
+            return {(deck, hand): 1.0}
+        first_kind = self.regular_draw[0][0]
+        return self._continue_policy(deck, hand, False, 0, 0, hand[first_kind], False)
+
+    def _continue_policy(self, deck: Counts, hand: Counts, supporter_used: bool, iteration: int,
+                         position: int, copies_left: int, used: bool) -> Dict[State, float]:
+        """정책 진행 중 상태에서 턴 종료까지의 결과 분포 (메모이제이션)
+
+        Args:
+            supporter_used: 이번 턴에 Supporter를 사용했는지
+            iteration: 연쇄 사용 반복 회차 (0부터)
+            position: 드로우 순서에서 현재 카드 위치
+            copies_left: 현재 카드를 사용 시점 손패 장수 기준으로 더 사용할 횟수
+            used: 이번 반복에서 카드를 1장이라도 사용했는지
+        """
+        key = (deck, hand, supporter_used, iteration, position, copies_left, used)
+        cached = self._policy_cache.get(key)
+        if cached is not None:
+            return cached
+
+        kind, card_name, is_supporter = self.regular_draw[position]
+        if copies_left > 0 and not (is_supporter and supporter_used):
+            # 현재 카드 1장 사용 후 손패에서 제거
+            result: Dict[State, float] = defaultdict(float)
+            for new_deck, new_hand, effect_p in self._effect_outcomes(card_name, deck, hand):
+                hand_after = list(new_hand)
+                hand_after[kind] -= 1
+                hand_after = tuple(hand_after)
+                branch = self._continue_policy(new_deck, hand_after, supporter_used or is_supporter,
+                                               iteration, position, copies_left - 1, True)
+                for state, branch_p in branch.items():
+                    result[state] += effect_p * branch_p
+            result = dict(result)
+        elif position + 1 < len(self.regular_draw):
+            # 다음 드로우 카드 (사용 시점의 손패 장수만큼 사용)
+            next_kind = self.regular_draw[position + 1][0]
+            result = self._continue_policy(deck, hand, supporter_used, iteration, position + 1,
+                                           hand[next_kind], used)
+        elif used and iteration + 1 < self.max_iterations:
+            # 이번 반복에서 카드를 사용했으면 처음부터 다시 (연쇄 사용)
+            first_kind = self.regular_draw[0][0]
+            next_iteration = iteration + 1 if self._track_iterations else 0
+            result = self._continue_policy(deck, hand, supporter_used, next_iteration, 0,
+                                           hand[first_kind], False)
+        else:
+            result = {(deck, hand): 1.0}
+
+        self._policy_cache[key] = result
+        return result
+
+    def _turn_transition(self, deck: Counts, hand: Counts) -> Dict[State, float]:
+        """1턴 전이: 1장 드로우 후 드로우 카드 사용"""
+        key = (deck, hand)
+        cached = self._turn_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result: Dict[State, float] = defaultdict(float)
+        for drawn_deck, drawn_hand, draw_p in self._draw_one(deck, hand):
+            for state, policy_p in self._use_draw_cards(drawn_deck, drawn_hand).items():
+                result[state] += draw_p * policy_p
+
+        result = dict(result)
+        self._turn_cache[key] = result
+        return result
+
+    # ===== 분포 계산 =====
+
+    def _hand_compositions(self, deck: Counts, size: int, kind: int = 0):
+        """덱 구성에서 size장을 뽑는 모든 손패 구성"""
+        if kind == len(deck):
+            if size == 0:
+                yield ()
+            return
+        for count in range(min(size, deck[kind]) + 1):
+            for rest in self._hand_compositions(deck, size - count, kind + 1):
+                yield (count,) + rest
+
+    def opening_distribution(self) -> Dict[State, float]:
+        """멀리건 규칙(첫 5장에 Basic Pokemon 1장 이상)을 조건으로 한 0턴 상태 분포"""
+        total_cards = sum(self.initial_deck)
+        total_ways = math.comb(total_cards, 5)
+        distribution: Dict[State, float] = {}
+        no_basic_ways = 0
+
+        for hand in self._hand_compositions(self.initial_deck, 5):
+            ways = 1
+            for deck_count, hand_count in zip(self.initial_deck, hand):
+                ways *= math.comb(deck_count, hand_count)
+            if not any(hand[kind] for kind in self.basic_kinds):
+                no_basic_ways += ways
+                continue
+            deck = tuple(deck_count - hand_count for deck_count, hand_count in zip(self.initial_deck, hand))
+            distribution[(deck, hand)] = ways
+
+        self.no_basic_probability = no_basic_ways / total_ways
+        valid_ways = total_ways - no_basic_ways
+        return {state: ways / valid_ways for state, ways in distribution.items()} if valid_ways else {}
+
+    def turn_distributions(self, max_turn: int):
+        """0턴부터 max_turn까지 각 턴 종료 시점의 (덱, 손패) 상태 분포를 차례로 생성 (유효 게임 조건부)"""
+        distribution = self.opening_distribution()
+        yield distribution
+        for _ in range(max_turn):
+            next_distribution: Dict[State, float] = defaultdict(float)
+            for (deck, hand), probability in distribution.items():
+                for state, transition_p in self._turn_transition(deck, hand).items():
+                    next_distribution[state] += probability * transition_p
+            distribution = dict(next_distribution)
+            yield distribution
+
+    def distribution_after_turn(self, max_turn: int) -> Dict[State, float]:
+        """max_turn 종료 시점의 (덱, 손패) 상태 분포 (유효 게임 조건부)"""
+        for distribution in self.turn_distributions(max_turn):
+            pass
+        return distribution
+
+    def card_curves(self, cards: List[str], max_turn: int) -> Dict[str, Dict[str, List[float]]]:
+        """개별 종류로 유지되는 카드의 턴별 확률 (0턴 ~ max_turn, 목표 카드 없는 정책)
+
+        목표 카드 없는 정책에서는 덱을 떠난 카드가 돌아오지 않으므로
+        "turn턴까지 손패에 들어온 적 있음" = 덱 장수가 처음보다 적음 입니다.
+
+        Returns:
+            {'in_hand': {카드: [턴 종료 시점 손패에 있을 확률]}, 'seen': {카드: [턴까지 본 확률]}}
+        """
+        kinds = {name: self.kinds.index(name) for name in cards}
+        in_hand = {name: [] for name in cards}
+        seen = {name: [] for name in cards}
+        for distribution in self.turn_distributions(max_turn):
+            for name, kind in kinds.items():
+                initial = self.initial_deck[kind]
+                in_hand[name].append(sum(p for (_, hand), p in distribution.items() if hand[kind] > 0))
+                seen[name].append(sum(p for (deck, _), p in distribution.items() if deck[kind] < initial))
+        return {'in_hand': in_hand, 'seen': seen}
+
+    def multi_card_probability(self, max_turn: int) -> float:
+        """max_turn까지 모든 목표 카드를 1장 이상 손패에 가질 정확한 확률 (유효 게임 기준)"""
+        if self.missing_targets:
+            return 0.0
+        distribution = self.distribution_after_turn(max_turn)
+        return sum(probability for (_, hand), probability in distribution.items()
+                   if all(hand[kind] > 0 for kind in self.target_kinds))
+
+    def valid_game_probability(self, max_attempts: int = 50) -> float:
+        """max_attempts 안에 멀리건이 성공할 확률 (시뮬레이션의 유효 게임 비율)"""
+        if not self.no_basic_probability:
+            self.opening_distribution()
+        return 1 - self.no_basic_probability ** max_attempts
+
+    @property
+    def state_count(self) -> int:
+        """메모이제이션된 서로 다른 (덱, 손패) 상태 수"""
+        return len(self._turn_cache) + len(self._policy_cache)
+
+
+def exact_card_curves(deck_input: Dict[str, Dict[str, Any]], draw_order: List[str], cards: List[str],
+                      max_turn: int, max_iterations: int = 10) -> Dict[str, Dict[str, List[float]]]:
+    """여러 카드의 턴별 확률 곡선 정확 계산 (목표 카드 없는 정책)
+
+    모든 카드를 한 엔진에서 개별 종류로 추적하면 상태 수가 카드 종류 수에 따라 폭증하므로,
+    이미 개별 종류인 카드(드로우 카드, Galdion 대상)는 기본 엔진 하나에서 읽고,
+    병합 버킷에 들어가는 카드는 (버킷, 장수)가 같으면 교환 가능하므로 대표 1장만
+    track_cards로 분리한 엔진을 버킷 / 장수 조합마다 하나씩 계산합니다.
+    """
+    base = ExactDrawEngine(deck_input, draw_order, max_iterations=max_iterations)
+    curves = base.card_curves([name for name in cards if name in base.kinds], max_turn)
+
+    classes: Dict[Tuple[bool, int], List[str]] = {}
+    for card_name in cards:
+        if card_name not in base.kinds:
+            card_info = deck_input[card_name]
+            classes.setdefault((card_info["type"] == "Basic Pokemon", card_info["count"]), []).append(card_name)
+
+    for members in classes.values():
+        engine = ExactDrawEngine(deck_input, draw_order, max_iterations=max_iterations, track_cards=members[:1])
+        tracked = engine.card_curves(members[:1], max_turn)
+        for key in ('in_hand', 'seen'):
+            for card_name in members:
+                curves[key][card_name] = tracked[key][members[0]]
+
+    return {key: {card_name: curves[key][card_name] for card_name in cards} for key in ('in_hand', 'seen')}
+
+
+def exact_request_probability(deck_input: Dict[str, Dict[str, Any]], draw_order: List[str],
+                              calculation_request: Dict[str, Any]) -> Optional[float]:
+    """계산 요청 하나의 정확 확률 (유효 게임 조건부, 0~1, 출력 없음)
+
+    시작 손패 요청은 드로우 카드와 무관하므로 항상, multi_card는 정확 계산 가능한
+    덱에서만 계산합니다. 정확 계산할 수 없는 요청이면 None을 반환합니다.
+    """
+    calc_type = calculation_request.get('type')
+    if calc_type in ('preferred_opening', 'non_preferred_opening'):
+        key = 'preferred_basics' if calc_type == 'preferred_opening' else 'non_preferred_basics'
+        # 시작 손패는 드로우 정책과 무관하므로 목표 카드 대신 track_cards로 분리
+        engine = ExactDrawEngine(deck_input, [], track_cards=calculation_request[key])
+        kinds = [engine.kinds.index(name) for name in calculation_request[key] if name in engine.kinds]
+        distribution = engine.opening_distribution()
+        if calc_type == 'preferred_opening':
+            return sum(p for (_, hand), p in distribution.items() if any(hand[kind] for kind in kinds))
+        other_basics = [kind for kind in engine.basic_kinds if kind not in kinds]
+        return sum(p for (_, hand), p in distribution.items() if not any(hand[kind] for kind in other_basics))
+
+    if calc_type == 'multi_card' and not unsupported_effects(deck_input, draw_order):
+        engine = ExactDrawEngine(deck_input, draw_order, calculation_request['target_cards'])
+        return engine.multi_card_probability(calculation_request.get('turn', 2))
+    return None
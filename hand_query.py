@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 손패 조건 질의(query) 컴파일 모듈
+
+계산 요청의 성공 조건을 게임마다 카드명 리스트를 훑어 판정하지 않고, 요청마다 한 번
+"카드 종류 집합" 연산 프로그램으로 컴파일합니다. 카드 종류는 인코딩 엔진에서는 카드 id,
+기준 엔진에서는 카드명이며, 손패는 그대로(리스트) 전달합니다.
+
+질의 DSL (중첩 가능):
+    {"all": [카드, ...]}     모든 카드를 1장 이상
+    {"any": [카드, ...]}     하나 이상을 1장 이상
+    {"none": [카드, ...]}    하나도 없음
+    {"and": [질의, ...]}     모두 만족
+    {"or": [질의, ...]}      하나 이상 만족
+
+컴파일 결과는 절(clause)들의 OR(DNF)이고, 절 하나는
+(need: 모두 있어야 하는 종류, any_of: 각각 하나 이상 있어야 하는 종류 집합들, none_of: 없어야 하는 종류)
+frozenset 묶음입니다. 판정은 C 구현 집합 연산만 사용합니다.
+
+- 절 1개, need만: need.issubset(hand) (목표 카드 수와 무관하게 거의 일정한 비용 → 목표 개수 제한 불필요)
+- 절 1개, any_of 1개만: not any_of.isdisjoint(hand)
+- 그 밖: set(hand) 1회 생성 후 절마다 부분집합 / 서로소 검사
+
+덱에 없는 카드: all에 있으면 그 절은 항상 거짓, any / none에서는 무시합니다.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Sequence, Tuple
+
+Clause = Tuple[FrozenSet[Hashable], Tuple[FrozenSet[Hashable], ...], FrozenSet[Hashable]]
+Resolver = Callable[[str], Optional[Hashable]]
+
+QUERY_OPERATORS = ("all", "any", "none", "and", "or")
+_EMPTY: FrozenSet[Hashable] = frozenset()
+
+
+def _operator(query: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    if not isinstance(query, dict) or len(query) != 1 or next(iter(query)) not in QUERY_OPERATORS:
+        raise ValueError(f"지원하지 않는 질의입니다: {query} (지원: {', '.join(QUERY_OPERATORS)} 중 하나의 키)")
+    operator, operands = next(iter(query.items()))
+    if not isinstance(operands, (list, tuple)):
+        raise ValueError(f"'{operator}' 질의의 값은 목록이어야 합니다: {operands}")
+    return operator, list(operands)
+
+
+def _merge(left: Clause, right: Clause) -> Optional[Clause]:
+    """두 절의 AND (모순이면 None)"""
+    need = left[0] | right[0]
+    none_of = left[2] | right[2]
+    if need & none_of:
+        return None
+    any_of = []
+    for group in left[1] + right[1]:
+        group = group - none_of
+        if not group:
+            return None
+        # need로 이미 만족하는 any_of는 생략
+        if not group & need and group not in any_of:
+            any_of.append(group)
+    return need, tuple(any_of), none_of
+
+
+def query_clauses(query: Dict[str, Any], resolve: Resolver) -> List[Clause]:
+    """질의를 DNF 절 목록으로 변환 (빈 목록이면 항상 거짓)"""
+    operator, operands = _operator(query)
+
+    if operator == "all":
+        keys = [resolve(card_name) for card_name in operands]
+        if any(key is None for key in keys):
+            return []
+        return [(frozenset(keys), (), _EMPTY)]
+    if operator == "any":
+        keys = frozenset(key for key in map(resolve, operands) if key is not None)
+        return [(_EMPTY, (keys,), _EMPTY)] if keys else []
+    if operator == "none":
+        return [(_EMPTY, (), frozenset(key for key in map(resolve, operands) if key is not None))]
+    if operator == "or":
+        clauses = []
+        for operand in operands:
+            for clause in query_clauses(operand, resolve):
+                if clause not in clauses:
+                    clauses.append(clause)
+        return clauses
+
+    clauses = [(_EMPTY, (), _EMPTY)]
+    for operand in operands:
+        operand_clauses = query_clauses(operand, resolve)
+        merged = []
+        for left in clauses:
+            for right in operand_clauses:
+                clause = _merge(left, right)
+                if clause is not None and clause not in merged:
+                    merged.append(clause)
+        clauses = merged
+    return clauses
+
+
+def _never(hand: Sequence[Hashable]) -> bool:
+    return False
+
+
+def _always(hand: Sequence[Hashable]) -> bool:
+    return True
+
+
+def _clause_matches(clause: Clause, present: set) -> bool:
+    need, any_of, none_of = clause
+    return (need.issubset(present)
+            and all(not group.isdisjoint(present) for group in any_of)
+            and none_of.isdisjoint(present))
+
+
+class HandQuery:
+    """컴파일된 손패 조건 (호출하면 손패 리스트가 조건을 만족하는지 반환)"""
+
+    def __init__(self, clauses: List[Clause]):
+        self.clauses = clauses
+        self._match = self._specialize(clauses)
+
+    def __call__(self, hand: Sequence[Hashable]) -> bool:
+        return self._match(hand)
+
+    @staticmethod
+    def _specialize(clauses: List[Clause]) -> Callable[[Sequence[Hashable]], bool]:
+        """자주 쓰는 형태는 집합 연산 1~2회짜리 함수로 특수화"""
+        if not clauses:
+            return _never
+        if len(clauses) == 1:
+            need, any_of, none_of = clauses[0]
+            if not any_of and not none_of:
+                return need.issubset if need else _always
+            if not need and not none_of and len(any_of) == 1:
+                group = any_of[0]
+                return lambda hand: not group.isdisjoint(hand)
+            if not need and len(any_of) == 1:
+                group = any_of[0]
+                return lambda hand: not group.isdisjoint(hand) and none_of.isdisjoint(hand)
+        if all(not any_of and not none_of for _, any_of, none_of in clauses):
+            needs = [need for need, _, _ in clauses]
+
+            def match_any_need(hand):
+                present = set(hand)
+                for need in needs:
+                    if need <= present:
+                        return True
+                return False
+            return match_any_need
+
+        def match(hand):
+            present = set(hand)
+            for clause in clauses:
+                if _clause_matches(clause, present):
+                    return True
+            return False
+        return match
+
+
+def compile_query(query: Dict[str, Any], resolve: Resolver) -> HandQuery:
+    """질의 DSL을 HandQuery로 컴파일
+
+    Args:
+        query: 질의 DSL 딕셔너리
+        resolve: 카드명 -> 손패에 들어 있는 카드 종류 (덱에 없으면 None)
+    """
+    return HandQuery(query_clauses(query, resolve))
+
+
+def request_queries(calculation_request: Dict[str, Any],
+                    basic_cards: List[str]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """계산 요청(복합 타입 포함)을 (시작 손패 질의, 최종 손패 질의)로 변환 (해당 없으면 None)
+
+    Args:
+        calculation_request: 계산 요청
+        basic_cards: 덱의 Basic Pokemon 카드명
+    """
+    calc_type = calculation_request.get('type')
+
+    opening_query = None
+    if calc_type == 'preferred_opening':
+        opening_query = {"any": calculation_request['preferred_basics']}
+    elif calc_type == 'preferred_and_multi':
+        opening_query = {"any": [card for card in calculation_request['preferred_basics'] if card in basic_cards]}
+    elif calc_type in ('non_preferred_opening', 'non_preferred_and_multi'):
+        non_preferred_basics = calculation_request['non_preferred_basics']
+        opening_query = {"and": [{"any": basic_cards},
+                                 {"none": [card for card in basic_cards if card not in non_preferred_basics]}]}
+
+    final_query = None
+    if calc_type == 'multi_or_multi':
+        final_query = {"or": [{"all": group['target_cards']} for group in calculation_request['target_groups']]}
+    elif calc_type in ('multi_card', 'preferred_and_multi', 'non_preferred_and_multi'):
+        final_query = {"all": calculation_request['target_cards']}
+    elif calc_type not in ('preferred_opening', 'non_preferred_opening'):
+        raise ValueError(f"지원하지 않는 계산 타입입니다: {calc_type}")
+
+    return opening_query, final_query
+
+
+def compile_request(calculation_request: Dict[str, Any], resolve: Resolver,
+                    basic_cards: List[str]) -> Tuple[Optional[HandQuery], Optional[HandQuery]]:
+    """계산 요청을 (시작 손패 HandQuery, 최종 손패 HandQuery)로 컴파일 (해당 없으면 None)"""
+    opening_query, final_query = request_queries(calculation_request, basic_cards)
+    return (compile_query(opening_query, resolve) if opening_query is not None else None,
+            compile_query(final_query, resolve) if final_query is not None else None)
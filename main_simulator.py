@@ -1,15 +1,33 @@
 # Pokemon Pocket Simulator - 메인 실행 함수 (확률 계산 모듈 분리 버전)
 import random
-import copy
+import operator
 from collections import defaultdict
 from typing import Dict, List, Tuple, Any
 
 # 확률 계산기 모듈 import
 from probability_calculator import ProbabilityCalculator
 # 카드 효과 모듈 import
-from card_effects import CardEffects, DRAW_CARDS, get_draw_cards_list, is_draw_card
+from card_effects import CardEffects, DRAW_CARDS, get_draw_cards_list, is_draw_card, resolve_effects
+# 정수 인코딩 엔진 import
+from encoded_engine import EncodedSimulationEngine, CardTable
+# 멀리건 없는 시작 손패 샘플러
+from opening_sampler import OpeningSampler, OPENING_METHODS, get_opening_sampler
+# 덱 종류별 위치 색인
+from deck_index import DeckIndex
+# Iono / Pokemon Communication 판단 캐시
+from decision_cache import DecisionCache, iono_signature, multi_or_multi_signature, pokemon_communication_signature
+# evolution 계산 타입 (v3 파이프라인)
+from v3_simulation import target_evolution_lines
+# 신뢰구간 방식 목록
+from stats_utils import INTERVAL_METHODS
+from progress import ProgressReporter, ConsoleProgressReporter
+# 계산 결과 영구 캐시
+from result_cache import ResultCache, make_cache_key
+from batch_engine import numpy_available
+from profiling import profile_phases
 import json
 import os
+import sys
 
 # 파일 읽기 함수들
 def load_deck_from_file(filename: str = "DeckList.txt") -> Dict[str, Dict[str, Any]]:
@@ -56,6 +74,7 @@ def load_test_cases_from_file(filename: str = "TestCase.txt") -> Tuple[List[Dict
     test_cases = []
     draw_order = []
     simulation_count = 2000
+    seed = None
     
     # 절대 경로 생성
     if not os.path.isabs(filename):
@@ -90,6 +109,7 @@ def load_test_cases_from_file(filename: str = "TestCase.txt") -> Tuple[List[Dict
                     elif 'draw_order' in data:
                         draw_order = data.get('draw_order', [])
                         simulation_count = data.get('simulation_count', 2000)
+                        seed = data.get('seed')
                 except json.JSONDecodeError:
                     continue
             elif in_json:
@@ -102,6 +122,10 @@ def load_test_cases_from_file(filename: str = "TestCase.txt") -> Tuple[List[Dict
         print(f"❌ 테스트 케이스 파일 읽기 오류: {e}")
         return None, None, None
     
+    # 설정 블록의 seed는 각 테스트 케이스의 기본 seed (케이스에 seed가 있으면 우선)
+    for test_case in test_cases:
+        test_case.setdefault('seed', seed)
+    
     return test_cases, draw_order, simulation_count
 
 # 카드 클래스
@@ -156,39 +180,94 @@ def print_deck_summary(deck: List[Card]):
     for card_type, count in sorted(type_count.items()):
         print(f"{card_type}: {count}장")
 
+_card_name = operator.attrgetter("name")
+
 # 게임 상태 관리 클래스
 class GameState:
-    def __init__(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str] = None):
-        self.original_deck = create_deck(deck_input)
-        self.deck = copy.deepcopy(self.original_deck)
+    def __init__(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str] = None, rng=None,
+                 opening_sampler: OpeningSampler = None, card_kinds: List[Card] = None, shuffle: bool = True):
+        """
+        Args:
+            opening_sampler: 멀리건 없는 시작 손패 샘플러 (None이면 기존 셔플 반복)
+            card_kinds: opening_sampler의 카드 id별 Card 객체
+            shuffle: 생성 시 덱 셔플 여부 (게임마다 재사용하는 상태는 initial_draw가 리셋 / 셔플하므로 False)
+        """
         self.hand = []
         self.turn = 0
         self.draw_order = draw_order or []
-        random.shuffle(self.deck)
+        # 셔플/카드 효과에 사용할 난수 생성기 (None이면 전역 random 모듈)
+        self.rng = rng if rng is not None else random
+        self.opening_sampler = opening_sampler
+        self.card_kinds = card_kinds
+        # 덱 색인 (카드 효과가 처음 필요로 할 때 생성, 리셋 후에는 보관해 둔 객체를 재구성해 재사용)
+        self.kind_types = {card_name: card_info["type"] for card_name, card_info in deck_input.items()}
+        self._deck_index = None
+        self._spare_deck_index = None
+        if opening_sampler is None:
+            # 원본 덱 스냅샷 (Card 객체는 게임 중 바뀌지 않으므로 덱 리스트만 복원)
+            self.original_deck = create_deck(deck_input)
+            self.deck = list(self.original_deck)
+            if shuffle:
+                self.rng.shuffle(self.deck)
+        else:
+            # 덱은 initial_draw에서 샘플러로 구성
+            self.original_deck = None
+            self.deck = []
     
     def reset_game(self):
-        self.deck = copy.deepcopy(self.original_deck)
-        self.hand = []
+        """새 게임 시작 상태로 되돌리기 (덱 / 손패 리스트를 제자리에서 복원, 객체 생성 없음)"""
+        if self.original_deck is not None:
+            self.deck[:] = self.original_deck
+            self.rng.shuffle(self.deck)
+        else:
+            self.deck.clear()
+        self.hand.clear()
         self.turn = 0
-        random.shuffle(self.deck)
+        if self._deck_index is not None:
+            self._spare_deck_index, self._deck_index = self._deck_index, None
+    
+    @property
+    def deck_index(self) -> DeckIndex:
+        """덱 색인 (덱 리스트가 교체되었거나 색인 밖에서 장수가 바뀌었으면 재구성)"""
+        index = self._deck_index
+        if index is None:
+            index = self._spare_deck_index
+            if index is None:
+                index = DeckIndex(self.deck, self.kind_types, _card_name)
+            else:
+                index.rebuild(self.deck)
+            self._deck_index = index
+        elif index.deck is not self.deck or len(index) != len(self.deck):
+            index.rebuild(self.deck)
+        return index
     
     def draw_cards(self, count: int) -> List[Card]:
         drawn = []
+        index = self._deck_index
+        use_index = index is not None and index.deck is self.deck and len(index) == len(self.deck)
         for _ in range(min(count, len(self.deck))):
             if self.deck:
-                card = self.deck.pop(0)
+                card = index.pop_top() if use_index else self.deck.pop(0)
                 self.hand.append(card)
                 drawn.append(card)
         return drawn
     
     def initial_draw(self) -> bool:
+        if self.opening_sampler is not None:
+            if not self.opening_sampler.valid:
+                return False
+            hand_ids, deck_ids = self.opening_sampler.sample(self.rng)
+            self.reset_game()
+            card_kind = self.card_kinds.__getitem__
+            self.hand.extend(map(card_kind, hand_ids))
+            self.deck.extend(map(card_kind, deck_ids))
+            return True
+        
         max_attempts = 50
         attempts = 0
         
         while attempts < max_attempts:
-            self.hand = []
-            self.deck = copy.deepcopy(self.original_deck)
-            random.shuffle(self.deck)
+            self.reset_game()
             
             self.draw_cards(5)
             
@@ -208,13 +287,47 @@ class GameState:
 
 # 시뮬레이션 엔진
 class SimulationEngine:
-    def __init__(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str] = None):
+    def __init__(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str] = None, opening: str = "mulligan"):
+        """
+        Args:
+            opening: 시작 손패 방식 - "mulligan" (Basic이 나올 때까지 셔플 반복) 또는
+                     "alias" (덱 구성별 alias 테이블로 한 번에 샘플링, opening_sampler 모듈)
+        """
+        if opening not in OPENING_METHODS:
+            raise ValueError(f"지원하지 않는 시작 손패 방식입니다: {opening} (지원: {', '.join(OPENING_METHODS)})")
         self.deck_input = deck_input
         self.draw_order = draw_order or []
+        self.opening = opening
         self.available_draw_cards = [card_name for card_name in deck_input.keys() if card_name in DRAW_CARDS]
+        # 드로우 순서의 카드 효과는 덱마다 한 번만 조회 (턴 진행 중에는 handler 직접 호출)
+        self.effects = resolve_effects(self.draw_order)
+        # Iono / Pokemon Communication 판단 캐시 (손패 / 덱 구성 서명 기준 LRU)
+        self.decision_cache = DecisionCache()
+        self._group_signature_parts = None
+        # 게임마다 재사용하는 게임 상태 (첫 게임에서 생성, 이후 initial_draw가 제자리에서 리셋)
+        self._game_state = None
+        
+        # run_stream이 accumulator에 전달하는 카드 id 기준 (EncodedSimulationEngine과 같은 id)
+        self.card_table = table = CardTable(deck_input)
+        
+        self.opening_sampler = None
+        self.card_kinds = None
+        if opening == "alias":
+            self.opening_sampler = get_opening_sampler(tuple(table.counts), tuple(table.is_basic))
+            self.card_kinds = [Card(name, card_type) for name, card_type in zip(table.names, table.types)]
     
-    def simulate_single_game(self, max_turn: int = 2, verbose: bool = False, target_cards: List[str] = None, target_groups: List[Dict] = None) -> Dict[str, Any]:
-        game_state = GameState(self.deck_input, self.draw_order)
+    def _reusable_game_state(self, rng=None) -> GameState:
+        """엔진의 게임 상태를 새 게임용 난수 생성기로 준비 (게임마다 생성하지 않고 재사용)"""
+        game_state = self._game_state
+        if type(game_state) is not GameState:  # 첫 게임이거나 GameState 클래스가 교체된 경우
+            game_state = self._game_state = GameState(self.deck_input, self.draw_order, rng, self.opening_sampler,
+                                                      self.card_kinds, shuffle=False)
+        else:
+            game_state.rng = rng if rng is not None else random
+        return game_state
+    
+    def simulate_single_game(self, max_turn: int = 2, verbose: bool = False, target_cards: List[str] = None, target_groups: List[Dict] = None, rng=None) -> Dict[str, Any]:
+        game_state = self._reusable_game_state(rng)
         result = {
             'success': False,
             'turn_results': {},
@@ -255,6 +368,60 @@ class SimulationEngine:
         result['final_hand'] = [card.name for card in game_state.hand]
         return result
     
+    def run_stream(self, accumulator, num_games: int, max_turn: int = 2, target_cards: List[str] = None,
+                   target_groups: List[Dict] = None, game_seeds: List[int] = None):
+        """게임 결과 딕셔너리 없이 num_games판을 실행하고 accumulator에 카드 id 손패만 전달
+        
+        EncodedSimulationEngine.run_stream과 같은 인터페이스이며 (카드 id는 card_table 기준),
+        simulate_single_game과 난수 사용 순서가 같으므로 같은 seed에서 같은 게임이 진행됩니다.
+        트래시는 드로우 카드 사용 후 버린 카드(사용한 드로우 카드)입니다.
+        
+        Args:
+            accumulator: GameAccumulator (accumulators 모듈) 인터페이스 객체
+            num_games: 실행할 게임 수
+            max_turn / target_cards / target_groups: simulate_single_game과 동일
+            game_seeds: 게임마다 난수 흐름을 초기화할 seed 목록 (주어지면 num_games 대신 사용)
+        
+        Returns:
+            accumulator
+        """
+        card_ids = self.card_table.ids
+        needs_opening_hand = accumulator.needs_opening_hand
+        needs_turn_hands = accumulator.needs_turn_hands
+        rng = None
+        if game_seeds is not None:
+            rng = random.Random()
+            num_games = len(game_seeds)
+        game_state = self._reusable_game_state(rng)
+        discard = []
+        
+        for game_index in range(num_games):
+            if game_seeds is not None:
+                rng.seed(game_seeds[game_index])
+            if not game_state.initial_draw():
+                accumulator.on_invalid_game()
+                continue
+            
+            if needs_opening_hand or needs_turn_hands:
+                hand = [card_ids[card.name] for card in game_state.hand]
+                if needs_opening_hand:
+                    accumulator.on_opening_hand(hand)
+                if needs_turn_hands:
+                    discard.clear()
+                    accumulator.on_turn_hand(0, hand, discard)
+            
+            for turn in range(1, max_turn + 1):
+                game_state.turn = turn
+                game_state.start_turn()
+                cards_used = self._use_draw_cards(game_state, False, target_cards, max_turn, target_groups)
+                if needs_turn_hands:
+                    discard.extend(card_ids[card_name] for card_name in cards_used)
+                    accumulator.on_turn_hand(turn, [card_ids[card.name] for card in game_state.hand], discard)
+            
+            accumulator.on_final_hand([card_ids[card.name] for card in game_state.hand])
+        
+        return accumulator
+    
     def _use_draw_cards(self, game_state: GameState, verbose: bool = False, target_cards: List[str] = None, max_turn: int = None, target_groups: List[Dict] = None) -> List[str]:
         """
         한 턴에서 드로우 카드들을 사용하는 함수 (올바른 게임 규칙 + Pokemon Communication 연쇄 로직)
@@ -279,6 +446,7 @@ class SimulationEngine:
             
             for card_name in regular_draw_cards:
                 cards_in_hand = [card for card in game_state.hand if card.name == card_name]
+                effect = self.effects[card_name]
                 
                 for card in cards_in_hand:
                     # Supporter 제한 체크
@@ -295,9 +463,9 @@ class SimulationEngine:
                         should_use = False
                         
                         if target_groups:  # multi_or_multi인 경우
-                            should_use = self._should_use_iono_for_multi_or_multi(game_state, target_groups, verbose)
+                            should_use = self._cached_multi_or_multi_iono(game_state, target_groups, verbose)
                         elif target_cards:  # 기존 multi_card인 경우
-                            decision = CardEffects.should_use_iono(game_state, target_cards)
+                            decision = self._cached_iono_decision(game_state, target_cards)
                             should_use = decision["should_use"]
                             if verbose and not should_use:
                                 print(f"  {card_name} 사용 안 함: {decision['reason']}")
@@ -305,7 +473,12 @@ class SimulationEngine:
                         if not should_use:
                             continue
 
-                    effect_result = CardEffects.use_card_effect(card_name, game_state)
+                    if effect.precondition is not None and not effect.precondition(game_state):
+                        if verbose:
+                            print(f"  {card_name} 사용 조건 불충족")
+                        continue
+
+                    effect_result = effect.handler(game_state)
                     
                     if verbose:
                         print(f"    결과: {effect_result['description']}")
@@ -326,7 +499,7 @@ class SimulationEngine:
                 
                 for pokemon_comm_card in pokemon_comm_cards:
                     # Pokemon Communication 사용 여부 판단
-                    decision = CardEffects.should_use_pokemon_communication(game_state, target_cards, max_turn)
+                    decision = self._cached_pokemon_communication_decision(game_state, target_cards, max_turn)
                     
                     if decision["should_use"]:
                         if verbose:
@@ -362,6 +535,32 @@ class SimulationEngine:
         
         return cards_used
     
+    # ==================== 판단 캐시 (decision_cache 모듈) ====================
+
+    def _cached_iono_decision(self, game_state: GameState, target_cards: List[str]) -> Dict[str, Any]:
+        """손패 서명 기준으로 캐시한 CardEffects.should_use_iono"""
+        key = iono_signature(game_state.hand, tuple(target_cards))
+        return self.decision_cache.lookup(key, lambda: CardEffects.should_use_iono(game_state, target_cards))
+
+    def _cached_multi_or_multi_iono(self, game_state: GameState, target_groups: List[Dict], verbose: bool = False) -> bool:
+        """손패 서명 기준으로 캐시한 _should_use_iono_for_multi_or_multi (verbose면 판단 로그를 위해 캐시 생략)"""
+        if verbose:
+            return self._should_use_iono_for_multi_or_multi(game_state, target_groups, verbose)
+        # 서명 재료는 같은 target_groups 객체가 반복 전달되는 동안 재사용
+        parts = self._group_signature_parts
+        if parts is None or parts[0] is not target_groups:
+            group_targets = tuple(tuple(group['target_cards']) for group in target_groups)
+            all_targets = frozenset(card_name for targets in group_targets for card_name in targets) - {"Iono"}
+            parts = self._group_signature_parts = (target_groups, group_targets, all_targets)
+        key = multi_or_multi_signature(game_state.hand, parts[1], parts[2])
+        return self.decision_cache.lookup(key, lambda: self._should_use_iono_for_multi_or_multi(game_state, target_groups))
+
+    def _cached_pokemon_communication_decision(self, game_state: GameState, target_cards: List[str], max_turn: int) -> Dict[str, Any]:
+        """손패 / 덱 서명 기준으로 캐시한 CardEffects.should_use_pokemon_communication"""
+        key = pokemon_communication_signature(game_state, tuple(target_cards), max_turn)
+        return self.decision_cache.lookup(
+            key, lambda: CardEffects.should_use_pokemon_communication(game_state, target_cards, max_turn))
+
     def _should_use_iono_for_multi_or_multi(self, game_state: GameState, target_groups: List[Dict], verbose: bool = False) -> bool:
         """
         multi_or_multi 상황에서 Iono 사용 여부를 판단하는 함수
@@ -401,7 +600,14 @@ class SimulationEngine:
 # ==================== 메인 실행 함수 ====================
 
 class PokemonPocketSimulator:
-    def __init__(self):
+    def __init__(self, progress_reporter: ProgressReporter = None, result_cache: ResultCache = None):
+        """
+        Args:
+            progress_reporter: 시뮬레이션 진행 상황 reporter (None이면 콘솔 출력)
+            result_cache: 계산 결과 캐시 (None이면 캐시 사용 안 함)
+        """
+        self.progress_reporter = progress_reporter or ConsoleProgressReporter()
+        self.result_cache = result_cache
         self.sim_engine = None
         self.prob_calculator = None
         self.current_deck = None
@@ -434,7 +640,7 @@ class PokemonPocketSimulator:
         """계산 요청 검증 (v2.0)"""
         try:
             calc_type = calculation_request.get("type")
-            supported_types = ["preferred_opening", "non_preferred_opening", "multi_card"]
+            supported_types = ["preferred_opening", "non_preferred_opening", "multi_card", "card_curves", "evolution"]
             
             if calc_type not in supported_types:
                 print(f"❌ 오류: 지원하지 않는 계산 타입입니다: {calc_type}")
@@ -459,23 +665,91 @@ class PokemonPocketSimulator:
                 if not target_cards:
                     print("❌ 오류: target_cards가 비어있습니다.")
                     return False
-                if len(target_cards) > 3:
-                    print("❌ 오류: target_cards는 최대 3개까지만 지원합니다.")
-                    return False
                     
                 turn = calculation_request.get("turn", 2)
                 if not isinstance(turn, int) or turn < 1:
                     print("❌ 오류: turn은 1 이상의 정수여야 합니다.")
                     return False
-            
+
+            elif calc_type == "card_curves":
+                cards = calculation_request.get("cards", [])
+                if not isinstance(cards, list):
+                    print("❌ 오류: cards는 카드 이름 목록이어야 합니다. (생략하면 덱의 모든 카드)")
+                    return False
+                if self.current_deck is not None:
+                    missing_cards = [card for card in cards if card not in self.current_deck]
+                    if missing_cards:
+                        print(f"❌ 오류: 덱에 없는 카드입니다: {', '.join(missing_cards)}")
+                        return False
+
+                turn = calculation_request.get("turn", 2)
+                if not isinstance(turn, int) or turn < 1:
+                    print("❌ 오류: turn은 1 이상의 정수여야 합니다.")
+                    return False
+                if "target_half_width" in calculation_request:
+                    print("❌ 오류: card_curves는 target_half_width(적응형 실행)를 지원하지 않습니다.")
+                    return False
+
+            elif calc_type == "evolution":
+                target_evolutions = calculation_request.get("target_evolutions", [])
+                evolution_lines = calculation_request.get("evolution_lines", [])
+                if not target_evolutions:
+                    print("❌ 오류: target_evolutions가 비어있습니다.")
+                    return False
+                if not evolution_lines:
+                    print("❌ 오류: evolution_lines가 비어있습니다.")
+                    return False
+                try:
+                    target_evolution_lines(evolution_lines, target_evolutions)
+                except ValueError as e:
+                    print(f"❌ 오류: {e}")
+                    return False
+                if self.current_deck is not None:
+                    missing_cards = [card for card in target_evolutions if card not in self.current_deck]
+                    if missing_cards:
+                        print(f"❌ 오류: 덱에 없는 카드입니다: {', '.join(missing_cards)}")
+                        return False
+
+                turn = calculation_request.get("turn", 2)
+                if not isinstance(turn, int) or turn < 1:
+                    print("❌ 오류: turn은 1 이상의 정수여야 합니다.")
+                    return False
+
+            # 목표 정밀도 기반 적응형 실행 옵션 검증
+            if "target_half_width" in calculation_request:
+                target_half_width = calculation_request["target_half_width"]
+                if not isinstance(target_half_width, (int, float)) or target_half_width <= 0:
+                    print("❌ 오류: target_half_width는 0보다 큰 숫자(%p)여야 합니다.")
+                    return False
+                max_simulations = calculation_request.get("max_simulations", 1)
+                if not isinstance(max_simulations, int) or max_simulations < 1:
+                    print("❌ 오류: max_simulations는 1 이상의 정수여야 합니다.")
+                    return False
+                confidence = calculation_request.get("confidence", 0.95)
+                if not 0 < confidence < 1:
+                    print("❌ 오류: confidence는 0과 1 사이여야 합니다.")
+                    return False
+                if calculation_request.get("interval_method", "wilson") not in INTERVAL_METHODS:
+                    print(f"❌ 오류: interval_method는 {', '.join(INTERVAL_METHODS)} 중 하나여야 합니다.")
+                    return False
+
             return True
             
         except Exception as e:
             print(f"❌ 계산 요청 오류: {e}")
             return False
     
-    def setup_simulation(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str] = None):
-        """시뮬레이션 설정"""
+    def setup_simulation(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str] = None, engine: str = "object",
+                         opening: str = "mulligan"):
+        """시뮬레이션 설정
+
+        Args:
+            deck_input: 덱 구성 정보
+            draw_order: 드로우 카드 발동 순서 (None이면 덱의 드로우 카드 순서)
+            engine: "object" (Card 객체 기반 SimulationEngine) 또는
+                    "encoded" (정수 인코딩 기반 EncodedSimulationEngine)
+            opening: "mulligan" (셔플 반복) 또는 "alias" (멀리건 없는 시작 손패 샘플링)
+        """
         print("\n" + "="*60)
         print("시뮬레이션 설정 중...")
         print("="*60)
@@ -484,6 +758,14 @@ class PokemonPocketSimulator:
         if not self.validate_deck_input(deck_input):
             return False
         
+        if engine not in ("object", "encoded"):
+            print(f"❌ 오류: 지원하지 않는 엔진입니다: {engine} (지원: object, encoded)")
+            return False
+        
+        if opening not in OPENING_METHODS:
+            print(f"❌ 오류: 지원하지 않는 시작 손패 방식입니다: {opening} (지원: {', '.join(OPENING_METHODS)})")
+            return False
+        
         # 드로우 순서 설정
         available_draw_cards = [card_name for card_name in deck_input.keys() if card_name in DRAW_CARDS]
         
@@ -499,16 +781,26 @@ class PokemonPocketSimulator:
             print(f"드로우 카드 발동 순서 (사용자 설정): {draw_order}")
         
         # 시뮬레이션 엔진 및 확률 계산기 생성
-        self.sim_engine = SimulationEngine(deck_input, draw_order)
-        self.prob_calculator = ProbabilityCalculator(self.sim_engine)  # 분리된 모듈 사용
+        if engine == "encoded":
+            self.sim_engine = EncodedSimulationEngine(deck_input, draw_order, opening=opening)
+        else:
+            self.sim_engine = SimulationEngine(deck_input, draw_order, opening)
+        self.prob_calculator = ProbabilityCalculator(self.sim_engine, self.progress_reporter)  # 분리된 모듈 사용
         self.current_deck = deck_input
         self.current_draw_order = draw_order
         
-        print("✅ 시뮬레이션 설정 완료")
+        print(f"✅ 시뮬레이션 설정 완료 (엔진: {engine}, 시작 손패: {opening})")
         return True
     
-    def run_calculation(self, calculation_request: Dict[str, Any], simulation_count: int = 10000):
-        """확률 계산 실행 (v2.0)"""
+    def run_calculation(self, calculation_request: Dict[str, Any], simulation_count: int = 10000, workers: int = 1, seed: int = None):
+        """확률 계산 실행 (v2.0)
+        
+        Args:
+            calculation_request: 계산 요청
+            simulation_count: 시뮬레이션 횟수
+            workers: 시뮬레이션 프로세스 수 (1이면 단일 프로세스)
+            seed: 난수 seed (None이면 매번 다른 결과)
+        """
         
         # 계산 요청 검증
         if not self.validate_calculation_request(calculation_request):
@@ -521,11 +813,85 @@ class PokemonPocketSimulator:
         
         print("✅ 계산 요청 검증 통과")
         
+        # 같은 조건으로 계산한 결과가 캐시에 있으면 재사용
+        cache_key = self._cache_key(calculation_request, simulation_count, workers, seed)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                print("💾 캐시된 결과를 사용합니다 (덱 / 드로우 순서 / 요청 / seed 동일)")
+                self.prob_calculator.print_calculation_result(cached)
+                return cached
+        
         # ProbabilityCalculator의 run_calculation 메서드에 위임
-        result = self.prob_calculator.run_calculation(calculation_request, simulation_count)
+        result = self.prob_calculator.run_calculation(calculation_request, simulation_count, workers=workers, seed=seed)
+        
+        if result and cache_key is not None:
+            self.result_cache.put(cache_key, result)
         
         return result
     
+    def run_calculation_suite(self, calculation_requests: List[Dict[str, Any]], simulation_count: int = 10000, seed: int = None) -> List[Dict[str, Any]]:
+        """여러 계산 요청을 게임 흐름을 공유해 실행 (스위트 모드)
+        
+        같은 덱 / 드로우 순서에서 정책 입력(target_cards 등)이 같은 시뮬레이션 요청은
+        가장 큰 turn까지 게임을 한 번만 진행하고 요청별 턴의 손패로 판정합니다.
+        정확 계산 / 적응형 요청은 run_calculation으로 개별 계산합니다.
+        
+        Args:
+            calculation_requests: 계산 요청 목록
+            simulation_count: 그룹별 시뮬레이션 횟수
+            seed: 난수 seed (그룹별 seed는 이 값과 그룹 정책 입력에서 파생)
+        
+        Returns:
+            요청 순서대로의 결과 목록 (검증 실패 요청은 None)
+        """
+        if self.sim_engine is None or self.prob_calculator is None:
+            print("❌ 오류: 시뮬레이션이 설정되어 있지 않습니다. setup_simulation()을 먼저 호출하세요.")
+            return [None] * len(calculation_requests)
+        
+        results = [None] * len(calculation_requests)
+        valid_indices = [index for index, request in enumerate(calculation_requests)
+                         if self.validate_calculation_request(request)]
+        individual, groups = self.prob_calculator.plan_suite([calculation_requests[index] for index in valid_indices])
+        
+        for position in individual:
+            index = valid_indices[position]
+            results[index] = self.run_calculation(calculation_requests[index], simulation_count, seed=seed)
+        
+        for group in groups:
+            # 그룹 결과는 그룹 구성(signature)에 따라 달라지므로 캐시 키에 포함
+            cache_keys = [self._cache_key(request, simulation_count, 1, seed, shared_pass=group['signature'])
+                          for _, request, _ in group['members']]
+            cached = [self.result_cache.get(key) if key is not None else None for key in cache_keys]
+            if all(result is not None for result in cached):
+                print(f"💾 캐시된 결과를 사용합니다 (게임 흐름 공유 요청 {len(cached)}개)")
+                group_results = dict(zip((position for position, _, _ in group['members']), cached))
+            else:
+                group_results = self.prob_calculator.run_shared_group(group, simulation_count, seed)
+                for key, (position, _, _) in zip(cache_keys, group['members']):
+                    if key is not None:
+                        self.result_cache.put(key, group_results[position])
+            
+            for position, result in group_results.items():
+                self.prob_calculator.print_calculation_result(result)
+                results[valid_indices[position]] = result
+        
+        return results
+    
+    def _cache_key(self, calculation_request: Dict[str, Any], simulation_count: int, workers: int, seed: int, **settings):
+        """결과 캐시 키 (캐시를 쓰지 않거나 seed 없는 시뮬레이션이면 None)"""
+        if self.result_cache is None:
+            return None
+        if self.prob_calculator.is_deterministic(calculation_request):
+            # 정확 계산은 seed / 시뮬레이션 횟수와 무관
+            seed = simulation_count = workers = None
+        elif seed is None:
+            return None
+        return make_cache_key(self.current_deck, self.current_draw_order, calculation_request,
+                              seed=seed, simulation_count=simulation_count, workers=workers,
+                              engine=type(self.sim_engine).__name__, opening=self.sim_engine.opening,
+                              numpy=numpy_available(), **settings)
+    
     def print_deck_info(self):
         """현재 덱 정보 출력"""
         if self.current_deck is None:
@@ -626,13 +992,18 @@ def main():
     else:
         print("\n❌ 시뮬레이션 실행 중 오류가 발생하였습니다.")
 
-def run_test_suite():
-    """모든 테스트의 확률 계산 테스트 실행 (파일에서 설정 읽기)"""
+def run_test_suite(use_cache: bool = True, shared: bool = False):
+    """모든 테스트의 확률 계산 테스트 실행 (파일에서 설정 읽기)
+    
+    Args:
+        use_cache: True면 이전 실행 결과를 작업 디렉토리의 결과 캐시에서 재사용
+        shared: True면 스위트 모드 (정책 입력이 같은 케이스끼리 게임 흐름 공유)
+    """
     print("Pokemon Pocket Simulator - 전체 테스트 스위트")
     print("="*60)
     
     # 시뮬레이터 인스턴스 생성
-    simulator = PokemonPocketSimulator()
+    simulator = PokemonPocketSimulator(result_cache=ResultCache() if use_cache else None)
     
     # 파일에서 덱 정보 읽기
     print("📁 DeckList.txt에서 덱 정보를 읽는 중...")
@@ -666,13 +1037,21 @@ def run_test_suite():
     # 덱 정보 출력
     simulator.print_deck_info()
     
+    # 스위트 모드: 모든 케이스를 한 번에 실행 (seed는 첫 케이스 기준 - 설정 블록의 seed)
+    if shared:
+        suite_results = simulator.run_calculation_suite([test_case["request"] for test_case in test_cases],
+                                                        simulation_count, seed=test_cases[0].get("seed") if test_cases else None)
+    
     results = []
     for i, test_case in enumerate(test_cases, 1):
         print(f"\n" + "="*80)
         print(f"테스트 {i}/{len(test_cases)}: {test_case['name']}")
         print("="*80)
         
-        result = simulator.run_calculation(test_case["request"], simulation_count)
+        if shared:
+            result = suite_results[i - 1]
+        else:
+            result = simulator.run_calculation(test_case["request"], simulation_count, seed=test_case.get("seed"))
         if result:
             results.append(result)
         else:
@@ -685,13 +1064,26 @@ def run_test_suite():
     
     for i, result in enumerate(results, 1):
         print(f"테스트 {i}: {result['description']}")
-        print(f"  확률: {result['probability_percent']:.2f}%")
+        if 'probability_percent' in result:
+            print(f"  확률: {result['probability_percent']:.2f}%")
+        else:
+            print(f"  카드 {len(result['cards'])}종 x {result['max_turn']}턴 확률 곡선")
         print()
     
     print(f"✅ 전체 테스트 완료: {len(results)}/{len(test_cases)}개 성공")
     print("📁 모든 설정이 파일에서 성공적으로 로드되었습니다.")
 
 if __name__ == "__main__":
+    # --profile: 단계별 프로파일 표 출력 + collapsed stack 저장 (--profile-output 경로, 기본 profile.folded)
+    profile = "--profile" in sys.argv
+    profile_output = "profile.folded"
+    if "--profile-output" in sys.argv:
+        profile_output = sys.argv[sys.argv.index("--profile-output") + 1]
+    # --no-cache: 전체 테스트 스위트에서 결과 캐시를 사용하지 않고 모두 다시 계산
+    use_cache = "--no-cache" not in sys.argv
+    # --shared: 전체 테스트 스위트를 게임 흐름 공유(스위트 모드)로 실행
+    shared = "--shared" in sys.argv
+    
     # 사용에 따라 단일 테스트 또는 전체 테스트 실행
     print("실행 모드를 선택하세요:")
     print("1. 단일 테스트 (타입 1)")
@@ -700,11 +1092,16 @@ if __name__ == "__main__":
     # 기본값: 단일 테스트
     try:
         choice = input("선택 (1/2, 기본값: 1): ").strip() or "1"
+        run = (lambda: run_test_suite(use_cache, shared)) if choice == "2" else main
         
-        if choice == "2":
-            run_test_suite()
+        if profile:
+            with profile_phases() as profiler:
+                run()
+            profiler.print_report()
+            profiler.write_collapsed(profile_output)
+            print(f"📁 collapsed stack 저장: {profile_output}")
         else:
-            main()
+            run()
     except KeyboardInterrupt:
         print("\n\n프로그램이 종료되었습니다.")
     except Exception as e:
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 멀리건 없는 시작 손패 샘플러
+
+기존 initial_draw는 첫 5장에 Basic Pokemon이 나올 때까지 덱 전체를 다시 셔플합니다.
+Basic이 적은 덱일수록 이 반복(멀리건)이 실행 시간의 큰 부분을 차지합니다.
+
+OpeningSampler는 덱 구성마다 한 번, "Basic을 포함하는 5장 조합(카드 종류별 장수)"의
+조건부 분포를 계산해 Walker alias 테이블로 만들어 두고 O(1)로 조합을 뽑습니다.
+
+- 조합 확률: Π C(종류별 장수, 뽑은 장수) / (Basic을 포함하는 5장 조합 수 합계)
+- 손패 순서: 뽑은 5장을 셔플 (조합이 정해지면 순서는 균등)
+- 남은 덱: 나머지 15장을 셔플 (손패와 독립인 균등 순열)
+
+따라서 "Basic이 나올 때까지 전체 셔플 반복"과 같은 분포의 (손패 순서, 덱 순서)를 얻습니다.
+기존 방식은 50번 연속 실패 시 게임을 무효 처리하지만(Basic 1장 덱에서도 약 5.6e-7),
+이 샘플러는 Basic이 1장 이상이면 항상 유효한 시작 손패를 만듭니다.
+"""
+
+import math
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+OPENING_METHODS = ("mulligan", "alias")
+
+
+def build_alias_table(probabilities: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Walker(Vose) alias 테이블 생성
+
+    Returns:
+        (accept, alias): i번 칸에서 accept[i] 확률로 i, 아니면 alias[i]
+    """
+    size = len(probabilities)
+    scaled = [probability * size for probability in probabilities]
+    accept = [1.0] * size
+    alias = list(range(size))
+
+    small = [index for index, value in enumerate(scaled) if value < 1.0]
+    large = [index for index, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        low = small.pop()
+        high = large.pop()
+        accept[low] = scaled[low]
+        alias[low] = high
+        scaled[high] = scaled[high] + scaled[low] - 1.0
+        if scaled[high] < 1.0:
+            small.append(high)
+        else:
+            large.append(high)
+
+    # 부동소수점 오차로 남은 칸은 항상 자기 자신을 선택
+    for index in small + large:
+        accept[index] = 1.0
+    return accept, alias
+
+
+class OpeningSampler:
+    """Basic을 포함하는 시작 손패 + 남은 덱 순서를 한 번에 샘플링
+
+    카드 종류는 정수 id(counts / is_basic의 인덱스)로 다룹니다.
+    """
+
+    def __init__(self, counts: Sequence[int], is_basic: Sequence[bool], hand_size: int = 5):
+        self.counts = tuple(counts)
+        self.is_basic = tuple(is_basic)
+        self.hand_size = hand_size
+
+        openings = []
+        weights = []
+        for opening in self._enumerate_openings():
+            if any(self.is_basic[card_id] for card_id in opening):
+                weight = 1
+                for card_id in set(opening):
+                    weight *= math.comb(self.counts[card_id], opening.count(card_id))
+                openings.append(opening)
+                weights.append(weight)
+
+        total_weight = sum(weights)
+        all_openings = math.comb(sum(self.counts), hand_size)
+        # Basic을 포함하는 조합이 없으면(Basic 0장 덱) 항상 무효
+        self.valid = total_weight > 0
+        self.no_basic_probability = 1 - total_weight / all_openings if all_openings else 1.0
+        self.openings = openings
+        self.probabilities = [weight / total_weight for weight in weights] if self.valid else []
+        self.leftovers = [self._leftover(opening) for opening in openings]
+        self._accept, self._alias = build_alias_table(self.probabilities)
+
+    def _enumerate_openings(self) -> List[Tuple[int, ...]]:
+        """가능한 모든 hand_size장 조합 (id 오름차순 튜플)"""
+        counts = self.counts
+        openings = []
+
+        def extend(card_id: int, remaining: int, current: List[int]):
+            if remaining == 0:
+                openings.append(tuple(current))
+                return
+            if card_id == len(counts):
+                return
+            for taken in range(min(counts[card_id], remaining), -1, -1):
+                current.extend([card_id] * taken)
+                extend(card_id + 1, remaining - taken, current)
+                del current[len(current) - taken:]
+
+        extend(0, self.hand_size, [])
+        return openings
+
+    def _leftover(self, opening: Tuple[int, ...]) -> Tuple[int, ...]:
+        """시작 손패를 제외한 나머지 덱 구성"""
+        leftover = []
+        for card_id, count in enumerate(self.counts):
+            leftover.extend([card_id] * (count - opening.count(card_id)))
+        return tuple(leftover)
+
+    def sample(self, rng) -> Tuple[List[int], List[int]]:
+        """(손패 id 리스트, 남은 덱 id 리스트) 샘플링 (덱 맨 위가 인덱스 0)
+
+        Args:
+            rng: random 모듈 또는 random.Random 인스턴스
+        """
+        position = rng.random() * len(self.openings)
+        index = int(position)
+        if position - index >= self._accept[index]:
+            index = self._alias[index]
+
+        hand = list(self.openings[index])
+        deck = list(self.leftovers[index])
+        rng.shuffle(hand)
+        rng.shuffle(deck)
+        return hand, deck
+
+
+@lru_cache(maxsize=64)
+def get_opening_sampler(counts: Tuple[int, ...], is_basic: Tuple[bool, ...]) -> OpeningSampler:
+    """덱 구성별로 한 번만 만든 OpeningSampler 반환"""
+    return OpeningSampler(counts, is_basic)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 병렬 Monte Carlo 실행 모듈
+
+시뮬레이션 횟수를 여러 프로세스(ProcessPoolExecutor)에 나누어 실행하고
+success_count / total_valid_games를 정확히 합산합니다.
+
+각 워커는 하나의 root seed에서 파생된 독립 seed를 사용하므로,
+같은 seed와 같은 워커 수로 실행하면 항상 같은 결과가 나옵니다.
+"""
+
+import hashlib
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Tuple, Union
+
+
+def derive_seed(root_seed: int, index: Union[int, str]) -> int:
+    """root seed와 index(번호 또는 이름)로 독립적인 64비트 하위 seed 하나를 생성"""
+    digest = hashlib.sha256(f"{root_seed}:{index}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def spawn_seeds(root_seed: int, count: int) -> List[int]:
+    """root seed에서 서로 독립적인 하위 seed들을 생성
+
+    Args:
+        root_seed: 기준 seed
+        count: 생성할 seed 개수
+
+    Returns:
+        List[int]: 64비트 하위 seed 목록 (같은 입력이면 항상 같은 값)
+    """
+    return [derive_seed(root_seed, index) for index in range(count)]
+
+
+def new_root_seed() -> int:
+    """seed가 지정되지 않았을 때 사용할 root seed 생성 (결과 재현용으로 결과에 기록)"""
+    return random.SystemRandom().getrandbits(63)
+
+
+def split_simulations(num_simulations: int, num_shards: int) -> List[int]:
+    """시뮬레이션 횟수를 num_shards개로 최대한 균등하게 분할"""
+    base, extra = divmod(num_simulations, num_shards)
+    return [base + (1 if index < extra else 0) for index in range(num_shards)]
+
+
+def _shard_calculator(engine_class, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str],
+                      seed: int, opening: str):
+    """워커 프로세스의 ProbabilityCalculator 생성 (조각 seed로 전역 난수 초기화)"""
+    # 순환 import 방지를 위해 워커 내부에서 import
+    from probability_calculator import ProbabilityCalculator
+
+    random.seed(seed)
+    engine = engine_class(deck_input, draw_order, opening=opening)
+    return ProbabilityCalculator(engine)
+
+
+def _run_shard(engine_class, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str],
+               calculation_request: Dict[str, Any], num_simulations: int, seed: int,
+               opening: str = "mulligan") -> Tuple[int, int]:
+    """워커 프로세스에서 실행되는 시뮬레이션 조각"""
+    calculator = _shard_calculator(engine_class, deck_input, draw_order, seed, opening)
+    return calculator.simulate_counts(calculation_request, num_simulations)
+
+
+def _run_evolution_shard(engine_class, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str],
+                         calculation_request: Dict[str, Any], num_simulations: int, seed: int,
+                         opening: str = "mulligan"):
+    """워커 프로세스에서 실행되는 진화 시뮬레이션 조각 (EvolutionCounter 반환)"""
+    calculator = _shard_calculator(engine_class, deck_input, draw_order, seed, opening)
+    return calculator.simulate_evolution_counter(calculation_request, num_simulations)
+
+
+def _run_shards(shard_function, shard_counts, simulation_engine, calculation_request: Dict[str, Any],
+                num_simulations: int, workers: int, seed: int, on_shard_done=None) -> List[Any]:
+    """shard_function을 workers개 프로세스에 나누어 실행하고 조각 결과 목록 반환
+
+    Args:
+        shard_counts: 조각 결과에서 (success_count, total_valid_games)를 꺼내는 함수 (on_shard_done 보고용)
+    """
+    shard_sizes = [size for size in split_simulations(num_simulations, workers) if size > 0]
+    shard_seeds = spawn_seeds(seed, len(shard_sizes))
+
+    with ProcessPoolExecutor(max_workers=len(shard_sizes)) as executor:
+        futures = {
+            executor.submit(shard_function, type(simulation_engine), simulation_engine.deck_input,
+                            simulation_engine.draw_order, calculation_request, shard_size, shard_seed,
+                            getattr(simulation_engine, 'opening', 'mulligan')): shard_size
+            for shard_size, shard_seed in zip(shard_sizes, shard_seeds)
+        }
+        shard_results = []
+        # 합산은 순서와 무관하므로 끝난 조각부터 보고
+        for future in as_completed(futures):
+            shard_result = future.result()
+            shard_results.append(shard_result)
+            if on_shard_done is not None:
+                on_shard_done(futures[future], *shard_counts(shard_result))
+    return shard_results
+
+
+def run_parallel_counts(simulation_engine, calculation_request: Dict[str, Any], num_simulations: int,
+                        workers: int, seed: int, on_shard_done=None) -> Tuple[int, int]:
+    """시뮬레이션을 workers개 프로세스에 나누어 실행하고 결과 합산
+
+    Args:
+        simulation_engine: 워커에서 같은 종류로 재생성할 엔진 (SimulationEngine 등)
+        calculation_request: 계산 요청
+        num_simulations: 전체 시뮬레이션 횟수
+        workers: 프로세스 수
+        seed: root seed
+        on_shard_done: 워커 조각이 끝날 때마다 (games, success_count, total_valid_games)로 호출할 함수
+
+    Returns:
+        (success_count, total_valid_games)
+    """
+    shard_results = _run_shards(_run_shard, tuple, simulation_engine, calculation_request, num_simulations,
+                                workers, seed, on_shard_done)
+    success_count = sum(result[0] for result in shard_results)
+    total_valid_games = sum(result[1] for result in shard_results)
+    return success_count, total_valid_games
+
+
+def run_parallel_evolution(simulation_engine, calculation_request: Dict[str, Any], num_simulations: int,
+                           workers: int, seed: int, on_shard_done=None):
+    """진화 요청을 workers개 프로세스에 나누어 실행하고 조각별 EvolutionCounter 합산
+
+    run_parallel_counts와 같은 조각 / seed 분할이며, 처음 진화 완료 턴 분포(first_success_counts)까지 합산합니다.
+
+    Returns:
+        EvolutionCounter
+    """
+    shard_results = _run_shards(_run_evolution_shard,
+                                lambda counter: (counter.success_count, counter.total_valid_games),
+                                simulation_engine, calculation_request, num_simulations, workers, seed, on_shard_done)
+    counter = shard_results[0]
+    for shard_counter in shard_results[1:]:
+        counter.merge(shard_counter)
+    return counter
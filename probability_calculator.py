@@ -1,18 +1,36 @@
 # probability_calculator.py - 확률 계산 전용 모듈 (v2.1 - 수학적 계산 추가)
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple, Optional
+import itertools
+import json
 import math
+import random
+import time
+
+from batch_engine import BatchDeckSampler, numpy_available, has_active_draw_effects
+from exact_engine import ExactDrawEngine, unsupported_effects, exact_card_curves
+from encoded_engine import EncodedSimulationEngine
+from parallel_runner import run_parallel_counts, run_parallel_evolution, new_root_seed, derive_seed
+from stats_utils import proportion_interval, required_trials
+from accumulators import counter_for_request, SuiteCounter, CardCurveCounter
+from hand_query import HandQuery, compile_request
+from v3_simulation import EvolutionSimulator, EvolutionCounter, target_evolution_lines
+from progress import ProgressReporter, ProgressTracker
 
 class ProbabilityCalculator:
     """Pokemon Pocket 시뮬레이터용 확률 계산기 v2.1"""
     
-    def __init__(self, simulation_engine):
+    def __init__(self, simulation_engine, progress_reporter: Optional[ProgressReporter] = None):
         """
         확률 계산기 초기화
         
         Args:
             simulation_engine: SimulationEngine 인스턴스
+            progress_reporter: 시뮬레이션 진행 상황을 받을 reporter (None이면 보고하지 않음)
         """
         self.sim_engine = simulation_engine
+        self.progress_reporter = progress_reporter or ProgressReporter()
+        self.progress_interval = 0.5   # 진행 상황 보고 최소 간격 (초)
+        self.progress_chunk = 1000     # 진행 상황 확인 단위 (게임 수)
         self.deck_input = simulation_engine.deck_input
         self.total_cards = 20
         self.opening_hand_size = 5
@@ -26,6 +44,11 @@ class ProbabilityCalculator:
                 count = card_info['count']
                 self.basic_pokemon_cards[card_name] = count
                 self.total_basic_count += count
+        
+        # 계산 요청별로 컴파일한 손패 질의 (_request_queries)
+        self._query_cache: Dict[str, Tuple[Optional[HandQuery], Optional[HandQuery]]] = {}
+        # evolution 요청별 v3 게임 실행기 (_evolution_simulator)
+        self._evolution_simulators: Dict[str, EvolutionSimulator] = {}
     
     def _is_basic_pokemon(self, card_name: str) -> bool:
         """카드가 Basic Pokemon인지 확인"""
@@ -70,7 +93,189 @@ class ProbabilityCalculator:
             k=0
         )
         return 1.0 - prob_zero_basic
-    
+
+    # ===== 시뮬레이션 공통 처리 (병렬 실행 등에서 사용) =====
+
+    def _game_kwargs(self, calculation_request: Dict[str, Any]) -> Dict[str, Any]:
+        """계산 요청에 맞는 simulate_single_game 인자 반환"""
+        calc_type = calculation_request.get('type')
+        max_turn = calculation_request.get('turn', 2)
+
+        if calc_type in ('preferred_opening', 'non_preferred_opening'):
+            return {'max_turn': 0}
+        if calc_type in ('multi_card', 'preferred_and_multi', 'non_preferred_and_multi'):
+            return {'max_turn': max_turn, 'target_cards': calculation_request['target_cards']}
+        if calc_type == 'multi_or_multi':
+            target_groups = calculation_request['target_groups']
+            all_target_cards = []
+            for group in target_groups:
+                all_target_cards.extend(group['target_cards'])
+            return {'max_turn': max_turn,
+                    'target_cards': list(dict.fromkeys(all_target_cards)),
+                    'target_groups': target_groups}
+
+        raise ValueError(f"지원하지 않는 계산 타입입니다: {calc_type}")
+
+    def _request_queries(self, calculation_request: Dict[str, Any]) -> Tuple[Optional[HandQuery], Optional[HandQuery]]:
+        """계산 요청을 카드명 기준 (시작 손패, 최종 손패) HandQuery로 컴파일 (요청별로 한 번만)"""
+        key = json.dumps(calculation_request, sort_keys=True, ensure_ascii=False)
+        queries = self._query_cache.get(key)
+        if queries is None:
+            deck_input = self.deck_input
+            queries = compile_request(calculation_request, lambda name: name if name in deck_input else None,
+                                      list(self.basic_pokemon_cards))
+            self._query_cache[key] = queries
+        return queries
+
+    def _evolution_simulator(self, calculation_request: Dict[str, Any]) -> EvolutionSimulator:
+        """evolution 요청의 v3 게임 실행기 (요청별로 한 번만 생성)"""
+        key = json.dumps(calculation_request, sort_keys=True, ensure_ascii=False)
+        simulator = self._evolution_simulators.get(key)
+        if simulator is None:
+            simulator = EvolutionSimulator(self.deck_input, self.sim_engine.draw_order,
+                                           calculation_request['target_evolutions'],
+                                           calculation_request['evolution_lines'],
+                                           calculation_request.get('preferred_basics'),
+                                           getattr(self.sim_engine, 'opening', 'mulligan'))
+            self._evolution_simulators[key] = simulator
+        return simulator
+
+    def _is_success(self, calculation_request: Dict[str, Any], game_result: Dict[str, Any]) -> bool:
+        """유효한 게임 결과가 계산 요청의 성공 조건을 만족하는지 판정"""
+        return self._matches_queries(self._request_queries(calculation_request), game_result)
+
+    @staticmethod
+    def _matches_queries(queries: Tuple[Optional[HandQuery], Optional[HandQuery]], game_result: Dict[str, Any]) -> bool:
+        opening_query, final_query = queries
+        if opening_query is not None and not opening_query(game_result['turn_results'][0]['hand_before_effects']):
+            return False
+        return final_query is None or final_query(game_result['final_hand'])
+
+    def simulate_counts(self, calculation_request: Dict[str, Any], num_simulations: int) -> Tuple[int, int]:
+        """
+        진행률 출력 없이 시뮬레이션만 실행하여 성공 횟수 집계
+
+        Args:
+            calculation_request: 계산 요청 (run_calculation과 같은 형식, 복합 타입 포함)
+            num_simulations: 시뮬레이션 횟수
+
+        Returns:
+            (success_count, total_valid_games)
+        """
+        # 진화 성공 확률은 v3 파이프라인(GameStateV3)으로 진행
+        if calculation_request.get('type') == 'evolution':
+            counter = self.simulate_evolution_counter(calculation_request, num_simulations)
+            return counter.success_count, counter.total_valid_games
+
+        # 스트리밍 API를 지원하는 엔진은 게임별 결과 딕셔너리 없이 집계
+        if hasattr(self.sim_engine, 'run_stream'):
+            counter = counter_for_request(calculation_request, self.sim_engine.card_table)
+            self.sim_engine.run_stream(counter, num_simulations, **self._game_kwargs(calculation_request))
+            return counter.success_count, counter.total_valid_games
+
+        game_kwargs = self._game_kwargs(calculation_request)
+        queries = self._request_queries(calculation_request)
+        success_count = 0
+        total_valid_games = 0
+
+        for _ in range(num_simulations):
+            game_result = self.sim_engine.simulate_single_game(**game_kwargs)
+
+            if game_result['success']:
+                total_valid_games += 1
+                if self._matches_queries(queries, game_result):
+                    success_count += 1
+
+        return success_count, total_valid_games
+
+    def simulate_evolution_counter(self, calculation_request: Dict[str, Any], num_simulations: int) -> EvolutionCounter:
+        """진행률 출력 없이 진화 시뮬레이션만 실행하여 EvolutionCounter(턴별 첫 성공 분포 포함) 반환"""
+        counter = EvolutionCounter(calculation_request.get('turn', 2))
+        self._evolution_simulator(calculation_request).run_stream(counter, num_simulations, counter.max_turn)
+        return counter
+
+    def _count_games_with_progress(self, calculation_request: Dict[str, Any], num_simulations: int) -> Tuple[int, int]:
+        """
+        progress_chunk 게임씩 simulate_counts로 집계하며 진행 상황을 progress_reporter에 보고
+        
+        보고 빈도는 ProgressTracker가 시간 기준으로 제한합니다.
+        """
+        tracker = self._progress_tracker(calculation_request, num_simulations)
+        success_count = 0
+        total_valid_games = 0
+        games_done = 0
+        
+        while games_done < num_simulations:
+            chunk_size = min(self.progress_chunk, num_simulations - games_done)
+            chunk_success, chunk_valid = self.simulate_counts(calculation_request, chunk_size)
+            success_count += chunk_success
+            total_valid_games += chunk_valid
+            games_done += chunk_size
+            tracker.advance(chunk_size, chunk_success, chunk_valid)
+        
+        tracker.finish()
+        return success_count, total_valid_games
+
+    def _progress_tracker(self, calculation_request: Dict[str, Any], total_games: int, confidence: float = 0.95) -> ProgressTracker:
+        """계산 요청에 대한 ProgressTracker 생성"""
+        return ProgressTracker(self.progress_reporter, calculation_request.get('type'), total_games,
+                               min_interval=self.progress_interval, confidence=confidence)
+
+    def evaluate_game(self, calculation_request: Dict[str, Any], rng=None) -> Optional[bool]:
+        """
+        게임 1판을 실행하고 성공 여부 반환
+
+        Args:
+            calculation_request: 계산 요청
+            rng: 이 게임에 사용할 난수 생성기 (None이면 엔진 기본값)
+
+        Returns:
+            성공 여부 (멀리건 실패로 무효인 게임은 None)
+        """
+        if calculation_request.get('type') == 'evolution':
+            game_result = self._evolution_simulator(calculation_request).simulate_single_game(
+                calculation_request.get('turn', 2), rng=rng)
+            return game_result['evolved'] if game_result['success'] else None
+        game_result = self.sim_engine.simulate_single_game(rng=rng, **self._game_kwargs(calculation_request))
+        if not game_result['success']:
+            return None
+        return self._is_success(calculation_request, game_result)
+
+    def _simulation_result(self, calculation_request: Dict[str, Any], success_count: int, total_valid_games: int, num_simulations: int) -> Dict[str, Any]:
+        """시뮬레이션 집계 결과를 계산 타입별 결과 딕셔너리로 변환"""
+        calc_type = calculation_request.get('type')
+        probability = (success_count / total_valid_games) * 100 if total_valid_games > 0 else 0.0
+
+        result = {'calculation_type': calc_type}
+
+        if calc_type == 'preferred_opening':
+            preferred_basics = calculation_request['preferred_basics']
+            result['description'] = f'선호하는 Basic Pokemon({", ".join(preferred_basics)})으로 시작할 수 있는 확률'
+            result['preferred_basics'] = preferred_basics
+        elif calc_type == 'non_preferred_opening':
+            non_preferred_basics = calculation_request['non_preferred_basics']
+            result['description'] = f'비선호하는 Basic Pokemon({", ".join(non_preferred_basics)})으로만 시작해야 하는 확률'
+            result['non_preferred_basics'] = non_preferred_basics
+        elif calc_type == 'multi_card':
+            target_cards = calculation_request['target_cards']
+            max_turn = calculation_request.get('turn', 2)
+            result['description'] = f'{max_turn}턴까지 {", ".join(target_cards)} 각각 1장 이상 드로우 확률'
+            result['target_cards'] = target_cards
+            result['max_turn'] = max_turn
+            result['card_count'] = len(target_cards)
+        elif calc_type == 'evolution':
+            target_evolutions = calculation_request['target_evolutions']
+            max_turn = calculation_request.get('turn', 2)
+            result['description'] = f'{max_turn}턴까지 {", ".join(target_evolutions)} 진화 완료 (Field) 확률'
+            result['target_evolutions'] = target_evolutions
+            result['max_turn'] = max_turn
+
+        result['probability_percent'] = round(probability, 2)
+        result['success_count'] = success_count
+        result['total_valid_games'] = total_valid_games
+        result['simulation_count'] = num_simulations
+        return result
+
     def calculate_preferred_opening_probability(self, preferred_basics: List[str], num_simulations: int = 10000) -> Dict[str, Any]:
         """
         선호하는 Basic Pokemon으로 시작할 수 있는 확률
@@ -87,49 +292,18 @@ class ProbabilityCalculator:
         print(f"선호하는 Basic Pokemon: {', '.join(preferred_basics)}")
         print(f"시뮬레이션 횟수: {num_simulations:,}회")
         
-        success_count = 0
-        total_valid_games = 0
-        checkpoint = max(1, num_simulations // 10)
-        
-        for i in range(num_simulations):
-            # 진행 상황 출력
-            if (i + 1) % checkpoint == 0 or i == 0:
-                progress = ((i + 1) / num_simulations) * 100
-                print(f"진행률: {progress:.1f}% ({i+1:,}/{num_simulations:,})")
-            
-            # 0턴(시작 5장)만 시뮬레이션
-            game_result = self.sim_engine.simulate_single_game(max_turn=0, verbose=False)
-            
-            # 게임이 성공적으로 진행된 경우만 체크
-            if game_result['success']:
-                total_valid_games += 1
-                
-                # 0턴 손패에서 선호하는 Basic 중 하나라도 있는지 확인
-                turn_0_hand = game_result['turn_results'][0]['hand_before_effects']
-                
-                has_preferred = any(card in turn_0_hand for card in preferred_basics)
-                if has_preferred:
-                    success_count += 1
+        success_count, total_valid_games = self._count_games_with_progress(
+            {'type': 'preferred_opening', 'preferred_basics': preferred_basics},
+            num_simulations)
         
         # 결과 계산
-        if total_valid_games == 0:
-            probability = 0.0
-        else:
-            probability = (success_count / total_valid_games) * 100
-        
-        result = {
-            'calculation_type': 'preferred_opening',
-            'description': f'선호하는 Basic Pokemon({", ".join(preferred_basics)})으로 시작할 수 있는 확률',
-            'preferred_basics': preferred_basics,
-            'probability_percent': round(probability, 2),
-            'success_count': success_count,
-            'total_valid_games': total_valid_games,
-            'simulation_count': num_simulations
-        }
+        result = self._simulation_result(
+            {'type': 'preferred_opening', 'preferred_basics': preferred_basics},
+            success_count, total_valid_games, num_simulations)
         
         print(f"\n=== 선호하는 Opening 확률 계산 완료 ===")
         print(f"성공: {success_count:,}회 / 유효 게임: {total_valid_games:,}회")
-        print(f"확률: {probability:.2f}%")
+        print(f"확률: {result['probability_percent']:.2f}%")
         
         return result
 
@@ -150,50 +324,17 @@ class ProbabilityCalculator:
         print(f"시뮬레이션 횟수: {num_simulations:,}회")
         print("조건: Basic Pokemon은 있지만 모두 비선호하는 카드인 경우")
         
-        success_count = 0
-        total_valid_games = 0
-        checkpoint = max(1, num_simulations // 10)
-        
-        for i in range(num_simulations):
-            if (i + 1) % checkpoint == 0 or i == 0:
-                progress = ((i + 1) / num_simulations) * 100
-                print(f"진행률: {progress:.1f}% ({i+1:,}/{num_simulations:,})")
-            
-            # 0턴(시작 5장)만 시뮬레이션
-            game_result = self.sim_engine.simulate_single_game(max_turn=0, verbose=False)
-            
-            if game_result['success']:
-                total_valid_games += 1
-                
-                turn_0_hand = game_result['turn_results'][0]['hand_before_effects']
-                
-                # Basic Pokemon들만 필터링
-                basic_pokemons_in_hand = [card for card in turn_0_hand 
-                                        if self._is_basic_pokemon(card)]
-                
-                # Basic이 있고, 모든 Basic이 비선호 목록에 포함된 경우
-                if (len(basic_pokemons_in_hand) > 0 and 
-                    all(basic in non_preferred_basics for basic in basic_pokemons_in_hand)):
-                    success_count += 1
-        
-        if total_valid_games == 0:
-            probability = 0.0
-        else:
-            probability = (success_count / total_valid_games) * 100
+        success_count, total_valid_games = self._count_games_with_progress(
+            {'type': 'non_preferred_opening', 'non_preferred_basics': non_preferred_basics},
+            num_simulations)
         
-        result = {
-            'calculation_type': 'non_preferred_opening',
-            'description': f'비선호하는 Basic Pokemon({", ".join(non_preferred_basics)})으로만 시작해야 하는 확률',
-            'non_preferred_basics': non_preferred_basics,
-            'probability_percent': round(probability, 2),
-            'success_count': success_count,
-            'total_valid_games': total_valid_games,
-            'simulation_count': num_simulations
-        }
+        result = self._simulation_result(
+            {'type': 'non_preferred_opening', 'non_preferred_basics': non_preferred_basics},
+            success_count, total_valid_games, num_simulations)
         
         print(f"\n=== 비선호하는 Opening 확률 계산 완료 ===")
         print(f"성공: {success_count:,}회 / 유효 게임: {total_valid_games:,}회")
-        print(f"확률: {probability:.2f}%")
+        print(f"확률: {result['probability_percent']:.2f}%")
         
         return result
 
@@ -203,7 +344,7 @@ class ProbabilityCalculator:
         (기존 타입 3, 4, 5 통합)
         
         Args:
-            target_cards: 대상 카드명 리스트 (1~3개)
+            target_cards: 대상 카드명 리스트 (1개 이상)
             max_turn: 최대 턴 수 (1, 2, 3 등)
             num_simulations: 시뮬레이션 횟수
         
@@ -216,50 +357,107 @@ class ProbabilityCalculator:
         print(f"시뮬레이션 횟수: {num_simulations:,}회")
         print(f"조건: {max_turn}턴까지 각 카드를 1장 이상씩 드로우")
         
-        success_count = 0
-        total_valid_games = 0
-        checkpoint = max(1, num_simulations // 10)
+        success_count, total_valid_games = self._count_games_with_progress(
+            {'type': 'multi_card', 'target_cards': target_cards, 'turn': max_turn},
+            num_simulations)
         
-        for i in range(num_simulations):
-            if (i + 1) % checkpoint == 0 or i == 0:
-                progress = ((i + 1) / num_simulations) * 100
-                print(f"진행률: {progress:.1f}% ({i+1:,}/{num_simulations:,})")
-            
-            game_result = self.sim_engine.simulate_single_game(max_turn=max_turn, verbose=False, target_cards=target_cards)
-            
-            if game_result['success']:
-                total_valid_games += 1
-                
-                # 최종 손패에서 모든 대상 카드가 있는지 확인
-                final_hand = game_result['final_hand']
-                
-                # 모든 카드가 1장 이상씩 있는지 확인
-                all_cards_found = all(card in final_hand for card in target_cards)
-                if all_cards_found:
-                    success_count += 1
+        result = self._simulation_result(
+            {'type': 'multi_card', 'target_cards': target_cards, 'turn': max_turn},
+            success_count, total_valid_games, num_simulations)
         
-        if total_valid_games == 0:
-            probability = 0.0
-        else:
-            probability = (success_count / total_valid_games) * 100
+        print(f"\n=== 멀티카드 드로우 확률 계산 완료 ===")
+        print(f"성공: {success_count:,}회 / 유효 게임: {total_valid_games:,}회")
+        print(f"확률: {result['probability_percent']:.2f}%")
         
-        result = {
+        return result
+
+    def calculate_multi_card_probability_batch(self, target_cards: List[str], max_turn: int, num_simulations: int = 10000, seed=None) -> Dict[str, Any]:
+        """
+        N턴까지 지정된 카드들을 각각 1장 이상 드로우할 확률 (NumPy 배치 엔진)
+        드로우 카드 효과가 발동되지 않는 덱/드로우 순서에서만 사용 가능
+        
+        Args:
+            target_cards: 대상 카드명 리스트 (1개 이상)
+            max_turn: 최대 턴 수 (1, 2, 3 등)
+            num_simulations: 시뮬레이션 횟수
+            seed: NumPy 난수 seed (None이면 매번 다른 결과)
+        
+        Returns:
+            Dict: calculate_multi_card_probability와 같은 형식의 결과
+        """
+        print(f"=== 멀티카드 드로우 확률 계산 시작 (NumPy 배치) ===")
+        print(f"대상 카드: {', '.join(target_cards)}")
+        print(f"최대 턴: {max_turn}턴")
+        print(f"시뮬레이션 횟수: {num_simulations:,}회")
+        print(f"조건: {max_turn}턴까지 각 카드를 1장 이상씩 드로우")
+        
+        sampler = BatchDeckSampler(self.deck_input, seed=seed)
+        tracker = self._progress_tracker({'type': 'multi_card'}, num_simulations)
+        success_count, total_valid_games = sampler.count_multi_card(
+            target_cards, max_turn, num_simulations, on_batch=tracker.advance)
+        tracker.finish()
+        
+        result = self._simulation_result(
+            {'type': 'multi_card', 'target_cards': target_cards, 'turn': max_turn},
+            success_count, total_valid_games, num_simulations)
+        
+        print(f"\n=== 멀티카드 드로우 확률 계산 완료 ===")
+        print(f"성공: {success_count:,}회 / 유효 게임: {total_valid_games:,}회")
+        print(f"확률: {result['probability_percent']:.2f}%")
+        
+        return result
+
+    def calculate_multi_card_exact(self, target_cards: List[str], max_turn: int) -> Dict[str, Any]:
+        """
+        N턴까지 지정된 카드들을 각각 1장 이상 드로우할 확률 (Markov 연쇄 정확 계산)
+        Poke Ball / Professor's Research / Galdion만 발동되는 덱에서 사용 가능
+        
+        Args:
+            target_cards: 대상 카드명 리스트
+            max_turn: 최대 턴 수
+        
+        Returns:
+            Dict: multi_card 결과 (샘플링 오차 없음)
+        """
+        print(f"=== 수학적 계산: 멀티카드 드로우 확률 (Markov 연쇄) ===")
+        print(f"대상 카드: {', '.join(target_cards)}")
+        print(f"최대 턴: {max_turn}턴")
+        
+        start_time = time.perf_counter()
+        engine = ExactDrawEngine(self.deck_input, self.sim_engine.draw_order, target_cards)
+        probability = engine.multi_card_probability(max_turn)
+        elapsed = time.perf_counter() - start_time
+        
+        print(f"카드 종류 (병합 후): {len(engine.kinds)}개, 계산한 상태: {engine.state_count:,}개")
+        print(f"최종 확률: {probability * 100:.2f}%")
+        
+        return {
             'calculation_type': 'multi_card',
             'description': f'{max_turn}턴까지 {", ".join(target_cards)} 각각 1장 이상 드로우 확률',
             'target_cards': target_cards,
             'max_turn': max_turn,
             'card_count': len(target_cards),
-            'probability_percent': round(probability, 2),
-            'success_count': success_count,
-            'total_valid_games': total_valid_games,
-            'simulation_count': num_simulations
+            'probability_percent': round(probability * 100, 2),
+            'raw_probability': probability,
+            'valid_game_probability': engine.valid_game_probability(),
+            'state_count': engine.state_count,
+            # 샘플링을 하지 않으므로 시뮬레이션 집계 값은 없음
+            'success_count': None,
+            'total_valid_games': None,
+            'simulation_count': 0,
+            'calculation_method': 'Markov Chain (수학적 정확값)',
+            'execution_time': f'{elapsed:.3f}초'
         }
-        
-        print(f"\n=== 멀티카드 드로우 확률 계산 완료 ===")
-        print(f"성공: {success_count:,}회 / 유효 게임: {total_valid_games:,}회")
-        print(f"확률: {probability:.2f}%")
-        
-        return result
+
+    def can_use_exact_engine(self) -> bool:
+        """Markov 연쇄 정확 계산 가능 여부 (Poke Ball / Professor's Research / Galdion만 발동)"""
+        return not unsupported_effects(self.deck_input, self.sim_engine.draw_order)
+
+    def can_use_batch_engine(self) -> bool:
+        """NumPy 배치 엔진 사용 가능 여부 (NumPy 설치 + 발동되는 드로우 카드 없음)"""
+        if not numpy_available():
+            return False
+        return not has_active_draw_effects(self.deck_input, self.sim_engine.draw_order)
 
     def calculate_preferred_opening_mathematical(self, preferred_basics: List[str]) -> Dict[str, Any]:
         """
@@ -429,6 +627,95 @@ class ProbabilityCalculator:
             'complementary_to_preferred': True
         }
 
+    def calculate_multi_card_mathematical(self, target_cards: List[str], max_turn: int) -> Dict[str, Any]:
+        """
+        N턴까지 지정된 카드들을 각각 1장 이상 드로우할 확률 (수학적 계산)
+        발동되는 드로우 카드가 없어 최종 손패가 "셔플된 덱의 앞 5 + N장"인 경우에만 정확함
+        
+        P(모든 목표 ≥ 1장 | Basic ≥ 1장)를 포함-배제 원리로 계산:
+            P(모든 목표 ∧ Basic) = Σ_{S⊆목표} (-1)^|S| · [P(S 없음) - P(S 없음 ∧ 첫 5장에 Basic 없음)]
+        
+        Args:
+            target_cards: 대상 카드명 리스트
+            max_turn: 최대 턴 수
+        
+        Returns:
+            계산 결과
+        """
+        print(f"=== 수학적 계산: 멀티카드 드로우 확률 ===")
+        print(f"대상 카드: {', '.join(target_cards)}")
+        print(f"최대 턴: {max_turn}턴")
+        
+        N = self.total_cards
+        seen_cards = min(self.opening_hand_size + max_turn, N)
+        unique_targets = list(dict.fromkeys(target_cards))
+        missing_cards = [card for card in unique_targets if card not in self.deck_input]
+        
+        prob_basic_at_least_one = self._probability_basic_at_least_one()
+        prob_all_with_basic = 0.0
+        
+        if not missing_cards:
+            for subset_size in range(len(unique_targets) + 1):
+                for subset in itertools.combinations(unique_targets, subset_size):
+                    subset_count = sum(self.deck_input[card]['count'] for card in subset)
+                    subset_basic_count = sum(self.deck_input[card]['count'] for card in subset if self._is_basic_pokemon(card))
+                    
+                    # P(S의 카드가 앞 seen_cards장에 하나도 없음)
+                    prob_none = self._combination(N - subset_count, seen_cards) / self._combination(N, seen_cards)
+                    
+                    # P(S 없음 ∧ 첫 5장에 Basic 없음): 첫 5장은 S와 Basic을 모두 피하고, 나머지 장은 S만 피함
+                    avoid_in_opening = N - (self.total_basic_count + subset_count - subset_basic_count)
+                    prob_none_no_basic = (
+                        self._combination(avoid_in_opening, self.opening_hand_size) / self._combination(N, self.opening_hand_size)
+                        * self._combination(N - self.opening_hand_size - subset_count, seen_cards - self.opening_hand_size)
+                        / self._combination(N - self.opening_hand_size, seen_cards - self.opening_hand_size)
+                    )
+                    
+                    prob_all_with_basic += (-1) ** subset_size * (prob_none - prob_none_no_basic)
+        else:
+            print(f"  경고: {', '.join(missing_cards)}은 덱에 없습니다.")
+        
+        conditional_probability = prob_all_with_basic / prob_basic_at_least_one if prob_basic_at_least_one > 0 else 0.0
+        probability_percent = conditional_probability * 100
+        
+        print(f"\n=== 수학적 계산 결과 ===")
+        print(f"P(Basic ≥ 1장): {prob_basic_at_least_one:.6f}")
+        print(f"P(모든 목표 카드 ≥ 1장 ∧ Basic ≥ 1장): {prob_all_with_basic:.6f}")
+        print(f"최종 확률: {probability_percent:.2f}%")
+        
+        return {
+            'calculation_type': 'multi_card',
+            'description': f'{max_turn}턴까지 {", ".join(target_cards)} 각각 1장 이상 드로우 확률',
+            'target_cards': target_cards,
+            'max_turn': max_turn,
+            'card_count': len(target_cards),
+            'probability_percent': round(probability_percent, 2),
+            'raw_probability': conditional_probability,
+            'prob_basic_at_least_one': prob_basic_at_least_one,
+            'success_count': None,
+            'total_valid_games': None,
+            'simulation_count': 0,
+            'calculation_method': 'Multivariate Hypergeometric 포함-배제 (수학적 정확값)',
+            'execution_time': '< 0.001초'
+        }
+
+    def can_use_multi_card_mathematical(self) -> bool:
+        """multi_card 수학적 계산 가능 여부 (발동되는 드로우 카드 없음)"""
+        return not has_active_draw_effects(self.deck_input, self.sim_engine.draw_order)
+
+    def is_deterministic(self, calculation_request: Dict[str, Any], use_mathematical: bool = True) -> bool:
+        """run_calculation 결과가 seed / 시뮬레이션 횟수와 무관한 정확값인지 여부"""
+        if not use_mathematical:
+            return False
+        calc_type = calculation_request.get('type')
+        if calc_type in ('preferred_opening', 'non_preferred_opening'):
+            return True
+        if calc_type == 'multi_card':
+            return self.can_use_multi_card_mathematical() or self.can_use_exact_engine()
+        if calc_type == 'card_curves':
+            return self.can_use_exact_card_curves()
+        return False
+
     def print_calculation_result(self, result: Dict[str, Any]):
         """확률 계산 결과를 보기 좋게 출력"""
         print("=" * 60)
@@ -453,24 +740,179 @@ class ProbabilityCalculator:
         elif result['calculation_type'] == 'multi_card':
             print(f"대상 카드: {', '.join(result['target_cards'])}")
             print(f"최대 턴: {result['max_turn']}턴")
+            if 'calculation_method' in result:
+                print(f"계산 방법: {result['calculation_method']}")
+                print(f"실행 시간: {result.get('execution_time', '정보 없음')}")
+        
+        elif result['calculation_type'] == 'evolution':
+            print(f"목표 진화: {', '.join(result['target_evolutions'])}")
+            print(f"최대 턴: {result['max_turn']}턴")
+            if 'first_success_percent' in result:
+                print("처음 진화 완료 턴 분포: " + ", ".join(
+                    f"{turn}턴 {value:.2f}%" for turn, value in enumerate(result['first_success_percent']) if turn > 0))
+        
+        elif result['calculation_type'] == 'card_curves':
+            print(f"최대 턴: {result['max_turn']}턴")
+            print(f"계산 방법: {result['calculation_method']}")
+            print(f"실행 시간: {result.get('execution_time', '정보 없음')}")
+            name_width = max(len(card_name) for card_name in result['cards'])
+            print(f"{'턴까지 본 확률 (%)':<{name_width}} " + " ".join(f"{turn:>6}" for turn in result['turns']))
+            for card_name in result['cards']:
+                print(f"{card_name:<{name_width}} " + " ".join(f"{value:>6.2f}" for value in result['seen_percent'][card_name]))
         
-        print(f"확률: {result['probability_percent']}%")
+        if 'probability_percent' in result:
+            print(f"확률: {result['probability_percent']}%")
         
         # 시뮬레이션 결과인 경우
-        if 'success_count' in result and 'total_valid_games' in result:
+        if result.get('success_count') is not None and result.get('total_valid_games') is not None:
             print(f"성공: {result['success_count']:,}회 / 총 {result['total_valid_games']:,}회")
             print(f"시뮬레이션 횟수: {result['simulation_count']:,}회")
         
+        # 목표 정밀도 기반 적응형 실행인 경우
+        if 'confidence_interval' in result:
+            low, high = result['confidence_interval']
+            status = "달성" if result['target_met'] else "미달 (최대 횟수 도달)"
+            print(f"{result['confidence'] * 100:.0f}% 신뢰구간 ({result['interval_method']}): "
+                  f"{low:.2f}% ~ {high:.2f}% (±{result['interval_half_width']:.2f}%p)")
+            print(f"목표 정밀도: ±{result['target_half_width']}%p {status}, 사용 게임: {result['games_used']:,}회")
+        
         print("=" * 60)
     
-    def run_calculation(self, calculation_request: Dict[str, Any], simulation_count: int = 10000, use_mathematical: bool = True) -> Dict[str, Any]:
+    def _chunk_counter(self, calculation_request: Dict[str, Any], workers: int, seed: int):
+        """적응형 실행에서 n게임씩 (success_count, total_valid_games)를 세는 함수 반환"""
+        if calculation_request.get('type') == 'multi_card' and self.can_use_batch_engine():
+            sampler = BatchDeckSampler(self.deck_input, seed=seed)
+            target_cards = calculation_request['target_cards']
+            max_turn = calculation_request.get('turn', 2)
+            return lambda num_games: sampler.count_multi_card(target_cards, max_turn, num_games)
+        
+        if workers > 1:
+            # chunk마다 root seed에서 파생한 seed로 병렬 실행
+            chunk_indices = itertools.count()
+            return lambda num_games: run_parallel_counts(
+                self.sim_engine, calculation_request, num_games, workers, derive_seed(seed, next(chunk_indices)))
+        
+        if seed is not None:
+            random.seed(seed)
+        return lambda num_games: self.simulate_counts(calculation_request, num_games)
+    
+    def _run_adaptive_simulation(self, calculation_request: Dict[str, Any], simulation_count: int, workers: int, seed: int) -> Dict[str, Any]:
+        """
+        목표 신뢰구간 반폭에 도달할 때까지 chunk 단위로 시뮬레이션
+        
+        요청 필드:
+            target_half_width: 목표 신뢰구간 반폭 (%p, 예: 0.2)
+            max_simulations: 최대 게임 수 (없으면 simulation_count)
+            confidence: 신뢰수준 (기본 0.95)
+            interval_method: "wilson" (기본) 또는 "clopper_pearson"
+        """
+        target_half_width = calculation_request['target_half_width']
+        max_simulations = calculation_request.get('max_simulations', simulation_count)
+        confidence = calculation_request.get('confidence', 0.95)
+        interval_method = calculation_request.get('interval_method', 'wilson')
+        min_chunk = 1000
+        
+        if workers > 1 and seed is None:
+            seed = new_root_seed()
+        print(f"🎯 목표 정밀도 ±{target_half_width}%p까지 시뮬레이션 (최대 {max_simulations:,}회, {interval_method})")
+        
+        count_games = self._chunk_counter(calculation_request, workers, seed)
+        tracker = self._progress_tracker(calculation_request, max_simulations, confidence)
+        success_count = 0
+        total_valid_games = 0
+        games_used = 0
+        low, high = 0.0, 1.0
+        
+        while games_used < max_simulations:
+            # 현재 추정치로 필요한 게임 수를 예측해 다음 chunk 크기 결정
+            chunk_size = min_chunk
+            if total_valid_games > 0:
+                needed_valid = required_trials(success_count / total_valid_games, target_half_width / 100, confidence)
+                needed_games = int(needed_valid * games_used / total_valid_games * 1.05)
+                chunk_size = max(min_chunk, needed_games - games_used)
+            chunk_size = min(chunk_size, max_simulations - games_used)
+            
+            chunk_success, chunk_valid = count_games(chunk_size)
+            success_count += chunk_success
+            total_valid_games += chunk_valid
+            games_used += chunk_size
+            
+            tracker.advance(chunk_size, chunk_success, chunk_valid)
+            
+            low, high = proportion_interval(success_count, total_valid_games, confidence, interval_method)
+            if total_valid_games > 0 and (high - low) / 2 <= target_half_width / 100:
+                break
+        
+        tracker.finish()
+        half_width = (high - low) / 2 * 100
+        result = self._simulation_result(calculation_request, success_count, total_valid_games, games_used)
+        result.update({
+            'games_used': games_used,
+            'confidence': confidence,
+            'interval_method': interval_method,
+            'confidence_interval': (low * 100, high * 100),
+            'interval_half_width': half_width,
+            'target_half_width': target_half_width,
+            'target_met': total_valid_games > 0 and half_width <= target_half_width
+        })
+        if workers > 1:
+            result['workers'] = workers
+        if seed is not None:
+            result['seed'] = seed
+        return result
+    
+    def _run_simulation(self, calculation_request: Dict[str, Any], simulation_count: int, workers: int, seed: int) -> Dict[str, Any]:
+        """시뮬레이션 실행 (workers > 1이면 프로세스 병렬 실행, target_half_width가 있으면 적응형 실행)"""
+        if 'target_half_width' in calculation_request:
+            return self._run_adaptive_simulation(calculation_request, simulation_count, workers, seed)
+        
+        if workers > 1:
+            if seed is None:
+                seed = new_root_seed()
+            print(f"🧵 {workers}개 프로세스로 병렬 시뮬레이션 실행 (seed={seed})")
+            
+            tracker = self._progress_tracker(calculation_request, simulation_count)
+            if calculation_request.get('type') == 'evolution':
+                # 처음 진화 완료 턴 분포도 조각별 EvolutionCounter를 합산해 단일 프로세스 결과와 같은 형식으로 반환
+                counter = run_parallel_evolution(self.sim_engine, calculation_request, simulation_count, workers, seed,
+                                                 on_shard_done=tracker.advance)
+                tracker.finish()
+                result = self._evolution_result(calculation_request, counter, simulation_count)
+                result['workers'] = workers
+                result['seed'] = seed
+                return result
+            success_count, total_valid_games = run_parallel_counts(
+                self.sim_engine, calculation_request, simulation_count, workers, seed,
+                on_shard_done=tracker.advance)
+            tracker.finish()
+            
+            result = self._simulation_result(calculation_request, success_count, total_valid_games, simulation_count)
+            result['workers'] = workers
+            result['seed'] = seed
+            return result
+        
+        if seed is not None:
+            random.seed(seed)
+        
+        calc_type = calculation_request.get('type')
+        if calc_type == 'preferred_opening':
+            return self.calculate_preferred_opening_probability(calculation_request['preferred_basics'], simulation_count)
+        if calc_type == 'non_preferred_opening':
+            return self.calculate_non_preferred_opening_probability(calculation_request['non_preferred_basics'], simulation_count)
+        if calc_type == 'evolution':
+            return self.calculate_evolution_probability(calculation_request, simulation_count)
+        return self.calculate_multi_card_probability(calculation_request['target_cards'], calculation_request.get('turn', 2), simulation_count)
+    
+    def run_calculation(self, calculation_request: Dict[str, Any], simulation_count: int = 10000, use_mathematical: bool = True, workers: int = 1, seed: int = None) -> Dict[str, Any]:
         """
         계산 요청에 따라 적절한 확률 계산 함수 호출
         
         Args:
             calculation_request: 계산 요청 정보
-            simulation_count: 시뮬레이션 횟수 (시뮬레이션 사용 시)
+            simulation_count: 시뮬레이션 횟수 (시뮬레이션 사용 시, target_half_width 요청이면 최대 횟수 기본값)
             use_mathematical: True면 수학적 계산, False면 시뮬레이션 사용
+            workers: 시뮬레이션에 사용할 프로세스 수 (1이면 현재 프로세스에서 실행)
+            seed: 난수 seed (병렬 실행 시 워커별 seed는 이 값에서 파생)
         
         Returns:
             Dict: 확률 계산 결과
@@ -493,7 +935,7 @@ class ProbabilityCalculator:
             if use_mathematical:
                 result = self.calculate_preferred_opening_mathematical(preferred_basics)
             else:
-                result = self.calculate_preferred_opening_probability(preferred_basics, simulation_count)
+                result = self._run_simulation(calculation_request, simulation_count, workers, seed)
             
         elif calc_type == 'non_preferred_opening':
             non_preferred_basics = calculation_request.get('non_preferred_basics', [])
@@ -504,7 +946,7 @@ class ProbabilityCalculator:
             if use_mathematical:
                 result = self.calculate_non_preferred_opening_mathematical(non_preferred_basics)
             else:
-                result = self.calculate_non_preferred_opening_probability(non_preferred_basics, simulation_count)
+                result = self._run_simulation(calculation_request, simulation_count, workers, seed)
             
         elif calc_type == 'multi_card':
             target_cards = calculation_request.get('target_cards', [])
@@ -512,19 +954,53 @@ class ProbabilityCalculator:
             if not target_cards:
                 print("❌ 오류: 대상 카드 목록이 필요합니다.")
                 return None
-            if len(target_cards) > 3:
-                print("❌ 오류: 대상 카드는 최대 3개까지만 지원합니다.")
-                return None
                 
-            if use_mathematical:
-                print("⚠️ 멀티카드 드로우는 카드 효과가 복잡하여 시뮬레이션을 사용합니다.")
+            if use_mathematical and self.can_use_multi_card_mathematical():
+                # 드로우 카드 효과가 없으면 포함-배제 공식으로 즉시 계산
+                result = self.calculate_multi_card_mathematical(target_cards, max_turn)
+            elif use_mathematical and self.can_use_exact_engine():
+                # 구성에만 의존하는 드로우 카드만 있으면 Markov 연쇄 정확 계산
+                result = self.calculate_multi_card_exact(target_cards, max_turn)
+            elif self.can_use_batch_engine():
+                # 드로우 카드 효과가 없으면 NumPy 배치 시뮬레이션
+                print("⚡ 발동되는 드로우 카드가 없어 NumPy 배치 엔진을 사용합니다.")
+                if 'target_half_width' in calculation_request:
+                    result = self._run_adaptive_simulation(calculation_request, simulation_count, workers, seed)
+                else:
+                    result = self.calculate_multi_card_probability_batch(target_cards, max_turn, simulation_count, seed=seed)
+            else:
+                if use_mathematical:
+                    print("⚠️ 멀티카드 드로우는 카드 효과가 복잡하여 시뮬레이션을 사용합니다.")
+                
+                # 카드 효과가 있으면 게임 단위 시뮬레이션 사용
+                result = self._run_simulation(calculation_request, simulation_count, workers, seed)
             
-            # 멀티카드는 항상 시뮬레이션 사용 (카드 효과 때문)
-            result = self.calculate_multi_card_probability(target_cards, max_turn, simulation_count)
+        elif calc_type == 'card_curves':
+            cards = calculation_request.get('cards') or list(self.deck_input)
+            max_turn = calculation_request.get('turn', 2)
+            missing_cards = [card for card in cards if card not in self.deck_input]
+            if missing_cards:
+                print(f"❌ 오류: 덱에 없는 카드입니다: {', '.join(missing_cards)}")
+                return None
+            
+            if use_mathematical and self.can_use_exact_card_curves():
+                result = self.calculate_card_curves_exact(cards, max_turn)
+            else:
+                result = self.calculate_card_curves_simulation(cards, max_turn, simulation_count, seed=seed)
+            
+        elif calc_type == 'evolution':
+            error = self.evolution_request_error(calculation_request)
+            if error:
+                print(f"❌ 오류: {error}")
+                return None
+            
+            if use_mathematical:
+                print("⚠️ 진화 성공 확률은 Field / 진화 상태가 있어 v3 파이프라인 시뮬레이션을 사용합니다.")
+            result = self._run_simulation(calculation_request, simulation_count, workers, seed)
             
         else:
             print(f"❌ 오류: '{calc_type}' 타입은 지원되지 않습니다.")
-            print("지원되는 타입: 'preferred_opening', 'non_preferred_opening', 'multi_card'")
+            print("지원되는 타입: 'preferred_opening', 'non_preferred_opening', 'multi_card', 'card_curves', 'evolution'")
             return None
         
         if result:
@@ -532,6 +1008,349 @@ class ProbabilityCalculator:
         
         return result
 
+    # ===== 카드별 턴별 확률 곡선 =====
+
+    def can_use_exact_card_curves(self) -> bool:
+        """card_curves 정확 계산 가능 여부 (목표 카드가 없으므로 Iono / Pokemon Communication은 무관)"""
+        return not unsupported_effects(self.deck_input, self.sim_engine.draw_order, with_targets=False)
+
+    def _card_curves_result(self, cards: List[str], max_turn: int, in_hand: Dict[str, List[float]],
+                            seen: Dict[str, List[float]]) -> Dict[str, Any]:
+        """카드별 턴별 확률(0~1)을 card_curves 결과 딕셔너리로 변환
+
+        처음 본 턴 분포는 "턴까지 본 확률"의 턴별 증가분이고, 나머지는 max_turn까지 보지 못한 확률입니다.
+        """
+        def percent(values):
+            return [round(float(value) * 100, 2) for value in values]
+
+        first_seen = {card: [seen[card][0]] + [seen[card][turn] - seen[card][turn - 1] for turn in range(1, max_turn + 1)]
+                      for card in cards}
+        return {
+            'calculation_type': 'card_curves',
+            'description': f'{max_turn}턴까지 카드별 턴별 드로우 확률 곡선 ({len(cards)}종)',
+            'cards': cards,
+            'max_turn': max_turn,
+            'turns': list(range(max_turn + 1)),
+            'seen_percent': {card: percent(seen[card]) for card in cards},
+            'in_hand_percent': {card: percent(in_hand[card]) for card in cards},
+            'first_seen_percent': {card: percent(first_seen[card]) for card in cards},
+            'never_seen_percent': {card: round((1 - seen[card][max_turn]) * 100, 2) for card in cards}
+        }
+
+    def calculate_card_curves_exact(self, cards: List[str], max_turn: int) -> Dict[str, Any]:
+        """
+        카드별로 0~max_turn턴까지 손패에 들어온 적이 있을 확률 / 턴 종료 시점 손패 보유 확률 (Markov 연쇄 정확 계산)
+        
+        목표 카드가 없으므로 Iono / Pokemon Communication은 사용하지 않는 정책입니다.
+        
+        Args:
+            cards: 대상 카드명 리스트
+            max_turn: 최대 턴 수
+        
+        Returns:
+            Dict: card_curves 결과 (샘플링 오차 없음)
+        """
+        print(f"=== 수학적 계산: 카드별 턴별 확률 곡선 (Markov 연쇄) ===")
+        print(f"대상 카드: {len(cards)}종, 최대 턴: {max_turn}턴")
+        
+        start_time = time.perf_counter()
+        curves = exact_card_curves(self.deck_input, self.sim_engine.draw_order, cards, max_turn)
+        elapsed = time.perf_counter() - start_time
+        
+        result = self._card_curves_result(cards, max_turn, curves['in_hand'], curves['seen'])
+        result.update({
+            'total_valid_games': None,
+            'simulation_count': 0,
+            'calculation_method': 'Markov Chain (수학적 정확값)',
+            'execution_time': f'{elapsed:.3f}초'
+        })
+        return result
+
+    def calculate_card_curves_simulation(self, cards: List[str], max_turn: int, num_simulations: int = 10000,
+                                         seed: int = None) -> Dict[str, Any]:
+        """
+        카드별 턴별 확률 곡선 (시뮬레이션 1회로 모든 카드 / 모든 턴 집계)
+        
+        트래시까지 봐야 하므로 run_stream이 없는 엔진이면 같은 덱의 EncodedSimulationEngine으로 실행합니다.
+        
+        Args:
+            cards: 대상 카드명 리스트
+            max_turn: 최대 턴 수
+            num_simulations: 시뮬레이션 횟수
+            seed: 난수 seed
+        
+        Returns:
+            Dict: card_curves 결과
+        """
+        print(f"=== 시뮬레이션: 카드별 턴별 확률 곡선 ===")
+        print(f"대상 카드: {len(cards)}종, 최대 턴: {max_turn}턴")
+        
+        engine = self.sim_engine
+        if not hasattr(engine, 'run_stream'):
+            engine = EncodedSimulationEngine(self.deck_input, self.sim_engine.draw_order)
+        if seed is not None:
+            random.seed(seed)
+        
+        start_time = time.perf_counter()
+        counter = CardCurveCounter(engine.card_table, max_turn)
+        tracker = self._progress_tracker({'type': 'card_curves'}, num_simulations)
+        games_done = 0
+        while games_done < num_simulations:
+            chunk_size = min(self.progress_chunk, num_simulations - games_done)
+            engine.run_stream(counter, chunk_size, max_turn=max_turn)
+            games_done += chunk_size
+            tracker.advance(chunk_size, 0, 0)
+        tracker.finish()
+        elapsed = time.perf_counter() - start_time
+        
+        total_valid_games = counter.total_valid_games
+        in_hand = {}
+        seen = {}
+        for card in cards:
+            card_id = engine.card_table.ids[card]
+            in_hand[card] = [counter.in_hand_counts[turn][card_id] / total_valid_games if total_valid_games else 0.0
+                             for turn in range(max_turn + 1)]
+            cumulative = itertools.accumulate(counter.first_seen_counts[turn][card_id] for turn in range(max_turn + 1))
+            seen[card] = [count / total_valid_games if total_valid_games else 0.0 for count in cumulative]
+        
+        result = self._card_curves_result(cards, max_turn, in_hand, seen)
+        result.update({
+            'total_valid_games': total_valid_games,
+            'simulation_count': num_simulations,
+            'calculation_method': '시뮬레이션 (게임 흐름 1회로 모든 카드 집계)',
+            'execution_time': f'{elapsed:.3f}초'
+        })
+        if seed is not None:
+            result['seed'] = seed
+        return result
+
+    # ===== v3 진화 성공 확률 =====
+
+    def evolution_request_error(self, calculation_request: Dict[str, Any]) -> Optional[str]:
+        """evolution 요청의 오류 메시지 (유효하면 None)"""
+        target_evolutions = calculation_request.get('target_evolutions')
+        evolution_lines = calculation_request.get('evolution_lines')
+        if not target_evolutions or not isinstance(target_evolutions, list):
+            return "target_evolutions(Field에 나와 있어야 하는 포켓몬 목록)가 필요합니다."
+        if not evolution_lines or not isinstance(evolution_lines, list):
+            return "evolution_lines(진화 라인 목록)가 필요합니다."
+        if any(not isinstance(line, dict) or not line.get('basic') for line in evolution_lines):
+            return "evolution_lines의 각 항목은 'basic'이 있는 딕셔너리여야 합니다."
+        missing_cards = [card for card in target_evolutions if card not in self.deck_input]
+        if missing_cards:
+            return f"덱에 없는 카드입니다: {', '.join(missing_cards)}"
+        try:
+            target_evolution_lines(evolution_lines, target_evolutions)
+        except ValueError as e:
+            return str(e)
+        return None
+
+    def calculate_evolution_probability(self, calculation_request: Dict[str, Any], num_simulations: int = 10000) -> Dict[str, Any]:
+        """
+        N턴까지 목표 진화 포켓몬이 모두 Field에 나와 있을 확률 (GameStateV3 / use_draw_cards_v3 / auto_evolve_all)
+        
+        Args:
+            calculation_request: evolution 요청
+                target_evolutions: Field에 나와 있어야 하는 포켓몬들
+                evolution_lines: 진화 라인 [{"basic", "stage1", "stage2"}]
+                preferred_basics: Active에 우선 배치할 Basic (선택)
+                turn: 최대 턴 (기본 2)
+            num_simulations: 시뮬레이션 횟수
+        
+        Returns:
+            Dict: 확률 계산 결과 (처음 진화 완료 턴 분포 first_success_percent 포함)
+        """
+        max_turn = calculation_request.get('turn', 2)
+        print(f"=== 진화 성공 확률 계산 시작 (v3) ===")
+        print(f"목표 진화: {', '.join(calculation_request['target_evolutions'])}")
+        print(f"최대 턴: {max_turn}턴")
+        print(f"시뮬레이션 횟수: {num_simulations:,}회")
+        
+        simulator = self._evolution_simulator(calculation_request)
+        counter = EvolutionCounter(max_turn)
+        tracker = self._progress_tracker(calculation_request, num_simulations)
+        games_done = 0
+        while games_done < num_simulations:
+            chunk_size = min(self.progress_chunk, num_simulations - games_done)
+            success_before, valid_before = counter.success_count, counter.total_valid_games
+            simulator.run_stream(counter, chunk_size, max_turn)
+            games_done += chunk_size
+            tracker.advance(chunk_size, counter.success_count - success_before, counter.total_valid_games - valid_before)
+        tracker.finish()
+        
+        result = self._evolution_result(calculation_request, counter, num_simulations)
+        
+        print(f"\n=== 진화 성공 확률 계산 완료 ===")
+        print(f"성공: {counter.success_count:,}회 / 유효 게임: {counter.total_valid_games:,}회")
+        print(f"확률: {result['probability_percent']:.2f}%")
+        
+        return result
+
+    def _evolution_result(self, calculation_request: Dict[str, Any], counter: EvolutionCounter,
+                          num_simulations: int) -> Dict[str, Any]:
+        """EvolutionCounter 집계를 결과 딕셔너리로 변환 (처음 진화 완료 턴 분포 first_success_percent 포함)"""
+        result = self._simulation_result(calculation_request, counter.success_count, counter.total_valid_games, num_simulations)
+        total_valid_games = counter.total_valid_games
+        result['first_success_percent'] = [round(count / total_valid_games * 100, 2) if total_valid_games else 0.0
+                                           for count in counter.first_success_counts]
+        return result
+
+    # ===== 스위트 공유 실행 =====
+
+    SHARED_PASS_TYPES = ('preferred_opening', 'non_preferred_opening', 'multi_card')
+
+    def _policy_inputs(self, calculation_request: Dict[str, Any]) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...], Optional[int]]:
+        """게임 진행(드로우 카드 판단)에 영향을 주는 요청 정보
+
+        목표 카드는 Iono 사용 판단(발동 순서에 있을 때)과 Pokemon Communication 교환
+        (덱에 있을 때)에만 쓰이고, Pokemon Communication은 마지막 턴에만 사용하므로
+        그때는 max_turn도 정책 입력입니다. 둘 다 없으면 모든 요청이 같은 게임 흐름을 공유합니다.
+
+        Returns:
+            (target_cards, target_groups, 정책이 의존하는 max_turn 또는 None)
+        """
+        game_kwargs = self._game_kwargs(calculation_request)
+        target_cards = tuple(game_kwargs.get('target_cards') or ())
+        target_groups = tuple(tuple(group['target_cards']) for group in game_kwargs.get('target_groups') or ())
+        uses_iono = 'Iono' in self.sim_engine.draw_order and 'Iono' in self.deck_input
+        uses_pokemon_communication = bool(target_cards) and 'Pokemon Communication' in self.deck_input
+        if not uses_iono and not uses_pokemon_communication:
+            return (), (), None
+        policy_turn = game_kwargs['max_turn'] if uses_pokemon_communication else None
+        return target_cards, target_groups, policy_turn
+
+    def plan_suite(self, calculation_requests: List[Dict[str, Any]], use_mathematical: bool = True) -> Tuple[List[int], List[Dict[str, Any]]]:
+        """스위트 요청을 개별 계산 대상과 게임 흐름을 공유할 그룹으로 분류
+
+        - 정확 계산 / 적응형(target_half_width) 요청은 개별 계산
+        - 나머지는 정책 입력(target_cards, target_groups, 필요하면 max_turn)이 같은 요청끼리 한 그룹
+        - 시작 손패만 보는 요청은 정책과 무관하므로 첫 번째 그룹에 합류
+
+        Returns:
+            (개별 계산 요청 index 목록, 그룹 목록)
+            그룹: {'signature', 'game_kwargs', 'members': [(요청 index, 요청, 판정 턴)]}
+        """
+        individual = []
+        groups: Dict[Any, Dict[str, Any]] = {}
+        opening_members = []
+
+        for index, request in enumerate(calculation_requests):
+            if (request.get('type') not in self.SHARED_PASS_TYPES or 'target_half_width' in request
+                    or self.is_deterministic(request, use_mathematical)):
+                individual.append(index)
+                continue
+
+            judgement_turn = self._game_kwargs(request)['max_turn']
+            policy = self._policy_inputs(request)
+            if judgement_turn == 0:
+                opening_members.append((index, request, 0))
+                continue
+
+            group = groups.get(policy)
+            if group is None:
+                # 정책이 목표 카드와 무관하면 목표 카드 없이 진행 (같은 게임 흐름)
+                group_kwargs = {}
+                if policy != ((), (), None):
+                    group_kwargs = {key: value for key, value in self._game_kwargs(request).items() if key != 'max_turn'}
+                group = groups[policy] = {'game_kwargs': group_kwargs, 'members': []}
+            group['members'].append((index, request, judgement_turn))
+
+        groups = list(groups.values())
+        if opening_members:
+            if groups:
+                groups[0]['members'].extend(opening_members)
+            else:
+                groups.append({'game_kwargs': {}, 'members': opening_members})
+
+        for group in groups:
+            group['game_kwargs']['max_turn'] = max(turn for _, _, turn in group['members'])
+            group['members'].sort()
+            group['signature'] = json.dumps(group['game_kwargs'], sort_keys=True, ensure_ascii=False)
+        return individual, groups
+
+    def simulate_suite_counts(self, group: Dict[str, Any], num_simulations: int) -> List[Tuple[int, int]]:
+        """그룹의 게임을 최대 판정 턴까지 한 번씩 실행하고 요청별 (success_count, total_valid_games) 집계"""
+        members = group['members']
+        game_kwargs = group['game_kwargs']
+
+        if hasattr(self.sim_engine, 'run_stream'):
+            counters = [counter_for_request(request, self.sim_engine.card_table) for _, request, _ in members]
+            suite_counter = SuiteCounter([(turn, counter) for (_, _, turn), counter in zip(members, counters)])
+            self.sim_engine.run_stream(suite_counter, num_simulations, **game_kwargs)
+            return [(counter.success_count, counter.total_valid_games) for counter in counters]
+
+        counts = [[0, 0] for _ in members]
+        for _ in range(num_simulations):
+            game_result = self.sim_engine.simulate_single_game(**game_kwargs)
+            if not game_result['success']:
+                continue
+
+            turn_results = game_result['turn_results']
+            for member_counts, (_, request, turn) in zip(counts, members):
+                # 판정 턴의 손패를 그 요청의 최종 손패로 판정
+                turn_view = {'turn_results': turn_results, 'final_hand': turn_results[turn]['hand_after_effects']}
+                member_counts[1] += 1
+                if self._is_success(request, turn_view):
+                    member_counts[0] += 1
+        return [tuple(member_counts) for member_counts in counts]
+
+    def run_shared_group(self, group: Dict[str, Any], simulation_count: int, seed: int = None) -> Dict[int, Dict[str, Any]]:
+        """그룹 하나를 공유 게임 흐름으로 시뮬레이션
+
+        seed가 있으면 그룹 seed를 그룹 signature에서 파생하므로, 같은 그룹은 스위트의 다른
+        요청과 무관하게 항상 같은 결과를 냅니다.
+
+        Returns:
+            {요청 index: 결과 딕셔너리}
+        """
+        members = group['members']
+        print(f"🔗 게임 흐름 공유: 요청 {len(members)}개, {group['game_kwargs']['max_turn']}턴까지 {simulation_count:,}회 시뮬레이션")
+        if seed is not None:
+            random.seed(derive_seed(seed, group['signature']))
+
+        tracker = self._progress_tracker({'type': 'suite'}, simulation_count)
+        totals = [(0, 0)] * len(members)
+        games_done = 0
+        while games_done < simulation_count:
+            chunk_size = min(self.progress_chunk, simulation_count - games_done)
+            chunk_counts = self.simulate_suite_counts(group, chunk_size)
+            totals = [(success + chunk_success, valid + chunk_valid)
+                      for (success, valid), (chunk_success, chunk_valid) in zip(totals, chunk_counts)]
+            games_done += chunk_size
+            # 진행 상황의 추정치는 그룹 첫 번째 요청 기준
+            tracker.advance(chunk_size, *chunk_counts[0])
+        tracker.finish()
+
+        results = {}
+        for (index, request, _), (success_count, total_valid_games) in zip(members, totals):
+            result = self._simulation_result(request, success_count, total_valid_games, simulation_count)
+            result['shared_pass'] = {'requests': len(members), 'max_turn': group['game_kwargs']['max_turn']}
+            results[index] = result
+        return results
+
+    def run_suite(self, calculation_requests: List[Dict[str, Any]], simulation_count: int = 10000,
+                  use_mathematical: bool = True, seed: int = None) -> List[Optional[Dict[str, Any]]]:
+        """여러 계산 요청을 게임 흐름을 공유해 실행
+
+        정책 입력이 같은 시뮬레이션 요청은 게임을 한 번만 진행하고 요청별 판정 턴의
+        손패로 각각 판정합니다. 요청 하나하나의 결과 분포는 run_calculation과 같지만,
+        같은 그룹의 결과는 같은 게임에서 나오므로 서로 상관되어 있습니다.
+
+        Returns:
+            요청 순서대로의 결과 목록
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(calculation_requests)
+        individual, groups = self.plan_suite(calculation_requests, use_mathematical)
+
+        for index in individual:
+            results[index] = self.run_calculation(calculation_requests[index], simulation_count,
+                                                  use_mathematical=use_mathematical, seed=seed)
+        for group in groups:
+            for index, result in self.run_shared_group(group, simulation_count, seed).items():
+                self.print_calculation_result(result)
+                results[index] = result
+        return results
+
     # ===== 복합 확률 계산 함수들 (v2.1 추가) =====
     
     def calculate_preferred_and_multi_probability(self, preferred_basics: List[str], target_cards: List[str], max_turn: int, num_simulations: int = 10000) -> Dict[str, Any]:
@@ -554,32 +1373,10 @@ class ProbabilityCalculator:
         print(f"시뮬레이션 횟수: {num_simulations:,}회")
         print(f"조건: 선호 Basic으로 시작 + {max_turn}턴까지 모든 목표 카드 확보")
         
-        success_count = 0
-        total_valid_games = 0
-        checkpoint = max(1, num_simulations // 10)
-        
-        for i in range(num_simulations):
-            if (i + 1) % checkpoint == 0 or i == 0:
-                progress = ((i + 1) / num_simulations) * 100
-                print(f"진행률: {progress:.1f}% ({i+1:,}/{num_simulations:,})")
-            
-            game_result = self.sim_engine.simulate_single_game(max_turn, target_cards=target_cards)
-            
-            if game_result['success']:
-                total_valid_games += 1
-                
-                # 조건 1: 선호하는 Basic Pokemon으로 시작했는지 체크
-                turn_0_hand = game_result.get('turn_results', {}).get(0, {}).get('hand_before_effects', [])
-                basic_pokemons_in_opening = [card for card in turn_0_hand if self._is_basic_pokemon(card)]
-                preferred_opening = any(basic in preferred_basics for basic in basic_pokemons_in_opening)
-                
-                # 조건 2: 목표 카드들을 모두 확보했는지 체크
-                final_hand = game_result['final_hand']
-                all_cards_found = all(card in final_hand for card in target_cards)
-                
-                # 복합 조건: 두 조건을 모두 만족
-                if preferred_opening and all_cards_found:
-                    success_count += 1
+        success_count, total_valid_games = self._count_games_with_progress(
+            {'type': 'preferred_and_multi', 'preferred_basics': preferred_basics,
+             'target_cards': target_cards, 'turn': max_turn},
+            num_simulations)
         
         if total_valid_games == 0:
             probability = 0.0
@@ -607,31 +1404,10 @@ class ProbabilityCalculator:
     
     def calculate_non_preferred_and_multi_probability(self, non_preferred_basics, target_cards, max_turn, num_simulations=10000):
         print("=== 비선호 시작 AND 멀티카드 확률 계산 시작 ===")
-        success_count = 0
-        total_valid_games = 0
-        
-        for i in range(num_simulations):
-            if (i + 1) % 1000 == 0:
-                progress = ((i + 1) / num_simulations) * 100
-                print(f"진행률: {progress:.1f}%")
-            
-            game_result = self.sim_engine.simulate_single_game(max_turn, target_cards=target_cards)
-            
-            if game_result['success']:
-                total_valid_games += 1
-                
-                # 비선호 시작 체크
-                turn_0_hand = game_result.get('turn_results', {}).get(0, {}).get('hand_before_effects', [])
-                basic_pokemons = [card for card in turn_0_hand if self._is_basic_pokemon(card)]
-                non_preferred_opening = (len(basic_pokemons) > 0 and 
-                                       all(basic in non_preferred_basics for basic in basic_pokemons))
-                
-                # 목표 카드 확보 체크
-                final_hand = game_result['final_hand']
-                all_cards_found = all(card in final_hand for card in target_cards)
-                
-                if non_preferred_opening and all_cards_found:
-                    success_count += 1
+        success_count, total_valid_games = self._count_games_with_progress(
+            {'type': 'non_preferred_and_multi', 'non_preferred_basics': non_preferred_basics,
+             'target_cards': target_cards, 'turn': max_turn},
+            num_simulations)
         
         probability = (success_count / total_valid_games) * 100 if total_valid_games > 0 else 0.0
         
@@ -646,34 +1422,9 @@ class ProbabilityCalculator:
     def calculate_multi_or_multi_probability(self, target_groups, max_turn, num_simulations=10000):
         print("=== 멀티 OR 멀티 확률 계산 시작 ===")
         
-        all_target_cards = []
-        for group in target_groups:
-            all_target_cards.extend(group['target_cards'])
-        all_target_cards = list(set(all_target_cards))
-        
-        success_count = 0
-        total_valid_games = 0
-        
-        for i in range(num_simulations):
-            if (i + 1) % 1000 == 0:
-                progress = ((i + 1) / num_simulations) * 100
-                print(f"진행률: {progress:.1f}%")
-            
-            game_result = self.sim_engine.simulate_single_game(max_turn, target_cards=all_target_cards, target_groups=target_groups)
-            
-            if game_result['success']:
-                total_valid_games += 1
-                
-                final_hand = game_result['final_hand']
-                group_completed = False
-                
-                for group in target_groups:
-                    if all(card in final_hand for card in group['target_cards']):
-                        group_completed = True
-                        break
-                
-                if group_completed:
-                    success_count += 1
+        success_count, total_valid_games = self._count_games_with_progress(
+            {'type': 'multi_or_multi', 'target_groups': target_groups, 'turn': max_turn},
+            num_simulations)
         
         probability = (success_count / total_valid_games) * 100 if total_valid_games > 0 else 0.0
         
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 단계별 프로파일링 모듈
+
+profile_phases() context 안에서만 주요 단계 함수를 계측 wrapper로 교체하고,
+context를 벗어나면 원래 함수로 되돌립니다 (평소 실행에는 오버헤드 없음).
+
+    with profile_phases() as profiler:
+        simulator.run_calculation(request, 100000)
+    profiler.print_report()
+    profiler.write_collapsed("profile.folded")   # flamegraph.pl / speedscope 입력
+
+측정 단계: initial_draw, start_turn, _use_draw_cards, CardEffects 효과별 함수,
+Iono / Pokemon Communication 판단 함수, auto_evolve_all, use_draw_cards_v3
+
+주의:
+- 병렬 실행(workers > 1)의 워커 프로세스는 측정되지 않음
+- EncodedSimulationEngine의 카드 효과는 엔진 생성 시 바인딩되므로
+  context 안에서 생성한 엔진만 효과별로 측정됨
+"""
+
+import functools
+import importlib
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple, Optional, Any
+
+# (모듈, 클래스 또는 None(모듈 함수), 함수 이름)
+PROFILE_TARGETS: List[Tuple[str, Optional[str], str]] = [
+    ("main_simulator", "GameState", "initial_draw"),
+    ("main_simulator", "GameState", "start_turn"),
+    ("main_simulator", "SimulationEngine", "_use_draw_cards"),
+    ("main_simulator", "SimulationEngine", "_should_use_iono_for_multi_or_multi"),
+    ("card_effects", "CardEffects", "poke_ball"),
+    ("card_effects", "CardEffects", "professors_research"),
+    ("card_effects", "CardEffects", "galdion"),
+    ("card_effects", "CardEffects", "pokemon_communication"),
+    ("card_effects", "CardEffects", "iono"),
+    ("card_effects", "CardEffects", "should_use_iono"),
+    ("card_effects", "CardEffects", "should_use_pokemon_communication"),
+    ("encoded_engine", "EncodedGameState", "initial_draw"),
+    ("encoded_engine", "EncodedGameState", "start_turn"),
+    ("encoded_engine", "EncodedSimulationEngine", "_use_draw_cards"),
+    ("encoded_engine", "EncodedSimulationEngine", "_poke_ball"),
+    ("encoded_engine", "EncodedSimulationEngine", "_professors_research"),
+    ("encoded_engine", "EncodedSimulationEngine", "_galdion"),
+    ("encoded_engine", "EncodedSimulationEngine", "_pokemon_communication"),
+    ("encoded_engine", "EncodedSimulationEngine", "_iono"),
+    ("encoded_engine", "EncodedSimulationEngine", "_should_use_iono"),
+    ("encoded_engine", "EncodedSimulationEngine", "_should_use_iono_for_multi_or_multi"),
+    ("encoded_engine", "EncodedSimulationEngine", "_choose_pokemon_communication_target"),
+    ("v3_game_state", "GameStateV3", "initial_draw"),
+    ("v3_game_state", "GameStateV3", "start_turn"),
+    ("v3_evolution_system", None, "auto_evolve_all"),
+    ("v3_draw_card_system", None, "auto_evolve_all"),
+    ("v3_draw_card_system", None, "use_draw_cards_v3"),
+]
+
+_active_profiler = None
+
+
+class PhaseProfiler:
+    """단계별 호출 횟수 / 누적 시간(자식 포함) / 자체 시간 / 호출 스택 집계"""
+
+    def __init__(self):
+        # 단계 이름 -> [호출 횟수, 누적 시간, 자체 시간]
+        self.stats: Dict[str, List[float]] = {}
+        # "바깥;안쪽" 호출 경로 -> 자체 시간 (collapsed stack)
+        self.collapsed: Dict[str, float] = {}
+        self._stack: List[List[Any]] = []
+
+    def wrap(self, phase: str, func):
+        """func 호출을 phase 단계로 기록하는 wrapper 생성"""
+        stack = self._stack
+        stats = self.stats
+        collapsed = self.collapsed
+        perf_counter = time.perf_counter
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            frame = [phase, 0.0]
+            stack.append(frame)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                path = ";".join(entry[0] for entry in stack)
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+
+                self_time = elapsed - frame[1]
+                entry = stats.get(phase)
+                if entry is None:
+                    entry = stats[phase] = [0, 0.0, 0.0]
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] += self_time
+                collapsed[path] = collapsed.get(path, 0.0) + self_time
+
+        return wrapper
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """누적 시간 내림차순 단계별 통계"""
+        rows = []
+        for phase, (calls, total, self_time) in self.stats.items():
+            rows.append({
+                'phase': phase,
+                'calls': int(calls),
+                'total_seconds': total,
+                'self_seconds': self_time,
+                'per_call_us': total / calls * 1e6 if calls else 0.0
+            })
+        rows.sort(key=lambda row: row['total_seconds'], reverse=True)
+        return rows
+
+    def print_report(self, limit: Optional[int] = None):
+        """단계별 통계 표 출력"""
+        rows = self.rows()
+        total_self = sum(row['self_seconds'] for row in rows)
+
+        print("=" * 92)
+        print("단계별 프로파일 (누적 시간 순)")
+        print("=" * 92)
+        print(f"{'단계':<52}{'호출':>10}{'누적(s)':>10}{'자체(s)':>10}{'µs/호출':>10}")
+        for row in rows[:limit]:
+            print(f"{row['phase']:<52}{row['calls']:>10,}{row['total_seconds']:>10.3f}"
+                  f"{row['self_seconds']:>10.3f}{row['per_call_us']:>10.2f}")
+        print("=" * 92)
+        print(f"측정된 자체 시간 합계: {total_self:.3f}초")
+
+    def write_collapsed(self, path: str):
+        """flamegraph용 collapsed stack 파일 저장 (값: 자체 시간 µs)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack_path, self_time in sorted(self.collapsed.items()):
+                f.write(f"{stack_path} {max(0, round(self_time * 1e6))}\n")
+
+
+@contextmanager
+def profile_phases(targets: List[Tuple[str, Optional[str], str]] = None):
+    """context 안에서 targets 함수들을 계측하는 PhaseProfiler 제공
+
+    Args:
+        targets: (모듈, 클래스 또는 None, 함수 이름) 목록 (None이면 PROFILE_TARGETS)
+
+    Yields:
+        PhaseProfiler
+    """
+    global _active_profiler
+    if _active_profiler is not None:
+        raise RuntimeError("이미 프로파일링 중입니다 (profile_phases는 중첩할 수 없음)")
+
+    profiler = PhaseProfiler()
+    patched = []
+    try:
+        for module_name, owner_name, attr in targets or PROFILE_TARGETS:
+            module = importlib.import_module(module_name)
+            owner = getattr(module, owner_name) if owner_name else module
+            original = owner.__dict__[attr] if owner_name else getattr(module, attr)
+            phase = f"{owner_name}.{attr}" if owner_name else attr
+
+            if isinstance(original, staticmethod):
+                replacement = staticmethod(profiler.wrap(phase, original.__func__))
+            else:
+                replacement = profiler.wrap(phase, original)
+            setattr(owner, attr, replacement)
+            patched.append((owner, attr, original))
+
+        _active_profiler = profiler
+        yield profiler
+    finally:
+        _active_profiler = None
+        for owner, attr, original in reversed(patched):
+            setattr(owner, attr, original)
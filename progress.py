@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 진행률 / 처리량 보고 모듈
+
+긴 시뮬레이션의 진행 상황을 stdout print 대신 교체 가능한 reporter로 전달합니다.
+
+- ProgressReporter: 아무것도 하지 않는 기본 reporter (ProbabilityCalculator 기본값)
+- ConsoleProgressReporter: 사람이 읽는 "진행률: ..." 한 줄 출력
+- JsonLinesProgressReporter: 기계가 읽는 JSON Lines 출력 (서비스 / 로그 수집용)
+
+ProgressTracker가 완료 게임 수를 누적하고 min_interval초마다 한 번만
+reporter를 호출합니다 (첫 보고와 마지막 완료 보고는 항상 전달).
+"""
+
+import json
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional, Tuple, Callable
+
+from stats_utils import proportion_interval
+
+
+@dataclass
+class ProgressUpdate:
+    """reporter에 전달되는 진행 상황 한 건"""
+    calculation_type: str
+    games_completed: int
+    total_games: int
+    success_count: int
+    total_valid_games: int
+    elapsed_seconds: float
+    games_per_second: float
+    estimate_percent: Optional[float]
+    interval_percent: Optional[Tuple[float, float]]
+    eta_seconds: Optional[float]
+    finished: bool = False
+
+    @property
+    def percent_complete(self) -> float:
+        if self.total_games <= 0:
+            return 100.0
+        return self.games_completed / self.total_games * 100
+
+    def to_dict(self):
+        data = asdict(self)
+        data['percent_complete'] = self.percent_complete
+        if self.interval_percent is not None:
+            data['interval_percent'] = list(self.interval_percent)
+        return data
+
+
+class ProgressReporter:
+    """진행 상황 reporter 기본 클래스 (아무것도 출력하지 않음)"""
+
+    def report(self, update: ProgressUpdate):
+        """throttle을 거친 진행 상황 (finished=True면 마지막 보고)"""
+
+
+class ConsoleProgressReporter(ProgressReporter):
+    """진행률 / 처리량 / 현재 추정치 / ETA를 한 줄씩 출력"""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def report(self, update: ProgressUpdate):
+        line = (f"진행률: {update.percent_complete:.1f}% "
+                f"({update.games_completed:,}/{update.total_games:,}) | "
+                f"{update.games_per_second:,.0f}게임/초")
+        if update.estimate_percent is not None:
+            low, high = update.interval_percent
+            line += f" | 추정 {update.estimate_percent:.2f}% [{low:.2f}~{high:.2f}]"
+        if update.finished:
+            line += f" | 완료 {update.elapsed_seconds:.2f}초"
+        elif update.eta_seconds is not None:
+            line += f" | 남은 시간 {update.eta_seconds:.1f}초"
+        print(line, file=self.stream or sys.stdout)
+
+
+class JsonLinesProgressReporter(ProgressReporter):
+    """진행 상황을 JSON 객체 한 줄씩 기록 (event: "progress" / "finished")"""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def report(self, update: ProgressUpdate):
+        record = {'event': 'finished' if update.finished else 'progress'}
+        record.update(update.to_dict())
+        stream = self.stream or sys.stdout
+        stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        stream.flush()
+
+
+class ProgressTracker:
+    """완료 게임 수를 누적하고 throttle된 ProgressUpdate를 reporter에 전달"""
+
+    def __init__(self, reporter: ProgressReporter, calculation_type: str, total_games: int,
+                 min_interval: float = 0.5, confidence: float = 0.95,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            reporter: 진행 상황을 받을 reporter
+            calculation_type: 계산 타입 (보고에 그대로 포함)
+            total_games: 전체 (최대) 게임 수
+            min_interval: 보고 최소 간격 (초)
+            confidence: 현재 추정치 신뢰구간의 신뢰수준 (Wilson)
+            clock: 시간 함수 (테스트용)
+        """
+        self.reporter = reporter
+        self.calculation_type = calculation_type
+        self.total_games = total_games
+        self.min_interval = min_interval
+        self.confidence = confidence
+        self.clock = clock
+        self.games_completed = 0
+        self.success_count = 0
+        self.total_valid_games = 0
+        self.start_time = clock()
+        self.last_report_time = None
+
+    def advance(self, games: int, success_count: int, total_valid_games: int):
+        """games게임 완료 (성공 / 유효 게임 수는 이번 조각 기준)"""
+        self.games_completed += games
+        self.success_count += success_count
+        self.total_valid_games += total_valid_games
+
+        now = self.clock()
+        if self.last_report_time is None or now - self.last_report_time >= self.min_interval:
+            self.last_report_time = now
+            self.reporter.report(self._update(now, finished=False))
+
+    def finish(self):
+        """마지막 완료 보고 (throttle과 무관하게 항상 전달)"""
+        self.reporter.report(self._update(self.clock(), finished=True))
+
+    def _update(self, now: float, finished: bool) -> ProgressUpdate:
+        elapsed = now - self.start_time
+        games_per_second = self.games_completed / elapsed if elapsed > 0 else 0.0
+
+        estimate = None
+        interval = None
+        if self.total_valid_games > 0:
+            estimate = self.success_count / self.total_valid_games * 100
+            low, high = proportion_interval(self.success_count, self.total_valid_games, self.confidence)
+            interval = (low * 100, high * 100)
+
+        eta = None
+        if games_per_second > 0:
+            eta = max(0, self.total_games - self.games_completed) / games_per_second
+
+        return ProgressUpdate(
+            calculation_type=self.calculation_type,
+            games_completed=self.games_completed,
+            total_games=self.total_games,
+            success_count=self.success_count,
+            total_valid_games=self.total_valid_games,
+            elapsed_seconds=elapsed,
+            games_per_second=games_per_second,
+            estimate_percent=estimate,
+            interval_percent=interval,
+            eta_seconds=eta,
+            finished=finished
+        )
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 계산 결과 영구 캐시
+
+run_all_tests.py / run_test_suite는 덱과 TestCase가 바뀌지 않아도 매번 모든 케이스를
+다시 시뮬레이션합니다. ResultCache는 계산 결과를 작업 디렉토리의 SQLite 파일에 저장하고,
+PokemonPocketSimulator.run_calculation이 시뮬레이션 전에 조회합니다.
+
+캐시 키 (정규화 JSON의 SHA-256):
+- 덱 입력 (카드 순서 유지 - 덱 생성 순서가 같은 seed의 난수 흐름을 바꾸므로)
+- 드로우 카드 발동 순서, 발동 카드의 효과 등록 정보
+- 계산 요청 (키 순서 무관)
+- 엔진 버전 (ENGINE_VERSION + 결과에 영향을 주는 모듈 소스 해시)
+- 엔진 / 시작 손패 방식 / NumPy 사용 가능 여부
+- seed, 시뮬레이션 횟수, 워커 수 (정확 계산 결과는 이 셋과 무관하므로 키에서 제외)
+
+seed가 None인 시뮬레이션은 매번 다른 결과가 나와야 하므로 저장하지 않습니다.
+
+저장소:
+- results 테이블: key(PRIMARY KEY 색인) / 결과 JSON / 크기 / 마지막 사용 순번 / 적중 횟수
+- 마지막 사용 순번(last_used) 색인으로 LRU 순서 조회
+- 저장할 때마다 max_entries(개수) / max_bytes(결과 JSON 크기 합계)를 넘는 만큼
+  가장 오래 사용하지 않은 항목부터 삭제
+
+캐시 오류(파일 손상, 잠금 시간 초과 등)는 경고만 출력하고 캐시 미스로 처리합니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+ENGINE_VERSION = "2.1"
+DEFAULT_CACHE_PATH = "simulation_cache.sqlite3"
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 계산 결과에 영향을 주는 모듈 (소스가 바뀌면 기존 캐시 항목은 자동으로 무효)
+ENGINE_MODULES = (
+    "main_simulator.py", "card_effects.py", "deck_index.py", "opening_sampler.py",
+    "encoded_engine.py", "batch_engine.py", "exact_engine.py", "parallel_runner.py",
+    "probability_calculator.py", "accumulators.py", "hand_query.py", "decision_cache.py",
+    "stats_utils.py", "v3_core_classes.py", "v3_game_state.py", "v3_evolution_system.py",
+    "v3_draw_card_system.py", "v3_simulation.py"
+)
+
+
+@lru_cache(maxsize=None)
+def engine_fingerprint() -> str:
+    """ENGINE_VERSION과 엔진 모듈 소스의 해시 (프로세스당 1회 계산)"""
+    digest = hashlib.sha256(ENGINE_VERSION.encode("utf-8"))
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for module_file in ENGINE_MODULES:
+        digest.update(module_file.encode("utf-8"))
+        try:
+            with open(os.path.join(base_dir, module_file), "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"<missing>")
+    return f"{ENGINE_VERSION}-{digest.hexdigest()[:16]}"
+
+
+def make_cache_key(deck_input: Dict[str, Dict[str, Any]], draw_order: List[str],
+                   calculation_request: Dict[str, Any], seed: Optional[int] = None,
+                   simulation_count: Optional[int] = None, workers: Optional[int] = None,
+                   **settings: Any) -> str:
+    """캐시 키 생성
+
+    Args:
+        deck_input: 덱 구성 정보
+        draw_order: 드로우 카드 발동 순서
+        calculation_request: 계산 요청
+        seed / simulation_count / workers: 시뮬레이션 설정 (정확 계산이면 None)
+        **settings: 그 밖에 결과에 영향을 주는 설정 (engine, opening 등)
+
+    Returns:
+        str: 정규화 JSON의 SHA-256 16진수 문자열
+    """
+    from card_effects import EFFECT_REGISTRY
+
+    effects = {}
+    for card_name in draw_order:
+        spec = EFFECT_REGISTRY.get(card_name)
+        if spec is not None:
+            effects[card_name] = f"{spec.tag}:{spec.handler.__module__}.{spec.handler.__qualname__}"
+
+    payload = {
+        "engine_version": engine_fingerprint(),
+        "deck": [[card_name, info["type"], info["count"]] for card_name, info in deck_input.items()],
+        "draw_order": list(draw_order),
+        "effects": effects,
+        "request": calculation_request,
+        "seed": seed,
+        "simulation_count": simulation_count,
+        "workers": workers,
+        "settings": settings
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """SQLite 기반 계산 결과 캐시 (LRU + 크기 제한)"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES, timeout: float = 30.0):
+        """
+        Args:
+            path: SQLite 파일 경로 (상대 경로면 현재 작업 디렉토리 기준)
+            max_entries: 최대 저장 항목 수
+            max_bytes: 결과 JSON 크기 합계 상한 (바이트)
+            timeout: 다른 프로세스가 파일을 잠그고 있을 때 기다리는 시간 (초)
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries와 max_bytes는 1 이상이어야 합니다.")
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created REAL NOT NULL,"
+                " last_used INTEGER NOT NULL,"
+                " hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_last_used ON results(last_used)")
+
+    @contextmanager
+    def _transaction(self):
+        """연결 1개로 트랜잭션 실행 (정상 종료 시 commit, 예외 시 rollback) 후 연결 닫기"""
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """저장된 결과 조회 (없으면 None), 적중 시 LRU 순번 갱신"""
+        try:
+            with self._transaction() as conn:
+                row = conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE results SET hits = hits + 1,"
+                    " last_used = (SELECT COALESCE(MAX(last_used), 0) + 1 FROM results)"
+                    " WHERE key = ?", (key,))
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            print(f"⚠️ 결과 캐시 조회 실패 (캐시 없이 계산합니다): {e}")
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """결과 저장 후 한도를 넘는 항목 삭제"""
+        try:
+            value = json.dumps(result, ensure_ascii=False)
+            size = len(value.encode("utf-8"))
+            if size > self.max_bytes:
+                return
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, value, size, created, last_used, hits)"
+                    " VALUES (?, ?, ?, ?, (SELECT COALESCE(MAX(last_used), 0) + 1 FROM results), 0)",
+                    (key, value, size, time.time()))
+                self._evict(conn)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"⚠️ 결과 캐시 저장 실패: {e}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        """최근 사용 순으로 누적했을 때 개수 / 크기 한도를 넘는 항목 삭제"""
+        conn.execute(
+            "DELETE FROM results WHERE key IN ("
+            " SELECT key FROM ("
+            "  SELECT key,"
+            "   ROW_NUMBER() OVER (ORDER BY last_used DESC) AS recency,"
+            "   SUM(size) OVER (ORDER BY last_used DESC) AS total"
+            "  FROM results)"
+            " WHERE recency > ? OR total > ?)",
+            (self.max_entries, self.max_bytes))
+
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM results")
+
+    def stats(self) -> Dict[str, int]:
+        """저장 항목 수 / 결과 크기 합계 / 누적 적중 횟수"""
+        with self._transaction() as conn:
+            entries, total_bytes, hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM results").fetchone()
+        return {'entries': entries, 'bytes': total_bytes, 'hits': hits}
+
+    def __len__(self) -> int:
+        return self.stats()['entries']
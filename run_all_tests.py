@@ -8,13 +8,14 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from main_simulator import PokemonPocketSimulator, load_deck_from_file, load_test_cases_from_file
+from result_cache import ResultCache
 
-def run_all_tests():
+def run_all_tests(use_cache: bool = True, shared: bool = False):
     print("=== Pokemon Pocket 시뮬레이터 - 전체 테스트 실행 ===")
     print()
     
-    # 시뮬레이터 인스턴스 생성
-    simulator = PokemonPocketSimulator()
+    # 시뮬레이터 인스턴스 생성 (같은 덱 / 요청 / seed 결과는 캐시에서 재사용)
+    simulator = PokemonPocketSimulator(result_cache=ResultCache() if use_cache else None)
     
     # 파일에서 덱 정보 읽기
     deck, draw_order = load_deck_from_file()
@@ -55,13 +56,21 @@ def run_all_tests():
     print(f"   - 드로우 카드: {draw_card_count}종류")
     print()
     
+    # 스위트 모드: 정책 입력이 같은 케이스끼리 게임을 한 번만 시뮬레이션 (seed는 첫 케이스 기준 - 설정 블록의 seed)
+    if shared:
+        suite_results = simulator.run_calculation_suite([test_case["request"] for test_case in test_cases],
+                                                        simulation_count, seed=test_cases[0].get("seed") if test_cases else None)
+    
     # 모든 테스트 케이스 실행
     results = []
     for i, test_case in enumerate(test_cases, 1):
         print(f"🧪 테스트 {i}/{len(test_cases)}: {test_case['name']}")
         print("-" * 60)
         
-        result = simulator.run_calculation(test_case["request"], simulation_count)
+        if shared:
+            result = suite_results[i - 1]
+        else:
+            result = simulator.run_calculation(test_case["request"], simulation_count, seed=test_case.get("seed"))
         if result:
             results.append((i, test_case['name'], result))
             prob_percent = result.get('probability_percent', 0.0)
@@ -86,4 +95,6 @@ def run_all_tests():
     print(f"✅ 전체 테스트 완료: {len(results)}/{len(test_cases)}개 성공")
 
 if __name__ == "__main__":
-    run_all_tests()
+    # --no-cache: 결과 캐시를 사용하지 않고 모두 다시 계산
+    # --shared: 스위트 모드 (게임 흐름 공유)
+    run_all_tests(use_cache="--no-cache" not in sys.argv, shared="--shared" in sys.argv)
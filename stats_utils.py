@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 통계 유틸리티
+
+시뮬레이션 확률(성공 횟수 / 유효 게임 수)의 신뢰구간 계산 함수들입니다.
+외부 라이브러리(scipy) 없이 표준 라이브러리만 사용합니다.
+
+- Wilson score 구간: 계산이 빠르고 p가 0/1 근처여도 안정적 (기본값)
+- Clopper-Pearson 구간: 베타 분포 분위수 기반의 보수적인 정확 구간
+
+엔진 간 분포 비교(equivalence 모듈)에 쓰는 검정:
+- 두 비율 z 검정 / 한 비율 z 검정 (정확값과 비교)
+- 카이제곱 동질성 검정 (범주형 결과 분포)
+"""
+
+import math
+from statistics import NormalDist
+from typing import Dict, Hashable, Tuple
+
+INTERVAL_METHODS = ("wilson", "clopper_pearson")
+
+
+def _z_value(confidence: float) -> float:
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score 신뢰구간 (0~1 비율)"""
+    if trials <= 0:
+        return 0.0, 1.0
+
+    z = _z_value(confidence)
+    p = successes / trials
+    z2_over_n = z * z / trials
+    center = (p + z2_over_n / 2) / (1 + z2_over_n)
+    half_width = z / (1 + z2_over_n) * math.sqrt(p * (1 - p) / trials + z2_over_n / (4 * trials))
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    """정규화 불완전 베타 함수의 연분수 전개 (modified Lentz 방법)"""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1, a - 1
+    c = 1.0
+    d = 1 - qab * x / qap
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+
+    for m in range(1, 100000):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-14:
+            break
+    return h
+
+
+def regularized_incomplete_beta(a: float, b: float, x: float) -> float:
+    """정규화 불완전 베타 함수 I_x(a, b) = Beta(a, b) 분포의 누적분포함수"""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+
+    log_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                 + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(log_front) * _beta_continued_fraction(a, b, x) / a
+    return 1 - math.exp(log_front) * _beta_continued_fraction(b, a, 1 - x) / b
+
+
+def beta_quantile(probability: float, a: float, b: float) -> float:
+    """Beta(a, b) 분포의 분위수 (이분법)"""
+    low, high = 0.0, 1.0
+    for _ in range(100):
+        middle = (low + high) / 2
+        if regularized_incomplete_beta(a, b, middle) < probability:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def clopper_pearson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Clopper-Pearson 정확 신뢰구간 (0~1 비율)"""
+    if trials <= 0:
+        return 0.0, 1.0
+
+    alpha = 1 - confidence
+    lower = 0.0 if successes == 0 else beta_quantile(alpha / 2, successes, trials - successes + 1)
+    upper = 1.0 if successes == trials else beta_quantile(1 - alpha / 2, successes + 1, trials - successes)
+    return lower, upper
+
+
+def proportion_interval(successes: int, trials: int, confidence: float = 0.95,
+                        method: str = "wilson") -> Tuple[float, float]:
+    """method에 맞는 비율 신뢰구간 계산 ("wilson" 또는 "clopper_pearson")"""
+    if method == "wilson":
+        return wilson_interval(successes, trials, confidence)
+    if method == "clopper_pearson":
+        return clopper_pearson_interval(successes, trials, confidence)
+    raise ValueError(f"지원하지 않는 신뢰구간 방식입니다: {method} (지원: {', '.join(INTERVAL_METHODS)})")
+
+
+def required_trials(probability: float, half_width: float, confidence: float = 0.95) -> int:
+    """정규 근사로 목표 반폭(0~1 비율)에 필요한 대략적인 시행 횟수 추정"""
+    z = _z_value(confidence)
+    variance = max(probability * (1 - probability), 1e-4)
+    return int(math.ceil(z * z * variance / (half_width * half_width)))
+
+
+# ===================== 가설 검정 =====================
+
+def _two_sided_p_value(z: float) -> float:
+    return 2 * (1 - NormalDist().cdf(abs(z)))
+
+
+def two_proportion_z_test(successes_a: int, trials_a: int, successes_b: int, trials_b: int) -> Tuple[float, float]:
+    """두 비율이 같은지 검정 (합동 분산 z 검정)
+
+    Returns:
+        (z 통계량, 양측 p-value)
+    """
+    if trials_a <= 0 or trials_b <= 0:
+        return 0.0, 1.0
+
+    pooled = (successes_a + successes_b) / (trials_a + trials_b)
+    variance = pooled * (1 - pooled) * (1 / trials_a + 1 / trials_b)
+    if variance <= 0:
+        # 두 표본 모두 전부 성공 또는 전부 실패
+        return 0.0, 1.0
+    z = (successes_a / trials_a - successes_b / trials_b) / math.sqrt(variance)
+    return z, _two_sided_p_value(z)
+
+
+def one_proportion_z_test(successes: int, trials: int, probability: float) -> Tuple[float, float]:
+    """표본 비율이 알려진 확률(정확값)과 같은지 검정
+
+    Returns:
+        (z 통계량, 양측 p-value)
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+
+    variance = probability * (1 - probability) / trials
+    if variance <= 0:
+        # 확률 0/1: 표본이 정확히 일치해야 함
+        return (0.0, 1.0) if successes == round(trials * probability) else (float('inf'), 0.0)
+    z = (successes / trials - probability) / math.sqrt(variance)
+    return z, _two_sided_p_value(z)
+
+
+def regularized_gamma_q(a: float, x: float) -> float:
+    """정규화 상부 불완전 감마 함수 Q(a, x)"""
+    if x <= 0:
+        return 1.0
+
+    log_front = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        # 급수 전개로 P(a, x) 계산
+        term = total = 1 / a
+        denominator = a
+        for _ in range(1000):
+            denominator += 1
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1 - total * math.exp(log_front))
+
+    # 연분수 전개 (Lentz 방법)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        if abs(d) < tiny:
+            d = tiny
+        c = b + an / c
+        if abs(c) < tiny:
+            c = tiny
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return min(1.0, math.exp(log_front) * h)
+
+
+def chi_square_sf(statistic: float, degrees_of_freedom: int) -> float:
+    """카이제곱 분포의 생존 함수 P(X >= statistic)"""
+    if degrees_of_freedom <= 0:
+        return 1.0
+    return regularized_gamma_q(degrees_of_freedom / 2, statistic / 2)
+
+
+def chi_square_homogeneity(counts_a: Dict[Hashable, int], counts_b: Dict[Hashable, int],
+                           min_expected: float = 5.0) -> Tuple[float, int, float]:
+    """두 표본의 범주 분포가 같은지 카이제곱 동질성 검정 (2 x k 분할표)
+
+    기대빈도가 min_expected 미만인 범주는 하나의 "기타" 범주로 합칩니다
+    (합친 범주도 부족하면 가장 작은 범주에 다시 합침).
+
+    Returns:
+        (카이제곱 통계량, 자유도, p-value)
+    """
+    total_a = sum(counts_a.values())
+    total_b = sum(counts_b.values())
+    total = total_a + total_b
+    if total_a <= 0 or total_b <= 0:
+        return 0.0, 0, 1.0
+
+    def smallest_expected(observed_a: int, observed_b: int) -> float:
+        return (observed_a + observed_b) * min(total_a, total_b) / total
+
+    cells = []
+    sparse = [0, 0]
+    for category in set(counts_a) | set(counts_b):
+        observed = (counts_a.get(category, 0), counts_b.get(category, 0))
+        if smallest_expected(*observed) < min_expected:
+            sparse[0] += observed[0]
+            sparse[1] += observed[1]
+        else:
+            cells.append(observed)
+    if sum(sparse) > 0:
+        if smallest_expected(*sparse) >= min_expected or not cells:
+            cells.append(tuple(sparse))
+        else:
+            cells.sort(key=sum)
+            cells[0] = (cells[0][0] + sparse[0], cells[0][1] + sparse[1])
+
+    if len(cells) < 2:
+        return 0.0, 0, 1.0
+
+    statistic = 0.0
+    for observed_a, observed_b in cells:
+        row_total = observed_a + observed_b
+        expected_a = row_total * total_a / total
+        expected_b = row_total * total_b / total
+        statistic += (observed_a - expected_a) ** 2 / expected_a + (observed_b - expected_b) ** 2 / expected_b
+    degrees_of_freedom = len(cells) - 1
+    return statistic, degrees_of_freedom, chi_square_sf(statistic, degrees_of_freedom)
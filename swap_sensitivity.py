@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Pokemon Pocket Simulator - 카드 1장 교체 민감도 행렬
+
+덱의 카드 X 1장을 후보 카드 Y 1장으로 바꾸는 모든 합법적인 교체(같은 카드 최대 2장)를
+같은 seed 목록(공통 난수)으로 평가하고, 교체별 성공 확률 변화와 표준오차를 순위로 정리합니다.
+
+교체 간 작업 공유:
+교체한 1장(덱의 마지막 X 자리, 이하 slot)은 덱의 "같은 위치"에 놓인 다른 카드일 뿐이므로,
+게임 i에서 slot이 한 번도 손패에 들어오지 않았고 X / Y가 속한 서치 대상 종류(Basic /
+Galdion 대상 / Pokemon, Pokemon Communication 판단의 "덱에 남은 목표 Pokemon" 확인)의
+덱 확인이 한 번도 일어나지 않았다면 드로우 / 서치 / Iono 셔플이 모두 위치 기준으로
+똑같이 진행되어 교체 전후 결과가 같습니다.
+
+- 기준 덱 1회 실행: 뺄 수 있는 모든 카드 X의 slot을 "X와 같은 값이지만 객체로 구분되는 id"로
+  표시해 두므로 게임 진행은 기준 덱과 완전히 같고, 게임별 결과와 함께 slot별 손패 진입 여부 /
+  게임 중 서치 종류를 한 번에 기록 (교체 수와 무관한 추가 실행 없음)
+- 교체 (X, Y)마다 영향을 받았을 수 있는 게임만 같은 seed로 다시 시뮬레이션하고,
+  나머지 게임은 기준 결과를 그대로 사용 (차이 0)
+
+따라서 교체 하나의 비용은 전체 게임 수가 아니라 "영향 받은 게임 수"이며, 게임 진행 기준 키
+(behavior_key)가 같은 후보는 한 번만 계산합니다. 전체 비용은 교체마다 전체 실행하는 경우보다
+항상 적습니다. 모든 덱 구성이 정확 계산 가능한 요청이면 Markov 연쇄 정확값으로 바로 계산합니다.
+
+    result = swap_sensitivity(deck, draw_order, request, candidates, num_games=20000, seed=1)
+    print_swap_sensitivity(result)
+"""
+
+import random
+import time
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from accumulators import OutcomeRecorder, counter_for_request
+from card_effects import BASIC_TYPES, POKEMON_TYPES, GALDION_TARGETS
+from deck_comparison import _outcome_summary, _paired_statistics
+from deck_optimizer import MAX_COPIES
+from encoded_engine import EncodedGameState, EncodedSimulationEngine
+from exact_engine import exact_request_probability
+from parallel_runner import new_root_seed
+from probability_calculator import ProbabilityCalculator
+
+
+def search_classes(card_name: str, card_type: str, target_cards: Iterable[str] = ()) -> FrozenSet[str]:
+    """카드가 속하는 서치 / 덱 확인 대상 종류
+
+    Poke Ball: basic, Galdion: galdion, Pokemon Communication 교환: pokemon,
+    Pokemon Communication 사용 판단(덱에 남은 목표 Pokemon 확인): target_pokemon
+    """
+    classes = set()
+    if card_type in BASIC_TYPES:
+        classes.add('basic')
+    if card_name in GALDION_TARGETS:
+        classes.add('galdion')
+    if card_type in POKEMON_TYPES:
+        classes.add('pokemon')
+        if card_name in target_cards:
+            classes.add('target_pokemon')
+    return frozenset(classes)
+
+
+def _request_card_names(value: Any) -> set:
+    """계산 요청에 등장하는 모든 문자열 (카드명 후보)"""
+    if isinstance(value, str):
+        return {value}
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        return set().union(*(_request_card_names(item) for item in value))
+    return set()
+
+
+def behavior_key(card_name: str, card_type: str, deck_input: Dict[str, Dict[str, Any]],
+                 draw_order: List[str], request_names: set) -> Tuple:
+    """교체로 넣은 카드의 게임 진행 기준 키 (키가 같은 후보는 같은 seed에서 게임별 결과가 같음)
+
+    이름이 게임 진행에 쓰이는 카드(덱에 이미 있음 / 발동 순서 / 계산 요청 / Galdion 대상)는
+    카드마다 다르고, 나머지는 Basic / Pokemon 여부만으로 구분됩니다.
+    """
+    if (card_name in deck_input or card_name in draw_order or card_name in request_names
+            or card_name in GALDION_TARGETS):
+        return ('card', card_name)
+    return ('blank', card_type in BASIC_TYPES, card_type in POKEMON_TYPES)
+
+
+def _slot_index(layout: List[Any], cut_card: Any) -> int:
+    """원본 덱 배치에서 마지막 cut_card의 위치 (교체되는 1장)"""
+    return len(layout) - 1 - layout[::-1].index(cut_card)
+
+
+def swap_deck(deck_input: Dict[str, Dict[str, Any]], cut_card: str, add_card: str,
+              add_type: str) -> Dict[str, Dict[str, Any]]:
+    """cut_card 1장을 add_card 1장으로 바꾼 덱 (카드 순서 유지, 새 카드는 맨 뒤)"""
+    deck = {}
+    for card_name, card_info in deck_input.items():
+        count = card_info["count"] - (card_name == cut_card) + (card_name == add_card)
+        if count > 0:
+            deck[card_name] = {"type": card_info["type"], "count": count}
+    if add_card not in deck:
+        deck[add_card] = {"type": add_type, "count": 1}
+    return deck
+
+
+def candidate_swaps(deck_input: Dict[str, Dict[str, Any]], candidates: Dict[str, Dict[str, Any]],
+                    protected_cards: Optional[List[str]] = None) -> List[Tuple[str, str, str]]:
+    """합법적인 1장 교체 목록 [(cut, add, add 타입)]
+
+    Args:
+        candidates: 넣을 수 있는 카드 {카드명: {"type"}} (덱에 있는 카드도 가능)
+        protected_cards: 빼지 않을 카드
+    """
+    protected = set(protected_cards or [])
+    swaps = []
+    for cut_card in deck_input:
+        if cut_card in protected:
+            continue
+        for add_card, add_info in candidates.items():
+            if add_card == cut_card:
+                continue
+            if add_card in deck_input:
+                if deck_input[add_card]["count"] >= MAX_COPIES:
+                    continue
+                add_type = deck_input[add_card]["type"]
+            else:
+                add_type = add_info["type"]
+            swaps.append((cut_card, add_card, add_type))
+    return swaps
+
+
+class _SlotId(int):
+    """slot 표시용 카드 id (원래 카드 id와 같은 값 / 해시라 게임 진행은 같고, 객체로만 구분)"""
+
+    def __new__(cls, card_id: int, cut_card: str):
+        slot = super().__new__(cls, card_id)
+        slot.cut_card = cut_card
+        return slot
+
+
+class _SlotTrackingState(EncodedGameState):
+    """slot이 손패에 들어왔는지 / 게임 중 어떤 서치가 있었는지 기록하는 게임 상태
+
+    기록은 멀리건 재시도를 포함해 게임 하나 동안 누적되며, _SlotRecorder가 게임 종료 시 초기화합니다.
+    slot이 손패에 들어온 게임은 서치 시점과 관계없이 영향 받은 게임이므로 서치는 게임 단위로만 기록합니다.
+    """
+
+    def __init__(self, table):
+        super().__init__(table, random.Random())
+        self.entered: set = set()
+        self.searched: set = set()
+
+    def check_slots(self, new_cards: List[int]):
+        for card_id in new_cards:
+            if type(card_id) is _SlotId:
+                self.entered.add(card_id.cut_card)
+
+    def draw_cards(self, count: int) -> int:
+        drawn = super().draw_cards(count)
+        if drawn:
+            self.check_slots(self.hand[-drawn:])
+        return drawn
+
+
+class _SlotTrackingEngine(EncodedSimulationEngine):
+    """기준 덱의 cut_cards마다 마지막 1장을 _SlotId(slot)로 표시해 추적하는 엔진
+
+    slot은 원래 카드 id와 같은 값으로 동작하므로 모든 게임이 기준 덱과 똑같이 진행됩니다.
+    """
+
+    def __init__(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str], cut_cards: Iterable[str]):
+        super().__init__(deck_input, draw_order)
+        table = self.card_table
+        state = _SlotTrackingState(table)
+        original_deck = state.original_deck
+        for cut_card in cut_cards:
+            cut_id = table.ids[cut_card]
+            original_deck[_slot_index(original_deck, cut_id)] = _SlotId(cut_id, cut_card)
+        state.deck[:] = original_deck
+        self.game_state = state
+        self.default_rng = state.rng
+
+    def _poke_ball(self, state: _SlotTrackingState):
+        state.searched.add('basic')
+        super()._poke_ball(state)
+        state.check_slots(state.hand[-1:])
+
+    def _galdion(self, state: _SlotTrackingState):
+        state.searched.add('galdion')
+        super()._galdion(state)
+        state.check_slots(state.hand[-1:])
+
+    def _pokemon_communication(self, state: _SlotTrackingState, sacrifice_id: int) -> bool:
+        state.searched.add('pokemon')
+        exchanged = super()._pokemon_communication(state, sacrifice_id)
+        state.check_slots(state.hand[-1:])
+        return exchanged
+
+    def _choose_pokemon_communication_target(self, state: _SlotTrackingState, context) -> int:
+        # 손패에 Pokemon과 손패에 없는 목표 카드가 있으면 덱에 남은 목표 Pokemon을 확인하므로
+        # X / Y가 목표 Pokemon이면 판단이 달라질 수 있음 (기준 덱에 없는 목표 카드는 항상 손패에 없으므로
+        # Y로 새로 들어오는 목표 Pokemon도 포함)
+        hand = state.hand
+        table = self.card_table
+        if (any(table.is_pokemon[card_id] for card_id in hand)
+                and any(name not in table.ids or table.ids[name] not in hand for name in context.target_cards)):
+            state.searched.add('target_pokemon')
+        return super()._choose_pokemon_communication_target(state, context)
+
+
+class _SlotRecorder(OutcomeRecorder):
+    """게임별 결과와 함께 손패에 들어온 slot(cut 카드) / 서치 종류 기록"""
+
+    def __init__(self, counter, state: _SlotTrackingState):
+        super().__init__(counter)
+        self.state = state
+        self.entered: List[FrozenSet[str]] = []
+        self.searched: List[FrozenSet[str]] = []
+
+    def _end_game(self):
+        state = self.state
+        self.entered.append(frozenset(state.entered))
+        self.searched.append(frozenset(state.searched))
+        state.entered.clear()
+        state.searched.clear()
+
+    def on_invalid_game(self):
+        super().on_invalid_game()
+        self._end_game()
+
+    def on_final_hand(self, hand: List[int]):
+        super().on_final_hand(hand)
+        self._end_game()
+
+
+def _swap_entry(cut_card: str, add_card: str, outcomes: List[Optional[bool]],
+                base_outcomes: List[Optional[bool]], touched_games: int) -> Dict[str, Any]:
+    success_count, total_valid_games = _outcome_summary(outcomes)
+    stats = _paired_statistics(base_outcomes, outcomes)
+    return {
+        'cut': cut_card,
+        'add': add_card,
+        'probability_percent': (success_count / total_valid_games) * 100 if total_valid_games else 0.0,
+        'success_count': success_count,
+        'total_valid_games': total_valid_games,
+        'difference_percent': stats['difference_percent'],
+        'standard_error_percent': stats['standard_error_percent'],
+        'touched_games': touched_games
+    }
+
+
+def swap_sensitivity(deck_input: Dict[str, Dict[str, Any]], draw_order: List[str],
+                     calculation_request: Dict[str, Any], candidates: Dict[str, Dict[str, Any]],
+                     num_games: int = 10000, protected_cards: Optional[List[str]] = None,
+                     seed: int = None) -> Dict[str, Any]:
+    """
+    카드 1장 교체 민감도 행렬 (공통 난수 + 영향 받은 게임만 재시뮬레이션)
+
+    Args:
+        deck_input: 기준 덱 구성 정보
+        draw_order: 드로우 카드 발동 순서 (후보 드로우 카드도 포함해 두면 교체 덱에서 사용)
+        calculation_request: 계산 요청 (복합 타입 포함, card_curves 제외)
+        candidates: 넣을 수 있는 카드 {카드명: {"type"}}
+        num_games: 교체별 게임 수 (모든 교체가 같은 seed 목록 사용)
+        protected_cards: 빼지 않을 카드
+        seed: root seed (None이면 새로 생성하여 결과에 기록)
+
+    Returns:
+        Dict: 'swaps' (확률 변화 순 [{'cut', 'add', 'probability_percent', 'difference_percent',
+              'standard_error_percent', 'touched_games', ...}]), 'matrix' ({cut: {add: 변화 %p}}) 외 통계
+    """
+    if calculation_request.get('type') == 'card_curves':
+        raise ValueError("card_curves는 확률 하나를 내지 않으므로 교체 민감도를 계산할 수 없습니다.")
+    if seed is None:
+        seed = new_root_seed()
+    swaps = candidate_swaps(deck_input, candidates, protected_cards)
+    start_time = time.perf_counter()
+
+    base_exact = exact_request_probability(deck_input, draw_order, calculation_request)
+    exact = []
+    for cut_card, add_card, add_type in swaps if base_exact is not None else ():
+        probability = exact_request_probability(swap_deck(deck_input, cut_card, add_card, add_type), draw_order,
+                                                calculation_request)
+        if probability is None:
+            break
+        exact.append(probability)
+    if base_exact is not None and len(exact) == len(swaps):
+        entries = [{'cut': cut_card, 'add': add_card, 'probability_percent': probability * 100,
+                    'difference_percent': (probability - base_exact) * 100, 'standard_error_percent': 0.0,
+                    'touched_games': 0}
+                   for (cut_card, add_card, _), probability in zip(swaps, exact)]
+        return _sensitivity_result(calculation_request, 'exact', seed, base_exact * 100, entries,
+                                   simulated_games=0, naive_games=0, start_time=start_time)
+
+    cut_cards = list(dict.fromkeys(cut_card for cut_card, _, _ in swaps))
+    base_engine = _SlotTrackingEngine(deck_input, draw_order, cut_cards)
+    game_kwargs = ProbabilityCalculator(base_engine)._game_kwargs(calculation_request)
+    target_cards = game_kwargs.get('target_cards') or ()
+    seed_stream = random.Random(seed)
+    game_seeds = [seed_stream.getrandbits(64) for _ in range(num_games)]
+
+    # 기준 덱 실행 1회로 게임별 결과와 모든 slot의 진입 여부 / 서치 종류를 함께 기록
+    base_recorder = _SlotRecorder(counter_for_request(calculation_request, base_engine.card_table),
+                                  base_engine.game_state)
+    base_engine.run_stream(base_recorder, num_games, game_seeds=game_seeds, **game_kwargs)
+    base_outcomes = base_recorder.outcomes
+    success_count, total_valid_games = _outcome_summary(base_outcomes)
+    base_percent = (success_count / total_valid_games) * 100 if total_valid_games else 0.0
+    base_layout = base_engine.card_table.decode(base_engine.game_state.original_deck)
+    request_names = _request_card_names(calculation_request)
+    simulated_games = num_games
+
+    def run_variant(cut_card: str, add_card: str, add_type: str, game_indices: List[int]) -> List[Optional[bool]]:
+        engine = EncodedSimulationEngine(swap_deck(deck_input, cut_card, add_card, add_type), draw_order)
+        ids = engine.card_table.ids
+        slot_index = _slot_index(base_layout, cut_card)
+        engine.game_state.original_deck[:] = [ids[add_card] if index == slot_index else ids[card_name]
+                                              for index, card_name in enumerate(base_layout)]
+        recorder = OutcomeRecorder(counter_for_request(calculation_request, engine.card_table))
+        engine.run_stream(recorder, len(game_indices), game_seeds=[game_seeds[index] for index in game_indices],
+                          **game_kwargs)
+        return recorder.outcomes
+
+    entries = []
+    for cut_card in cut_cards:
+        # 게임 진행이 같은 후보끼리 묶어 한 번만 계산
+        groups: Dict[Any, List[Tuple[str, str]]] = {}
+        for swap_cut, add_card, add_type in swaps:
+            if swap_cut == cut_card:
+                key = behavior_key(add_card, add_type, deck_input, draw_order, request_names)
+                groups.setdefault(key, []).append((add_card, add_type))
+
+        cut_classes = search_classes(cut_card, deck_input[cut_card]["type"], target_cards)
+        for members in groups.values():
+            add_card, add_type = members[0]
+            # 영향 받았을 수 있는 게임: slot 진입 또는 X / Y가 대상인 서치
+            classes = cut_classes | search_classes(add_card, add_type, target_cards)
+            touched = [index for index in range(num_games)
+                       if cut_card in base_recorder.entered[index] or base_recorder.searched[index] & classes]
+            outcomes = list(base_outcomes)
+            for index, outcome in zip(touched, run_variant(cut_card, add_card, add_type, touched)):
+                outcomes[index] = outcome
+            simulated_games += len(touched)
+            for add_card, _ in members:
+                entries.append(_swap_entry(cut_card, add_card, outcomes, base_outcomes, len(touched)))
+
+    return _sensitivity_result(calculation_request, 'simulation', seed, base_percent, entries,
+                               simulated_games=simulated_games, naive_games=num_games * (len(swaps) + 1),
+                               start_time=start_time, num_games=num_games)
+
+
+def _sensitivity_result(calculation_request: Dict[str, Any], method: str, seed: int, base_percent: float,
+                        entries: List[Dict[str, Any]], simulated_games: int, naive_games: int,
+                        start_time: float, num_games: int = 0) -> Dict[str, Any]:
+    matrix: Dict[str, Dict[str, float]] = {}
+    for entry in entries:
+        matrix.setdefault(entry['cut'], {})[entry['add']] = entry['difference_percent']
+    entries.sort(key=lambda entry: -entry['difference_percent'])
+    return {
+        'calculation_type': calculation_request.get('type'),
+        'method': method,
+        'seed': seed,
+        'base_probability_percent': base_percent,
+        'num_games': num_games,
+        'swaps': entries,
+        'matrix': matrix,
+        'simulated_games': simulated_games,
+        'naive_games': naive_games,
+        'execution_time': time.perf_counter() - start_time
+    }
+
+
+def print_swap_sensitivity(result: Dict[str, Any], top: int = 10):
+    """교체 민감도 순위와 행렬 출력"""
+    print("\n" + "=" * 60)
+    print(f"🔁 카드 교체 민감도 ({result['calculation_type']}, {result['method']}, seed: {result['seed']})")
+    print("=" * 60)
+    print(f"기준 덱: {result['base_probability_percent']:.2f}%, 교체 {len(result['swaps'])}개, "
+          f"{result['execution_time']:.1f}초")
+    if result['method'] == 'simulation':
+        print(f"교체별 {result['num_games']:,}게임, 실제 시뮬레이션 {result['simulated_games']:,}게임 "
+              f"(교체마다 전체 실행 시 {result['naive_games']:,}게임)")
+
+    for rank, entry in enumerate(result['swaps'][:top], 1):
+        print(f"  {rank}. -{entry['cut']} +{entry['add']}: {entry['probability_percent']:.2f}% "
+              f"({entry['difference_percent']:+.2f}%p ± {entry['standard_error_percent']:.2f})")
+    if len(result['swaps']) > top:
+        print(f"  ... 외 {len(result['swaps']) - top}개")
+
+    add_cards = list(dict.fromkeys(add_card for row in result['matrix'].values() for add_card in row))
+    print("\n변화 행렬 (%p, 행: 뺀 카드 / 열: 넣은 카드)")
+    print(f"  {'':>20}" + "".join(f"{add_card[:10]:>11}" for add_card in add_cards))
+    for cut_card, row in result['matrix'].items():
+        cells = "".join(f"{row[add_card]:>+11.2f}" if add_card in row else f"{'-':>11}" for add_card in add_cards)
+        print(f"  {cut_card[:20]:>20}{cells}")
+    print("=" * 60)
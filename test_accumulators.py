@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+스트리밍 accumulator 테스트
+
+같은 seed에서 run_stream + 컴파일된 predicate 집계가
+simulate_single_game(trace 모드) + _is_success 집계와 정확히 같은지 확인합니다. (인코딩 / 기준 엔진 모두)
+"""
+
+import sys
+import os
+import time
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import SimulationEngine, load_deck_from_file
+from encoded_engine import EncodedSimulationEngine
+from probability_calculator import ProbabilityCalculator
+from accumulators import counter_for_request, GameAccumulator
+from test_encoded_engine import IONO_DECK
+
+
+def _trace_counts(calculator, request, num_games):
+    """trace 모드(게임별 결과 딕셔너리)로 집계"""
+    game_kwargs = calculator._game_kwargs(request)
+    success_count = 0
+    total_valid_games = 0
+    for _ in range(num_games):
+        game_result = calculator.sim_engine.simulate_single_game(**game_kwargs)
+        if game_result['success']:
+            total_valid_games += 1
+            success_count += calculator._is_success(request, game_result)
+    return success_count, total_valid_games
+
+
+def test_stream_matches_trace():
+    """요청 타입별로 스트리밍 집계와 trace 집계가 같은지 테스트"""
+    print("=== 스트리밍 / trace 집계 비교 ===")
+
+    deck, _ = load_deck_from_file()
+    cases = [
+        (deck, ["Poke Ball", "Professor's Research"],
+         {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 3}),
+        (deck, ["Poke Ball"],
+         {"type": "preferred_and_multi", "preferred_basics": ["Type:Null", "Silvally"],
+          "target_cards": ["Silvally"], "turn": 2}),
+        (deck, [],
+         {"type": "non_preferred_opening", "non_preferred_basics": ["Charmander", "Pikachu"]}),
+        (IONO_DECK, ["Poke Ball", "Professor's Research", "Iono"],
+         {"type": "multi_or_multi", "turn": 3, "target_groups": [
+             {"name": "A", "target_cards": ["Charizard EX", "Master Ball"]},
+             {"name": "B", "target_cards": ["Dragonite", "Pikachu"]}]}),
+    ]
+
+    for engine_class in (EncodedSimulationEngine, SimulationEngine):
+        for index, (deck_input, draw_order, request) in enumerate(cases, 1):
+            calculator = ProbabilityCalculator(engine_class(deck_input, draw_order))
+
+            random.seed(index)
+            trace = _trace_counts(calculator, request, 3000)
+            random.seed(index)
+            stream = calculator.simulate_counts(request, 3000)
+
+            print(f"{index}. {engine_class.__name__} {request['type']}: trace {trace} / stream {stream}")
+            assert trace == stream, "스트리밍 집계가 trace 집계와 다름"
+
+    print("✅ 스트리밍 / trace 집계 비교 통과!\n")
+
+
+def test_custom_accumulator():
+    """사용자 정의 accumulator가 선언한 상태만 받는지 테스트"""
+    print("=== 사용자 정의 accumulator 테스트 ===")
+
+    class HandSizeSum(GameAccumulator):
+        def __init__(self):
+            self.total = 0
+            self.games = 0
+            self.invalid = 0
+
+        def on_invalid_game(self):
+            self.invalid += 1
+
+        def on_opening_hand(self, hand):
+            raise AssertionError("needs_opening_hand가 False면 호출되면 안 됨")
+
+        def on_final_hand(self, hand):
+            self.total += len(hand)
+            self.games += 1
+
+    deck, _ = load_deck_from_file()
+    engine = EncodedSimulationEngine(deck, [])
+    accumulator = engine.run_stream(HandSizeSum(), 500, max_turn=2)
+    print(f"1. 평균 최종 손패: {accumulator.total / accumulator.games:.2f}장")
+    assert accumulator.games + accumulator.invalid == 500, "게임 수 누락"
+    assert accumulator.total == 7 * accumulator.games, "드로우 카드를 쓰지 않으면 손패는 항상 7장"
+
+    random.seed(3)
+    request = {"type": "multi_card", "target_cards": ["Blacephalon"], "turn": 2}
+    calculator = ProbabilityCalculator(EncodedSimulationEngine(deck, ["Poke Ball", "Professor's Research"]))
+    start = time.perf_counter()
+    _trace_counts(calculator, request, 5000)
+    trace_time = time.perf_counter() - start
+    start = time.perf_counter()
+    engine = calculator.sim_engine
+    engine.run_stream(counter_for_request(request, engine.card_table), 5000, **calculator._game_kwargs(request))
+    stream_time = time.perf_counter() - start
+    print(f"2. 5,000게임: trace {trace_time:.3f}초 / stream {stream_time:.3f}초")
+
+    print("✅ 사용자 정의 accumulator 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 스트리밍 accumulator 테스트")
+    print("=" * 60)
+
+    test_stream_matches_trace()
+    test_custom_accumulator()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+목표 정밀도 기반 적응형 시뮬레이션 테스트
+
+Wilson / Clopper-Pearson 신뢰구간 계산과, target_half_width 요청이
+목표 반폭에 도달하면 멈추고 최대 횟수를 넘지 않는지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import PokemonPocketSimulator, load_deck_from_file
+from stats_utils import wilson_interval, clopper_pearson_interval, proportion_interval
+
+
+def test_intervals():
+    """신뢰구간 계산 테스트 (알려진 값과 비교)"""
+    print("=== 신뢰구간 계산 테스트 ===")
+
+    low, high = clopper_pearson_interval(5, 10)
+    print(f"1. Clopper-Pearson 5/10: {low:.4f} ~ {high:.4f}")
+    assert abs(low - 0.1871) < 1e-4 and abs(high - 0.8129) < 1e-4, "Clopper-Pearson 구간 오류"
+
+    low, high = clopper_pearson_interval(0, 10)
+    assert low == 0.0 and abs(high - 0.3085) < 1e-4, "성공 0회 Clopper-Pearson 구간 오류"
+
+    low, high = wilson_interval(5, 10)
+    print(f"2. Wilson 5/10: {low:.4f} ~ {high:.4f}")
+    assert abs(low - 0.2366) < 1e-4 and abs(high - 0.7634) < 1e-4, "Wilson 구간 오류"
+
+    # 표본이 크면 두 방식이 거의 같아야 함
+    wilson = proportion_interval(3500, 10000, method="wilson")
+    exact = proportion_interval(3500, 10000, method="clopper_pearson")
+    assert abs(wilson[0] - exact[0]) < 1e-3 and abs(wilson[1] - exact[1]) < 1e-3, "큰 표본에서 구간 차이가 큼"
+
+    try:
+        proportion_interval(1, 2, method="unknown")
+        assert False, "지원하지 않는 방식은 오류가 발생해야 함"
+    except ValueError:
+        pass
+
+    print("✅ 신뢰구간 계산 테스트 통과!\n")
+
+
+def test_adaptive_stopping():
+    """목표 반폭 도달 시 조기 종료 및 최대 횟수 제한 테스트"""
+    print("=== 적응형 시뮬레이션 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    draw_order = ["Poke Ball", "Professor's Research", "Pokemon Communication"]
+    simulator = PokemonPocketSimulator()
+    simulator.setup_simulation(deck, draw_order, engine="encoded")
+
+    request = {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 3,
+               "target_half_width": 2.0, "max_simulations": 50000}
+    result = simulator.run_calculation(request, seed=7)
+
+    low, high = result['confidence_interval']
+    print(f"1. {result['games_used']:,}게임 사용, ±{result['interval_half_width']:.2f}%p")
+    assert result['target_met'], "목표 정밀도에 도달해야 함"
+    assert result['interval_half_width'] <= 2.0, "달성 반폭이 목표보다 큼"
+    assert result['games_used'] < 50000, "쉬운 요청은 최대 횟수 전에 멈춰야 함"
+    assert result['simulation_count'] == result['games_used'], "사용 게임 수 기록 오류"
+    assert low <= result['probability_percent'] <= high, "확률이 신뢰구간 밖에 있음"
+
+    capped = dict(request, target_half_width=0.05, max_simulations=3000, interval_method="clopper_pearson")
+    result = simulator.run_calculation(capped, seed=7)
+    print(f"2. 최대 3,000게임 제한: {result['games_used']:,}게임, ±{result['interval_half_width']:.2f}%p")
+    assert result['games_used'] == 3000, "최대 횟수를 넘거나 덜 실행함"
+    assert not result['target_met'], "도달 불가능한 목표는 미달로 기록되어야 함"
+    assert result['interval_method'] == "clopper_pearson", "신뢰구간 방식 기록 오류"
+
+    invalid = dict(request, target_half_width=0)
+    assert simulator.run_calculation(invalid) is None, "target_half_width <= 0은 거부되어야 함"
+
+    print("✅ 적응형 시뮬레이션 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 적응형 정밀도 테스트")
+    print("=" * 60)
+
+    test_intervals()
+    test_adaptive_stopping()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+NumPy 배치 엔진 테스트
+
+드로우 카드 효과가 없는 덱에서 배치 엔진과 게임 단위 시뮬레이션,
+수학적 기대값이 서로 일치하는지 확인합니다.
+"""
+
+import sys
+import os
+import math
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_engine import BatchDeckSampler, numpy_available, has_active_draw_effects
+from encoded_engine import EncodedSimulationEngine
+
+
+NO_EFFECT_DECK = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Raichu": {"type": "Stage1 Pokemon", "count": 2},
+    "Magnemite": {"type": "Basic Pokemon", "count": 1},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Potion": {"type": "Item", "count": 2},
+    "Switch": {"type": "Item", "count": 2},
+    "Giant Cape": {"type": "Pokemon Tool", "count": 2},
+    "Energy Search": {"type": "Item", "count": 2},
+    "Red Card": {"type": "Item", "count": 2},
+    "Sabrina": {"type": "Supporter", "count": 2},
+    "Leaf": {"type": "Supporter", "count": 1}
+}
+
+
+def test_active_draw_effects():
+    """발동 드로우 카드 판정 테스트"""
+    print("=== 드로우 카드 발동 판정 테스트 ===")
+
+    assert not has_active_draw_effects(NO_EFFECT_DECK, []), "드로우 순서가 비어 있으면 효과 없음"
+    assert has_active_draw_effects(NO_EFFECT_DECK, ["Poke Ball"]), "Poke Ball이 드로우 순서에 있으면 효과 있음"
+
+    pc_deck = dict(NO_EFFECT_DECK)
+    pc_deck["Pokemon Communication"] = {"type": "Item", "count": 1}
+    assert has_active_draw_effects(pc_deck, []), "Pokemon Communication은 드로우 순서와 무관하게 발동"
+
+    print("✅ 드로우 카드 발동 판정 테스트 통과!\n")
+
+
+def test_mulligan_rule():
+    """멀리건 후 모든 덱의 첫 5장에 Basic Pokemon이 있는지 테스트"""
+    if not numpy_available():
+        print("⚠️ NumPy가 없어 배치 엔진 테스트를 건너뜁니다.")
+        return
+    print("=== 배치 멀리건 테스트 ===")
+
+    sampler = BatchDeckSampler(NO_EFFECT_DECK, seed=1)
+    decks, valid = sampler.sample_decks(20000)
+
+    assert decks.shape == (20000, 20), "덱 행렬 크기 오류"
+    assert valid.all(), "Basic 3장 덱에서 멀리건 실패 발생"
+    assert sampler.is_basic[decks[:, :5]].any(axis=1).all(), "첫 5장에 Basic이 없는 덱 존재"
+
+    print("✅ 배치 멀리건 테스트 통과!\n")
+
+
+def test_batch_matches_exact_and_scalar():
+    """배치 엔진 결과를 수학적 기대값 및 게임 단위 시뮬레이션과 비교"""
+    if not numpy_available():
+        print("⚠️ NumPy가 없어 배치 엔진 테스트를 건너뜁니다.")
+        return
+    print("=== 배치 엔진 정확도 테스트 ===")
+
+    # P(Leaf가 앞 7장에 있음 | 첫 5장에 Basic 존재), Basic 3장 / Leaf 1장
+    prob_no_basic = math.comb(17, 5) / math.comb(20, 5)
+    prob_leaf_without_basic = prob_no_basic * (5 / 17 + (12 / 17) * (2 / 15))
+    expected = (7 / 20 - prob_leaf_without_basic) / (1 - prob_no_basic)
+
+    sampler = BatchDeckSampler(NO_EFFECT_DECK, seed=7)
+    success_count, total_valid_games = sampler.count_multi_card(["Leaf"], 2, 400000)
+    batch_probability = success_count / total_valid_games
+    print(f"1. 배치: {batch_probability:.4f} / 기대값: {expected:.4f}")
+    assert abs(batch_probability - expected) < 0.005, "배치 결과가 기대값과 다름"
+
+    random.seed(11)
+    engine = EncodedSimulationEngine(NO_EFFECT_DECK, [])
+    scalar_success = 0
+    for _ in range(20000):
+        final_hand = engine.simulate_single_game(max_turn=2, target_cards=["Leaf"])['final_hand']
+        scalar_success += "Leaf" in final_hand
+    scalar_probability = scalar_success / 20000
+    print(f"2. 게임 단위: {scalar_probability:.4f}")
+    assert abs(scalar_probability - batch_probability) < 0.02, "배치와 게임 단위 결과 불일치"
+
+    success_count, _ = sampler.count_multi_card(["Leaf", "없는 카드"], 2, 1000)
+    assert success_count == 0, "덱에 없는 목표 카드는 성공할 수 없음"
+
+    print("✅ 배치 엔진 정확도 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - NumPy 배치 엔진 테스트")
+    print("=" * 60)
+
+    test_active_draw_effects()
+    test_mulligan_rule()
+    test_batch_matches_exact_and_scalar()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+벤치마크 패키지 테스트
+
+케이스 정의가 모두 실행되는지(적은 연산 수로), baseline에 모든 케이스가 있는지,
+baseline 비교가 회귀를 올바르게 판정하는지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks import build_cases, run_benchmarks, load_baseline, compare_to_baseline
+
+
+def test_cases_run():
+    """빠른 모드(연산 수 축소)로 카드 효과 / v3 케이스 실행"""
+    print("=== 벤치마크 케이스 실행 테스트 ===")
+
+    results = run_benchmarks("effect/", repeats=1, scale=0.02, verbose=False)
+    results.update(run_benchmarks("v3/", repeats=1, scale=0.02, verbose=False))
+    for name, measured in results.items():
+        print(f"  {name}: {measured['ops_per_sec']:,.0f}/s, peak {measured['peak_kib']:.1f} KiB")
+        assert measured['ops_per_sec'] > 0 and measured['peak_kib'] >= 0, "측정값 오류"
+    assert len(results) == 7, "카드 효과 5개 + v3 2개 케이스가 실행되어야 함"
+
+    baseline = load_baseline()
+    case_names = {case.name for case in build_cases()}
+    assert baseline is not None and set(baseline['results']) == case_names, "baseline에 모든 케이스가 있어야 함"
+
+    print("✅ 벤치마크 케이스 실행 테스트 통과!\n")
+
+
+def test_compare_to_baseline():
+    """처리량 / 메모리 회귀 판정 테스트"""
+    print("=== baseline 비교 테스트 ===")
+
+    baseline = {'results': {
+        'a': {'ops_per_sec': 1000.0, 'peak_kib': 10.0},
+        'b': {'ops_per_sec': 1000.0, 'peak_kib': 1000.0},
+        'c': {'ops_per_sec': 1000.0, 'peak_kib': 10.0},
+    }}
+    results = {
+        'a': {'ops_per_sec': 800.0, 'peak_kib': 60.0},    # 허용 범위 안 (작은 메모리 증가는 무시)
+        'b': {'ops_per_sec': 1100.0, 'peak_kib': 1500.0},  # 메모리 회귀
+        'c': {'ops_per_sec': 700.0, 'peak_kib': 10.0},    # 처리량 회귀
+        'd': {'ops_per_sec': 1.0, 'peak_kib': 1.0},       # 새 케이스
+    }
+
+    comparisons = {item['name']: item for item in compare_to_baseline(results, baseline, threshold=0.25)}
+    print(f"1. 상태: {[(name, item['status']) for name, item in sorted(comparisons.items())]}")
+    assert comparisons['a']['status'] == 'ok', "허용 범위 안의 변화는 회귀가 아님"
+    assert comparisons['b']['regression'] and comparisons['c']['regression'], "회귀를 감지해야 함"
+    assert comparisons['d']['status'] == 'new' and not comparisons['d']['regression'], "새 케이스는 회귀가 아님"
+
+    print("✅ baseline 비교 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 벤치마크 패키지 테스트")
+    print("=" * 60)
+
+    test_cases_run()
+    test_compare_to_baseline()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
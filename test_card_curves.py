@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+카드별 턴별 확률 곡선(card_curves) 테스트
+
+정확 계산과 시뮬레이션 곡선이 같은 분포인지, 곡선이 턴에 따라 단조 증가하고
+처음 본 턴 분포와 합이 맞는지, 턴 종료 시점 보유 확률이 multi_card 정확값과 같은지,
+목표 카드가 없어 Iono / Pokemon Communication이 있는 덱도 정확 계산되는지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import PokemonPocketSimulator, SimulationEngine
+from encoded_engine import EncodedSimulationEngine
+from probability_calculator import ProbabilityCalculator
+from progress import ProgressReporter
+from stats_utils import one_proportion_z_test
+
+SEARCH_DECK = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Type:Null": {"type": "Basic Pokemon", "count": 2},
+    "Silvally": {"type": "Stage1 Pokemon", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Galdion": {"type": "Supporter", "count": 2},
+    "Potion": {"type": "Item", "count": 2},
+    "X Speed": {"type": "Item", "count": 2},
+    "Leaf": {"type": "Supporter", "count": 2},
+    "Red Card": {"type": "Item", "count": 2}
+}
+SEARCH_ORDER = ["Poke Ball", "Galdion", "Professor's Research"]
+
+IONO_DECK = {name: info for name, info in SEARCH_DECK.items() if name != "Galdion"}
+IONO_DECK["Iono"] = {"type": "Supporter", "count": 2}
+IONO_ORDER = ["Poke Ball", "Professor's Research", "Iono"]
+
+CURVES_REQUEST = {"type": "card_curves", "turn": 3}
+
+
+def _assert_same_distribution(exact, simulated):
+    """시뮬레이션 곡선의 모든 값이 정확값과 같은 분포인지 (비율 검정)"""
+    total = simulated['total_valid_games']
+    for key in ('seen_percent', 'in_hand_percent'):
+        for card_name in exact['cards']:
+            for expected, observed in zip(exact[key][card_name], simulated[key][card_name]):
+                _, p_value = one_proportion_z_test(round(observed / 100 * total), total, expected / 100)
+                assert p_value > 0.0005, f"{card_name} {key}: 정확값 {expected}% / 시뮬레이션 {observed}%"
+
+
+def test_exact_matches_simulation():
+    """정확 계산 곡선과 시뮬레이션 곡선 비교 (기준 / 인코딩 엔진)"""
+    print("=== 정확 계산 / 시뮬레이션 곡선 비교 테스트 ===")
+
+    exact = None
+    for engine_class in (EncodedSimulationEngine, SimulationEngine):
+        calculator = ProbabilityCalculator(engine_class(SEARCH_DECK, SEARCH_ORDER), ProgressReporter())
+        if exact is None:
+            exact = calculator.run_calculation(CURVES_REQUEST)
+            assert exact['calculation_method'].startswith('Markov'), "Galdion 덱은 정확 계산"
+        simulated = calculator.run_calculation(CURVES_REQUEST, 6000, use_mathematical=False, seed=3)
+        print(f"1. {engine_class.__name__}: Silvally 정확 {exact['seen_percent']['Silvally']} / "
+              f"시뮬레이션 {simulated['seen_percent']['Silvally']}")
+        _assert_same_distribution(exact, simulated)
+
+    print("✅ 정확 계산 / 시뮬레이션 곡선 비교 테스트 통과!\n")
+
+
+def test_curve_consistency():
+    """단조 증가 / 처음 본 턴 분포 합 / multi_card 정확값 일치 테스트"""
+    print("=== 곡선 일관성 테스트 ===")
+
+    calculator = ProbabilityCalculator(EncodedSimulationEngine(SEARCH_DECK, SEARCH_ORDER), ProgressReporter())
+    result = calculator.run_calculation(CURVES_REQUEST)
+
+    for card_name in result['cards']:
+        seen = result['seen_percent'][card_name]
+        assert all(earlier <= later for earlier, later in zip(seen, seen[1:])), f"{card_name}: 본 확률은 단조 증가"
+        assert all(held <= total + 1e-9 for held, total in zip(result['in_hand_percent'][card_name], seen))
+        distribution_sum = sum(result['first_seen_percent'][card_name]) + result['never_seen_percent'][card_name]
+        assert abs(distribution_sum - 100) < 0.05, f"{card_name}: 처음 본 턴 분포 합 {distribution_sum}"
+    print(f"1. {len(result['cards'])}종 곡선 단조 증가, 처음 본 턴 분포 합 100%")
+
+    for card_name in ("Silvally", "Leaf"):
+        for turn in (1, 3):
+            multi = calculator.calculate_multi_card_exact([card_name], turn)
+            assert abs(multi['probability_percent'] - result['in_hand_percent'][card_name][turn]) < 0.011, \
+                f"{card_name} {turn}턴: 턴 종료 시점 보유 확률은 multi_card 정확값과 같음"
+    print("2. 턴 종료 시점 보유 확률 = multi_card 정확값")
+
+    print("✅ 곡선 일관성 테스트 통과!\n")
+
+
+def test_target_free_policy_deck():
+    """Iono 덱 정확 계산 + 시뮬레이터 요청 검증 테스트"""
+    print("=== 목표 카드 없는 정책 / 요청 검증 테스트 ===")
+
+    simulator = PokemonPocketSimulator(progress_reporter=ProgressReporter())
+    assert simulator.setup_simulation(IONO_DECK, IONO_ORDER, engine="encoded")
+    assert simulator.prob_calculator.is_deterministic(CURVES_REQUEST), "목표 카드가 없으면 Iono 덱도 정확 계산"
+    assert not simulator.prob_calculator.is_deterministic({"type": "multi_card", "target_cards": ["Leaf"], "turn": 2})
+
+    request = {"type": "card_curves", "cards": ["Iono", "Leaf"], "turn": 3}
+    exact = simulator.run_calculation(request)
+    simulated = simulator.prob_calculator.run_calculation(request, 6000, use_mathematical=False, seed=8)
+    print(f"1. Iono 정확 {exact['seen_percent']['Iono']} / 시뮬레이션 {simulated['seen_percent']['Iono']}")
+    assert exact['cards'] == ["Iono", "Leaf"]
+    _assert_same_distribution(exact, simulated)
+
+    assert simulator.run_calculation({"type": "card_curves", "cards": ["Mewtwo"], "turn": 2}) is None, "덱에 없는 카드"
+    assert simulator.run_calculation({"type": "card_curves", "turn": 0}) is None, "turn은 1 이상"
+    print("2. 잘못된 요청 거부")
+
+    print("✅ 목표 카드 없는 정책 / 요청 검증 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 카드별 턴별 확률 곡선 테스트")
+    print("=" * 60)
+
+    test_exact_matches_simulation()
+    test_curve_consistency()
+    test_target_free_policy_deck()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
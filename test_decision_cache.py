@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Iono / Pokemon Communication 판단 캐시 테스트
+
+LRU 캐시가 크기 제한과 적중 / 미스 집계를 지키는지, 서명이 같은 손패 / 덱 상태에서
+캐시된 판단이 직접 계산한 판단과 항상 같은지, 캐시를 켠 엔진과 끈 엔진이 같은 seed에서
+게임 단위로 같은 결과를 내는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from decision_cache import DecisionCache
+from card_effects import CardEffects
+from main_simulator import SimulationEngine, GameState
+
+DECK = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Type:Null": {"type": "Basic Pokemon", "count": 2},
+    "Silvally": {"type": "Stage1 Pokemon", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Pokemon Communication": {"type": "Item", "count": 2},
+    "Iono": {"type": "Supporter", "count": 2},
+    "Potion": {"type": "Item", "count": 2},
+    "Leaf": {"type": "Supporter", "count": 2},
+    "Red Card": {"type": "Item", "count": 2}
+}
+DRAW_ORDER = ["Poke Ball", "Pokemon Communication", "Professor's Research", "Iono"]
+TARGETS = ["Silvally", "Leaf"]
+GROUPS = [{"name": "A", "target_cards": ["Silvally", "Leaf"]},
+          {"name": "B", "target_cards": ["Pikachu", "Potion", "Red Card"]}]
+
+
+def test_lru_cache():
+    """LRU 크기 제한 / 적중 집계 테스트"""
+    print("=== LRU 판단 캐시 테스트 ===")
+
+    cache = DecisionCache(maxsize=2)
+    calls = []
+
+    def compute(value):
+        return lambda: calls.append(value) or value
+
+    assert cache.lookup("a", compute(1)) == 1
+    assert cache.lookup("b", compute(2)) == 2
+    assert cache.lookup("a", compute(99)) == 1, "적중이면 저장된 값 반환"
+    cache.lookup("c", compute(3))  # 가장 오래 쓰지 않은 "b" 삭제
+    assert len(cache) == 2 and cache.lookup("b", compute(4)) == 4
+    assert calls == [1, 2, 3, 4], f"미스일 때만 계산해야 함: {calls}"
+
+    stats = cache.stats()
+    print(f"1. {stats}")
+    assert stats['hits'] == 1 and stats['misses'] == 4 and stats['entries'] == 2
+
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()['hit_rate'] == 0.0
+    try:
+        DecisionCache(maxsize=0)
+    except ValueError as e:
+        print(f"2. maxsize=0: {e}")
+    else:
+        assert False, "maxsize=0은 ValueError가 나야 함"
+
+    print("✅ LRU 판단 캐시 테스트 통과!\n")
+
+
+def test_cached_decisions_match():
+    """캐시된 판단 = 직접 계산한 판단 (무작위 손패 / 덱 상태)"""
+    print("=== 캐시 판단 일치 테스트 ===")
+
+    engine = SimulationEngine(DECK, DRAW_ORDER)
+    rng = random.Random(11)
+    for _ in range(3000):
+        game_state = GameState(DECK, DRAW_ORDER, rng=rng)
+        game_state.hand = [game_state.deck.pop() for _ in range(rng.randint(1, 9))]
+        game_state.turn = rng.randint(1, 3)
+
+        assert engine._cached_iono_decision(game_state, TARGETS) == CardEffects.should_use_iono(game_state, TARGETS)
+        assert (engine._cached_multi_or_multi_iono(game_state, GROUPS)
+                == engine._should_use_iono_for_multi_or_multi(game_state, GROUPS))
+        assert (engine._cached_pokemon_communication_decision(game_state, TARGETS, 3)
+                == CardEffects.should_use_pokemon_communication(game_state, TARGETS, 3))
+
+    stats = engine.decision_cache.stats()
+    print(f"1. 무작위 상태 3,000개 x 판단 3종 일치 (적중률 {stats['hit_rate'] * 100:.1f}%, 항목 {stats['entries']:,}개)")
+    assert stats['hits'] > 0
+
+    print("✅ 캐시 판단 일치 테스트 통과!\n")
+
+
+def _final_hands(engine, seed, **kwargs):
+    random.seed(seed)
+    return [engine.simulate_single_game(**kwargs)['final_hand'] for _ in range(1500)]
+
+
+def test_engine_results_unchanged():
+    """캐시 사용 엔진 = 캐시 미사용 엔진 (같은 seed, 게임 단위)"""
+    print("=== 엔진 결과 일치 테스트 ===")
+
+    for kwargs in (dict(max_turn=3, target_cards=TARGETS),
+                   dict(max_turn=3, target_cards=TARGETS + ["Pikachu"], target_groups=GROUPS)):
+        cached = SimulationEngine(DECK, DRAW_ORDER)
+        uncached = SimulationEngine(DECK, DRAW_ORDER)
+        uncached.decision_cache.lookup = lambda key, compute: compute()
+
+        assert _final_hands(cached, 5, **kwargs) == _final_hands(uncached, 5, **kwargs)
+        stats = cached.decision_cache.stats()
+        print(f"  {'multi_or_multi' if 'target_groups' in kwargs else 'multi_card'}: "
+              f"적중 {stats['hits']:,} / 미스 {stats['misses']:,} ({stats['hit_rate'] * 100:.1f}%)")
+        assert stats['hit_rate'] > 0.5, "반복되는 손패 모양은 대부분 캐시 적중이어야 함"
+
+    print("✅ 엔진 결과 일치 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 판단 캐시 테스트")
+    print("=" * 60)
+
+    test_lru_cache()
+    test_cached_decisions_match()
+    test_engine_results_unchanged()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
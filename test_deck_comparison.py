@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+공통 난수(CRN) 덱 비교 테스트
+
+같은 seed에서 구성별 게임이 같은 난수 흐름을 쓰는지,
+paired difference와 표준오차가 올바르게 계산되는지,
+드로우 순서 경주가 뒤처진 순서를 일찍 제외하고 순위를 매기는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import SimulationEngine, load_deck_from_file
+from encoded_engine import EncodedSimulationEngine
+from probability_calculator import ProbabilityCalculator
+from accumulators import OutcomeRecorder, counter_for_request
+from deck_comparison import (compare_configurations, print_comparison_result, candidate_draw_orders,
+                             rank_draw_orders, print_draw_order_ranking)
+
+IONO_DECK = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Type:Null": {"type": "Basic Pokemon", "count": 2},
+    "Silvally": {"type": "Stage1 Pokemon", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Galdion": {"type": "Supporter", "count": 2},
+    "Iono": {"type": "Supporter", "count": 2},
+    "Pokemon Communication": {"type": "Item", "count": 2},
+    "Leaf": {"type": "Supporter", "count": 2},
+    "Red Card": {"type": "Item", "count": 2}
+}
+
+
+def test_card_effects_use_game_rng():
+    """카드 효과 셔플이 전역 random이 아닌 게임별 rng를 사용하는지 테스트"""
+    print("=== 게임별 rng 사용 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    draw_order = ["Poke Ball", "Professor's Research", "Pokemon Communication"]
+    request = {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 3}
+    configurations = [{"name": "A", "deck": deck, "draw_order": draw_order},
+                      {"name": "B", "deck": deck, "draw_order": draw_order}]
+
+    random.seed(1)
+    first = compare_configurations(configurations, request, 300, seed=99, engine_class=SimulationEngine)
+    random.seed(2)
+    second = compare_configurations(configurations, request, 300, seed=99, engine_class=SimulationEngine)
+
+    print(f"1. 성공 횟수: {first['configurations'][0]['success_count']} / {second['configurations'][0]['success_count']}")
+    assert first['configurations'] == second['configurations'], "전역 random 상태에 따라 결과가 달라짐"
+
+    comparison = first['comparisons'][0]
+    assert comparison['difference_percent'] == 0.0, "같은 구성은 게임별 결과가 같아야 함"
+    assert comparison['standard_error_percent'] == 0.0, "같은 구성의 paired 표준오차는 0이어야 함"
+
+    print("✅ 게임별 rng 사용 테스트 통과!\n")
+
+
+def test_draw_order_comparison():
+    """드로우 순서 비교에서 paired 표준오차가 독립 실행보다 작은지 테스트"""
+    print("=== 드로우 순서 비교 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    request = {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 3}
+    configurations = [
+        {"name": "드로우 없음", "deck": deck, "draw_order": []},
+        {"name": "Poke Ball 우선", "deck": deck, "draw_order": ["Poke Ball", "Professor's Research"]},
+        {"name": "Research 우선", "deck": deck, "draw_order": ["Professor's Research", "Poke Ball"]},
+    ]
+
+    result = compare_configurations(configurations, request, 4000, seed=2025)
+    print_comparison_result(result)
+
+    assert len(result['comparisons']) == 2, "baseline 외 구성마다 비교 결과가 있어야 함"
+    for comparison in result['comparisons']:
+        probabilities = {config['name']: config['probability_percent'] for config in result['configurations']}
+        expected = probabilities[comparison['candidate']] - probabilities[comparison['baseline']]
+        assert abs(comparison['difference_percent'] - expected) < 1e-9, "paired difference 계산 오류"
+        assert comparison['difference_percent'] > 0, "드로우 카드 사용 시 확률이 올라가야 함"
+        assert comparison['standard_error_percent'] < comparison['independent_standard_error_percent'], \
+            "공통 난수 비교의 표준오차가 독립 실행보다 커짐"
+
+    try:
+        compare_configurations(configurations[:1], request, 10)
+        assert False, "구성이 1개면 오류가 발생해야 함"
+    except ValueError:
+        pass
+
+    print("✅ 드로우 순서 비교 테스트 통과!\n")
+
+
+def test_run_stream_game_seeds():
+    """run_stream 게임별 seed가 evaluate_game의 게임별 rng와 같은 게임을 내는지 테스트"""
+    print("=== run_stream 게임별 seed 테스트 ===")
+
+    request = {"type": "multi_card", "target_cards": ["Silvally", "Leaf"], "turn": 3}
+    order = ["Iono", "Poke Ball", "Galdion", "Professor's Research", "Pokemon Communication"]
+    engine = EncodedSimulationEngine(IONO_DECK, order)
+    seeds = [random.Random(index).getrandbits(64) for index in range(300)]
+
+    recorder = OutcomeRecorder(counter_for_request(request, engine.card_table))
+    calculator = ProbabilityCalculator(engine)
+    engine.run_stream(recorder, 0, max_turn=3, target_cards=request['target_cards'], game_seeds=seeds)
+    expected = [calculator.evaluate_game(request, random.Random(game_seed)) for game_seed in seeds]
+    print(f"1. {len(seeds)}게임 성공 {sum(filter(None, recorder.outcomes))}회")
+    assert recorder.outcomes == expected, "같은 게임 seed면 run_stream과 evaluate_game이 같은 게임"
+
+    print("✅ run_stream 게임별 seed 테스트 통과!\n")
+
+
+def test_rank_draw_orders():
+    """드로우 순서 경주 / 정확 계산 순위 테스트"""
+    print("=== 드로우 순서 순위 테스트 ===")
+
+    orders = candidate_draw_orders(IONO_DECK)
+    print(f"1. 드로우 카드 5장 순열 120개 → 게임 진행이 다른 순서 {len(orders)}개")
+    assert len(orders) == 24, "Pokemon Communication 위치만 다른 순서는 같은 게임"
+
+    request = {"type": "multi_card", "target_cards": ["Silvally", "Leaf"], "turn": 3}
+    result = rank_draw_orders(IONO_DECK, request, max_games=4000, round_games=1000, min_games=1000, seed=11)
+    print_draw_order_ranking(result, top=5)
+    ranking = result['ranking']
+    assert result['method'] == 'racing' and len(ranking) == 24
+    assert result['total_games'] < result['unpruned_games'], "뒤처진 순서는 일찍 제외"
+    assert ranking[0]['pruned_after'] is None and ranking[0]['games'] == 4000
+    assert all(entry['difference_percent'] <= 1e-9 for entry in ranking), "1위와의 차이는 0 이하"
+    survivors = [entry for entry in ranking if entry['pruned_after'] is None]
+    assert ranking[:len(survivors)] == survivors, "끝까지 남은 순서가 앞 순위"
+
+    search_deck = {name: info for name, info in IONO_DECK.items() if name not in ("Iono", "Pokemon Communication")}
+    search_deck["Potion"] = {"type": "Item", "count": 2}
+    search_deck["X Speed"] = {"type": "Item", "count": 2}
+    exact = rank_draw_orders(search_deck, request, seed=11)
+    print(f"2. 정확 계산 가능 덱: {exact['method']}, 1위 {' → '.join(exact['ranking'][0]['draw_order'])} "
+          f"{exact['ranking'][0]['probability_percent']:.2f}%")
+    probabilities = [entry['probability_percent'] for entry in exact['ranking']]
+    assert exact['method'] == 'exact' and exact['total_games'] == 0 and len(probabilities) == 6
+    assert probabilities == sorted(probabilities, reverse=True)
+
+    print("✅ 드로우 순서 순위 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 공통 난수 비교 테스트")
+    print("=" * 60)
+
+    test_card_effects_use_game_rng()
+    test_draw_order_comparison()
+    test_run_stream_game_seeds()
+    test_rank_draw_orders()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
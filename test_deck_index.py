@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+덱 색인(DeckIndex) 테스트
+
+색인 연산 후에도 장수가 덱과 일치하는지, 서치 / 교환 후 남은 덱이 셔플 없이도
+균등한 순열인지, 색인을 쓰는 카드 효과가 기존 결과 분포와 같은지 확인합니다.
+"""
+
+import sys
+import os
+import math
+import random
+import itertools
+from collections import Counter
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from deck_index import DeckIndex
+from main_simulator import SimulationEngine, GameState, load_deck_from_file
+
+KIND_TYPES = {"A": "Basic Pokemon", "B": "Basic Pokemon", "C": "Item", "D": "Stage1 Pokemon"}
+
+
+def _chi_square(observed: Counter, categories: list, total: int) -> float:
+    expected = total / len(categories)
+    return sum((observed.get(category, 0) - expected) ** 2 / expected for category in categories)
+
+
+def test_index_consistency():
+    """무작위 연산 후 색인 장수 / 키 리스트 일치 테스트"""
+    print("=== 색인 일관성 테스트 ===")
+
+    rng = random.Random(3)
+    for _ in range(300):
+        deck = [rng.choice("ABCD") for _ in range(12)]
+        index = DeckIndex(deck, KIND_TYPES, str) if rng.random() < 0.5 else DeckIndex(deck, KIND_TYPES)
+        for _ in range(10):
+            operation = rng.randrange(4)
+            if operation == 0 and deck:
+                index.pop_top()
+            elif operation == 1:
+                index.take_random(rng, ("A", "B"))
+            elif operation == 2:
+                index.insert_random(rng, rng.choice("ABCD"))
+            else:
+                index.shuffle_in(rng, ["C"])
+
+            expected_keys = [index.key_of(card) for card in deck] if index.key_of else deck
+            assert index.keys == expected_keys, "키 리스트가 덱과 다름"
+            counts = {kind: count for kind, count in index.counts.items() if count}
+            assert counts == Counter(expected_keys), "종류별 장수가 덱과 다름"
+
+    index = DeckIndex(list("AACD"), KIND_TYPES)
+    assert index.kinds_of_types(("Basic Pokemon",)) == ("A", "B"), "종류 순서는 kind_types 순서"
+    assert index.count_any(("A", "B")) == 2 and index.take_random(rng, ("B",)) is None, "대상이 없으면 None"
+    print("1. 300개 덱 × 10회 무작위 연산 후 색인 일치")
+
+    print("✅ 색인 일관성 테스트 통과!\n")
+
+
+def test_uniform_without_shuffle():
+    """서치 / 교환 후 남은 덱 순서의 균등성 테스트 (셔플 생략 근거)"""
+    print("=== 셔플 생략 균등성 테스트 ===")
+
+    rng = random.Random(11)
+    trials = 60000
+
+    # 균등 순열에서 A를 1장 서치한 뒤 남은 덱 "ABCC"의 순열 12가지가 균등해야 함
+    remaining = Counter()
+    for _ in range(trials):
+        deck = list("AABCC")
+        rng.shuffle(deck)
+        index = DeckIndex(deck, KIND_TYPES)
+        assert index.take_random(rng, ("A", "D")) == "A"
+        remaining["".join(deck)] += 1
+    categories = sorted(set("".join(order) for order in itertools.permutations("ABCC")))
+    statistic = _chi_square(remaining, categories, trials)
+    print(f"1. 서치 후 남은 덱 순열 {len(categories)}가지: χ² = {statistic:.1f} (자유도 {len(categories) - 1})")
+    assert statistic < 35, "서치 후 남은 덱이 균등 순열이 아님"
+
+    # 덱에 넣은 카드의 위치가 균등해야 함
+    positions = Counter()
+    for _ in range(trials):
+        deck = list("CCCC")
+        index = DeckIndex(deck, KIND_TYPES)
+        index.insert_random(rng, "A")
+        positions[deck.index("A")] += 1
+    statistic = _chi_square(positions, list(range(5)), trials)
+    print(f"2. 넣은 카드 위치 5가지: χ² = {statistic:.1f} (자유도 4)")
+    assert statistic < 20, "넣은 카드의 위치가 균등하지 않음"
+
+    print("✅ 셔플 생략 균등성 테스트 통과!\n")
+
+
+def test_effects_match_list_path():
+    """색인 경로와 기존 리스트 경로(셔플 포함)의 결과 분포 비교"""
+    print("=== 카드 효과 분포 비교 ===")
+
+    class ListGameState(GameState):
+        """색인 없이 기존 리스트 탐색 + 셔플 경로를 사용하는 게임 상태"""
+        deck_index = None
+
+    deck, draw_order = load_deck_from_file()
+    engine = SimulationEngine(deck, draw_order)
+
+    num_games = 6000
+    rates = {}
+    for label, state_class in (("색인", GameState), ("리스트", ListGameState)):
+        random.seed(21 if label == "색인" else 22)
+        success = valid = 0
+        original = sys.modules['main_simulator'].GameState
+        sys.modules['main_simulator'].GameState = state_class
+        try:
+            for _ in range(num_games):
+                result = engine.simulate_single_game(max_turn=2, target_cards=["Blacephalon", "BalsaMine"])
+                if result['success']:
+                    valid += 1
+                    success += all(name in result['final_hand'] for name in ["Blacephalon", "BalsaMine"])
+        finally:
+            sys.modules['main_simulator'].GameState = original
+        rates[label] = (success, valid)
+
+    (s1, n1), (s2, n2) = rates["색인"], rates["리스트"]
+    pooled = (s1 + s2) / (n1 + n2)
+    standard_error = math.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n2))
+    print(f"1. 색인 {s1 / n1 * 100:.2f}% / 리스트 {s2 / n2 * 100:.2f}%")
+    assert abs(s1 / n1 - s2 / n2) < 4 * standard_error, "색인 경로의 결과 분포가 기존과 다름"
+
+    print("✅ 카드 효과 분포 비교 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 덱 색인 테스트")
+    print("=" * 60)
+
+    test_index_consistency()
+    test_uniform_without_shuffle()
+    test_effects_match_list_path()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+덱 리스트 최적화 테스트
+
+교체 이웃이 항상 합법적인 20장 덱인지, 공통 난수 평가가 재현 가능한지,
+hill_climb가 정확 계산 목적 함수를 개선하는지, 병렬 평가가 단일 프로세스와
+같은 탐색 경로를 내는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from deck_optimizer import DeckOptimizer, evaluate_deck, normalize_objective
+from exact_engine import exact_request_probability
+
+CARD_POOL = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Type:Null": {"type": "Basic Pokemon", "count": 2},
+    "Silvally": {"type": "Stage1 Pokemon", "count": 2},
+    "Charmander": {"type": "Basic Pokemon", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Galdion": {"type": "Supporter", "count": 2},
+    "Iono": {"type": "Supporter", "count": 2},
+    "Potion": {"type": "Item", "count": 2},
+    "X Speed": {"type": "Item", "count": 2},
+    "Leaf": {"type": "Supporter", "count": 2},
+    "Red Card": {"type": "Item", "count": 2},
+    "Giant Cape": {"type": "Pokemon Tool", "count": 2},
+    "Switch": {"type": "Item", "count": 2}
+}
+FIXED_CARDS = {"Silvally": {"type": "Stage1 Pokemon", "count": 1}, "Leaf": {"type": "Supporter", "count": 1}}
+DRAW_ORDER = ["Poke Ball", "Galdion", "Professor's Research"]
+EXACT_OBJECTIVE = [
+    {"name": "2턴 Silvally + Leaf", "request": {"type": "multi_card", "target_cards": ["Silvally", "Leaf"], "turn": 2}},
+    {"name": "Type:Null 시작", "weight": 0.5, "request": {"type": "preferred_opening", "preferred_basics": ["Type:Null"]}}
+]
+
+
+def test_neighbors_are_legal():
+    """시작 덱 / 교체 이웃 합법성 테스트"""
+    print("=== 교체 이웃 합법성 테스트 ===")
+
+    optimizer = DeckOptimizer(CARD_POOL, EXACT_OBJECTIVE, fixed_cards=FIXED_CARDS, draw_order=DRAW_ORDER, seed=1)
+    start = optimizer.initial_composition()
+    neighbors = optimizer.neighbors(start)
+    print(f"1. 시작 덱 {sum(start)}장, 교체 이웃 {len(neighbors)}개")
+    assert optimizer.is_legal(start) and neighbors
+    assert all(optimizer.is_legal(composition) for _, composition in neighbors), "모든 이웃은 20장 / 최대 2장 / 고정 카드 유지"
+
+    try:
+        optimizer.composition_of({"Mewtwo": {"type": "Basic Pokemon", "count": 2}})
+        assert False, "카드 풀에 없는 카드는 ValueError"
+    except ValueError:
+        pass
+    for objective in ({"type": "card_curves", "turn": 2}, []):
+        try:
+            normalize_objective(objective)
+            assert False, "확률 하나가 아닌 목적 함수는 ValueError"
+        except ValueError:
+            pass
+    try:
+        DeckOptimizer(CARD_POOL, EXACT_OBJECTIVE, fixed_cards={"Leaf": {"type": "Supporter", "count": 3}})
+        assert False, "고정 장수는 최대 2장"
+    except ValueError:
+        pass
+    print("2. 잘못된 시작 덱 / 목적 함수 / 고정 카드 거부")
+
+    print("✅ 교체 이웃 합법성 테스트 통과!\n")
+
+
+def test_hill_climb_improves_exact_objective():
+    """정확 계산 목적 함수 hill_climb 테스트"""
+    print("=== hill_climb 정확 계산 목적 함수 테스트 ===")
+
+    optimizer = DeckOptimizer(CARD_POOL, EXACT_OBJECTIVE, fixed_cards=FIXED_CARDS, draw_order=DRAW_ORDER, seed=2)
+    result = optimizer.optimize(method="hill_climb", max_steps=6, verbose=False)
+    print(f"1. 점수 {result['initial_score']:.2f} → {result['score']:.2f}, 평가 {result['evaluations']}회, "
+          f"시뮬레이션 {result['simulated_games']}게임")
+    assert result['score'] > result['initial_score'] and result['simulated_games'] == 0, "정확 계산만 사용"
+    assert sum(info['count'] for info in result['deck'].values()) == 20
+    assert result['deck']["Silvally"]['count'] >= 1 and result['deck']["Leaf"]['count'] >= 1
+
+    expected = sum(term.get('weight', 1.0) * exact_request_probability(result['deck'], DRAW_ORDER, term['request']) * 100
+                   for term in EXACT_OBJECTIVE)
+    assert abs(result['score'] - expected) < 1e-9, "결과 점수는 최적 덱의 정확값 가중합"
+    scores = [entry['score'] for entry in result['history']]
+    assert all(earlier < later for earlier, later in zip(scores, scores[1:])), "hill_climb는 점수가 오르는 이동만"
+
+    print("✅ hill_climb 정확 계산 목적 함수 테스트 통과!\n")
+
+
+def test_common_random_numbers_and_workers():
+    """공통 난수 재현성 / 병렬 평가 일치 테스트"""
+    print("=== 공통 난수 / 병렬 평가 테스트 ===")
+
+    # Iono가 발동되면 정확 계산을 할 수 없어 시뮬레이션으로 평가
+    objective = normalize_objective({"type": "multi_card", "target_cards": ["Silvally", "Leaf"], "turn": 2})
+    draw_order = DRAW_ORDER + ["Iono"]
+    optimizer = DeckOptimizer(CARD_POOL, objective, fixed_cards=FIXED_CARDS, draw_order=draw_order, num_games=500, seed=3)
+    deck = optimizer.deck_input(optimizer.initial_composition())
+    random.seed(99)
+    caller_state = random.getstate()
+    first = evaluate_deck(deck, draw_order, objective, 500, seed=3)
+    assert random.getstate() == caller_state, "평가가 호출한 쪽의 전역 random 상태를 바꾸면 안 됨"
+    assert first == evaluate_deck(deck, draw_order, objective, 500, seed=3), "같은 seed면 같은 평가"
+    assert first['simulated_games'] == 500
+    print(f"1. 같은 seed 두 번 평가: {first['score']:.2f} = {first['score']:.2f} (전역 random 상태 유지)")
+
+    results = []
+    for workers in (1, 2):
+        optimizer = DeckOptimizer(CARD_POOL, objective, fixed_cards=FIXED_CARDS, draw_order=draw_order, num_games=300, seed=4)
+        results.append(optimizer.optimize(method="anneal", max_steps=4, workers=workers, batch_size=4, verbose=False))
+    print(f"2. anneal 프로세스 1개 / 2개: {results[0]['score']:.2f} / {results[1]['score']:.2f}, "
+          f"분당 평가 {results[0]['evaluations_per_minute']:,.0f} / {results[1]['evaluations_per_minute']:,.0f}")
+    assert results[0]['history'] == results[1]['history'] and results[0]['deck'] == results[1]['deck'], \
+        "병렬 평가도 같은 탐색 경로"
+
+    print("✅ 공통 난수 / 병렬 평가 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 덱 리스트 최적화 테스트")
+    print("=" * 60)
+
+    test_neighbors_are_legal()
+    test_hill_climb_improves_exact_objective()
+    test_common_random_numbers_and_workers()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+카드 효과 레지스트리 테스트
+
+기본 드로우 카드가 등록되어 있는지, 새 카드를 분기 추가 없이 등록해
+기준 엔진 / 인코딩 엔진에서 사용할 수 있는지, precondition이 불충족이면
+카드가 손패에 남는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import SimulationEngine, GameState
+from encoded_engine import EncodedSimulationEngine
+from card_effects import (CardEffects, DRAW_CARDS, EFFECT_REGISTRY, register_effect,
+                          unregister_effect, resolve_effects)
+
+TEST_DECK = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Raichu": {"type": "Stage1 Pokemon", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Great Ball": {"type": "Item", "count": 2},
+    "Potion": {"type": "Item", "count": 10}
+}
+
+
+def test_builtin_registry():
+    """기본 드로우 카드 등록 / 조회 테스트"""
+    print("=== 기본 효과 등록 테스트 ===")
+
+    expected = ["Poke Ball", "Professor's Research", "Galdion", "Pokemon Communication", "Iono"]
+    print(f"1. 등록된 카드: {list(EFFECT_REGISTRY)}")
+    assert list(EFFECT_REGISTRY) == expected and list(DRAW_CARDS) == expected, "기본 드로우 카드 5종이 등록되어야 함"
+    assert all(spec.encoded for spec in EFFECT_REGISTRY.values()), "기본 카드는 인코딩 엔진 메서드가 있어야 함"
+
+    resolved = resolve_effects(["Poke Ball", "Potion"])
+    assert resolved["Poke Ball"] is EFFECT_REGISTRY["Poke Ball"], "등록된 카드는 레지스트리 항목 그대로"
+    unknown = resolved["Potion"].handler(GameState(TEST_DECK))
+    assert unknown == CardEffects.use_card_effect("Potion", GameState(TEST_DECK)), "미등록 카드는 기존 동작과 동일"
+    assert not unknown["success"] and "알 수 없는 카드" in unknown["description"]
+
+    print("✅ 기본 효과 등록 테스트 통과!\n")
+
+
+def test_register_new_card():
+    """새 카드 등록 (precondition 포함) 테스트"""
+    print("=== 새 카드 등록 테스트 ===")
+
+    def great_ball_ready(game_state) -> bool:
+        return any(card.card_type == "Stage1 Pokemon" for card in game_state.deck)
+
+    @register_effect("Great Ball", "random_stage1_pokemon", precondition=great_ball_ready)
+    def _use_great_ball(game_state):
+        stage1 = [card for card in game_state.deck if card.card_type == "Stage1 Pokemon"]
+        selected = random.choice(stage1)
+        game_state.deck.remove(selected)
+        game_state.hand.append(selected)
+        random.shuffle(game_state.deck)
+        return {"card_name": "Great Ball", "success": True, "description": f"{selected.name}을 덱에서 손으로"}
+
+    try:
+        assert DRAW_CARDS["Great Ball"] == "random_stage1_pokemon", "등록 시 DRAW_CARDS에도 반영"
+
+        engine = SimulationEngine(TEST_DECK, ["Great Ball"])
+        random.seed(5)
+        raichu_games = 0
+        for _ in range(300):
+            result = engine.simulate_single_game(max_turn=1, target_cards=["Raichu"])
+            if "Great Ball" in result['cards_used']:
+                raichu_games += 1
+                assert "Raichu" in result['final_hand'], "Great Ball 사용 게임은 Raichu를 손에 넣어야 함"
+        print(f"1. Great Ball 사용 후 Raichu 확보 게임: {raichu_games}")
+        assert raichu_games > 0, "등록한 효과가 엔진에서 실행되어야 함"
+
+        # precondition 불충족: 덱에 Stage1이 없으면 사용하지 않고 손패에 남김
+        game_state = GameState(TEST_DECK)
+        game_state.hand = [card for card in game_state.deck if card.name == "Great Ball"][:1]
+        game_state.deck = [card for card in game_state.deck if card.card_type != "Stage1 Pokemon"
+                           and card not in game_state.hand]
+        game_state.turn = 1
+        cards_used = engine._use_draw_cards(game_state, target_cards=["Raichu"], max_turn=1)
+        print(f"2. 조건 불충족 시 사용 카드: {cards_used}, 손패: {[card.name for card in game_state.hand]}")
+        assert cards_used == [] and [card.name for card in game_state.hand] == ["Great Ball"], \
+            "precondition이 False면 카드를 손패에 남겨야 함"
+
+        # 인코딩 엔진 메서드가 없는 효과는 draw_order에 있을 때만 거부
+        try:
+            EncodedSimulationEngine(TEST_DECK, ["Great Ball"])
+            assert False, "인코딩 엔진 미지원 효과는 ValueError"
+        except ValueError as e:
+            print(f"3. 인코딩 엔진 미지원: {e}")
+        EncodedSimulationEngine(TEST_DECK, ["Poke Ball"]).simulate_single_game(max_turn=1)
+    finally:
+        unregister_effect("Great Ball")
+
+    assert "Great Ball" not in DRAW_CARDS and "Great Ball" not in EFFECT_REGISTRY, "등록 해제 후 남으면 안 됨"
+    print("✅ 새 카드 등록 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 카드 효과 레지스트리 테스트")
+    print("=" * 60)
+
+    test_builtin_registry()
+    test_register_new_card()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
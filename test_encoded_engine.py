@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+정수 인코딩 엔진(EncodedSimulationEngine) 테스트
+
+같은 난수 흐름에서 기준 엔진(SimulationEngine)과 한 게임씩 동일한 결과를 내는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import SimulationEngine, load_deck_from_file
+from encoded_engine import CardTable, EncodedGameState, EncodedSimulationEngine
+
+
+IONO_DECK = {
+    "Charizard EX": {"type": "Basic Pokemon", "count": 2},
+    "Dragonite": {"type": "Stage2 Pokemon", "count": 2},
+    "Master Ball": {"type": "Item", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Squirtle": {"type": "Basic Pokemon", "count": 2},
+    "Energy Search": {"type": "Item", "count": 2},
+    "Iono": {"type": "Supporter", "count": 2},
+    "Galdion": {"type": "Supporter", "count": 2}
+}
+
+
+def _compare_with_reference(deck_input, draw_order, num_games=300, **game_kwargs):
+    """같은 seed로 두 엔진을 실행해 결과가 다른 게임 수를 반환"""
+    reference = SimulationEngine(deck_input, draw_order)
+    encoded = EncodedSimulationEngine(deck_input, draw_order)
+    mismatches = 0
+
+    for seed in range(num_games):
+        random.seed(seed)
+        reference_result = reference.simulate_single_game(**game_kwargs)
+
+        # 두 엔진 모두 게임 상태를 재사용하므로 같은 seed면 같은 난수 흐름
+        encoded_result = encoded.simulate_single_game(rng=random.Random(seed), **game_kwargs)
+
+        if reference_result != encoded_result:
+            mismatches += 1
+
+    return mismatches
+
+
+def test_card_table():
+    """CardTable id 부여 및 변환 테스트"""
+    print("=== CardTable 테스트 ===")
+
+    table = CardTable(IONO_DECK)
+    deck = table.build_deck()
+
+    assert len(deck) == 20, "원본 덱 크기 오류"
+    assert table.names[table.id_of("Iono")] == "Iono", "id ↔ 이름 변환 오류"
+    assert table.id_of("없는 카드") == -1, "덱에 없는 카드는 -1이어야 함"
+    assert table.is_basic[table.id_of("Pikachu")], "Basic 판정 오류"
+    assert table.is_draw[table.id_of("Poke Ball")], "드로우 카드 판정 오류"
+    assert table.decode(deck[:2]) == ["Charizard EX", "Charizard EX"], "decode 오류"
+
+    print("✅ CardTable 테스트 통과!\n")
+
+
+def test_reset_reuses_arrays():
+    """리셋이 기존 리스트를 재사용하는지 테스트"""
+    print("=== 게임 리셋 테스트 ===")
+
+    state = EncodedGameState(CardTable(IONO_DECK), random.Random(0))
+    deck_list = state.deck
+    hand_list = state.hand
+
+    for _ in range(10):
+        assert state.initial_draw(), "초기 드로우 실패"
+        assert len(state.hand) == 5 and len(state.deck) == 15, "초기 드로우 장수 오류"
+        assert state.deck is deck_list and state.hand is hand_list, "리셋 시 새 리스트가 생성됨"
+        assert sorted(state.deck + state.hand) == sorted(state.original_deck), "카드 구성 불일치"
+
+    print("✅ 게임 리셋 테스트 통과!\n")
+
+
+def test_same_games_as_reference():
+    """기준 엔진과 게임 단위 일치 테스트"""
+    print("=== 기준 엔진 일치 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    draw_order = ["Poke Ball", "Professor's Research", "Pokemon Communication"]
+
+    mismatches = _compare_with_reference(deck, draw_order, max_turn=3,
+                                         target_cards=["Blacephalon", "Silvally", "BalsaMine"])
+    print(f"1. DeckList.txt 덱 (Pokemon Communication): 불일치 {mismatches}게임")
+    assert mismatches == 0, "Pokemon Communication 덱 결과 불일치"
+
+    iono_order = ["Iono", "Poke Ball", "Professor's Research", "Galdion"]
+    mismatches = _compare_with_reference(IONO_DECK, iono_order, max_turn=3,
+                                         target_cards=["Charizard EX", "Dragonite", "Master Ball"])
+    print(f"2. Iono 덱 (multi_card): 불일치 {mismatches}게임")
+    assert mismatches == 0, "Iono 덱 결과 불일치"
+
+    target_groups = [
+        {"name": "A", "target_cards": ["Charizard EX", "Master Ball"]},
+        {"name": "B", "target_cards": ["Dragonite", "Pikachu"]}
+    ]
+    mismatches = _compare_with_reference(IONO_DECK, iono_order, max_turn=2,
+                                         target_cards=["Charizard EX", "Master Ball", "Dragonite", "Pikachu"],
+                                         target_groups=target_groups)
+    print(f"3. Iono 덱 (multi_or_multi): 불일치 {mismatches}게임")
+    assert mismatches == 0, "multi_or_multi 결과 불일치"
+
+    print("✅ 기준 엔진 일치 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 정수 인코딩 엔진 테스트")
+    print("=" * 60)
+
+    test_card_table()
+    test_reset_reuses_arrays()
+    test_same_games_as_reference()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
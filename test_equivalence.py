@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+엔진 동등성 검증 하네스 테스트
+
+검정 함수가 알려진 값을 재현하는지, 최적화 엔진이 기준 엔진과 동등하다고
+판정되는지, 규칙이 다른 엔진은 EngineDivergenceError로 잡아내는지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from encoded_engine import EncodedSimulationEngine
+from equivalence import (Candidate, EngineDivergenceError, assert_equivalent, compare_engines,
+                         default_candidates, load_corpus)
+from stats_utils import chi_square_sf, chi_square_homogeneity, two_proportion_z_test, one_proportion_z_test
+
+SEARCH_DECK = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Type:Null": {"type": "Basic Pokemon", "count": 2},
+    "Silvally": {"type": "Stage1 Pokemon", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Galdion": {"type": "Supporter", "count": 2},
+    "Potion": {"type": "Item", "count": 4},
+    "Leaf": {"type": "Supporter", "count": 4}
+}
+SEARCH_ORDER = ["Poke Ball", "Galdion", "Professor's Research"]
+
+
+def _candidates(*names):
+    return [candidate for candidate in default_candidates() if candidate.name in names]
+
+
+def test_statistics():
+    """카이제곱 / 비율 검정 값 테스트"""
+    print("=== 검정 함수 테스트 ===")
+
+    assert abs(chi_square_sf(3.841458820694124, 1) - 0.05) < 1e-9, "자유도 1 임계값"
+    assert abs(chi_square_sf(18.307038053275146, 10) - 0.05) < 1e-6, "자유도 10 임계값"
+    assert abs(two_proportion_z_test(50, 100, 50, 100)[1] - 1.0) < 1e-12
+    assert two_proportion_z_test(0, 100, 0, 100) == (0.0, 1.0), "모두 실패한 두 표본은 같은 분포"
+    assert one_proportion_z_test(300, 1000, 0.3)[1] > 0.99 and one_proportion_z_test(400, 1000, 0.3)[1] < 1e-6
+
+    statistic, degrees_of_freedom, p_value = chi_square_homogeneity({'a': 500, 'b': 500, 'c': 2},
+                                                                    {'a': 500, 'b': 500, 'd': 1})
+    print(f"1. 희소 범주 병합 후 χ² = {statistic:.2f}, 자유도 {degrees_of_freedom}, p = {p_value:.3f}")
+    assert degrees_of_freedom == 1 and p_value > 0.5, "기대빈도가 작은 범주는 합쳐야 함"
+
+    print("✅ 검정 함수 테스트 통과!\n")
+
+
+def test_optimized_engines_equivalent():
+    """인코딩 / alias / 정확 계산 엔진 동등성 테스트"""
+    print("=== 최적화 엔진 동등성 테스트 ===")
+
+    corpus = load_corpus(requests=[
+        {"name": "2턴 Blacephalon + BalsaMine", "request": {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 2}},
+        {"name": "선호 Opening", "request": {"type": "preferred_opening", "preferred_basics": ["Type:Null", "Blacephalon"]}}
+    ])
+    corpus.append({'name': "서치 덱 | 2턴 Silvally + Leaf", 'deck_input': SEARCH_DECK, 'draw_order': SEARCH_ORDER,
+                   'request': {"type": "multi_card", "target_cards": ["Silvally", "Leaf"], "turn": 2}})
+
+    report = assert_equivalent(corpus, _candidates("encoded", "encoded_alias", "exact", "batch"),
+                               num_games=3000, seed=5, verbose=False)
+    exact_tests = [test for test in report['tests'] if test['candidate'] == "exact"]
+    print(f"1. 검정 {len(report['tests'])}건 모두 통과 (정확값 비교 {len(exact_tests)}건)")
+    assert len(exact_tests) == 1, "Pokemon Communication이 없는 서치 덱만 정확 계산 대상"
+    assert {test['test'] for test in report['tests']} >= {"성공률", "턴별 성공 패턴", "최종 손패 분포"}
+
+    print("✅ 최적화 엔진 동등성 테스트 통과!\n")
+
+
+def test_detects_rule_change():
+    """규칙이 다른 엔진 검출 테스트"""
+    print("=== 규칙 변경 검출 테스트 ===")
+
+    # Poke Ball 효과를 빠뜨린 엔진 (조용한 규칙 변경)
+    broken = Candidate("no_poke_ball", "game",
+                       lambda deck, order: EncodedSimulationEngine(deck, [name for name in order if name != "Poke Ball"]))
+    corpus = [{'name': "서치 덱 | 2턴 Pikachu + Type:Null", 'deck_input': SEARCH_DECK, 'draw_order': SEARCH_ORDER,
+               'request': {"type": "multi_card", "target_cards": ["Pikachu", "Type:Null"], "turn": 2}}]
+
+    report = compare_engines(corpus, [broken], num_games=3000, seed=6, verbose=False)
+    print(f"1. 기각된 검정: {[test['test'] for test in report['failures']]}")
+    try:
+        assert_equivalent(corpus, [broken], num_games=3000, seed=6, verbose=False)
+        assert False, "규칙이 다른 엔진은 EngineDivergenceError"
+    except EngineDivergenceError as e:
+        assert "no_poke_ball" in str(e)
+
+    print("✅ 규칙 변경 검출 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 엔진 동등성 검증 테스트")
+    print("=" * 60)
+
+    test_statistics()
+    test_optimized_engines_equivalent()
+    test_detects_rule_change()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Markov 연쇄 정확 계산 엔진 테스트
+
+드로우 효과가 없는 덱에서는 하이퍼지오메트릭 기대값과,
+Poke Ball / Professor's Research / Galdion 덱에서는 시뮬레이션과 일치하는지 확인합니다.
+"""
+
+import sys
+import os
+import math
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import PokemonPocketSimulator, load_deck_from_file
+from encoded_engine import EncodedSimulationEngine
+from exact_engine import ExactDrawEngine, unsupported_effects
+from test_batch_engine import NO_EFFECT_DECK
+
+
+def _galdion_deck():
+    """DeckList.txt 덱에서 Pokemon Communication을 Galdion으로 바꾼 덱"""
+    deck, _ = load_deck_from_file()
+    deck = dict(deck)
+    del deck["Pokemon Communication"]
+    deck["Galdion"] = {"type": "Supporter", "count": 2}
+    return deck
+
+
+def test_matches_hypergeometric():
+    """드로우 효과가 없는 덱에서 수학적 기대값과 일치하는지 테스트"""
+    print("=== 하이퍼지오메트릭 기대값 비교 ===")
+
+    # P(Leaf가 앞 7장에 있음 | 첫 5장에 Basic 존재), Basic 3장 / Leaf 1장
+    prob_no_basic = math.comb(17, 5) / math.comb(20, 5)
+    prob_leaf_without_basic = prob_no_basic * (5 / 17 + (12 / 17) * (2 / 15))
+    expected = (7 / 20 - prob_leaf_without_basic) / (1 - prob_no_basic)
+
+    engine = ExactDrawEngine(NO_EFFECT_DECK, [], ["Leaf"])
+    probability = engine.multi_card_probability(2)
+    print(f"1. 정확 계산: {probability:.10f} / 기대값: {expected:.10f}")
+    assert abs(probability - expected) < 1e-12, "정확 계산이 기대값과 다름"
+    assert len(engine.kinds) == 3, "목표 카드 외의 카드가 Basic / 기타 묶음으로 병합되지 않음"
+
+    assert ExactDrawEngine(NO_EFFECT_DECK, [], ["없는 카드"]).multi_card_probability(2) == 0.0, \
+        "덱에 없는 목표 카드는 확률 0이어야 함"
+
+    print("✅ 하이퍼지오메트릭 기대값 비교 통과!\n")
+
+
+def test_matches_simulation():
+    """Poke Ball / Professor's Research / Galdion 덱에서 시뮬레이션과 비교"""
+    print("=== 시뮬레이션 비교 ===")
+
+    deck = _galdion_deck()
+    draw_order = ["Poke Ball", "Professor's Research", "Galdion"]
+    target_cards = ["Blacephalon", "Silvally"]
+
+    engine = ExactDrawEngine(deck, draw_order, target_cards)
+    probability = engine.multi_card_probability(2)
+
+    random.seed(5)
+    simulation = EncodedSimulationEngine(deck, draw_order)
+    num_games = 30000
+    success_count = 0
+    for _ in range(num_games):
+        final_hand = simulation.simulate_single_game(max_turn=2, target_cards=target_cards)['final_hand']
+        success_count += all(card in final_hand for card in target_cards)
+    simulated = success_count / num_games
+    standard_error = math.sqrt(probability * (1 - probability) / num_games)
+
+    print(f"1. 정확 계산: {probability * 100:.3f}% / 시뮬레이션: {simulated * 100:.3f}% "
+          f"(상태 {engine.state_count:,}개)")
+    assert abs(simulated - probability) < 4 * standard_error, "정확 계산과 시뮬레이션 결과 불일치"
+
+    # 사용하면 손패에서 사라지는 드로우 카드는 목표로 남을 수 없음
+    assert ExactDrawEngine(deck, draw_order, ["Poke Ball"]).multi_card_probability(2) == 0.0, \
+        "드로우 순서에 있는 Poke Ball은 항상 사용되어야 함"
+
+    print("✅ 시뮬레이션 비교 통과!\n")
+
+
+def test_dispatch_and_unsupported():
+    """run_calculation 연결 및 미지원 카드 처리 테스트"""
+    print("=== 계산 경로 선택 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    assert unsupported_effects(deck, []) == ["Pokemon Communication"], "Pokemon Communication은 미지원"
+    try:
+        ExactDrawEngine(deck, [], ["Blacephalon"])
+        assert False, "미지원 카드가 있으면 오류가 발생해야 함"
+    except ValueError:
+        pass
+
+    simulator = PokemonPocketSimulator()
+    simulator.setup_simulation(_galdion_deck(), ["Poke Ball", "Professor's Research", "Galdion"])
+    request = {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 2}
+    result = simulator.run_calculation(request)
+    print(f"1. {result['calculation_method']}: {result['probability_percent']}%")
+    assert result['calculation_method'].startswith("Markov"), "정확 계산 경로를 사용해야 함"
+    assert 0 < result['raw_probability'] < 1, "확률 범위 오류"
+
+    print("✅ 계산 경로 선택 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - Markov 연쇄 정확 계산 테스트")
+    print("=" * 60)
+
+    test_matches_hypergeometric()
+    test_matches_simulation()
+    test_dispatch_and_unsupported()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
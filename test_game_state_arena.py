@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+게임 상태 재사용(스냅샷 / 복원) 테스트
+
+GameState / GameStateV3의 reset_game이 새 객체를 만들지 않고 덱 / 손패 / Field /
+Discard Pile을 원래 상태로 복원하는지, 엔진이 게임마다 같은 상태 객체를 재사용해도
+게임별 seed 결과가 매번 새로 만든 상태와 같고 같은 seed의 계산이 재현되는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import SimulationEngine, PokemonPocketSimulator, load_deck_from_file, load_test_cases_from_file
+from v3_game_state import GameStateV3
+from v3_simulation import EvolutionSimulator, place_basics
+from v3_draw_card_system import use_draw_cards_v3
+from test_v3_simulation import DECK as EVOLUTION_DECK, DRAW_ORDER as EVOLUTION_DRAW_ORDER, LINES
+
+TARGETS = ["Blacephalon", "BalsaMine"]
+
+
+def test_game_state_reset():
+    """GameState 제자리 리셋 테스트"""
+    print("=== GameState 리셋 테스트 ===")
+
+    deck, draw_order = load_deck_from_file()
+    for opening in ("mulligan", "alias"):
+        engine = SimulationEngine(deck, draw_order, opening=opening)
+        random.seed(1)
+        engine.simulate_single_game(max_turn=3, target_cards=TARGETS)
+        game_state = engine._game_state
+        deck_list, hand_list = game_state.deck, game_state.hand
+        card_ids = {id(card) for card in game_state.original_deck or game_state.card_kinds}
+        index = game_state.deck_index
+
+        for _ in range(200):
+            engine.simulate_single_game(max_turn=3, target_cards=TARGETS)
+            assert engine._game_state is game_state, "게임마다 같은 상태 객체를 재사용해야 함"
+            assert game_state.deck is deck_list, "덱 리스트를 제자리에서 복원해야 함"
+            assert {id(card) for card in game_state.deck + game_state.hand} <= card_ids, "Card 객체를 새로 만들면 안 됨"
+
+        game_state.reset_game()
+        assert game_state.hand is hand_list and not game_state.hand and game_state.turn == 0
+        if opening == "mulligan":
+            assert sorted(card.name for card in game_state.deck) == sorted(card.name for card in game_state.original_deck)
+        assert game_state._deck_index is None, "리셋 후 색인은 다시 필요할 때 재구성"
+        assert game_state.deck_index is index, "색인 객체는 재사용"
+        print(f"1. {opening}: 201게임 동안 상태 / 덱 리스트 / 색인 객체 재사용")
+
+    print("✅ GameState 리셋 테스트 통과!\n")
+
+
+def test_engine_results_unchanged():
+    """재사용 상태 = 게임마다 새로 만든 상태 (게임별 seed), 같은 seed 계산 재현"""
+    print("=== 엔진 결과 일치 테스트 ===")
+
+    deck, draw_order = load_deck_from_file()
+    for opening in ("mulligan", "alias"):
+        reused = SimulationEngine(deck, draw_order, opening=opening)
+        fresh = SimulationEngine(deck, draw_order, opening=opening)
+        for seed in range(500):
+            expected = fresh.simulate_single_game(max_turn=3, target_cards=TARGETS, rng=random.Random(seed))
+            fresh._game_state = None  # 다음 게임은 새 상태로
+            actual = reused.simulate_single_game(max_turn=3, target_cards=TARGETS, rng=random.Random(seed))
+            assert actual['final_hand'] == expected['final_hand'], f"seed {seed}: 결과 불일치"
+        print(f"1. {opening}: 게임별 seed 500게임 결과 일치")
+
+    _, draw_order, _ = load_test_cases_from_file()
+    simulator = PokemonPocketSimulator()
+    assert simulator.setup_simulation(deck, draw_order)
+    request = {"type": "preferred_opening", "preferred_basics": ["Blacephalon"]}
+    first = simulator.prob_calculator.run_calculation(request, 2000, use_mathematical=False, seed=9)
+    again = simulator.prob_calculator.run_calculation(request, 2000, use_mathematical=False, seed=9)
+    print(f"2. 같은 seed 재실행: {first['probability_percent']:.2f}% = {again['probability_percent']:.2f}%")
+    assert first['success_count'] == again['success_count'], "상태를 재사용해도 같은 seed는 같은 결과"
+
+    print("✅ 엔진 결과 일치 테스트 통과!\n")
+
+
+def test_v3_reset():
+    """GameStateV3 덱 / Field / Discard Pile 복원 테스트"""
+    print("=== GameStateV3 리셋 테스트 ===")
+
+    game_state = GameStateV3(EVOLUTION_DECK, EVOLUTION_DRAW_ORDER, evolution_lines=LINES, rng=random.Random(4))
+    original_names = sorted(card.name for card in game_state.deck)
+    active, bench = game_state.field.active, list(game_state.field.bench)
+
+    played = 0
+    for _ in range(50):
+        game_state.reset_game()
+        game_state.shuffle_deck()
+        if not game_state.initial_draw():
+            continue
+        place_basics(game_state)
+        for _ in range(3):
+            game_state.start_turn()
+            use_draw_cards_v3(game_state, EVOLUTION_DRAW_ORDER, ["Charizard"])
+            place_basics(game_state)
+        played += bool(game_state.discard_pile)
+    assert played > 0, "드로우 카드 사용으로 Discard Pile이 채워진 게임이 있어야 함"
+
+    game_state.field.resize_bench(5)
+    game_state.reset_game()
+    field = game_state.field
+    print(f"1. 리셋 후 Deck {len(game_state.deck)}장, Hand {len(game_state.hand)}장, Discard {len(game_state.discard_pile)}장")
+    assert sorted(card.name for card in game_state.deck) == original_names, "덱 구성 복원"
+    assert not game_state.hand and not game_state.discard_pile and not game_state.newly_placed_pokemon
+    assert game_state.turn == 0 and not game_state.supporter_used
+    assert field.active is active and field.bench == bench and field.bench_limit == 3, "처음 슬롯 객체로 복원"
+    assert all(slot.is_empty() and slot.can_evolve and slot.attached_tool is None for slot in [active] + bench)
+    print("2. Field (Active / 벤치 3칸) 빈 슬롯으로 복원")
+
+    print("✅ GameStateV3 리셋 테스트 통과!\n")
+
+
+def test_evolution_simulator_reuse():
+    """EvolutionSimulator 상태 재사용 = 게임마다 새 상태 (게임별 seed)"""
+    print("=== 진화 시뮬레이터 상태 재사용 테스트 ===")
+
+    for opening in ("mulligan", "alias"):
+        reused = EvolutionSimulator(EVOLUTION_DECK, EVOLUTION_DRAW_ORDER, ["Charizard"], LINES, opening=opening)
+        fresh = EvolutionSimulator(EVOLUTION_DECK, EVOLUTION_DRAW_ORDER, ["Charizard"], LINES, opening=opening)
+        first_state = None
+        for seed in range(400):
+            expected = fresh.simulate_single_game(4, rng=random.Random(seed))
+            fresh._game_state = None
+            actual = reused.simulate_single_game(4, rng=random.Random(seed))
+            assert actual == expected, f"seed {seed}: 결과 불일치"
+            first_state = first_state or reused._game_state
+            assert reused._game_state is first_state
+        print(f"1. {opening}: 게임별 seed 400게임 결과 일치, 상태 객체 1개")
+
+    print("✅ 진화 시뮬레이터 상태 재사용 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 게임 상태 재사용 테스트")
+    print("=" * 60)
+
+    test_game_state_reset()
+    test_engine_results_unchanged()
+    test_v3_reset()
+    test_evolution_simulator_reuse()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
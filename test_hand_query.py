@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+손패 조건 질의(hand_query) 테스트
+
+질의 DSL이 all / any / none / and / or 의미대로 컴파일되는지, 계산 요청을 컴파일한
+id 기반 / 카드명 기반 판정이 직접 구현한 판정과 무작위 손패에서 모두 같은지,
+목표 카드 4개 이상 요청이 검증을 통과하고 계산되는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from hand_query import compile_query, compile_request
+from encoded_engine import CardTable
+from main_simulator import PokemonPocketSimulator, load_deck_from_file, load_test_cases_from_file
+
+IDS = {"A": 0, "B": 1, "C": 2, "D": 3}
+
+
+def test_query_dsl():
+    """질의 DSL 의미 테스트"""
+    print("=== 질의 DSL 테스트 ===")
+
+    query = compile_query({"and": [{"any": ["A", "B"]}, {"none": ["C"]},
+                                   {"or": [{"all": ["D"]}, {"all": ["A", "B"]}]}]}, IDS.get)
+    print(f"1. 절 {len(query.clauses)}개: {query.clauses}")
+    cases = {(0, 3): True, (0, 1): True, (0, 2, 3): False, (3,): False, (1, 3, 3): True, (): False}
+    for hand, expected in cases.items():
+        assert query(list(hand)) is expected, f"{hand}: {expected}가 나와야 함"
+
+    assert not compile_query({"all": ["A", "Z"]}, IDS.get)([0, 1]), "덱에 없는 카드가 all에 있으면 항상 거짓"
+    assert compile_query({"any": ["A", "Z"]}, IDS.get)([0]), "any / none에서는 덱에 없는 카드 무시"
+    assert not compile_query({"any": ["Z"]}, IDS.get)([0]) and compile_query({"none": ["Z"]}, IDS.get)([0])
+    assert compile_query({"all": []}, IDS.get)([]), "빈 all은 항상 참"
+    assert compile_query({"and": [{"all": ["A"]}, {"none": ["A"]}]}, IDS.get).clauses == [], "모순인 절은 제거"
+    print("2. 덱에 없는 카드 / 빈 목록 / 모순 처리 확인")
+
+    for invalid in ({"every": ["A"]}, {"all": "A"}, {"all": ["A"], "any": ["B"]}):
+        try:
+            compile_query(invalid, IDS.get)
+        except ValueError as e:
+            print(f"3. {invalid}: {e}")
+        else:
+            assert False, f"{invalid}는 ValueError가 나야 함"
+
+    print("✅ 질의 DSL 테스트 통과!\n")
+
+
+def _reference_success(request, basics, opening_hand, final_hand):
+    """카드명 리스트 탐색으로 직접 구현한 성공 판정"""
+    calc_type = request['type']
+    basics_in_opening = [card for card in opening_hand if card in basics]
+    if calc_type in ('preferred_opening', 'preferred_and_multi'):
+        pool = basics_in_opening if calc_type == 'preferred_and_multi' else opening_hand
+        if not any(card in pool for card in request['preferred_basics']):
+            return False
+    if calc_type in ('non_preferred_opening', 'non_preferred_and_multi'):
+        if not basics_in_opening or not all(card in request['non_preferred_basics'] for card in basics_in_opening):
+            return False
+    if calc_type == 'multi_or_multi':
+        return any(all(card in final_hand for card in group['target_cards']) for group in request['target_groups'])
+    if calc_type in ('multi_card', 'preferred_and_multi', 'non_preferred_and_multi'):
+        return all(card in final_hand for card in request['target_cards'])
+    return True
+
+
+def test_compiled_requests():
+    """계산 요청 컴파일 결과 = 직접 판정 (무작위 손패)"""
+    print("=== 계산 요청 컴파일 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    table = CardTable(deck)
+    names = list(deck)
+    basics = [name for name, basic in zip(table.names, table.is_basic) if basic]
+    requests = [
+        {"type": "preferred_opening", "preferred_basics": basics[:1] + ["Mew"]},
+        {"type": "non_preferred_opening", "non_preferred_basics": basics[:1]},
+        {"type": "multi_card", "target_cards": names[:6]},
+        {"type": "multi_card", "target_cards": [names[0], "Mew"]},
+        {"type": "preferred_and_multi", "preferred_basics": basics[:1] + names[-1:], "target_cards": names[2:4]},
+        {"type": "non_preferred_and_multi", "non_preferred_basics": basics, "target_cards": names[5:6]},
+        {"type": "multi_or_multi", "target_groups": [{"target_cards": names[i:i + 3]} for i in range(0, 9, 3)]}
+    ]
+
+    rng = random.Random(5)
+    hands = []
+    for _ in range(3000):
+        deck_list = table.build_deck()
+        rng.shuffle(deck_list)
+        hands.append((deck_list[:5], deck_list[:rng.randint(5, 10)]))
+
+    for request in requests:
+        id_queries = compile_request(request, table.ids.get, basics)
+        name_queries = compile_request(request, lambda name: name if name in deck else None, basics)
+        successes = 0
+        for opening_ids, final_ids in hands:
+            opening_names, final_names = table.decode(opening_ids), table.decode(final_ids)
+            expected = _reference_success(request, basics, opening_names, final_names)
+            for (opening_query, final_query), opening, final in ((id_queries, opening_ids, final_ids),
+                                                                 (name_queries, opening_names, final_names)):
+                actual = ((opening_query is None or opening_query(opening))
+                          and (final_query is None or final_query(final)))
+                assert actual == expected, f"{request}: {opening_names} / {final_names}"
+            successes += expected
+        print(f"  {request['type']}: 성공 {successes:,} / {len(hands):,}")
+
+    print("✅ 계산 요청 컴파일 테스트 통과!\n")
+
+
+def test_many_targets():
+    """목표 카드 4개 이상 요청 테스트"""
+    print("=== 목표 카드 개수 제한 해제 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    _, draw_order, _ = load_test_cases_from_file()
+    simulator = PokemonPocketSimulator()
+    assert simulator.setup_simulation(deck, draw_order, engine="encoded")
+    targets = list(deck)[:5]
+    request = {"type": "multi_card", "target_cards": targets, "turn": 3}
+    assert simulator.validate_calculation_request(request), "목표 카드 5개 요청도 유효"
+
+    result = simulator.run_calculation(request, 2000, seed=3)
+    print(f"1. {', '.join(targets)} (3턴): {result['probability_percent']:.2f}%")
+    assert result is not None and result['card_count'] == 5
+
+    fewer = simulator.run_calculation({"type": "multi_card", "target_cards": targets[:2], "turn": 3}, 2000, seed=3)
+    print(f"2. 앞의 2개만: {fewer['probability_percent']:.2f}%")
+    assert result['probability_percent'] < fewer['probability_percent'], "목표 카드가 많으면 확률이 낮아야 함"
+
+    print("✅ 목표 카드 개수 제한 해제 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 손패 조건 질의 테스트")
+    print("=" * 60)
+
+    test_query_dsl()
+    test_compiled_requests()
+    test_many_targets()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+multi_card 수학적 계산(포함-배제) 테스트
+
+드로우 효과가 없는 덱에서 포함-배제 공식이 Markov 연쇄 정확 계산과
+일치하는지, run_calculation이 자동으로 이 경로를 선택하는지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import PokemonPocketSimulator, SimulationEngine
+from probability_calculator import ProbabilityCalculator
+from exact_engine import ExactDrawEngine
+from test_batch_engine import NO_EFFECT_DECK
+
+
+def test_matches_exact_engine():
+    """여러 목표 조합 / 턴에서 Markov 연쇄 결과와 비교"""
+    print("=== 포함-배제 공식 vs Markov 연쇄 ===")
+
+    calculator = ProbabilityCalculator(SimulationEngine(NO_EFFECT_DECK, []))
+    cases = [
+        (["Leaf"], 2),
+        (["Pikachu", "Raichu"], 3),
+        (["Pikachu", "Magnemite", "Sabrina"], 1),
+        (["Raichu", "Potion", "Switch"], 5),
+        (["Magnemite"], 0),
+    ]
+
+    for index, (target_cards, max_turn) in enumerate(cases, 1):
+        closed_form = calculator.calculate_multi_card_mathematical(target_cards, max_turn)['raw_probability']
+        exact = ExactDrawEngine(NO_EFFECT_DECK, [], target_cards).multi_card_probability(max_turn)
+        print(f"{index}. {target_cards} {max_turn}턴: {closed_form:.10f} / {exact:.10f}")
+        assert abs(closed_form - exact) < 1e-12, "포함-배제 결과가 정확 계산과 다름"
+
+    missing = calculator.calculate_multi_card_mathematical(["Leaf", "없는 카드"], 2)
+    assert missing['raw_probability'] == 0.0, "덱에 없는 목표 카드는 확률 0이어야 함"
+
+    print("✅ 포함-배제 공식 비교 통과!\n")
+
+
+def test_dispatch():
+    """드로우 카드 발동 여부에 따른 계산 경로 선택 테스트"""
+    print("=== 계산 경로 선택 테스트 ===")
+
+    request = {"type": "multi_card", "target_cards": ["Leaf", "Pikachu"], "turn": 2}
+
+    simulator = PokemonPocketSimulator()
+    simulator.setup_simulation(NO_EFFECT_DECK, [])
+    result = simulator.run_calculation(request)
+    print(f"1. 드로우 순서 없음: {result['calculation_method']}")
+    assert result['calculation_method'].startswith("Multivariate"), "포함-배제 경로를 사용해야 함"
+
+    simulator.setup_simulation(NO_EFFECT_DECK, ["Poke Ball"])
+    result = simulator.run_calculation(request)
+    print(f"2. Poke Ball 발동: {result['calculation_method']}")
+    assert result['calculation_method'].startswith("Markov"), "드로우 카드가 발동되면 포함-배제를 쓰면 안 됨"
+
+    print("✅ 계산 경로 선택 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - multi_card 수학적 계산 테스트")
+    print("=" * 60)
+
+    test_matches_exact_engine()
+    test_dispatch()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+멀리건 없는 시작 손패 샘플러(alias 테이블) 테스트
+
+alias 테이블이 조합 확률을 정확히 재현하는지, alias 방식 엔진이
+기존 멀리건 방식과 같은 분포의 게임을 만드는지 확인합니다.
+"""
+
+import sys
+import os
+import math
+import time
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import SimulationEngine, load_deck_from_file
+from encoded_engine import EncodedSimulationEngine
+from probability_calculator import ProbabilityCalculator
+from opening_sampler import OpeningSampler, build_alias_table
+
+# Basic 1장 덱: 멀리건 방식은 시작 손패마다 평균 4번 셔플
+BASIC_LIGHT_DECK = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 1},
+    "Raichu": {"type": "Stage1 Pokemon", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Potion": {"type": "Item", "count": 3},
+    "Switch": {"type": "Item", "count": 3},
+    "Giant Cape": {"type": "Pokemon Tool", "count": 3},
+    "Leaf": {"type": "Supporter", "count": 2},
+    "Red Card": {"type": "Item", "count": 2}
+}
+
+
+def _count(engine, target_cards, num_games, seed):
+    random.seed(seed)
+    calculator = ProbabilityCalculator(engine)
+    return calculator.simulate_counts({"type": "multi_card", "target_cards": target_cards, "turn": 2}, num_games)
+
+
+def test_alias_table():
+    """alias 테이블 / 조합 분포 정확성 테스트"""
+    print("=== alias 테이블 테스트 ===")
+
+    probabilities = [0.5, 0.2, 0.15, 0.1, 0.05]
+    accept, alias = build_alias_table(probabilities)
+    for index, probability in enumerate(probabilities):
+        reconstructed = (accept[index] + sum(1 - accept[other] for other in range(len(alias))
+                                             if alias[other] == index and other != index)) / len(probabilities)
+        assert abs(reconstructed - probability) < 1e-12, "alias 테이블이 확률을 재현하지 못함"
+
+    sampler = OpeningSampler([1, 2, 2, 3, 3, 3, 2, 2, 2], [True] + [False] * 8)
+    expected_no_basic = math.comb(19, 5) / math.comb(20, 5)
+    print(f"1. 조합 {len(sampler.openings):,}개, P(Basic 없음) = {sampler.no_basic_probability:.6f}")
+    assert abs(sampler.no_basic_probability - expected_no_basic) < 1e-12, "Basic 없는 확률 오류"
+    assert abs(sum(sampler.probabilities) - 1) < 1e-12, "조건부 확률 합은 1"
+
+    rng = random.Random(1)
+    for _ in range(200):
+        hand, deck = sampler.sample(rng)
+        assert len(hand) == 5 and len(deck) == 15 and 0 in hand, "시작 손패에 Basic이 있어야 함"
+        assert sorted(hand + deck) == sorted(sum(([card_id] * count for card_id, count in enumerate(sampler.counts)), [])), \
+            "덱 구성이 보존되어야 함"
+
+    assert not OpeningSampler([10, 10], [False, False]).valid, "Basic이 없는 덱은 항상 무효"
+
+    print("✅ alias 테이블 테스트 통과!\n")
+
+
+def test_matches_mulligan():
+    """alias 방식과 멀리건 방식 엔진의 결과 분포 비교"""
+    print("=== 멀리건 방식과 분포 비교 ===")
+
+    # 드로우 효과 없음: 포함-배제 정확값과 비교
+    no_effect = EncodedSimulationEngine(BASIC_LIGHT_DECK, [], opening="alias")
+    exact = ProbabilityCalculator(no_effect).calculate_multi_card_mathematical(["Raichu", "Leaf"], 2)['raw_probability']
+    success, valid = _count(no_effect, ["Raichu", "Leaf"], 30000, 1)
+    standard_error = math.sqrt(exact * (1 - exact) / valid)
+    print(f"1. Basic 1장 덱: alias {success / valid * 100:.2f}% / 정확값 {exact * 100:.2f}%")
+    assert valid == 30000, "alias 방식은 무효 게임이 없어야 함"
+    assert abs(success / valid - exact) < 4 * standard_error, "alias 방식 결과가 정확값과 다름"
+
+    # Pokemon Communication(손패 순서에 의존) 덱: 두 방식 비교
+    deck, draw_order = load_deck_from_file()
+    target_cards = ["Blacephalon", "BalsaMine"]
+    for engine_class in (EncodedSimulationEngine, SimulationEngine):
+        num_games = 20000 if engine_class is EncodedSimulationEngine else 5000
+        alias_success, alias_valid = _count(engine_class(deck, draw_order, opening="alias"), target_cards, num_games, 2)
+        mulligan_success, mulligan_valid = _count(engine_class(deck, draw_order), target_cards, num_games, 3)
+        p_alias = alias_success / alias_valid
+        p_mulligan = mulligan_success / mulligan_valid
+        pooled = (alias_success + mulligan_success) / (alias_valid + mulligan_valid)
+        standard_error = math.sqrt(pooled * (1 - pooled) * (1 / alias_valid + 1 / mulligan_valid))
+        print(f"2. {engine_class.__name__}: alias {p_alias * 100:.2f}% / 멀리건 {p_mulligan * 100:.2f}%")
+        assert abs(p_alias - p_mulligan) < 4 * standard_error, "alias 방식과 멀리건 방식의 분포가 다름"
+
+    print("✅ 멀리건 방식과 분포 비교 통과!\n")
+
+
+def test_speed():
+    """Basic이 적은 덱에서 처리량 비교"""
+    print("=== Basic 1장 덱 처리량 ===")
+
+    for opening in ("mulligan", "alias"):
+        engine = EncodedSimulationEngine(BASIC_LIGHT_DECK, ["Poke Ball", "Professor's Research"], opening=opening)
+        start = time.perf_counter()
+        _count(engine, ["Raichu"], 20000, 4)
+        elapsed = time.perf_counter() - start
+        print(f"  {opening}: {20000 / elapsed:,.0f}게임/초")
+
+    print("✅ 처리량 측정 완료!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 시작 손패 샘플러 테스트")
+    print("=" * 60)
+
+    test_alias_table()
+    test_matches_mulligan()
+    test_speed()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
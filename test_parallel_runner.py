@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+병렬 Monte Carlo 실행 테스트
+
+워커 seed 파생, 시뮬레이션 분할, 병렬 결과 합산과 재현성을 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import PokemonPocketSimulator, load_deck_from_file
+from parallel_runner import spawn_seeds, split_simulations
+
+
+def test_seed_and_split():
+    """seed 파생 및 시뮬레이션 분할 테스트"""
+    print("=== seed 파생 / 분할 테스트 ===")
+
+    seeds = spawn_seeds(42, 4)
+    assert seeds == spawn_seeds(42, 4), "같은 root seed는 같은 하위 seed를 만들어야 함"
+    assert len(set(seeds)) == 4, "하위 seed가 중복됨"
+    assert seeds[:2] == spawn_seeds(42, 2), "워커 수와 무관하게 앞쪽 seed는 같아야 함"
+    assert spawn_seeds(43, 4) != seeds, "다른 root seed는 다른 하위 seed를 만들어야 함"
+
+    shards = split_simulations(10001, 4)
+    print(f"1. 10,001회 분할: {shards}")
+    assert sum(shards) == 10001 and max(shards) - min(shards) <= 1, "분할 오류"
+
+    print("✅ seed 파생 / 분할 테스트 통과!\n")
+
+
+def test_parallel_calculation():
+    """병렬 계산 결과 합산 및 재현성 테스트"""
+    print("=== 병렬 계산 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    draw_order = ["Poke Ball", "Professor's Research", "Pokemon Communication"]
+    request = {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 3}
+
+    simulator = PokemonPocketSimulator()
+    simulator.setup_simulation(deck, draw_order, engine="encoded")
+
+    first = simulator.run_calculation(request, 4000, workers=3, seed=2025)
+    second = simulator.run_calculation(request, 4000, workers=3, seed=2025)
+
+    print(f"1. 병렬 결과: {first['probability_percent']:.2f}% ({first['success_count']}/{first['total_valid_games']})")
+    assert first['simulation_count'] == 4000, "시뮬레이션 횟수 합산 오류"
+    assert first['total_valid_games'] == 4000, "유효 게임 수 합산 오류"
+    assert first['workers'] == 3 and first['seed'] == 2025, "병렬 실행 정보 누락"
+    assert first['success_count'] == second['success_count'], "같은 seed의 병렬 결과가 재현되지 않음"
+
+    single = simulator.run_calculation(request, 4000, seed=2025)
+    print(f"2. 단일 프로세스 결과: {single['probability_percent']:.2f}%")
+    assert abs(single['probability_percent'] - first['probability_percent']) < 5.0, "단일/병렬 결과 차이가 너무 큼"
+
+    print("✅ 병렬 계산 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 병렬 실행 테스트")
+    print("=" * 60)
+
+    test_seed_and_split()
+    test_parallel_calculation()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
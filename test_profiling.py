@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+단계별 프로파일링 테스트
+
+profile_phases() 안에서 단계별 호출 횟수와 호출 스택이 기록되고,
+context를 벗어나면 원래 함수로 복원되는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import SimulationEngine, load_deck_from_file
+from card_effects import CardEffects
+from encoded_engine import EncodedSimulationEngine
+from profiling import profile_phases
+import v3_draw_card_system
+from benchmarks.cases import _v3_state, EVOLUTION_DRAW_ORDER, EVOLUTION_TARGETS
+
+
+def test_engine_phases():
+    """기준 엔진 / 인코딩 엔진 단계별 호출 횟수 테스트"""
+    print("=== 엔진 단계별 프로파일 테스트 ===")
+
+    deck, draw_order = load_deck_from_file()
+    original_poke_ball = CardEffects.__dict__['poke_ball']
+
+    random.seed(7)
+    with profile_phases() as profiler:
+        engine = SimulationEngine(deck, draw_order)
+        results = [engine.simulate_single_game(max_turn=2, target_cards=["Blacephalon"]) for _ in range(300)]
+        encoded = EncodedSimulationEngine(deck, draw_order)
+        for _ in range(300):
+            encoded.simulate_single_game(max_turn=2, target_cards=["Blacephalon"])
+
+    stats = {row['phase']: row for row in profiler.rows()}
+    valid_games = sum(result['success'] for result in results)
+    print(f"1. 기록된 단계: {len(stats)}개, GameState.start_turn {stats['GameState.start_turn']['calls']}회")
+    assert stats['GameState.initial_draw']['calls'] == 300, "게임마다 initial_draw 1회"
+    assert stats['GameState.start_turn']['calls'] == 2 * valid_games, "유효 게임마다 턴 수만큼 start_turn"
+    assert stats['EncodedGameState.initial_draw']['calls'] == 300, "인코딩 엔진 initial_draw 누락"
+    assert 'EncodedSimulationEngine._poke_ball' in stats, "context 안에서 만든 인코딩 엔진은 효과별로 측정되어야 함"
+
+    assert "SimulationEngine._use_draw_cards;CardEffects.poke_ball" in profiler.collapsed, \
+        "카드 효과는 _use_draw_cards 아래 스택으로 기록되어야 함"
+    assert CardEffects.__dict__['poke_ball'] is original_poke_ball, "context 종료 후 원래 함수로 복원되어야 함"
+
+    path = os.path.join(tempfile.mkdtemp(), "profile.folded")
+    profiler.write_collapsed(path)
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    print(f"2. collapsed stack: {len(lines)}줄 (예: {lines[0]})")
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines), "collapsed 형식은 '스택 정수값'"
+
+    print("✅ 엔진 단계별 프로파일 테스트 통과!\n")
+
+
+def test_v3_phases():
+    """v3 드로우 카드 / 진화 파이프라인 프로파일 테스트"""
+    print("=== v3 파이프라인 프로파일 테스트 ===")
+
+    random.seed(3)
+    states = [_v3_state(2) for _ in range(100)]
+    with profile_phases() as profiler:
+        for game_state in states:
+            v3_draw_card_system.use_draw_cards_v3(game_state, EVOLUTION_DRAW_ORDER, EVOLUTION_TARGETS)
+
+    stats = {row['phase']: row for row in profiler.rows()}
+    print(f"1. use_draw_cards_v3 {stats['use_draw_cards_v3']['calls']}회, auto_evolve_all {stats['auto_evolve_all']['calls']}회")
+    assert stats['use_draw_cards_v3']['calls'] == 100, "use_draw_cards_v3 호출 횟수 오류"
+    assert stats['auto_evolve_all']['calls'] >= 100, "턴 마지막 진화 체크는 항상 실행"
+    assert "use_draw_cards_v3;auto_evolve_all" in profiler.collapsed, "진화 체크는 드로우 카드 사용 아래 스택"
+
+    try:
+        with profile_phases():
+            with profile_phases():
+                pass
+        assert False, "중첩 프로파일링은 오류가 발생해야 함"
+    except RuntimeError:
+        pass
+
+    print("✅ v3 파이프라인 프로파일 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 단계별 프로파일링 테스트")
+    print("=" * 60)
+
+    test_engine_phases()
+    test_v3_phases()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
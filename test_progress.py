@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+진행률 / 처리량 reporter 테스트
+
+ProgressTracker의 시간 기준 throttle과 JSON Lines reporter 출력,
+ProbabilityCalculator의 기본(무출력) reporter 동작을 확인합니다.
+"""
+
+import sys
+import os
+import io
+import json
+import random
+from contextlib import redirect_stdout
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import load_deck_from_file
+from encoded_engine import EncodedSimulationEngine
+from probability_calculator import ProbabilityCalculator
+from progress import ProgressReporter, ProgressTracker, JsonLinesProgressReporter, ConsoleProgressReporter
+
+
+class RecordingReporter(ProgressReporter):
+    def __init__(self):
+        self.updates = []
+
+    def report(self, update):
+        self.updates.append(update)
+
+
+def test_tracker_throttle():
+    """가짜 시계로 throttle / 처리량 / ETA 계산 테스트"""
+    print("=== ProgressTracker throttle 테스트 ===")
+
+    now = [0.0]
+    reporter = RecordingReporter()
+    tracker = ProgressTracker(reporter, 'multi_card', 10000, min_interval=1.0, clock=lambda: now[0])
+
+    for _ in range(10):
+        now[0] += 0.25
+        tracker.advance(1000, 300, 990)
+    tracker.finish()
+
+    # 0.25초(첫 보고), 1.25초, 2.25초 + 완료 보고
+    print(f"1. 보고 횟수: {len(reporter.updates)}회")
+    assert len(reporter.updates) == 4, "min_interval 간격으로만 보고해야 함"
+
+    first = reporter.updates[0]
+    assert first.games_completed == 1000 and first.games_per_second == 4000, "처리량 계산 오류"
+    assert abs(first.eta_seconds - 9000 / 4000) < 1e-9, "ETA 계산 오류"
+
+    last = reporter.updates[-1]
+    low, high = last.interval_percent
+    print(f"2. 완료: {last.games_completed:,}게임, 추정 {last.estimate_percent:.2f}% [{low:.2f}~{high:.2f}]")
+    assert last.finished and last.eta_seconds == 0, "완료 보고 오류"
+    assert last.success_count == 3000 and last.total_valid_games == 9900, "누적 집계 오류"
+    assert low < last.estimate_percent < high, "신뢰구간이 추정치를 포함해야 함"
+
+    print("✅ ProgressTracker throttle 테스트 통과!\n")
+
+
+def test_calculator_reporters():
+    """ProbabilityCalculator의 reporter 연결 테스트"""
+    print("=== 계산기 reporter 테스트 ===")
+
+    deck, draw_order = load_deck_from_file()
+    request = ["Blacephalon", "BalsaMine"]
+
+    # 기본 reporter는 진행 상황을 출력하지 않음
+    calculator = ProbabilityCalculator(EncodedSimulationEngine(deck, draw_order))
+    output = io.StringIO()
+    with redirect_stdout(output):
+        calculator.calculate_multi_card_probability(request, 2, 3000)
+    assert "진행률" not in output.getvalue(), "기본 reporter는 아무것도 출력하지 않아야 함"
+
+    stream = io.StringIO()
+    calculator = ProbabilityCalculator(EncodedSimulationEngine(deck, draw_order), JsonLinesProgressReporter(stream))
+    calculator.progress_interval = 0.0
+    random.seed(1)
+    with redirect_stdout(io.StringIO()):
+        result = calculator.calculate_multi_card_probability(request, 2, 3000)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    print(f"1. JSON Lines 기록: {len(records)}줄, 마지막 {records[-1]['event']}")
+    assert [record['event'] for record in records] == ['progress'] * 3 + ['finished'], "chunk마다 보고 + 완료 보고"
+    assert records[-1]['games_completed'] == 3000, "완료 게임 수 오류"
+    assert records[-1]['success_count'] == result['success_count'], "reporter 집계가 결과와 다름"
+    assert records[-1]['calculation_type'] == 'multi_card', "계산 타입 누락"
+
+    output = io.StringIO()
+    ConsoleProgressReporter(output).report(calculator._progress_tracker({'type': 'multi_card'}, 10)._update(1.0, False))
+    print(f"2. 콘솔 출력: {output.getvalue().strip()}")
+    assert output.getvalue().startswith("진행률: 0.0%"), "콘솔 출력 형식 오류"
+
+    print("✅ 계산기 reporter 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 진행률 reporter 테스트")
+    print("=" * 60)
+
+    test_tracker_throttle()
+    test_calculator_reporters()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+계산 결과 영구 캐시 테스트
+
+캐시 키가 요청 키 순서와 무관하고 덱 / seed가 다르면 달라지는지,
+LRU / 크기 한도로 오래된 항목이 삭제되는지, run_calculation이 seed가 같은
+두 번째 계산과 정확 계산을 캐시에서 재사용하는지 확인합니다.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import PokemonPocketSimulator, load_deck_from_file, load_test_cases_from_file
+from result_cache import ResultCache, make_cache_key
+
+MULTI_REQUEST = {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 2}
+
+
+def test_cache_key():
+    """캐시 키 정규화 테스트"""
+    print("=== 캐시 키 테스트 ===")
+
+    deck, draw_order = load_deck_from_file()
+    key = make_cache_key(deck, draw_order, MULTI_REQUEST, seed=1, simulation_count=1000, workers=1)
+    reordered = {"turn": 2, "target_cards": ["Blacephalon", "BalsaMine"], "type": "multi_card"}
+    assert key == make_cache_key(deck, draw_order, reordered, seed=1, simulation_count=1000, workers=1), \
+        "요청 키 순서가 달라도 같은 키"
+
+    reversed_deck = dict(reversed(list(deck.items())))
+    different = [
+        make_cache_key(deck, draw_order, MULTI_REQUEST, seed=2, simulation_count=1000, workers=1),
+        make_cache_key(deck, draw_order, MULTI_REQUEST, seed=1, simulation_count=2000, workers=1),
+        make_cache_key(deck, draw_order[::-1], MULTI_REQUEST, seed=1, simulation_count=1000, workers=1),
+        make_cache_key(reversed_deck, draw_order, MULTI_REQUEST, seed=1, simulation_count=1000, workers=1),
+        make_cache_key(deck, draw_order, MULTI_REQUEST, seed=1, simulation_count=1000, workers=1, opening="alias")
+    ]
+    print(f"1. 키: {key[:16]}...")
+    assert key not in different and len(set(different)) == len(different), "결과에 영향을 주는 입력은 키를 바꿔야 함"
+
+    print("✅ 캐시 키 테스트 통과!\n")
+
+
+def test_eviction():
+    """LRU / 크기 한도 삭제 테스트"""
+    print("=== 캐시 삭제 정책 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResultCache(os.path.join(temp_dir, "cache.sqlite3"), max_entries=3)
+        for name in "abc":
+            cache.put(name, {'name': name})
+        assert cache.get("a") == {'name': "a"}, "저장한 결과 그대로 조회"
+        cache.put("d", {'name': "d"})
+        print(f"1. 항목 4개 저장 (한도 3개, a 조회 후): {cache.stats()}")
+        assert cache.get("b") is None, "가장 오래 사용하지 않은 b가 삭제되어야 함"
+        assert all(cache.get(name) is not None for name in "acd")
+
+        sized = ResultCache(os.path.join(temp_dir, "sized.sqlite3"), max_bytes=100)
+        for index in range(5):
+            sized.put(str(index), {'payload': "x" * 30})
+        stats = sized.stats()
+        print(f"2. 크기 한도 100바이트: {stats}")
+        assert stats['bytes'] <= 100 and sized.get("4") is not None and sized.get("0") is None, \
+            "크기 한도를 넘으면 오래된 항목부터 삭제"
+
+        sized.put("big", {'payload': "x" * 200})
+        assert sized.get("big") is None, "한도보다 큰 결과는 저장하지 않음"
+
+    print("✅ 캐시 삭제 정책 테스트 통과!\n")
+
+
+def test_run_calculation_uses_cache():
+    """run_calculation 캐시 재사용 테스트"""
+    print("=== run_calculation 캐시 재사용 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    _, draw_order, _ = load_test_cases_from_file()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResultCache(os.path.join(temp_dir, "cache.sqlite3"))
+        simulator = PokemonPocketSimulator(result_cache=cache)
+        assert simulator.setup_simulation(deck, draw_order)
+
+        first = simulator.run_calculation(MULTI_REQUEST, 1000, seed=7)
+        calls = []
+        original = simulator.prob_calculator.run_calculation
+        simulator.prob_calculator.run_calculation = lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs)
+
+        second = simulator.run_calculation(MULTI_REQUEST, 1000, seed=7)
+        print(f"1. seed 7 두 번째 계산: {second['probability_percent']:.2f}% (재계산 {len(calls)}회)")
+        assert second == first and not calls, "같은 seed의 두 번째 계산은 캐시에서 재사용"
+
+        simulator.run_calculation(MULTI_REQUEST, 1000, seed=8)
+        simulator.run_calculation(MULTI_REQUEST, 1000)
+        simulator.run_calculation(MULTI_REQUEST, 1000)
+        print(f"2. seed 8 / seed 없음 2회: 재계산 {len(calls)}회, 저장 {len(cache)}개")
+        assert len(calls) == 3 and len(cache) == 2, "seed가 다르거나 없으면 다시 계산, seed 없는 결과는 저장 안 함"
+
+        opening = {"type": "preferred_opening", "preferred_basics": ["Type:Null", "Blacephalon"]}
+        simulator.run_calculation(opening, 1000)
+        simulator.run_calculation(opening, 5000, seed=3)
+        print(f"3. 정확 계산 2회 (seed 없음 / seed 3): 재계산 {len(calls) - 3}회")
+        assert len(calls) == 4, "정확 계산은 seed / 횟수와 무관하게 재사용"
+
+        uncached = PokemonPocketSimulator()
+        uncached.setup_simulation(deck, draw_order)
+        assert uncached.run_calculation(MULTI_REQUEST, 1000, seed=7) == first, "캐시 결과는 직접 계산한 결과와 같음"
+
+    print("✅ run_calculation 캐시 재사용 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 결과 캐시 테스트")
+    print("=" * 60)
+
+    test_cache_key()
+    test_eviction()
+    test_run_calculation_uses_cache()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+스위트 모드(게임 흐름 공유) 테스트
+
+정책 입력이 같은 요청끼리만 그룹이 되는지, 그룹의 게임을 한 번만 시뮬레이션하는지,
+기준 엔진 / 인코딩 엔진의 스위트 결과가 같은 분포인지, 공유 결과가 요청별
+개별 실행과 같은 분포인지, 스위트 결과가 결과 캐시에서 재사용되는지 확인합니다.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main_simulator import PokemonPocketSimulator, SimulationEngine, load_deck_from_file, load_test_cases_from_file
+from encoded_engine import EncodedSimulationEngine
+from probability_calculator import ProbabilityCalculator
+from result_cache import ResultCache
+from stats_utils import two_proportion_z_test
+
+IONO_DECK = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Type:Null": {"type": "Basic Pokemon", "count": 2},
+    "Silvally": {"type": "Stage1 Pokemon", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Iono": {"type": "Supporter", "count": 2},
+    "Potion": {"type": "Item", "count": 2},
+    "X Speed": {"type": "Item", "count": 2},
+    "Leaf": {"type": "Supporter", "count": 2},
+    "Red Card": {"type": "Item", "count": 2}
+}
+IONO_ORDER = ["Poke Ball", "Professor's Research", "Iono"]
+
+SEARCH_DECK = {name: info for name, info in IONO_DECK.items() if name != "Iono"}
+SEARCH_DECK["Galdion"] = {"type": "Supporter", "count": 2}
+SEARCH_ORDER = ["Poke Ball", "Galdion", "Professor's Research"]
+
+SEARCH_REQUESTS = [
+    {"type": "multi_card", "target_cards": ["Silvally", "Leaf"], "turn": 2},
+    {"type": "multi_card", "target_cards": ["Pikachu"], "turn": 1},
+    {"type": "preferred_opening", "preferred_basics": ["Type:Null"]},
+    {"type": "multi_card", "target_cards": ["Type:Null", "Silvally"], "turn": 3},
+    {"type": "non_preferred_opening", "non_preferred_basics": ["Pikachu"]}
+]
+
+
+def _multi(targets, turn):
+    return {"type": "multi_card", "target_cards": targets, "turn": turn}
+
+
+def test_plan_suite():
+    """정책 입력 기준 그룹 분류 테스트"""
+    print("=== 스위트 그룹 분류 테스트 ===")
+
+    # Pokemon Communication 덱: 목표 카드와 turn이 모두 같아야 같은 그룹
+    deck, _ = load_deck_from_file()
+    _, draw_order, _ = load_test_cases_from_file()
+    calculator = ProbabilityCalculator(EncodedSimulationEngine(deck, draw_order))
+    requests = [_multi(["Blacephalon", "BalsaMine"], 2), _multi(["Blacephalon", "BalsaMine"], 3),
+                _multi(["Blacephalon", "BalsaMine"], 2), _multi(["Leaf"], 2),
+                {"type": "preferred_opening", "preferred_basics": ["Type:Null"]}]
+    individual, groups = calculator.plan_suite(requests)
+    members = [[index for index, _, _ in group['members']] for group in groups]
+    print(f"1. Pokemon Communication 덱: 개별 {individual}, 그룹 {members}")
+    assert individual == [4] and members == [[0, 2], [1], [3]], "정확 계산은 개별, 같은 목표 + 같은 turn만 공유"
+
+    # Iono 덱: 목표 카드가 같으면 turn이 달라도 공유
+    calculator = ProbabilityCalculator(EncodedSimulationEngine(IONO_DECK, IONO_ORDER))
+    individual, groups = calculator.plan_suite([_multi(["Silvally"], turn) for turn in (1, 2, 3)] + [_multi(["Leaf"], 2)])
+    print(f"2. Iono 덱: 그룹 {[(len(group['members']), group['game_kwargs']['max_turn']) for group in groups]}")
+    assert [(len(group['members']), group['game_kwargs']['max_turn']) for group in groups] == [(3, 3), (1, 2)]
+
+    # 정책이 목표 카드와 무관한 덱: 시작 손패 요청까지 모두 한 그룹
+    calculator = ProbabilityCalculator(EncodedSimulationEngine(SEARCH_DECK, SEARCH_ORDER))
+    individual, groups = calculator.plan_suite(SEARCH_REQUESTS, use_mathematical=False)
+    print(f"3. 서치 덱 (시뮬레이션): 개별 {individual}, 그룹 크기 {[len(group['members']) for group in groups]}")
+    assert individual == [] and len(groups) == 1 and len(groups[0]['members']) == 5
+    assert groups[0]['game_kwargs'] == {'max_turn': 3}, "목표 카드 없이 가장 큰 turn까지 진행"
+
+    print("✅ 스위트 그룹 분류 테스트 통과!\n")
+
+
+def test_shared_pass():
+    """게임 1회 시뮬레이션 / 엔진 간 일치 / 개별 실행과의 분포 비교"""
+    print("=== 게임 흐름 공유 실행 테스트 ===")
+
+    num_games = 4000
+    results = {}
+    for engine_class in (SimulationEngine, EncodedSimulationEngine):
+        calculator = ProbabilityCalculator(engine_class(SEARCH_DECK, SEARCH_ORDER))
+        simulated = []
+        if hasattr(calculator.sim_engine, 'run_stream'):
+            original = calculator.sim_engine.run_stream
+            calculator.sim_engine.run_stream = lambda accumulator, games, **kwargs: simulated.append(games) or original(accumulator, games, **kwargs)
+        results[engine_class.__name__] = calculator.run_suite(SEARCH_REQUESTS, num_games, use_mathematical=False, seed=9)
+        if simulated:
+            print(f"1. 인코딩 엔진 시뮬레이션 게임 수: {sum(simulated):,} (요청 {len(SEARCH_REQUESTS)}개)")
+            assert sum(simulated) == num_games, "그룹의 게임은 한 번만 시뮬레이션"
+
+    object_counts = [result['success_count'] for result in results['SimulationEngine']]
+    encoded_counts = [result['success_count'] for result in results['EncodedSimulationEngine']]
+    print(f"2. 성공 횟수 (기준 / 인코딩): {object_counts} / {encoded_counts}")
+    for reference, encoded in zip(results['SimulationEngine'], results['EncodedSimulationEngine']):
+        _, p_value = two_proportion_z_test(reference['success_count'], reference['total_valid_games'],
+                                           encoded['success_count'], encoded['total_valid_games'])
+        assert p_value > 0.001, "기준 엔진(턴별 손패 판정)과 인코딩 엔진(SuiteCounter) 결과 분포가 다름"
+    assert all(result['shared_pass'] == {'requests': 5, 'max_turn': 3} for result in results['SimulationEngine'])
+
+    calculator = ProbabilityCalculator(EncodedSimulationEngine(SEARCH_DECK, SEARCH_ORDER))
+    for request, shared in zip(SEARCH_REQUESTS, results['EncodedSimulationEngine']):
+        single = calculator.run_calculation(request, num_games, use_mathematical=False, seed=10)
+        _, p_value = two_proportion_z_test(shared['success_count'], shared['total_valid_games'],
+                                           single['success_count'], single['total_valid_games'])
+        assert p_value > 0.001, f"공유 결과와 개별 결과 분포가 다름: {request}"
+    print("3. 요청별 공유 결과와 개별 실행 결과 분포 일치")
+
+    print("✅ 게임 흐름 공유 실행 테스트 통과!\n")
+
+
+def test_simulator_suite_cache():
+    """PokemonPocketSimulator.run_calculation_suite + 결과 캐시 테스트"""
+    print("=== 스위트 모드 결과 캐시 테스트 ===")
+
+    requests = [_multi(["Silvally"], turn) for turn in (1, 2, 3)]
+    requests.append({"type": "multi_card", "target_cards": [], "turn": 2})
+    with tempfile.TemporaryDirectory() as temp_dir:
+        simulator = PokemonPocketSimulator(result_cache=ResultCache(os.path.join(temp_dir, "cache.sqlite3")))
+        assert simulator.setup_simulation(IONO_DECK, IONO_ORDER, engine="encoded")
+
+        first = simulator.run_calculation_suite(requests, 2000, seed=4)
+        assert first[3] is None and all(result is not None for result in first[:3]), "검증 실패 요청만 None"
+        print(f"1. Silvally 1~3턴: {[result['probability_percent'] for result in first[:3]]}")
+        assert all(result['shared_pass'] == {'requests': 3, 'max_turn': 3} for result in first[:3])
+
+        calls = []
+        original = simulator.prob_calculator.run_shared_group
+        simulator.prob_calculator.run_shared_group = lambda *args: calls.append(args) or original(*args)
+        second = simulator.run_calculation_suite(requests, 2000, seed=4)
+        print(f"2. 두 번째 실행 재계산 그룹: {len(calls)}개")
+        assert second == first and not calls, "같은 스위트는 캐시에서 재사용"
+
+    print("✅ 스위트 모드 결과 캐시 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 스위트 모드 테스트")
+    print("=" * 60)
+
+    test_plan_suite()
+    test_shared_pass()
+    test_simulator_suite_cache()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
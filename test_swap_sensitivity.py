@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+카드 1장 교체 민감도 행렬 테스트
+
+합법적인 교체만 만드는지, 영향 받지 않은 게임의 결과를 재사용한 교체별 결과가
+같은 seed 목록으로 교체 덱 전체를 다시 실행한 결과와 게임 단위로 같은지,
+실제 시뮬레이션 게임 수가 교체마다 전체 실행하는 경우보다 (서치 카드가 많은
+Pokemon Communication / Poke Ball 덱에서도) 확실히 적은지,
+정확 계산 가능한 요청은 정확값 차이를 내는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from accumulators import OutcomeRecorder, counter_for_request
+from encoded_engine import EncodedSimulationEngine
+from exact_engine import exact_request_probability
+from swap_sensitivity import candidate_swaps, swap_deck, swap_sensitivity, print_swap_sensitivity
+from probability_calculator import ProbabilityCalculator
+from main_simulator import load_deck_from_file, load_test_cases_from_file
+
+DECK = {
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Type:Null": {"type": "Basic Pokemon", "count": 2},
+    "Silvally": {"type": "Stage1 Pokemon", "count": 1},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Galdion": {"type": "Supporter", "count": 2},
+    "Potion": {"type": "Item", "count": 2},
+    "X Speed": {"type": "Item", "count": 2},
+    "Leaf": {"type": "Supporter", "count": 1},
+    "Red Card": {"type": "Item", "count": 2},
+    "Sabrina": {"type": "Supporter", "count": 2}
+}
+DRAW_ORDER = ["Poke Ball", "Galdion", "Professor's Research", "Iono"]
+CANDIDATES = {
+    "Iono": {"type": "Supporter"},
+    "Cyrus": {"type": "Supporter"},
+    "Rare Candy": {"type": "Item"},
+    "Pikachu ex": {"type": "Basic Pokemon"},
+    "Silvally": {"type": "Stage1 Pokemon"},
+    "Potion": {"type": "Item"}
+}
+MULTI_REQUEST = {"type": "multi_card", "target_cards": ["Silvally", "Leaf"], "turn": 2}
+
+
+def test_candidate_swaps():
+    """합법적인 교체 목록 테스트"""
+    print("=== 교체 후보 테스트 ===")
+
+    swaps = candidate_swaps(DECK, CANDIDATES, protected_cards=["Leaf"])
+    print(f"1. 교체 {len(swaps)}개 (뺄 카드 {len(DECK) - 1}종 x 후보 {len(CANDIDATES)}종)")
+    assert not any(cut_card == "Leaf" for cut_card, _, _ in swaps), "보호 카드는 빼지 않음"
+    assert not any(add_card == "Potion" for _, add_card, _ in swaps), "이미 2장인 카드는 넣을 수 없음"
+    assert ("Pikachu", "Silvally", "Stage1 Pokemon") in swaps and ("Silvally", "Silvally", "Stage1 Pokemon") not in swaps
+    assert len(swaps) == (len(DECK) - 1) * (len(CANDIDATES) - 1) - 1
+
+    swapped = swap_deck(DECK, "Leaf", "Silvally", "Stage1 Pokemon")
+    print(f"2. Leaf -> Silvally: {list(swapped)[-3:]}, Silvally {swapped['Silvally']['count']}장")
+    assert "Leaf" not in swapped and swapped["Silvally"]["count"] == 2
+    assert sum(info["count"] for info in swapped.values()) == 20
+    assert list(swap_deck(DECK, "Leaf", "Iono", "Supporter"))[-1] == "Iono", "새 카드는 맨 뒤"
+
+    print("✅ 교체 후보 테스트 통과!\n")
+
+
+def _assert_matches_full_runs(deck, draw_order, request, candidates, result, num_games, seed):
+    """교체별 결과 = 같은 seed 목록으로 교체 덱 전체를 다시 실행한 결과 (게임 단위 성공 / 유효 게임 수)"""
+    seed_stream = random.Random(seed)
+    game_seeds = [seed_stream.getrandbits(64) for _ in range(num_games)]
+    base_engine = EncodedSimulationEngine(deck, draw_order)
+    base_layout = base_engine.card_table.decode(base_engine.game_state.original_deck)
+    game_kwargs = ProbabilityCalculator(base_engine)._game_kwargs(request)
+
+    for entry in result['swaps']:
+        add_type = deck[entry['add']]["type"] if entry['add'] in deck else candidates[entry['add']]["type"]
+        engine = EncodedSimulationEngine(swap_deck(deck, entry['cut'], entry['add'], add_type), draw_order)
+        # 기준 덱 배치에서 마지막 cut 카드 자리만 add 카드로 바꾼 배치
+        layout = list(base_layout)
+        layout[len(layout) - 1 - layout[::-1].index(entry['cut'])] = entry['add']
+        engine.game_state.original_deck[:] = [engine.card_table.ids[card_name] for card_name in layout]
+        recorder = OutcomeRecorder(counter_for_request(request, engine.card_table))
+        engine.run_stream(recorder, num_games, game_seeds=game_seeds, **game_kwargs)
+        full = (recorder.counter.success_count, recorder.counter.total_valid_games)
+        assert (entry['success_count'], entry['total_valid_games']) == full, \
+            f"-{entry['cut']} +{entry['add']}: 재사용 {entry['success_count']} / 전체 실행 {full[0]}"
+
+
+def test_matches_full_runs():
+    """재사용 결과 = 교체 덱 전체 재실행 결과 (게임 단위)"""
+    print("=== 전체 재실행 결과 일치 테스트 ===")
+
+    num_games, seed = 1500, 21
+    result = swap_sensitivity(DECK, DRAW_ORDER, MULTI_REQUEST, CANDIDATES, num_games=num_games, seed=seed)
+    print_swap_sensitivity(result, top=5)
+    assert result['method'] == 'simulation' and len(result['swaps']) == len(candidate_swaps(DECK, CANDIDATES))
+
+    _assert_matches_full_runs(DECK, DRAW_ORDER, MULTI_REQUEST, CANDIDATES, result, num_games, seed)
+    print(f"1. 교체 {len(result['swaps'])}개 모두 전체 재실행 결과와 일치")
+
+    assert result['matrix']["Potion"]["Cyrus"] == 0.0, "게임 진행에 쓰이지 않는 카드끼리 교체는 차이 0"
+    assert result['simulated_games'] < result['naive_games'] * 0.8
+    print(f"2. 시뮬레이션 {result['simulated_games']:,}게임 (교체마다 전체 실행 시 {result['naive_games']:,}게임)")
+
+    print("✅ 전체 재실행 결과 일치 테스트 통과!\n")
+
+
+def test_communication_deck():
+    """Pokemon Communication / Poke Ball 덱 (DeckList.txt): 결과 일치 + 시뮬레이션 게임 수 절감"""
+    print("=== Pokemon Communication 덱 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    _, draw_order, _ = load_test_cases_from_file()
+    assert "Pokemon Communication" in draw_order and "Poke Ball" in draw_order
+    request = {"type": "multi_card", "target_cards": ["Blacephalon", "BalsaMine"], "turn": 2}
+
+    num_games, seed = 1000, 5
+    result = swap_sensitivity(deck, draw_order, request, CANDIDATES, num_games=num_games, seed=seed)
+    _assert_matches_full_runs(deck, draw_order, request, CANDIDATES, result, num_games, seed)
+    print(f"1. 교체 {len(result['swaps'])}개 모두 전체 재실행 결과와 일치")
+
+    ratio = result['simulated_games'] / result['naive_games']
+    print(f"2. 시뮬레이션 {result['simulated_games']:,}게임 / 교체마다 전체 실행 {result['naive_games']:,}게임 ({ratio:.2f})")
+    assert ratio < 0.65, "서치 카드가 많은 덱에서도 교체마다 전체 실행하는 경우보다 확실히 적어야 함"
+
+    print("✅ Pokemon Communication 덱 테스트 통과!\n")
+
+
+def test_swapped_in_target():
+    """기준 덱에 없는 목표 Pokemon을 넣는 교체: Pokemon Communication 판단 변화까지 반영"""
+    print("=== 새 목표 Pokemon 교체 테스트 ===")
+
+    deck, _ = load_deck_from_file()
+    _, draw_order, _ = load_test_cases_from_file()
+    assert "Mewtwo" not in deck
+    request = {"type": "multi_card", "target_cards": ["Blacephalon", "Mewtwo"], "turn": 2}
+    candidates = {"Mewtwo": {"type": "Basic Pokemon"}}
+
+    num_games, seed = 1500, 3
+    result = swap_sensitivity(deck, draw_order, request, candidates, num_games=num_games, seed=seed)
+    _assert_matches_full_runs(deck, draw_order, request, candidates, result, num_games, seed)
+    entry = next(entry for entry in result['swaps'] if entry['cut'] == "Type:Null")
+    print(f"1. -Type:Null +Mewtwo: {entry['success_count']}/{entry['total_valid_games']} (전체 재실행과 일치)")
+    assert entry['success_count'] > 0
+
+    print("✅ 새 목표 Pokemon 교체 테스트 통과!\n")
+
+
+def test_exact_sensitivity():
+    """정확 계산 가능한 요청 테스트"""
+    print("=== 정확 계산 교체 민감도 테스트 ===")
+
+    request = {"type": "preferred_opening", "preferred_basics": ["Type:Null"]}
+    result = swap_sensitivity(DECK, DRAW_ORDER, request, {"Pikachu ex": {"type": "Basic Pokemon"}},
+                              protected_cards=["Type:Null"])
+    print(f"1. 기준 {result['base_probability_percent']:.2f}%, 1위 -{result['swaps'][0]['cut']} "
+          f"+{result['swaps'][0]['add']} ({result['swaps'][0]['difference_percent']:+.2f}%p)")
+    assert result['method'] == 'exact' and result['simulated_games'] == 0
+
+    base = exact_request_probability(DECK, DRAW_ORDER, request)
+    swapped = exact_request_probability(swap_deck(DECK, "Potion", "Pikachu ex", "Basic Pokemon"), DRAW_ORDER, request)
+    assert abs(result['matrix']["Potion"]["Pikachu ex"] - (swapped - base) * 100) < 1e-9
+    assert result['matrix']["Potion"]["Pikachu ex"] < 0, "Basic을 늘리면 Type:Null 시작 확률 감소"
+
+    print("✅ 정확 계산 교체 민감도 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator - 카드 교체 민감도 테스트")
+    print("=" * 60)
+
+    test_candidate_swaps()
+    test_matches_full_runs()
+    test_communication_deck()
+    test_swapped_in_target()
+    test_exact_sensitivity()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
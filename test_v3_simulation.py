@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+v3 진화 성공 확률 시뮬레이션 테스트
+
+진화 시스템이 다른 라인의 포켓몬을 진화시키지 않고 턴당 한 번만 진화시키는지,
+게임마다 덱이 셔플되고 게임별 seed로 재현되는지, 드로우 카드가 없는 덱에서
+진화 확률이 포함-배제 정확값으로 구한 상한 / 하한 사이에 있는지,
+evolution 계산 타입이 검증 / 병렬 / 적응형 실행 경로에서 동작하는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from v3_core_classes import Card
+from v3_game_state import GameStateV3
+from v3_evolution_system import auto_evolve_all
+from v3_simulation import EvolutionSimulator, EvolutionCounter
+from main_simulator import PokemonPocketSimulator, SimulationEngine
+from probability_calculator import ProbabilityCalculator
+
+LINES = [{"basic": "Charmander", "stage1": "Charmeleon", "stage2": "Charizard"},
+         {"basic": "Pikachu", "stage1": "Raichu", "stage2": None}]
+DECK = {
+    "Charmander": {"type": "Basic Pokemon", "count": 2},
+    "Charmeleon": {"type": "Stage1 Pokemon", "count": 2},
+    "Charizard": {"type": "Stage2 Pokemon", "count": 2},
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Raichu": {"type": "Stage1 Pokemon", "count": 2},
+    "rare candy": {"type": "Item", "count": 2},
+    "Poke Ball": {"type": "Item", "count": 2},
+    "Professor's Research": {"type": "Supporter", "count": 2},
+    "Potion": {"type": "Item", "count": 2},
+    "Switch": {"type": "Item", "count": 2}
+}
+DRAW_ORDER = ["Poke Ball", "Professor's Research"]
+PLAIN_DECK = {
+    "Charmander": {"type": "Basic Pokemon", "count": 2},
+    "Charmeleon": {"type": "Stage1 Pokemon", "count": 2},
+    "Pikachu": {"type": "Basic Pokemon", "count": 2},
+    "Potion": {"type": "Item", "count": 7},
+    "Switch": {"type": "Item", "count": 7}
+}
+
+
+def test_evolution_rules():
+    """진화 라인 / 턴당 1회 진화 규칙 테스트"""
+    print("=== 진화 규칙 테스트 ===")
+
+    game_state = GameStateV3(DECK, DRAW_ORDER, evolution_lines=LINES)
+    game_state.hand = [Card("Pikachu", "Basic Pokemon"), Card("Charmander", "Basic Pokemon")]
+    game_state.place_pokemon_active("Pikachu")
+    game_state.place_pokemon_bench("Charmander")
+    game_state.start_turn()
+    game_state.hand = [Card("Charmeleon", "Stage1 Pokemon"), Card("Charizard", "Stage2 Pokemon")]
+
+    log = auto_evolve_all(game_state)
+    active = [card.name for card in game_state.field.active.evolution_stack]
+    bench = [card.name for card in game_state.field.bench[0].evolution_stack]
+    print(f"1. Active: {active}, Bench: {bench}, 진화 {log['total_evolutions']}회")
+    assert active == ["Pikachu"], "Charmander 라인 카드로 Pikachu가 진화하면 안 됨"
+    assert bench == ["Charmander", "Charmeleon"], "턴당 한 번만 진화 (Stage2까지 연속 진화 금지)"
+
+    game_state.start_turn()
+    auto_evolve_all(game_state)
+    bench = [card.name for card in game_state.field.bench[0].evolution_stack]
+    print(f"2. 다음 턴 Bench: {bench}")
+    assert bench == ["Charmander", "Charmeleon", "Charizard"]
+
+    # 같은 이름의 Basic을 벤치에 추가로 놓으면 새 슬롯만 진화 불가
+    game_state.hand = [Card("Charmander", "Basic Pokemon")]
+    game_state.place_pokemon_bench("Charmander")
+    assert game_state.field.bench[0].can_evolve is False and game_state.field.bench[1].can_evolve is False
+    game_state.start_turn()
+    game_state.hand = [Card("Pikachu", "Basic Pokemon")]
+    game_state.place_pokemon_bench("Pikachu")
+    assert game_state.field.bench[1].can_evolve and not game_state.field.bench[2].can_evolve
+    print("3. 새로 놓은 슬롯만 진화 불가 마킹")
+
+    print("✅ 진화 규칙 테스트 통과!\n")
+
+
+def test_shuffled_and_seeded():
+    """게임별 셔플 / seed 재현 테스트"""
+    print("=== 셔플 / seed 재현 테스트 ===")
+
+    simulator = EvolutionSimulator(DECK, DRAW_ORDER, ["Charizard"], LINES)
+    random.seed(3)
+    games = [simulator.simulate_single_game(1) for _ in range(50)]
+    openings = {(tuple(map(tuple, game['field'])), tuple(game['final_hand'])) for game in games}
+    print(f"1. 50게임의 서로 다른 결과: {len(openings)}개")
+    assert len(openings) > 25, "게임마다 덱이 셔플되어야 함"
+
+    seeds = list(range(300))
+    counters = [EvolutionCounter(4), EvolutionCounter(4)]
+    for counter in counters:
+        simulator.run_stream(counter, len(seeds), 4, game_seeds=seeds)
+    print(f"2. 같은 게임별 seed: {counters[0].first_success_counts} = {counters[1].first_success_counts}")
+    assert counters[0].first_success_counts == counters[1].first_success_counts
+    assert sum(counters[0].first_success_counts) == counters[0].success_count
+
+    print("✅ 셔플 / seed 재현 테스트 통과!\n")
+
+
+def test_bounds_without_draw_cards():
+    """드로우 카드가 없는 덱: P(N-1턴까지 Basic + Stage1) <= P(N턴까지 진화) <= P(N턴까지 Basic + Stage1)"""
+    print("=== 정확값 상한 / 하한 테스트 ===")
+
+    calculator = ProbabilityCalculator(SimulationEngine(PLAIN_DECK, []))
+    simulator = EvolutionSimulator(PLAIN_DECK, [], ["Charmeleon"], LINES)
+    random.seed(7)
+    counter = EvolutionCounter(4)
+    simulator.run_stream(counter, 20000, 4)
+
+    for turn in range(2, 5):
+        evolved = sum(counter.first_success_counts[:turn + 1]) / counter.total_valid_games * 100
+        lower = calculator.calculate_multi_card_mathematical(["Charmander", "Charmeleon"], turn - 1)['probability_percent']
+        upper = calculator.calculate_multi_card_mathematical(["Charmander", "Charmeleon"], turn)['probability_percent']
+        print(f"  {turn}턴: {lower:.2f}% <= {evolved:.2f}% <= {upper:.2f}%")
+        assert lower - 1.5 <= evolved <= upper + 1.5
+
+    print("✅ 정확값 상한 / 하한 테스트 통과!\n")
+
+
+def test_calculation_type():
+    """evolution 계산 타입 테스트 (검증 / 단일 / 병렬 / 적응형)"""
+    print("=== evolution 계산 타입 테스트 ===")
+
+    simulator = PokemonPocketSimulator()
+    assert simulator.setup_simulation(DECK, DRAW_ORDER)
+    request = {"type": "evolution", "target_evolutions": ["Charizard"], "evolution_lines": LINES,
+               "preferred_basics": ["Charmander"], "turn": 3}
+
+    for invalid in ({**request, "target_evolutions": []}, {**request, "target_evolutions": ["Mewtwo"]},
+                    {**request, "evolution_lines": LINES[1:]}, {**request, "turn": 0}):
+        assert not simulator.validate_calculation_request(invalid), f"{invalid}는 검증 실패해야 함"
+    print("1. 잘못된 요청 검증 실패 확인")
+
+    result = simulator.run_calculation(request, 3000, seed=5)
+    print(f"2. 단일 프로세스: {result['probability_percent']:.2f}%, 턴별 {result['first_success_percent']}")
+    assert result['calculation_type'] == 'evolution' and result['total_valid_games'] == 3000
+    assert 0 < result['probability_percent'] < 100
+    assert abs(sum(result['first_success_percent']) - result['probability_percent']) < 0.1
+
+    parallel = simulator.prob_calculator.run_calculation(request, 2000, workers=2, seed=5)
+    again = simulator.prob_calculator.run_calculation(request, 2000, workers=2, seed=5)
+    print(f"3. 2개 프로세스: {parallel['probability_percent']:.2f}% (재실행 {again['probability_percent']:.2f}%)")
+    assert parallel['success_count'] == again['success_count'] and parallel['workers'] == 2
+    assert parallel['first_success_percent'] == again['first_success_percent'], "병렬 실행도 턴별 분포 포함 (조각 합산)"
+    assert len(parallel['first_success_percent']) == len(result['first_success_percent'])
+    assert abs(sum(parallel['first_success_percent']) - parallel['probability_percent']) < 0.1
+    assert abs(parallel['probability_percent'] - result['probability_percent']) < 6
+
+    adaptive = simulator.run_calculation({**request, "target_half_width": 2.0, "max_simulations": 20000}, seed=5)
+    print(f"4. 적응형: ±{adaptive['interval_half_width']:.2f}%p, {adaptive['games_used']:,}게임")
+    assert adaptive['target_met'] and adaptive['games_used'] < 20000
+
+    evaluation = simulator.prob_calculator.evaluate_game(request, rng=random.Random(1))
+    assert evaluation in (True, False)
+
+    print("✅ evolution 계산 타입 테스트 통과!\n")
+
+
+def main():
+    print("Pokemon Pocket Simulator v3.0 - 진화 성공 확률 시뮬레이션 테스트")
+    print("=" * 60)
+
+    test_evolution_rules()
+    test_shuffled_and_seeded()
+    test_bounds_without_draw_cards()
+    test_calculation_type()
+
+    print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
@@ -48,6 +48,12 @@ class PokemonSlot:
         self.attached_tool: Optional[Card] = None
         self.can_evolve: bool = True
         
+    def reset(self):
+        """빈 슬롯으로 되돌리기 (슬롯 객체 재사용)"""
+        self.evolution_stack.clear()
+        self.attached_tool = None
+        self.can_evolve = True
+        
     def get_top_pokemon(self) -> Optional[Card]:
         """최상위(활성) 포켓몬 반환"""
         return self.evolution_stack[-1] if self.evolution_stack else None
@@ -141,6 +147,16 @@ class Field:
         self.active = PokemonSlot()
         self.bench = [PokemonSlot() for _ in range(initial_bench_size)]
         self.bench_limit = initial_bench_size
+        # 처음 벤치 슬롯 스냅샷 (reset에서 벤치 크기가 바뀌었어도 원래 슬롯들로 복원)
+        self._initial_bench = list(self.bench)
+        
+    def reset(self):
+        """빈 Field로 되돌리기 (Active / 처음 벤치 슬롯 객체를 재사용)"""
+        self.active.reset()
+        self.bench[:] = self._initial_bench
+        for slot in self.bench:
+            slot.reset()
+        self.bench_limit = len(self.bench)
         
     def resize_bench(self, new_limit: int) -> List[Card]:
         """벤치 크기 변경 (카드 효과용)
@@ -5,7 +5,7 @@
 from typing import List, Dict, Any
 from v3_game_state import GameStateV3
 from v3_evolution_system import auto_evolve_all
-from card_effects import CardEffects
+from card_effects import CardEffects, EFFECT_REGISTRY
 
 
 def use_draw_cards_v3(game_state: GameStateV3,
@@ -73,6 +73,12 @@ def use_draw_cards_v3(game_state: GameStateV3,
                     details = evolution_log.get('evolution_details', [])
                     print(f'  진화 완료: {details}')
             
+            effect = EFFECT_REGISTRY.get(card_name)
+            if effect is not None and effect.precondition is not None and not effect.precondition(game_state):
+                if verbose:
+                    print(f'    {card_name} 사용 조건 불충족')
+                continue
+            
             # 카드 효과 실행
             effect_result = CardEffects.use_card_effect(card_name, game_state)
             
@@ -80,8 +86,9 @@ def use_draw_cards_v3(game_state: GameStateV3,
                 description = effect_result.get('description', '효과 실행')
                 print(f'    결과: {description}')
             
-            # 사용된 카드 처리
-            game_state.hand.remove(card)
+            # 사용된 카드 처리 (손패가 Iono뿐이면 iono()가 이미 손패에서 제거함)
+            if card in game_state.hand:
+                game_state.hand.remove(card)
             result['cards_used'].append(card_name)
             
             # Supporter 사용 체크
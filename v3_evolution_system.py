@@ -143,7 +143,7 @@ def _try_normal_evolution(game_state: GameStateV3,
     일반 진화 규칙:
     - Basic → Stage1 → Stage2 순차 진화
     - 해당 턴에 배치된 포켓몬은 진화 불가
-    - 항상 최고 단계까지 진화 시도
+    - 각 포켓몬은 턴당 한 번만 진화 (진화한 슬롯은 다음 턴까지 진화 불가)
     
     Args:
         game_state: 게임 상태
@@ -268,14 +268,15 @@ def _find_evolution_in_hand(game_state: GameStateV3,
     if not target_line:
         return None
     
-    # 현재 단계에 따라 다음 단계 카드 찾기
+    # 현재 단계에 따라 다음 단계 카드 찾기 (현재 포켓몬이 그 라인의 이전 단계일 때만,
+    # rare candy로 Stage2가 된 슬롯이나 다른 라인의 포켓몬은 제외)
     target_card_name = None
     target_card_type = None
     
-    if current_stage == 1:  # Basic → Stage1
+    if current_stage == 1 and current_pokemon.name == target_line.get("basic"):  # Basic → Stage1
         target_card_name = target_line.get("stage1")
         target_card_type = "Stage1 Pokemon"
-    elif current_stage == 2:  # Stage1 → Stage2
+    elif current_stage == 2 and current_pokemon.name == target_line.get("stage1"):  # Stage1 → Stage2
         target_card_name = target_line.get("stage2")
         target_card_type = "Stage2 Pokemon"
     
@@ -315,6 +316,9 @@ def _execute_rare_candy_evolution(game_state: GameStateV3,
         # 3. rare candy를 discard pile로
         game_state.move_to_discard_pile([rare_candy_card])
         
+        # 4. 포켓몬은 턴당 한 번만 진화 가능
+        slot.can_evolve = False
+        
         return True
         
     except (ValueError, Exception):
@@ -343,6 +347,9 @@ def _execute_normal_evolution(game_state: GameStateV3,
         # 2. Hand에서 진화 카드 제거
         game_state.hand.remove(evolution_card)
         
+        # 3. 포켓몬은 턴당 한 번만 진화 가능
+        slot.can_evolve = False
+        
         return True
         
     except (ValueError, Exception):
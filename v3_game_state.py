@@ -19,7 +19,9 @@ v3 가이드 참조:
 
 from typing import List, Dict, Any, Optional
 import copy
+import random
 from v3_core_classes import Card, Field, create_pokemon_card
+from opening_sampler import OPENING_METHODS, get_opening_sampler
 
 
 class GameStateV3:
@@ -36,7 +38,9 @@ class GameStateV3:
     def __init__(self, deck_input: Dict[str, Dict[str, Any]], 
                  draw_order: Optional[List[str]] = None,
                  preferred_basics: Optional[List[str]] = None,
-                 evolution_lines: Optional[List[Dict[str, str]]] = None):
+                 evolution_lines: Optional[List[Dict[str, str]]] = None,
+                 opening: str = "mulligan",
+                 rng=None):
         """GameState 초기화
         
         Args:
@@ -44,14 +48,20 @@ class GameStateV3:
             draw_order: 드로우 순서 (시뮬레이션용)
             preferred_basics: 선호 Basic Pokemon 리스트
             evolution_lines: 진화 라인 정의 [{"basic": "피카츄", "stage1": "라이츄", "stage2": None}]
+            opening: 시작 손패 방식 ("mulligan" 또는 "alias": 멀리건 없이 셔플된 손패/덱 샘플링)
+            rng: 셔플/카드 효과에 사용할 난수 생성기 (None이면 전역 random 모듈)
         """
+        if opening not in OPENING_METHODS:
+            raise ValueError(f"지원하지 않는 시작 손패 방식입니다: {opening}")
         
         # === 기존 v2.02 호환 속성들 ===
         self.deck = self._create_deck_from_input(deck_input)
+        self.original_deck = list(self.deck)           # reset_game 복원용 원본 덱 스냅샷
         self.hand: List[Card] = []
         self.turn = 0
         self.supporter_used = False
         self.draw_order = draw_order or []
+        self.rng = rng if rng is not None else random
         
         # === v3.0 신규 속성들 ===
         self.field = Field()                           # Field 공간 (Active + Bench)
@@ -62,18 +72,33 @@ class GameStateV3:
         self.preferred_basics = preferred_basics or []
         self.evolution_lines = evolution_lines or []
         
+        # === 시작 손패 샘플러 (opening="alias") ===
+        self.opening_sampler = None
+        self.card_kinds: List[Card] = []
+        if opening == "alias":
+            self.card_kinds = [Card(name, self._card_type(info)) for name, info in deck_input.items()]
+            counts = tuple(info.get("count", 1) for info in deck_input.values())
+            is_basic = tuple(card.card_type == "Basic Pokemon" for card in self.card_kinds)
+            self.opening_sampler = get_opening_sampler(counts, is_basic)
+        
+    @staticmethod
+    def _card_type(card_info: Dict[str, Any]) -> str:
+        """덱 입력의 카드 타입 ("카드타입" 또는 v2 덱 형식의 "type")"""
+        return card_info.get("카드타입", card_info.get("type", "Unknown"))
+        
     def _create_deck_from_input(self, deck_input: Dict[str, Dict[str, Any]]) -> List[Card]:
         """덱 입력으로부터 Card 리스트 생성 (v2.02 호환성 유지)
         
         Args:
             deck_input: {"카드명": {"카드타입": str, "count": int}} 형식
+                        (v2 덱 형식 {"카드명": {"type": str, "count": int}}도 허용)
             
         Returns:
             List[Card]: 생성된 덱 카드들
         """
         deck = []
         for card_name, card_info in deck_input.items():
-            card_type = card_info.get("카드타입", "Unknown")
+            card_type = self._card_type(card_info)
             count = card_info.get("count", 1)
             
             for _ in range(count):
@@ -82,19 +107,22 @@ class GameStateV3:
         return deck
         
     def reset_game(self):
-        """게임 상태를 초기 상태로 리셋 (v2.02 호환)"""
+        """게임 상태를 초기 상태로 리셋 (v2.02 호환)
+        
+        덱 / 손패 / Field / Discard Pile을 제자리에서 복원해 게임마다 상태 객체를 재사용합니다
+        (Card 객체는 게임 중 바뀌지 않으므로 원본 덱 리스트만 복원). 덱은 셔플하지 않으므로
+        생성 직후와 같이 shuffle_deck()을 호출한 뒤 initial_draw()를 사용합니다.
+        """
         # 기존 속성 리셋
-        self.hand = []
+        self.deck[:] = self.original_deck
+        self.hand.clear()
         self.turn = 0
         self.supporter_used = False
         
         # v3.0 신규 속성 리셋
-        self.field = Field()
-        self.discard_pile = []
-        self.newly_placed_pokemon = []
-        
-        # 덱 리셋 (deep copy로 원본 보존)
-        # Note: deck은 초기화 시점의 원본 덱을 참조해야 하므로 별도 처리 필요
+        self.field.reset()
+        self.discard_pile.clear()
+        self.newly_placed_pokemon.clear()
         
     def draw_cards(self, count: int) -> List[Card]:
         """덱에서 카드 드로우 (v2.02 호환)
@@ -124,11 +152,22 @@ class GameStateV3:
         Returns:
             bool: 유효한 드로우 완료 여부
         """
+        if self.opening_sampler is not None:
+            # 셔플된 덱에서 Basic이 나올 때까지 반복한 것과 같은 분포의 손패/덱을 한 번에 샘플링
+            if not self.opening_sampler.valid:
+                return False
+            hand_ids, deck_ids = self.opening_sampler.sample(self.rng)
+            card_kind = self.card_kinds.__getitem__
+            self.hand.clear()
+            self.hand.extend(map(card_kind, hand_ids))
+            self.deck[:] = map(card_kind, deck_ids)
+            return True
+        
         max_attempts = 10  # 무한 루프 방지
         attempts = 0
         
         while attempts < max_attempts:
-            self.hand = []
+            self.hand.clear()
             drawn_cards = self.draw_cards(5)
             
             # Basic Pokemon이 있는지 체크
@@ -137,12 +176,16 @@ class GameStateV3:
                 
             # Basic Pokemon이 없으면 덱에 다시 넣고 셔플
             self.deck.extend(self.hand)
-            self.hand = []
-            # TODO: 실제 셔플 로직 필요 (현재는 시뮬레이션이므로 draw_order 사용)
+            self.hand.clear()
+            self.shuffle_deck()
             attempts += 1
             
         return False  # 최대 시도 횟수 초과
         
+    def shuffle_deck(self):
+        """덱 셔플 (self.rng 사용)"""
+        self.rng.shuffle(self.deck)
+        
     def _has_basic_pokemon_in_hand(self) -> bool:
         """Hand에 Basic Pokemon이 있는지 체크"""
         for card in self.hand:
@@ -166,7 +209,7 @@ class GameStateV3:
         self.draw_cards(1)
         
         # 새 턴이므로 모든 포켓몬이 진화 가능해짐
-        self.newly_placed_pokemon = []
+        self.newly_placed_pokemon.clear()
         self.field.mark_new_turn()
         
     def place_pokemon_active(self, card_name: str) -> bool:
@@ -217,16 +260,20 @@ class GameStateV3:
         if card_to_place is None:
             return False
             
+        # 배치될 슬롯 (같은 이름의 포켓몬이 이미 벤치에 있어도 새 슬롯을 마킹하도록 먼저 결정)
+        if slot_index is None:
+            available_slots = self.field.get_available_bench_slots()
+            if not available_slots:
+                return False
+            slot_index = available_slots[0]
+            
         # Field에 배치 시도
         success = self.field.place_pokemon_bench(card_to_place, slot_index)
         if success:
             self.hand.remove(card_to_place)
             self.newly_placed_pokemon.append(card_to_place)
-            # 배치된 슬롯을 찾아서 진화 불가 마킹
-            for slot in self.field.bench:
-                if not slot.is_empty() and slot.get_top_pokemon().name == card_name:
-                    self.field.mark_newly_placed(slot)
-                    break
+            # 배치된 슬롯을 진화 불가 마킹
+            self.field.mark_newly_placed(self.field.bench[slot_index])
                     
         return success
         
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pokemon Pocket Simulator v3.0 - 진화 성공 확률 시뮬레이션
+파일명: v3_simulation.py
+목적: GameStateV3 / use_draw_cards_v3 / auto_evolve_all로 게임을 끝까지 진행해
+      "N턴까지 목표 진화 포켓몬이 Field에 나와 있을 확률"(evolution 계산 타입)을 집계
+
+게임 진행 (SimulationEngine과 같은 턴 규칙):
+- 0턴: (재사용하는 게임 상태를 reset_game으로 복원) 셔플 후 시작 손패 5장 (Basic이 없으면 다시 셔플), Basic 배치
+- 1턴~: 1장 드로우 → Basic 배치 → use_draw_cards_v3 (Iono 전 / 턴 마지막 진화 체크 포함)
+        → 이번 턴에 손에 들어온 Basic 배치 (다음 턴부터 진화 가능)
+- 성공: 턴 종료 시점에 check_evolution_success가 참 (처음 성공한 턴에서 게임 종료)
+
+Basic 배치 정책: Active는 선호 Basic(preferred_basics) 우선, 나머지 Basic은 빈 벤치 슬롯에 모두 배치
+Iono 판단의 목표 카드: 목표 진화가 속한 진화 라인 카드 중 아직 Field에 나오지 않은 카드
+"""
+
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from v3_game_state import GameStateV3
+from v3_evolution_system import check_evolution_success
+from v3_draw_card_system import use_draw_cards_v3
+
+EVOLUTION_STAGES = ("basic", "stage1", "stage2")
+
+
+def target_evolution_lines(evolution_lines: List[Dict[str, str]], target_evolutions: List[str]) -> List[Dict[str, str]]:
+    """목표 진화 포켓몬이 속한 진화 라인들 (목표가 어느 라인에도 없으면 ValueError)"""
+    lines = []
+    for target in target_evolutions:
+        line = next((line for line in evolution_lines
+                     if target in (line.get(stage) for stage in EVOLUTION_STAGES)), None)
+        if line is None:
+            raise ValueError(f"목표 진화 포켓몬이 진화 라인에 없습니다: {target}")
+        if line not in lines:
+            lines.append(line)
+    return lines
+
+
+def place_basics(game_state: GameStateV3):
+    """손패의 Basic Pokemon을 Field에 배치 (Active는 선호 Basic 우선, 나머지는 빈 벤치에)"""
+    if not game_state.field.has_active_pokemon():
+        candidates = game_state.get_preferred_basics_in_hand() or game_state.get_basic_pokemon_in_hand()
+        if not candidates:
+            return
+        game_state.place_pokemon_active(candidates[0].name)
+
+    for card in game_state.get_basic_pokemon_in_hand():
+        if not game_state.field.get_available_bench_slots():
+            break
+        game_state.place_pokemon_bench(card.name)
+
+
+class EvolutionCounter:
+    """진화 게임 결과 집계 (run_stream 누적기)
+
+    Attributes:
+        max_turn: 판정 턴
+        first_success_counts: 턴별로 처음 목표 진화를 달성한 게임 수 (index = 턴)
+        success_count: max_turn까지 달성한 게임 수
+        total_valid_games: 멀리건 실패를 제외한 게임 수
+    """
+
+    def __init__(self, max_turn: int):
+        self.max_turn = max_turn
+        self.first_success_counts = [0] * (max_turn + 1)
+        self.success_count = 0
+        self.total_valid_games = 0
+
+    def on_invalid_game(self):
+        pass
+
+    def on_game(self, first_success_turn: Optional[int]):
+        """유효한 게임 1판 (first_success_turn: 처음 달성한 턴, 달성하지 못했으면 None)"""
+        self.total_valid_games += 1
+        if first_success_turn is not None:
+            self.first_success_counts[first_success_turn] += 1
+            self.success_count += 1
+
+    def merge(self, other: 'EvolutionCounter'):
+        """다른 집계(병렬 워커 조각)를 더함"""
+        for turn, count in enumerate(other.first_success_counts):
+            self.first_success_counts[turn] += count
+        self.success_count += other.success_count
+        self.total_valid_games += other.total_valid_games
+
+
+class EvolutionSimulator:
+    """v3 파이프라인으로 진화 성공 여부를 판정하는 게임 실행기"""
+
+    def __init__(self, deck_input: Dict[str, Dict[str, Any]], draw_order: List[str],
+                 target_evolutions: List[str], evolution_lines: List[Dict[str, str]],
+                 preferred_basics: Optional[List[str]] = None, opening: str = "mulligan"):
+        """
+        Args:
+            deck_input: 덱 구성 정보 (v2 "type" 형식 또는 v3 "카드타입" 형식)
+            draw_order: 드로우 카드 발동 순서
+            target_evolutions: Field에 나와 있어야 하는 포켓몬들 (모두 만족해야 성공)
+            evolution_lines: 진화 라인 [{"basic": str, "stage1": str, "stage2": str 또는 None}]
+            preferred_basics: Active에 우선 배치할 Basic Pokemon
+            opening: 시작 손패 방식 ("mulligan" 또는 "alias")
+        """
+        self.deck_input = deck_input
+        self.draw_order = list(draw_order)
+        self.target_evolutions = list(target_evolutions)
+        self.evolution_lines = list(evolution_lines)
+        self.preferred_basics = list(preferred_basics or [])
+        self.opening = opening
+        # 게임마다 재사용하는 게임 상태 (첫 게임에서 생성, 이후 reset_game으로 제자리 복원)
+        self._game_state: Optional[GameStateV3] = None
+        self.line_cards = [card_name for line in target_evolution_lines(self.evolution_lines, self.target_evolutions)
+                           for card_name in (line.get(stage) for stage in EVOLUTION_STAGES)
+                           if card_name and card_name in deck_input]
+
+    def _iono_targets(self, game_state: GameStateV3) -> List[str]:
+        """Iono 판단용 목표 카드 (목표 진화 라인 카드 중 아직 Field에 없는 카드)"""
+        on_field = {card.name for slot in game_state.field.get_all_pokemon_slots() for card in slot.evolution_stack}
+        return [card_name for card_name in self.line_cards if card_name not in on_field]
+
+    def play(self, max_turn: int, rng=None, verbose: bool = False) -> Tuple[bool, Optional[int], GameStateV3]:
+        """게임 1판 진행
+
+        Returns:
+            (유효한 게임 여부, 처음 목표 진화를 달성한 턴 또는 None, 마지막 게임 상태)
+            게임 상태는 다음 게임에서 재사용되므로 필요한 값은 다음 play 전에 꺼내 둡니다.
+        """
+        game_state = self._game_state
+        if game_state is None:
+            game_state = self._game_state = GameStateV3(
+                self.deck_input, self.draw_order, preferred_basics=self.preferred_basics,
+                evolution_lines=self.evolution_lines, opening=self.opening, rng=rng)
+        else:
+            game_state.reset_game()
+            game_state.rng = rng if rng is not None else random
+        game_state.shuffle_deck()
+        if not game_state.initial_draw():
+            return False, None, game_state
+        place_basics(game_state)
+
+        for turn in range(1, max_turn + 1):
+            game_state.start_turn()
+            place_basics(game_state)
+            use_draw_cards_v3(game_state, self.draw_order, self._iono_targets(game_state), verbose)
+            place_basics(game_state)
+            if check_evolution_success(game_state, self.target_evolutions):
+                return True, turn, game_state
+        return True, None, game_state
+
+    def simulate_single_game(self, max_turn: int, rng=None, verbose: bool = False) -> Dict[str, Any]:
+        """게임 1판 결과 (SimulationEngine.simulate_single_game과 같은 'success' 의미: 유효한 게임 여부)"""
+        valid, first_success_turn, game_state = self.play(max_turn, rng, verbose)
+        return {
+            'success': valid,
+            'evolved': first_success_turn is not None,
+            'first_success_turn': first_success_turn,
+            'field': [[card.name for card in slot.evolution_stack] for slot in game_state.field.get_all_pokemon_slots()],
+            'final_hand': [card.name for card in game_state.hand]
+        }
+
+    def run_stream(self, accumulator: EvolutionCounter, num_games: int, max_turn: int,
+                   game_seeds: Optional[List[int]] = None):
+        """num_games판을 진행하며 결과를 accumulator에 전달 (게임별 결과 딕셔너리 없음)
+
+        Args:
+            game_seeds: 게임별 seed (공통 난수 비교용, None이면 전역 random 모듈)
+        """
+        for game_index in range(num_games):
+            rng = random.Random(game_seeds[game_index]) if game_seeds is not None else None
+            valid, first_success_turn, _ = self.play(max_turn, rng)
+            if valid:
+                accumulator.on_game(first_success_turn)
+            else:
+                accumulator.on_invalid_game()